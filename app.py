@@ -5,6 +5,25 @@ import dash
 import dash_bootstrap_components as dbc
 import dash_mantine_components as dmc
 from dash_iconify import DashIconify
+from flask import abort, jsonify, request
+from games.expedition33.calculator.callbacks import overview_cache_stats, panel_cache_stats, view_cache_stats
+from games.expedition33.calculator.coalesce import coalesce_stats
+from games.expedition33.calculator.conversion_gate import conversion_stats
+from games.expedition33.calculator.import_cache import import_cache_stats
+from games.expedition33.calculator.import_jobs import import_job_stats
+from games.expedition33.calculator.import_store import import_store_stats
+from games.expedition33.calculator.save_import import SaveImportError
+from games.expedition33.calculator.save_uploads import (
+    MAX_UPLOAD_REQUEST_BYTES,
+    SAVE_UPLOAD_ROUTE,
+    UploadQuotaExceeded,
+    UploadTooLarge,
+    receive_upload,
+    upload_stats,
+)
+from games.expedition33.calculator.ui.patches import patch_stats
+from werkzeug.exceptions import RequestEntityTooLarge
+import os
 
 def build_games_tree() -> list[dict[str, Any]]:
     """Build Mantine tree data from the registered Dash pages.
@@ -228,6 +247,60 @@ def navigate_from_tree(selected: list[str] | None) -> str:
 
 # For Gunicorn
 server = app.server
+server.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_REQUEST_BYTES
+# The metrics route exposes worker pids and traffic counters, so it only
+# answers when the deployment opts in.
+METRICS_ENABLED = os.environ.get("LUDEX_METRICS") == "1"
+
+
+@server.route("/metrics/calculator-cache")
+def calculator_cache_metrics() -> Any:
+    """Report the Expedition 33 calculator cache, result-patch, coalescing, and save-import counters.
+
+    Cache, patch, import, and import-job counters are per worker process, so
+    the response includes the worker pid. Coalescing and uesave admission
+    counters and the stored import count are shared by every worker. The
+    route answers 404 unless ``LUDEX_METRICS=1`` is set.
+    """
+    if not METRICS_ENABLED:
+        abort(404)
+    return jsonify(
+        {
+            "pid": os.getpid(),
+            "view_cache": view_cache_stats(),
+            "overview_cache": overview_cache_stats(),
+            "panel_caches": panel_cache_stats(),
+            "result_patches": patch_stats(),
+            "coalescing": coalesce_stats(),
+            "save_imports": import_store_stats(),
+            "save_conversions": conversion_stats(),
+            "parsed_saves": import_cache_stats(),
+            "import_jobs": import_job_stats(),
+            "save_uploads": upload_stats(),
+        }
+    )
+
+
+@server.route(SAVE_UPLOAD_ROUTE, methods=["POST"])
+def exp33_save_upload() -> Any:
+    """Stream an Expedition 33 save upload to disk and return its upload token.
+
+    Accepts only the raw request body, with the file's name in the
+    ``filename`` query parameter. Multipart forms are refused: werkzeug
+    spools the whole form before the route could read it in chunks.
+    """
+    if request.mimetype.startswith("multipart/"):
+        return jsonify({"error": "Send the save as the raw request body."}), 415
+    try:
+        token = receive_upload(request.stream, request.args.get("filename"), request.content_length)
+    except (UploadTooLarge, RequestEntityTooLarge):
+        return jsonify({"error": "Uploaded save is too large."}), 413
+    except UploadQuotaExceeded as exc:
+        return jsonify({"error": str(exc)}), 503
+    except SaveImportError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify({"token": token})
+
 
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,166 @@
+(function () {
+  var VISIBLE = {};
+  var HIDDEN = { display: "none" };
+  // Mirrors SAVE_UPLOAD_ROUTE in save_uploads.py.
+  var SAVE_UPLOAD_URL = "/exp33/calculator/save-upload";
+  var SAVE_UPLOAD_BUTTON_ID = "exp33-calculator-save-upload";
+  var SAVE_UPLOAD_RESULT_ID = "exp33-calculator-save-upload-result";
+  // Identifies this page load to the server's request coalescing.
+  var SESSION = Math.random().toString(36).slice(2) + Date.now().toString(36);
+  var sequence = 0;
+
+  function styleFor(visible, control) {
+    return visible[control] ? VISIBLE : HIDDEN;
+  }
+
+  function addAll(visible, controls) {
+    (controls || []).forEach(function (control) {
+      visible[control] = true;
+    });
+  }
+
+  // Posts a save file to the upload route as the raw request body, so it is
+  // never read into a data URL or sent through a callback, and hands the
+  // route's response (an upload token, or an error message) to the import
+  // callbacks.
+  function uploadSave(save) {
+    fetch(SAVE_UPLOAD_URL + "?filename=" + encodeURIComponent(save.name), {
+      method: "POST",
+      headers: { "Content-Type": "application/octet-stream" },
+      body: save,
+    })
+      .then(function (response) {
+        return response.json().catch(function () {
+          return {
+            error: response.status === 413 ? "Uploaded save is too large." : "Uploaded save could not be sent to the server.",
+          };
+        });
+      })
+      .catch(function () {
+        return { error: "Uploaded save could not be sent to the server." };
+      })
+      .then(function (result) {
+        window.dash_clientside.set_props(SAVE_UPLOAD_RESULT_ID, { data: result });
+      });
+  }
+
+  // The import button opens a file picker; Dash has no file input component
+  // that exposes the chosen File.
+  document.addEventListener("click", function (event) {
+    if (!event.target.closest || !event.target.closest("#" + SAVE_UPLOAD_BUTTON_ID)) {
+      return;
+    }
+    var input = document.createElement("input");
+    input.type = "file";
+    input.accept = ".sav,.SAV";
+    input.addEventListener("change", function () {
+      if (input.files && input.files[0]) {
+        uploadSave(input.files[0]);
+      }
+    });
+    input.click();
+  });
+
+  // Mirrors normalize_weapon_level in weapons.py.
+  function weaponTier(value) {
+    var level = Math.trunc(Number(value || 0));
+    if (!Number.isFinite(level)) {
+      return "0";
+    }
+    if (level >= 20) {
+      return "20";
+    }
+    if (level >= 10) {
+      return "10";
+    }
+    if (level >= 4) {
+      return "4";
+    }
+    return "0";
+  }
+
+  function weaponControls(map, character, weapon, level) {
+    var tiers = (map.weapons[character] || {})[weapon || ""];
+    return tiers ? tiers[weaponTier(level)] : { character: [], bonus: [] };
+  }
+
+  // Mirrors get_row in core.py.
+  function resolveSkill(map, character, skill) {
+    var skills = map.skills[character];
+    if (Object.prototype.hasOwnProperty.call(skills, skill)) {
+      return skill;
+    }
+    var fallback = map.default_skills[character];
+    return Object.prototype.hasOwnProperty.call(skills, fallback) ? fallback : map.first_skills[character];
+  }
+
+  var exp33Calculator = {
+    // Folds every result-callback control into the state store, keeping only
+    // values that differ from the page defaults, and stamps each change with
+    // this page's session and a new sequence number.
+    syncCalculatorState: function () {
+      var values = Array.prototype.slice.call(arguments, 0, -2);
+      var defaults = arguments[arguments.length - 2] || {};
+      var current = arguments[arguments.length - 1];
+      var changed = {};
+      Object.keys(defaults).forEach(function (key, index) {
+        var value = values[index] === undefined ? null : values[index];
+        if (JSON.stringify(value) !== JSON.stringify(defaults[key])) {
+          changed[key] = value;
+        }
+      });
+      if (current && JSON.stringify(changed) === JSON.stringify(current)) {
+        return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+      }
+      sequence += 1;
+      return [changed, { session: SESSION, seq: sequence }];
+    },
+
+    // Clientside port of the character-control visibility rules.
+    syncVisibleControls: function (character, skill, compareSkill, weapon, weaponLevel, map) {
+      var active = character || map.default_character;
+      var skills = map.skills[active];
+      var visible = {};
+      addAll(visible, skills[resolveSkill(map, active, skill)]);
+      if (compareSkill && Object.prototype.hasOwnProperty.call(skills, compareSkill)) {
+        addAll(visible, skills[compareSkill]);
+      }
+      addAll(visible, weaponControls(map, active, weapon, weaponLevel).character);
+
+      var outputs = [["setup-" + active]];
+      map.characters.forEach(function (name) {
+        outputs.push(name === active ? VISIBLE : HIDDEN);
+      });
+      map.character_controls.forEach(function (control) {
+        outputs.push(styleFor(visible, control));
+      });
+      map.characters.forEach(function (name) {
+        var hasVisible = Object.keys(visible).some(function (control) {
+          return control.indexOf(name) === 0;
+        });
+        outputs.push(hasVisible ? HIDDEN : VISIBLE);
+      });
+      return outputs;
+    },
+
+    // Clientside port of the Picto and weapon bonus-control visibility rules.
+    syncVisibleBonusControls: function (character, pictos, weapon, weaponLevel, map) {
+      var active = character || map.default_character;
+      var required = {};
+      (pictos || []).forEach(function (name) {
+        addAll(required, map.pictos[name]);
+      });
+      addAll(required, weaponControls(map, active, weapon, weaponLevel).bonus);
+      var hasSelection = Boolean(pictos && pictos.length) || Boolean(weapon);
+
+      var outputs = [weapon ? VISIBLE : HIDDEN, hasSelection];
+      map.picto_controls.concat(map.weapon_controls).forEach(function (control) {
+        outputs.push(styleFor(required, control));
+      });
+      outputs.push(hasSelection && !Object.keys(required).length ? VISIBLE : HIDDEN);
+      return outputs;
+    },
+  };
+
+  window.dash_clientside = Object.assign({}, window.dash_clientside, { exp33Calculator: exp33Calculator });
+})();
@@ -0,0 +1,221 @@
+"""Micro-benchmark for the calculator's per-skill evaluation path.
+
+Run from the repository root::
+
+    python -m games.expedition33.calculator.benchmark
+
+The report covers the time of one ``calculate_skill_result`` call and one
+compiled-evaluator call averaged over every skill row and a fixed set of
+sampled states, the per-character cost of building, expanding, and hashing
+the typed character state, the time to rank every skill for each character, the time
+to compare eight skills in one shared pass against one pass per skill, the
+time and memoized state count of a full-length rotation plan for each character,
+and the memory retained per loaded record.
+"""
+
+from __future__ import annotations
+from games.expedition33.calculator.core import CALCULATOR_DATA, load_calculator_data
+from games.expedition33.calculator.evaluators import compare_character_skills, evaluate_skill_result, rank_character_skills
+from games.expedition33.calculator.logic import calculate_skill_result
+from games.expedition33.calculator.pictos import PICTO_DEFINITIONS
+from games.expedition33.calculator.planner import MAX_PLAN_TURNS, plan_rotation
+from games.expedition33.calculator.states import CHARACTER_STATES, LUNE_STAIN_CONTROLS, build_character_state
+from games.expedition33.calculator.sweep import SWEEP_FIELDS
+from games.expedition33.calculator.weapons import WEAPON_DEFINITIONS
+from collections.abc import Callable
+from typing import Any
+import argparse
+import random
+import time
+import tracemalloc
+
+
+def sample_states(character: str, count: int, seed: int = 33) -> list[dict[str, Any]]:
+    """Draw reproducible character states from the sweepable field ranges."""
+
+    rng = random.Random(f"{seed}:{character}")
+    fields = SWEEP_FIELDS[character]
+    return [{key: rng.choice(field["values"]) for key, field in fields.items()} for _ in range(count)]
+
+
+def sample_controls(character: str, count: int) -> list[dict[str, Any]]:
+    """Turn sampled states into the control values a character state reads."""
+
+    controls = dict(CHARACTER_STATES[character].CONTROLS)
+    if character == "lune":
+        controls.update(LUNE_STAIN_CONTROLS)
+    return [{control: state.get(name) for name, control in controls.items()} for state in sample_states(character, count)]
+
+
+def time_state_building(samples: int, repeat: int) -> dict[str, tuple[float, float, float]]:
+    """Time the state-building stage of one calculator request per character.
+
+    Returns:
+        The best per-state time in seconds of ``build_character_state``, of
+        ``as_state``, and of hashing the state as a cache key.
+    """
+
+    timings = {}
+    for character in CALCULATOR_DATA:
+        controls = sample_controls(character, samples)
+        build = expand = digest = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            states = [build_character_state(character, entry) for entry in controls]
+            build = min(build, (time.perf_counter() - started) / samples)
+            started = time.perf_counter()
+            for state in states:
+                state.as_state()
+            expand = min(expand, (time.perf_counter() - started) / samples)
+            started = time.perf_counter()
+            for state in states:
+                hash(state)
+            digest = min(digest, (time.perf_counter() - started) / samples)
+        timings[character] = (build, expand, digest)
+    return timings
+
+
+def time_evaluations(
+    evaluate: Callable[..., Any],
+    states_per_row: int,
+    repeat: int,
+) -> tuple[int, float]:
+    """Time one evaluation function over every row and sampled state.
+
+    Returns:
+        The number of evaluations per pass and the best pass time in seconds.
+    """
+
+    work = [
+        (character, row, state)
+        for character, payload in CALCULATOR_DATA.items()
+        for state in sample_states(character, states_per_row)
+        for row in payload["records"]
+    ]
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for character, row, state in work:
+            evaluate(character, row, state)
+        best = min(best, time.perf_counter() - started)
+    return len(work), best
+
+
+def time_rankings(repeat: int) -> dict[str, float]:
+    """Time ranking every skill for each character with an empty setup."""
+
+    timings = {}
+    for character in CALCULATOR_DATA:
+        state = sample_states(character, 1)[0]
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rank_character_skills(character, state, None, {}, None, None, {}, 1000.0)
+            best = min(best, time.perf_counter() - started)
+        timings[character] = best
+    return timings
+
+
+def time_skill_comparisons(repeat: int, skills: int = 8) -> dict[str, tuple[float, float]]:
+    """Time comparing several skills with a weapon and Pictos equipped.
+
+    Returns:
+        The best time in seconds of one shared ``compare_character_skills``
+        pass and of one call per skill, per character.
+    """
+
+    pictos = list(PICTO_DEFINITIONS)[:6]
+    timings = {}
+    for character in CALCULATOR_DATA:
+        state = sample_states(character, 1)[0]
+        names = [row.skill for row in CALCULATOR_DATA[character]["records"][:skills]]
+        weapon = next(iter(WEAPON_DEFINITIONS.get(character, {})), None)
+        args = (state, pictos, {}, weapon, 20, {}, 1000.0)
+        shared = separate = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            compare_character_skills(character, names, *args)
+            shared = min(shared, time.perf_counter() - started)
+            started = time.perf_counter()
+            for name in names:
+                compare_character_skills(character, [name], *args)
+            separate = min(separate, time.perf_counter() - started)
+        timings[character] = (shared, separate)
+    return timings
+
+
+def time_rotation_plans(repeat: int) -> dict[str, tuple[int, float]]:
+    """Time planning a ``MAX_PLAN_TURNS`` rotation for each character.
+
+    Returns:
+        The memoized state count and best time in seconds per character.
+    """
+
+    timings = {}
+    for character in CALCULATOR_DATA:
+        state = sample_states(character, 1)[0]
+        best = float("inf")
+        states = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            plan = plan_rotation(character, MAX_PLAN_TURNS, state, None, {}, None, None, {}, 1000.0, crit_rate=0.5)
+            best = min(best, time.perf_counter() - started)
+            states = plan["states"]
+        timings[character] = (states, best)
+    return timings
+
+
+def measure_record_memory() -> tuple[int, int]:
+    """Measure the memory retained by a fresh ``load_calculator_data`` call.
+
+    Returns:
+        The number of loaded records and the retained bytes.
+    """
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    payloads = load_calculator_data()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    records = sum(len(payload["records"]) for payload in payloads.values())
+    return records, retained
+
+
+def main() -> None:
+    """Run the benchmark and print a short report."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=50, help="sampled states per skill row")
+    parser.add_argument("--repeat", type=int, default=5, help="passes per measurement; the best is reported")
+    args = parser.parse_args()
+
+    for evaluate in (calculate_skill_result, evaluate_skill_result):
+        evaluations, seconds = time_evaluations(evaluate, args.states, args.repeat)
+        print(f"{evaluate.__name__}: {evaluations} evaluations, {seconds / evaluations * 1e6:.2f} us each")
+
+    state_timings = time_state_building(args.states, args.repeat)
+    for character, (build, expand, digest) in state_timings.items():
+        print(
+            f"build_character_state[{character}]: {build * 1e6:.2f} us build, "
+            f"{expand * 1e6:.2f} us as_state, {digest * 1e6:.2f} us hash"
+        )
+    eager = sum(build for build, _, _ in state_timings.values())
+    print(f"build_character_state[all characters]: {eager * 1e6:.2f} us if every character were built")
+
+    for character, seconds in time_rankings(args.repeat).items():
+        rows = len(CALCULATOR_DATA[character]["records"])
+        print(f"rank_character_skills[{character}]: {rows} rows, {seconds * 1e3:.3f} ms")
+
+    for character, (shared, separate) in time_skill_comparisons(args.repeat).items():
+        print(f"compare_character_skills[{character}]: 8 skills, {shared * 1e3:.3f} ms shared, {separate * 1e3:.3f} ms per skill")
+
+    for character, (states, seconds) in time_rotation_plans(args.repeat).items():
+        print(f"plan_rotation[{character}]: {MAX_PLAN_TURNS} turns, {states} states, {seconds * 1e3:.1f} ms")
+
+    records, retained = measure_record_memory()
+    print(f"load_calculator_data: {records} records, {retained / records:.0f} bytes retained per record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Build the precomputed skill outcome tables shipped with the calculator.
+
+Run from the repository root after editing the skill CSVs, ``core.py``,
+``logic.py``, or ``evaluators.py``::
+
+    python -m games.expedition33.calculator.build_tables
+
+Every skill row is evaluated once with the reference ``calculate_skill_result``
+over the full product of its character's state fields, so the tables never
+inherit a bug from the compiled evaluators they stand in for. Fields the result never varies along are dropped, so each table
+only spans the state that matters for that row. ``--check`` rebuilds the
+tables in memory and exits non-zero when the shipped file is stale or differs.
+"""
+
+from __future__ import annotations
+from games.expedition33.calculator.core import CALCULATOR_DATA, HIDDEN_STYLE, CalculatorRow, CalculatorState
+from games.expedition33.calculator.logic import build_skill_control_styles, calculate_skill_result
+from games.expedition33.calculator.tables import (
+    RANK_BONUS_AXIS,
+    TABLE_PATH,
+    result_key,
+    source_fingerprint,
+)
+from games.expedition33.calculator.verify import EXTRA_STATE_VALUES, RANK_BONUS_FLAGS, state_space
+from games.expedition33.calculator.sweep import SWEEP_FIELDS
+from pathlib import Path
+from typing import Any
+import argparse
+import io
+import json
+import sys
+import numpy as np
+
+# Setup controls whose id does not follow ``<character>_<state field>``.
+CONTROL_FIELDS = {"monoco_mask": "mask_active"}
+
+
+def character_domains(character: str) -> dict[str, list[Any]]:
+    """Return the enumerated values of every table axis for one character."""
+
+    domains = {key: list(field["values"]) for key, field in SWEEP_FIELDS[character].items()}
+    domains.update(EXTRA_STATE_VALUES.get(character, {}))
+    domains[RANK_BONUS_AXIS] = RANK_BONUS_FLAGS.get(character, [False])
+    return domains
+
+
+def visible_fields(character: str, row: CalculatorRow) -> set[str]:
+    """Return the state fields whose setup controls are shown for ``row``."""
+
+    return {
+        CONTROL_FIELDS.get(control, control.removeprefix(f"{character}_"))
+        for control, style in build_skill_control_styles(character, row).items()
+        if style != HIDDEN_STYLE
+    }
+
+
+def tabulate_row(
+    character: str,
+    row: CalculatorRow,
+    states: list[CalculatorState],
+    domains: dict[str, list[Any]],
+    result_ids: dict[tuple[Any, ...], int],
+) -> tuple[list[str], np.ndarray]:
+    """Evaluate one row over every state and drop the axes it ignores.
+
+    Args:
+        character: The calculator character id.
+        row: The skill row to tabulate.
+        states: The full state product, in row-major order over ``domains``
+            without the rank-bonus axis.
+        domains: The enumerated values of every axis.
+        result_ids: The character's interned results; new results are added.
+
+    Returns:
+        The kept axes and the result-id array spanning them.
+    """
+
+    flags = domains[RANK_BONUS_AXIS]
+    ids = [
+        result_ids.setdefault(result_key(calculate_skill_result(character, row, state, flag)), len(result_ids))
+        for state in states
+        for flag in flags
+    ]
+    axes = list(domains)
+    cells = np.array(ids, dtype=np.int64).reshape([len(domains[key]) for key in axes])
+    for axis in reversed(range(len(axes))):
+        first = cells.take([0], axis=axis)
+        if (cells == first).all():
+            cells = first.squeeze(axis)
+            del axes[axis]
+    return axes, cells
+
+
+def build_outcome_tables(report: bool = False) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Tabulate every loaded skill row.
+
+    Args:
+        report: Print rows whose result depends on a field the setup panel
+            hides for that row.
+
+    Returns:
+        The JSON metadata and the per-row result-id arrays keyed
+        ``"<character>/<row index>"``.
+    """
+
+    meta: dict[str, Any] = {"fingerprint": source_fingerprint(), "characters": {}}
+    arrays: dict[str, np.ndarray] = {}
+    for character, payload in CALCULATOR_DATA.items():
+        domains = character_domains(character)
+        states = list(state_space(character))
+        result_ids: dict[tuple[Any, ...], int] = {}
+        rows = []
+        for index, row in enumerate(payload["records"]):
+            axes, cells = tabulate_row(character, row, states, domains, result_ids)
+            rows.append({"skill": row.skill, "axes": axes})
+            arrays[f"{character}/{index}"] = cells
+            hidden = set(axes) - visible_fields(character, row) - {RANK_BONUS_AXIS}
+            if report and hidden:
+                print(f"{character} / {row.skill}: depends on hidden {', '.join(sorted(hidden))}")
+
+        dtype = np.min_scalar_type(len(result_ids))
+        for index in range(len(rows)):
+            arrays[f"{character}/{index}"] = arrays[f"{character}/{index}"].astype(dtype)
+        meta["characters"][character] = {
+            "domains": domains,
+            "results": [list(values) for values in result_ids],
+            "rows": rows,
+        }
+    return meta, arrays
+
+
+def encode_tables(meta: dict[str, Any], arrays: dict[str, np.ndarray]) -> bytes:
+    """Serialize tables into the ``.npz`` layout ``load_outcome_tables`` reads."""
+
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, meta=np.array(json.dumps(meta, sort_keys=True)), **arrays)
+    return buffer.getvalue()
+
+
+def tables_match(path: Path, meta: dict[str, Any], arrays: dict[str, np.ndarray]) -> bool:
+    """Return whether the file at ``path`` holds exactly these tables."""
+
+    if not path.exists():
+        return False
+    with np.load(path, allow_pickle=False) as archive:
+        if json.loads(str(archive["meta"])) != meta or set(archive.files) != {"meta", *arrays}:
+            return False
+        return all(np.array_equal(archive[key], cells) and archive[key].dtype == cells.dtype for key, cells in arrays.items())
+
+
+def main() -> None:
+    """Write the outcome tables, or check the shipped ones."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail instead of writing when the shipped tables differ")
+    parser.add_argument("--report", action="store_true", help="list results that depend on hidden setup controls")
+    parser.add_argument("--output", type=Path, default=TABLE_PATH, help="table file to write or check")
+    args = parser.parse_args()
+
+    meta, arrays = build_outcome_tables(args.report)
+    cells = sum(array.size for array in arrays.values())
+    print(f"{len(arrays)} rows, {cells} cells")
+    if args.check:
+        if not tables_match(args.output, meta, arrays):
+            print(f"{args.output} is stale; rerun build_tables")
+            sys.exit(1)
+        print(f"{args.output} is up to date")
+        return
+
+    args.output.write_bytes(encode_tables(meta, arrays))
+    print(f"wrote {args.output} ({args.output.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any, TypeAlias, TypedDict
+
+# Evaluated skill views kept per worker process; each entry holds one
+# skill's result and summary components for one canonical setup.
+VIEW_CACHE_SIZE = 1024
+# Serialized comparison overviews kept per worker process; each entry holds
+# the overview for one primary/compare pair of cached skill views.
+OVERVIEW_CACHE_SIZE = 1024
+# Serialized heavy panels (ranking, optimizer, sweep, rotations, plan, skill
+# grid) kept per worker process and per panel; each entry holds one panel
+# body for the subset of the setup that panel reads.
+PANEL_CACHE_SIZE = 256
+
+FrozenMapping: TypeAlias = tuple[tuple[str, Hashable], ...]
+
+
+class CacheStats(TypedDict):
+    """Hit/miss counters for one in-process LRU cache."""
+
+    hits: int
+    misses: int
+    hit_rate: float
+    maxsize: int
+    currsize: int
+
+
+@dataclass(frozen=True, slots=True)
+class CalculatorInputs:
+    """Canonical, hashable form of the inputs that shape one skill view.
+
+    Attributes:
+        character: The calculator character id.
+        skill: The resolved skill name, after default-skill fallback.
+        attack: The effective attack power.
+        affinity: The normalized enemy affinity.
+        weapon: The selected weapon name, if any.
+        weapon_level: The normalized weapon unlock tier.
+        pictos: The selected Picto names in selection order.
+        attack_type_override: The optional Picto attack-type override.
+        state: The ``CharacterState`` of ``character``.
+        picto_state: The frozen shared Picto state.
+        weapon_state: The frozen shared weapon state.
+    """
+
+    character: str
+    skill: str
+    attack: float
+    affinity: str
+    weapon: str | None
+    weapon_level: str
+    pictos: tuple[str, ...]
+    attack_type_override: str | None
+    state: Hashable
+    picto_state: FrozenMapping
+    weapon_state: FrozenMapping
+
+
+def canonical_value(value: Any) -> Hashable:
+    """Convert a callback value into a canonical hashable value.
+
+    Integral floats collapse to ints so ``3`` and ``3.0`` share a cache entry,
+    and lists become tuples.
+    """
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(canonical_value(item) for item in value)
+    if isinstance(value, Mapping):
+        return freeze_mapping(value)
+    return value
+
+
+def freeze_mapping(mapping: Mapping[str, Any]) -> FrozenMapping:
+    """Freeze a normalized state dictionary into sorted key/value pairs."""
+
+    return tuple(sorted((key, canonical_value(value)) for key, value in mapping.items()))
+
+
+def thaw_mapping(frozen: FrozenMapping) -> dict[str, Any]:
+    """Rebuild the state dictionary the evaluators expect from a frozen one."""
+
+    return dict(frozen)
+
+
+def cache_stats(cached: Any) -> CacheStats:
+    """Read the counters of a ``functools.lru_cache``-wrapped function."""
+
+    info = cached.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+        "maxsize": info.maxsize,
+        "currsize": info.currsize,
+    }
@@ -1,19 +1,31 @@
 from __future__ import annotations
-from dash import html, Input, Output, State, callback, no_update
-from loguru import logger
+from dash import html, ClientsideFunction, Input, Output, State, callback, callback_context, clientside_callback, no_update
+from dash.exceptions import PreventUpdate
+from collections.abc import Callable
+from dataclasses import replace
+from functools import lru_cache
 from typing import Any, TypeAlias, TypedDict
+from games.expedition33.calculator.cache import (
+    OVERVIEW_CACHE_SIZE,
+    PANEL_CACHE_SIZE,
+    VIEW_CACHE_SIZE,
+    CacheStats,
+    CalculatorInputs,
+    cache_stats,
+    freeze_mapping,
+    thaw_mapping,
+)
+from games.expedition33.calculator.coalesce import RequestTicket, claim_request, is_superseded
 from games.expedition33.calculator.core import (
     AffinityDetails,
     calculate_current_cost,
     CALCULATOR_DATA,
     CalculationResult,
     CalculatorRow,
-    CalculatorState,
     CHARACTER_META,
-    CharacterStyles,
     clamp_int,
+    clean_text,
     ComponentChildren,
-    ControlStyles,
     DEFAULT_CHARACTER,
     DEFAULT_SKILLS,
     get_row,
@@ -28,31 +40,85 @@ from games.expedition33.calculator.core import (
     ToggleInput,
     VISIBLE_STYLE,
 )
+from games.expedition33.calculator.ui.page import CONTROL_DEFAULTS, layout
+from games.expedition33.calculator.ui.state_store import (
+    CALCULATOR_CONTROLS,
+    CALCULATOR_STATE_ID,
+    CONTROL_DEFAULTS_ID,
+    RENDERED_VIEWS_ID,
+    REQUEST_TICKET_ID,
+    CalculatorControls,
+    apply_initial_outputs,
+    resolve_controls,
+)
+from games.expedition33.calculator.ui.patches import (
+    PATCH_RESULT_VIEWS,
+    RenderedViews,
+    component_json,
+    patch_bodies,
+    recall_bodies,
+    remember_bodies,
+)
 from games.expedition33.calculator.ui.result_views import (
+    build_build_loadout_table,
     build_comparison_overview,
+    build_picto_loadout_table,
+    build_ranking_table,
+    build_skill_comparison_grid,
     build_result_body,
     build_summary_body,
+    build_rotation_plan,
+    build_rotation_table,
+    build_sweep_heatmap,
 )
+from games.expedition33.calculator.import_jobs import IMPORT_STAGES, cancel_job, fail_import_job, load_job, start_import_job
+from games.expedition33.calculator.import_store import load_import
+from games.expedition33.calculator.evaluators import compare_character_skills, evaluate_skill_result, rank_character_skills
 from games.expedition33.calculator.logic import (
     apply_weapon_bonus,
     apply_picto_bonus,
-    build_skill_control_styles,
-    calculate_skill_result,
     resolve_picto_attack_type,
 )
-from games.expedition33.calculator.pictos import PictoSummary, evaluate_pictos, required_picto_controls
-from games.expedition33.calculator.save_import import SaveImportError, parse_uploaded_save
+from games.expedition33.calculator.optimizer import MAX_PICTO_SLOTS, optimize_builds, optimize_pictos
+from games.expedition33.calculator.pictos import PictoSummary, evaluate_pictos
+from games.expedition33.calculator.planner import MAX_PLAN_TURNS, plan_rotation
+from games.expedition33.calculator.rotation import (
+    DEFAULT_ROTATION_RUNS,
+    DEFAULT_START_AP,
+    MAX_AP,
+    MAX_ROTATION_RUNS,
+    parse_rotations,
+    simulate_rotations,
+)
+from games.expedition33.calculator.states import build_character_state
+from games.expedition33.calculator.sweep import SWEEP_FIELDS, sweep_field_options, sweep_skill
+from games.expedition33.calculator.save_import import SaveImportPayload
+from games.expedition33.calculator.visibility import (
+    CHARACTER_CONTROLS,
+    PICTO_CONTROLS,
+    WEAPON_CONTROLS,
+    character_control_wrapper_id,
+    picto_control_wrapper_id,
+    weapon_control_wrapper_id,
+)
 from games.expedition33.calculator.weapons import (
     WeaponSummary,
     evaluate_weapon,
     normalize_weapon_level,
-    required_weapon_character_controls,
-    required_weapon_controls,
     weapon_options_for,
 )
 
-SkillDropdownUpdate: TypeAlias = tuple[list[SkillOption], str, list[SkillOption], str | None, float]
-VisibleControlsUpdate: TypeAlias = tuple[Any, ...]
+SkillDropdownUpdate: TypeAlias = tuple[
+    list[SkillOption],
+    str,
+    list[SkillOption],
+    str | None,
+    float,
+    list[SkillOption],
+    list[str],
+    list[SkillOption],
+    list[str],
+]
 CalculatorResultPanels: TypeAlias = tuple[
     StyleRule,
     ComponentChildren,
@@ -62,10 +128,40 @@ CalculatorResultPanels: TypeAlias = tuple[
     StyleRule,
     ComponentChildren,
     ComponentChildren,
+    ComponentChildren,
+    ComponentChildren,
+    ComponentChildren,
+    ComponentChildren,
+    ComponentChildren,
+    ComponentChildren,
 ]
-
+# (component id, property) of every result panel, in ``CalculatorResultPanels``
+# order.
+RESULT_OUTPUTS: tuple[tuple[str, str], ...] = (
+    ("exp33-calculator-compare-overview-card", "style"),
+    ("exp33-calculator-compare-overview-body", "children"),
+    ("exp33-calculator-primary-column", "lg"),
+    ("exp33-calculator-result-body", "children"),
+    ("exp33-calculator-summary-body", "children"),
+    ("exp33-calculator-compare-column", "style"),
+    ("exp33-calculator-compare-result-body", "children"),
+    ("exp33-calculator-compare-summary-body", "children"),
+    ("exp33-calculator-rank-body", "children"),
+    ("exp33-calculator-optimize-body", "children"),
+    ("exp33-calculator-sweep-body", "children"),
+    ("exp33-calculator-rotation-body", "children"),
+    ("exp33-calculator-rotation-plan-body", "children"),
+    ("exp33-calculator-compare-grid-body", "children"),
+)
+# Positions of the primary and compare result/summary bodies in
+# ``CalculatorResultPanels``; these are the outputs sent as patches.
+PATCHED_PANELS = (3, 4, 6, 7)
 class EvaluatedSkillView(TypedDict):
-    """Fully evaluated calculator state for one selected skill."""
+    """Fully evaluated calculator state for one selected skill.
+
+    The result and summary card bodies are kept as serialized component JSON,
+    which Dash sends as-is, so a cached view is never re-serialized.
+    """
 
     row: CalculatorRow
     affinity: AffinityDetails
@@ -74,9 +170,322 @@ class EvaluatedSkillView(TypedDict):
     skill_result: CalculationResult
     current_cost: str
     total_bonus_factor: float
+    result_body: Any
+    summary_body: Any
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def evaluate_skill_view(inputs: CalculatorInputs) -> EvaluatedSkillView:
+    """Evaluate and render one skill against a canonical calculator setup.
+
+    Views are cached per worker process, so the primary and compare panels,
+    toggling back to a previous setup, and visitors sharing the default build
+    reuse earlier work. Cached views and their components are shared between
+    requests and must be treated as read-only.
+
+    Args:
+        inputs: The canonical setup for the skill to evaluate.
+
+    Returns:
+        A fully evaluated payload containing the resolved row, affinity,
+        summaries, result, current AP cost, total multiplicative bonus, and the
+        serialized result and summary card bodies.
+    """
+
+    character = inputs.character
+    state = inputs.state.as_state()
+    row = get_row(character, inputs.skill)
+    affinity = resolve_affinity(row, inputs.affinity)
+    resolved_picto_attack_type = resolve_picto_attack_type(row, inputs.attack_type_override)
+    picto_state = {**thaw_mapping(inputs.picto_state), "attack_type": resolved_picto_attack_type}
+    weapon_state = {**thaw_mapping(inputs.weapon_state), "attack_type": resolved_picto_attack_type}
+
+    picto_summary = evaluate_pictos(list(inputs.pictos), picto_state)
+    weapon_summary = evaluate_weapon(character, inputs.weapon, inputs.weapon_level, row, weapon_state)
+    skill_result = evaluate_skill_result(
+        character,
+        row,
+        state,
+        weapon_summary["suppress_verso_rank_bonus"],
+    )
+    skill_result = apply_weapon_bonus(skill_result, weapon_summary)
+    skill_result = apply_picto_bonus(skill_result, picto_summary)
+    current_cost = calculate_current_cost(character, row, state)
+    total_bonus_factor = picto_summary["total_factor"] * weapon_summary["total_factor"]
+
+    return {
+        "row": row,
+        "affinity": affinity,
+        "picto_summary": picto_summary,
+        "weapon_summary": weapon_summary,
+        "skill_result": skill_result,
+        "current_cost": current_cost,
+        "total_bonus_factor": total_bonus_factor,
+        "result_body": component_json(
+            build_result_body(
+                character,
+                row,
+                inputs.attack,
+                current_cost,
+                skill_result,
+                picto_summary,
+                weapon_summary,
+                affinity,
+            )
+        ),
+        "summary_body": component_json(build_summary_body(row, inputs.attack, total_bonus_factor, affinity)),
+    }
+
+
+@lru_cache(maxsize=OVERVIEW_CACHE_SIZE)
+def render_comparison_overview(primary: CalculatorInputs, compare: CalculatorInputs) -> Any:
+    """Render the side-by-side overview of two skills under one setup.
+
+    Overviews are cached per worker process like the skill views they are
+    built from, and returned as serialized component JSON.
+
+    Args:
+        primary: The canonical setup of the primary skill.
+        compare: The canonical setup of the compare skill.
+
+    Returns:
+        The serialized comparison overview body.
+    """
+
+    primary_view = evaluate_skill_view(primary)
+    compare_view = evaluate_skill_view(compare)
+    return component_json(
+        build_comparison_overview(
+            primary_view["row"],
+            primary.attack,
+            primary_view["current_cost"],
+            primary_view["skill_result"],
+            primary_view["affinity"],
+            compare_view["row"],
+            compare.attack,
+            compare_view["current_cost"],
+            compare_view["skill_result"],
+            compare_view["affinity"],
+        )
+    )
+
+
+def setup_arguments(inputs: CalculatorInputs) -> tuple[Any, ...]:
+    """Return the shared-setup arguments the panel functions take, in order.
+
+    That is ``(state, pictos, picto_state, weapon, weapon_level,
+    weapon_state)``.
+    """
+
+    return (
+        inputs.state.as_state(),
+        list(inputs.pictos),
+        thaw_mapping(inputs.picto_state),
+        inputs.weapon,
+        inputs.weapon_level,
+        thaw_mapping(inputs.weapon_state),
+    )
+
+
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def render_ranking(inputs: CalculatorInputs) -> Any:
+    """Rank every skill under one setup, highlighting ``inputs.skill``."""
+
+    state, pictos, picto_state, weapon, weapon_level, weapon_state = setup_arguments(inputs)
+    rankings = rank_character_skills(
+        inputs.character,
+        state,
+        pictos,
+        picto_state,
+        weapon,
+        weapon_level,
+        weapon_state,
+        inputs.attack,
+        inputs.affinity,
+        inputs.attack_type_override,
+    )
+    return component_json(build_ranking_table(rankings, inputs.skill))
+
+
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def render_optimizer(
+    inputs: CalculatorInputs,
+    slot_budget: int,
+    search_weapons: bool,
+    skill_mix: tuple[str, ...] | None,
+) -> Any:
+    """Rank Picto loadouts for ``inputs.skill``, or whole builds for a skill mix.
+
+    Args:
+        inputs: The setup and primary skill. The Picto-only search does not
+            read ``attack``, so callers may zero it to share entries.
+        slot_budget: The clamped Picto/Lumina slot budget, at least ``1``.
+        search_weapons: Whether every weapon and unlock level is searched.
+        skill_mix: The available skills picked for the mix, or ``None`` when
+            no mix was picked.
+
+    Returns:
+        The serialized loadout table.
+    """
+
+    state, pictos, picto_state, weapon, weapon_level, weapon_state = setup_arguments(inputs)
+    if search_weapons or skill_mix is not None:
+        builds = optimize_builds(
+            inputs.character,
+            {name: 1.0 for name in skill_mix or ()} or {inputs.skill: 1.0},
+            state,
+            picto_state,
+            weapon_state,
+            inputs.attack,
+            slot_budget,
+            enemy_affinity=inputs.affinity,
+            attack_type_override=inputs.attack_type_override,
+            builds=None if search_weapons else [(weapon, weapon_level)],
+        )
+        return component_json(build_build_loadout_table(builds, weapon, weapon_level, pictos))
+
+    loadouts = optimize_pictos(
+        inputs.character,
+        get_row(inputs.character, inputs.skill),
+        state,
+        picto_state,
+        slot_budget,
+        weapon=weapon,
+        weapon_level=weapon_level,
+        weapon_state=weapon_state,
+        attack_type_override=inputs.attack_type_override,
+    )
+    return component_json(build_picto_loadout_table(loadouts, pictos))
+
+
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def render_sweep(inputs: CalculatorInputs, x_field: str, y_field: str | None) -> Any:
+    """Sweep ``inputs.skill`` over one or two state fields; ``attack`` is not read."""
+
+    state, pictos, picto_state, weapon, weapon_level, weapon_state = setup_arguments(inputs)
+    sweep = sweep_skill(
+        inputs.character,
+        get_row(inputs.character, inputs.skill),
+        state,
+        x_field,
+        y_field,
+        pictos,
+        picto_state,
+        weapon,
+        weapon_level,
+        weapon_state,
+        inputs.affinity,
+        inputs.attack_type_override,
+    )
+    return component_json(build_sweep_heatmap(inputs.character, sweep))
+
+
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def render_rotations(
+    inputs: CalculatorInputs,
+    rotations: tuple[tuple[str, ...], ...],
+    unknown: tuple[str, ...],
+    runs: int,
+    start_ap: int,
+    crit_rate: float | None,
+) -> Any:
+    """Simulate the parsed rotations under one setup; ``inputs.skill`` is not read."""
+
+    state, pictos, picto_state, weapon, weapon_level, weapon_state = setup_arguments(inputs)
+    results = []
+    if rotations:
+        results = simulate_rotations(
+            inputs.character,
+            [list(rotation) for rotation in rotations],
+            state,
+            pictos,
+            picto_state,
+            weapon,
+            weapon_level,
+            weapon_state,
+            inputs.attack,
+            inputs.affinity,
+            inputs.attack_type_override,
+            runs=runs,
+            start_ap=start_ap,
+            crit_rate=crit_rate,
+        )
+    return component_json(build_rotation_table(results, list(unknown), runs))
+
+
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def render_rotation_plan(inputs: CalculatorInputs, turns: int, start_ap: int, crit_rate: float | None) -> Any:
+    """Plan the highest-damage rotation under one setup; ``inputs.skill`` is not read."""
+
+    state, pictos, picto_state, weapon, weapon_level, weapon_state = setup_arguments(inputs)
+    plan = plan_rotation(
+        inputs.character,
+        turns,
+        state,
+        pictos,
+        picto_state,
+        weapon,
+        weapon_level,
+        weapon_state,
+        inputs.attack,
+        inputs.affinity,
+        inputs.attack_type_override,
+        start_ap=start_ap,
+        crit_rate=crit_rate,
+    )
+    return component_json(build_rotation_plan(plan))
+
 
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def render_skill_grid(inputs: CalculatorInputs, skills: tuple[str, ...]) -> Any:
+    """Compare ``skills`` side by side, highlighting ``inputs.skill``."""
 
-def imported_build(save_import: dict[str, Any] | None, character: str) -> dict[str, Any] | None:
+    state, pictos, picto_state, weapon, weapon_level, weapon_state = setup_arguments(inputs)
+    entries = compare_character_skills(
+        inputs.character,
+        list(skills),
+        state,
+        pictos,
+        picto_state,
+        weapon,
+        weapon_level,
+        weapon_state,
+        inputs.attack,
+        inputs.affinity,
+        inputs.attack_type_override,
+    )
+    return component_json(build_skill_comparison_grid(entries, inputs.skill))
+
+
+PANEL_RENDERERS = {
+    "ranking": render_ranking,
+    "optimizer": render_optimizer,
+    "sweep": render_sweep,
+    "rotations": render_rotations,
+    "rotation_plan": render_rotation_plan,
+    "skill_grid": render_skill_grid,
+}
+
+
+def view_cache_stats() -> CacheStats:
+    """Return this worker's skill-view cache counters for monitoring."""
+
+    return cache_stats(evaluate_skill_view)
+
+
+def overview_cache_stats() -> CacheStats:
+    """Return this worker's comparison-overview cache counters for monitoring."""
+
+    return cache_stats(render_comparison_overview)
+
+
+def panel_cache_stats() -> dict[str, CacheStats]:
+    """Return this worker's heavy-panel cache counters, by panel."""
+
+    return {name: cache_stats(renderer) for name, renderer in PANEL_RENDERERS.items()}
+
+
+def imported_build(save_import: SaveImportPayload | None, character: str) -> dict[str, Any] | None:
     """Return the imported build payload for one character when available."""
 
     if not isinstance(save_import, dict):
@@ -127,208 +536,6 @@ def build_import_summary(build: dict[str, Any], filename: str) -> ComponentChild
     ]
 
 
-def build_character_section_styles(active_character: str) -> tuple[list[str], CharacterStyles]:
-    """Build accordion state for the active character section.
-
-    Args:
-        active_character: The character id currently selected in the UI.
-
-    Returns:
-        A tuple containing the accordion item to open and the per-character
-        visibility styles for each setup section.
-    """
-
-    active_item = [f"setup-{active_character}"]
-    styles = {
-        character: VISIBLE_STYLE if character == active_character else HIDDEN_STYLE
-        for character in CALCULATOR_DATA
-    }
-    return active_item, styles
-
-
-def control_style(control_styles: ControlStyles, control: str) -> StyleRule:
-    """Read the visibility style for a single control.
-
-    Args:
-        control_styles: The full control-style mapping for the selected skill.
-        control: The logical control name to look up.
-
-    Returns:
-        The control's style rule, defaulting to the shared hidden style.
-    """
-
-    return control_styles.get(control, HIDDEN_STYLE)
-
-
-def merge_control_styles(*style_sets: ControlStyles) -> ControlStyles:
-    """Merge multiple control-style maps, keeping any visible control visible.
-
-    Args:
-        *style_sets: One or more control-style mappings to combine.
-
-    Returns:
-        A merged style map where a control remains visible if any input mapping
-        marks it visible.
-    """
-
-    merged: ControlStyles = {}
-    for style_set in style_sets:
-        for control, style in style_set.items():
-            if style == VISIBLE_STYLE:
-                merged[control] = VISIBLE_STYLE
-            elif control not in merged:
-                merged[control] = HIDDEN_STYLE
-    return merged
-
-
-def empty_state_style(control_styles: ControlStyles, prefix: str) -> StyleRule:
-    """Decide whether a character section should show its empty-state notice.
-
-    Args:
-        control_styles: The full control-style mapping for the selected skill.
-        prefix: The control-name prefix belonging to a single character section.
-
-    Returns:
-        The visible style when no controls in the section are shown, otherwise
-        the hidden style.
-    """
-
-    has_visible_control = any(
-        key.startswith(prefix) and value == VISIBLE_STYLE
-        for key, value in control_styles.items()
-    )
-    return HIDDEN_STYLE if has_visible_control else VISIBLE_STYLE
-
-
-def build_calculator_states(
-    gustave_charges: NumericInput,
-    lune_stains: NumericInput,
-    lune_earth_stains: NumericInput,
-    lune_fire_stains: NumericInput,
-    lune_ice_stains: NumericInput,
-    lune_lightning_stains: NumericInput,
-    lune_light_stains: NumericInput,
-    lune_turns: NumericInput,
-    lune_all_crits: ToggleInput,
-    maelle_stance: str | None,
-    maelle_burn_stacks: NumericInput,
-    maelle_hits_taken: NumericInput,
-    maelle_marked: ToggleInput,
-    maelle_all_crits: ToggleInput,
-    monoco_turns: NumericInput,
-    monoco_mask: ToggleInput,
-    monoco_stunned: ToggleInput,
-    monoco_marked: ToggleInput,
-    monoco_powerless: ToggleInput,
-    monoco_burning: ToggleInput,
-    monoco_low_life: ToggleInput,
-    monoco_full_life: ToggleInput,
-    monoco_all_crits: ToggleInput,
-    sciel_foretell: NumericInput,
-    sciel_twilight: ToggleInput,
-    sciel_full_life: ToggleInput,
-    verso_rank: str | None,
-    verso_shots: NumericInput,
-    verso_uses: NumericInput,
-    verso_stunned: ToggleInput,
-    verso_speed_bonus: ToggleInput,
-    verso_missing_health: NumericInput,
-) -> dict[str, CalculatorState]:
-    """Normalize raw callback inputs into per-character calculator state.
-
-    Args:
-        gustave_charges: Gustave's Overcharge count.
-        lune_stains: Lune's fallback active stain count.
-        lune_earth_stains: Lune's active Earth Stain count.
-        lune_fire_stains: Lune's active Fire Stain count.
-        lune_ice_stains: Lune's active Ice Stain count.
-        lune_lightning_stains: Lune's active Lightning Stain count.
-        lune_light_stains: Lune's active Light Stain count.
-        lune_turns: The number of turns elapsed for turn-based Lune skills.
-        lune_all_crits: Whether all relevant Lune hits crit.
-        maelle_stance: Maelle's current stance.
-        maelle_burn_stacks: Burn stacks consumed or referenced by Maelle skills.
-        maelle_hits_taken: Hits Maelle took in the previous round.
-        maelle_marked: Whether the target is marked for Maelle.
-        maelle_all_crits: Whether all relevant Maelle hits crit.
-        monoco_turns: Burn turns elapsed for Monoco skills.
-        monoco_mask: Whether Monoco's mask bonus is active.
-        monoco_stunned: Whether the target is stunned for Monoco.
-        monoco_marked: Whether the target is marked for Monoco.
-        monoco_powerless: Whether the target is powerless.
-        monoco_burning: Whether the target is burning.
-        monoco_low_life: Whether the target is at low life.
-        monoco_full_life: Whether the target is at full life.
-        monoco_all_crits: Whether all relevant Monoco hits crit.
-        sciel_foretell: Sciel's applied foretell count.
-        sciel_twilight: Whether Twilight is active for Sciel.
-        sciel_full_life: Whether Sciel is at full life.
-        verso_rank: Verso's current rank.
-        verso_shots: The number of stored shots for Follow Up.
-        verso_uses: The use count for repeat-use Verso skills.
-        verso_stunned: Whether Verso's target is stunned.
-        verso_speed_bonus: Whether Verso has the full speed bonus active.
-        verso_missing_health: Verso's missing HP percentage for Berserk Slash.
-
-    Returns:
-        A mapping of character ids to the normalized state dictionary expected
-        by the calculator logic.
-    """
-
-    lune_elemental_stains = {
-        "earth_stains": clamp_int(lune_earth_stains, 0, 4),
-        "fire_stains": clamp_int(lune_fire_stains, 0, 4),
-        "ice_stains": clamp_int(lune_ice_stains, 0, 4),
-        "lightning_stains": clamp_int(lune_lightning_stains, 0, 4),
-        "light_stains": clamp_int(lune_light_stains, 0, 4),
-    }
-    typed_lune_stains = sum(lune_elemental_stains.values())
-
-    return {
-        "gustave": {
-            "charges": gustave_charges,
-        },
-        "lune": {
-            "stains": min(4, typed_lune_stains) if typed_lune_stains > 0 else clamp_int(lune_stains, 0, 4),
-            "turns": lune_turns,
-            "all_crits": lune_all_crits,
-            **lune_elemental_stains,
-        },
-        "maelle": {
-            "stance": maelle_stance,
-            "burn_stacks": maelle_burn_stacks,
-            "hits_taken": maelle_hits_taken,
-            "marked": maelle_marked,
-            "all_crits": maelle_all_crits,
-            "turns": 3,
-        },
-        "monoco": {
-            "turns": monoco_turns,
-            "mask_active": monoco_mask,
-            "stunned": monoco_stunned,
-            "marked": monoco_marked,
-            "powerless": monoco_powerless,
-            "burning": monoco_burning,
-            "low_life": monoco_low_life,
-            "full_life": monoco_full_life,
-            "all_crits": monoco_all_crits,
-        },
-        "sciel": {
-            "foretell": sciel_foretell,
-            "twilight": sciel_twilight,
-            "full_life": sciel_full_life,
-        },
-        "verso": {
-            "rank": verso_rank,
-            "shots": verso_shots,
-            "uses": verso_uses,
-            "stunned": verso_stunned,
-            "speed_bonus": verso_speed_bonus,
-            "missing_health": verso_missing_health,
-        },
-    }
-
-
 def build_picto_state(
     resolved_attack_type: str,
     picto_below_10_health: ToggleInput,
@@ -454,50 +661,87 @@ def build_weapon_state(
     }
 
 
+@callback(
+    Output("exp33-calculator-save-import-job", "data"),
+    Input("exp33-calculator-save-upload-result", "data"),
+    prevent_initial_call=True,
+)
+def import_save_file(upload: dict[str, str] | None) -> str | Any:
+    """Start importing a save received by the upload route in a background job.
+
+    The browser posts the file to ``SAVE_UPLOAD_ROUTE`` itself, so this
+    callback only receives the upload token, or the route's error message.
+    It returns as soon as the job is recorded, or its process forked; the
+    browser polls the job id with ``refresh_import_job``.
+    """
+
+    if not upload:
+        return no_update
+    if "token" not in upload:
+        return fail_import_job(upload.get("error") or "Uploaded save could not be imported.")
+    return start_import_job(upload["token"])
+
+
 @callback(
     Output("exp33-calculator-save-import-store", "data"),
     Output("exp33-calculator-save-import-status", "children"),
     Output("exp33-calculator-save-import-status", "color"),
     Output("exp33-calculator-save-import-status", "is_open"),
     Output("exp33-calculator-character", "value"),
-    Input("exp33-calculator-save-upload", "contents"),
-    State("exp33-calculator-save-upload", "filename"),
+    Output("exp33-calculator-save-import-poll", "disabled"),
+    Output("exp33-calculator-save-import-progress", "style"),
+    Output("exp33-calculator-save-import-progress-bar", "value"),
+    Output("exp33-calculator-save-import-progress-bar", "label"),
+    Input("exp33-calculator-save-import-job", "data"),
+    Input("exp33-calculator-save-import-poll", "n_intervals"),
+    Input("exp33-calculator-save-import-cancel", "n_clicks"),
     State("exp33-calculator-character", "value"),
     prevent_initial_call=True,
 )
-def import_save_file(
-    contents: str | None,
-    filename: str | None,
+def refresh_import_job(
+    job_id: str | None,
+    n_intervals: int | None,
+    cancel_clicks: int | None,
     current_character: str | None,
-) -> tuple[dict[str, Any] | None, str | Any, str | Any, bool | Any, str | Any]:
-    """Parse an uploaded `.sav` file into calculator-ready state."""
+) -> tuple[Any, ...]:
+    """Show the progress of the background save import and apply its result.
 
-    if not contents:
-        return no_update, no_update, no_update, no_update, no_update
+    A cancel click stops the job before its status is read. Once the job
+    finishes, the browser store receives its import token and polling stops.
+    A failed or cancelled job leaves the store alone, so the previous import
+    stays applied.
+    """
 
-    try:
-        payload = parse_uploaded_save(contents, filename)
-    except SaveImportError as exc:
-        return None, str(exc), "danger", True, no_update
-    except Exception as exc:
-        logger.exception("Unexpected failure while importing uploaded save: {}", exc)
-        return None, "Uploaded save could not be imported.", "danger", True, no_update
+    ctx = callback_context
+    if ctx.triggered and ctx.triggered[0]["prop_id"].split(".")[0] == "exp33-calculator-save-import-cancel":
+        cancel_job(job_id)
+
+    status = load_job(job_id)
+    if status is None:
+        return no_update, no_update, no_update, no_update, no_update, True, HIDDEN_STYLE, 0, ""
+    if status["state"] == "running":
+        progress, label = IMPORT_STAGES[status["stage"]]
+        return no_update, no_update, no_update, False, no_update, False, VISIBLE_STYLE, progress, label
+    if status["state"] == "cancelled":
+        return no_update, status["message"], "secondary", True, no_update, True, HIDDEN_STYLE, 0, ""
+    if status["state"] == "failed":
+        return no_update, status["message"], "danger", True, no_update, True, HIDDEN_STYLE, 0, ""
 
     available_characters = [
         CHARACTER_META[character]["label"]
         for character in CALCULATOR_DATA
-        if character in payload["characters"]
+        if character in status["characters"]
     ]
     preferred_character = (
         current_character
-        if current_character in payload["characters"]
-        else payload["preferred_character"]
+        if current_character in status["characters"]
+        else status["preferred_character"]
     )
     message = (
-        f"Imported {payload['filename']} for {', '.join(available_characters)}. "
+        f"Imported {status['filename']} for {', '.join(available_characters)}. "
         "Attack Power still needs manual input."
     )
-    return payload, message, "info", True, preferred_character
+    return status["token"], message, "info", True, preferred_character, True, HIDDEN_STYLE, 1, ""
 
 
 @callback(
@@ -505,14 +749,16 @@ def import_save_file(
     Output("exp33-calculator-save-summary-body", "children"),
     Input("exp33-calculator-character", "value"),
     Input("exp33-calculator-save-import-store", "data"),
+    prevent_initial_call=True,
 )
 def update_import_summary(
     character: str | None,
-    save_import: dict[str, Any] | None,
+    import_token: str | None,
 ) -> tuple[StyleRule, ComponentChildren]:
     """Show the imported build summary for the active character."""
 
     selected_character = character or DEFAULT_CHARACTER
+    save_import = load_import(import_token)
     build = imported_build(save_import, selected_character)
     if not build:
         return HIDDEN_STYLE, []
@@ -531,34 +777,43 @@ def update_import_summary(
     Output("exp33-calculator-compare-skill", "options"),
     Output("exp33-calculator-compare-skill", "value"),
     Output("exp33-calculator-attack", "value"),
+    Output("exp33-calculator-optimize-skills", "options"),
+    Output("exp33-calculator-optimize-skills", "value"),
+    Output("exp33-calculator-compare-skills", "options"),
+    Output("exp33-calculator-compare-skills", "value"),
     Input("exp33-calculator-character", "value"),
     Input("exp33-calculator-save-import-store", "data"),
+    prevent_initial_call=True,
 )
 def update_skill_dropdown(
     character: str | None,
-    save_import: dict[str, Any] | None,
+    import_token: str | None,
 ) -> SkillDropdownUpdate:
     """Refresh the skill dropdown and default attack when the character changes.
 
     Args:
         character: The selected calculator character id.
-        save_import: Optional imported build data from an uploaded save.
+        import_token: The import-store token of an uploaded save, if any.
 
     Returns:
         A tuple of ``(primary_options, primary_skill, compare_options,
-        compare_skill, default_attack)`` for the newly selected character.
-        The compare skill resets to ``None`` so stale selections do not carry
-        across characters.
+        compare_skill, default_attack, optimize_options, optimize_skills,
+        compare_grid_options, compare_grid_skills)`` for the newly selected
+        character. The compare skill, optimizer skill mix, and compared skills
+        reset so stale selections do not carry across characters; an imported
+        build seeds the skill mix and the compared skills with its equipped
+        skills.
     """
 
     selected_character = character or DEFAULT_CHARACTER
     options = skill_options_for(selected_character)
     default_skill = DEFAULT_SKILLS.get(selected_character, options[0]["value"])
     compare_skill = None
+    optimize_skills: list[str] = []
     if default_skill not in {option["value"] for option in options}:
         default_skill = options[0]["value"]
     attack = CALCULATOR_DATA[selected_character]["default_attack"]
-    build = imported_build(save_import, selected_character)
+    build = imported_build(load_import(import_token), selected_character)
     if build:
         option_values = {option["value"] for option in options}
         matched_skills = [
@@ -568,12 +823,13 @@ def update_skill_dropdown(
         ]
         if matched_skills:
             default_skill = matched_skills[0]
+            optimize_skills = matched_skills
         if len(matched_skills) > 1:
             compare_skill = next(
                 (skill for skill in matched_skills[1:] if skill != default_skill),
                 None,
             )
-    return options, default_skill, options, compare_skill, attack
+    return options, default_skill, options, compare_skill, attack, options, optimize_skills, options, optimize_skills
 
 
 @callback(
@@ -582,16 +838,17 @@ def update_skill_dropdown(
     Output("exp33-calculator-weapon-level", "value"),
     Input("exp33-calculator-character", "value"),
     Input("exp33-calculator-save-import-store", "data"),
+    prevent_initial_call=True,
 )
 def update_weapon_dropdown(
     character: str | None,
-    save_import: dict[str, Any] | None,
+    import_token: str | None,
 ) -> tuple[list[SkillOption], str | None, str]:
     """Refresh the weapon dropdown when the character changes.
 
     Args:
         character: The selected calculator character id.
-        save_import: Optional imported build data from an uploaded save.
+        import_token: The import-store token of an uploaded save, if any.
 
     Returns:
         A tuple of ``(options, selected_weapon, selected_level)`` for the
@@ -600,7 +857,7 @@ def update_weapon_dropdown(
 
     selected_character = character or DEFAULT_CHARACTER
     options = weapon_options_for(selected_character)
-    build = imported_build(save_import, selected_character)
+    build = imported_build(load_import(import_token), selected_character)
     if not build:
         return options, None, "20"
 
@@ -613,353 +870,166 @@ def update_weapon_dropdown(
     return options, selected_weapon, selected_level
 
 
+@callback(
+    Output("exp33-calculator-sweep-x", "data"),
+    Output("exp33-calculator-sweep-x", "value"),
+    Output("exp33-calculator-sweep-y", "data"),
+    Output("exp33-calculator-sweep-y", "value"),
+    Input("exp33-calculator-character", "value"),
+    prevent_initial_call=True,
+)
+def update_sweep_fields(character: str | None) -> tuple[list[dict[str, str]], None, list[dict[str, str]], None]:
+    """Refresh the sweepable setup fields when the character changes."""
+
+    options = sweep_field_options(character or DEFAULT_CHARACTER)
+    return options, None, options, None
+
+
 @callback(
     Output("exp33-calculator-pictos", "value"),
     Input("exp33-calculator-character", "value"),
     Input("exp33-calculator-save-import-store", "data"),
+    prevent_initial_call=True,
 )
 def update_imported_pictos(
     character: str | None,
-    save_import: dict[str, Any] | None,
+    import_token: str | None,
 ) -> list[str]:
     """Prefill equipped lumina from the imported save when available."""
 
     selected_character = character or DEFAULT_CHARACTER
-    build = imported_build(save_import, selected_character)
+    build = imported_build(load_import(import_token), selected_character)
     if not build:
         return []
     return [str(name) for name in build.get("equipped_pictos", [])]
 
 
-@callback(
+clientside_callback(
+    ClientsideFunction(namespace="exp33Calculator", function_name="syncVisibleControls"),
     Output("exp33-calculator-character-accordion", "active_item"),
-    Output("exp33-calculator-item-gustave", "style"),
-    Output("exp33-calculator-item-lune", "style"),
-    Output("exp33-calculator-item-maelle", "style"),
-    Output("exp33-calculator-item-monoco", "style"),
-    Output("exp33-calculator-item-sciel", "style"),
-    Output("exp33-calculator-item-verso", "style"),
-    Output("exp33-calculator-control-gustave-charges", "style"),
-    Output("exp33-calculator-control-lune-stains", "style"),
-    Output("exp33-calculator-control-lune-earth-stains", "style"),
-    Output("exp33-calculator-control-lune-fire-stains", "style"),
-    Output("exp33-calculator-control-lune-ice-stains", "style"),
-    Output("exp33-calculator-control-lune-lightning-stains", "style"),
-    Output("exp33-calculator-control-lune-light-stains", "style"),
-    Output("exp33-calculator-control-lune-turns", "style"),
-    Output("exp33-calculator-control-lune-all-crits", "style"),
-    Output("exp33-calculator-control-maelle-stance", "style"),
-    Output("exp33-calculator-control-maelle-burn-stacks", "style"),
-    Output("exp33-calculator-control-maelle-hits-taken", "style"),
-    Output("exp33-calculator-control-maelle-marked", "style"),
-    Output("exp33-calculator-control-maelle-all-crits", "style"),
-    Output("exp33-calculator-control-monoco-turns", "style"),
-    Output("exp33-calculator-control-monoco-mask", "style"),
-    Output("exp33-calculator-control-monoco-stunned", "style"),
-    Output("exp33-calculator-control-monoco-marked", "style"),
-    Output("exp33-calculator-control-monoco-powerless", "style"),
-    Output("exp33-calculator-control-monoco-burning", "style"),
-    Output("exp33-calculator-control-monoco-low-life", "style"),
-    Output("exp33-calculator-control-monoco-full-life", "style"),
-    Output("exp33-calculator-control-monoco-all-crits", "style"),
-    Output("exp33-calculator-empty-gustave", "style"),
-    Output("exp33-calculator-empty-lune", "style"),
-    Output("exp33-calculator-empty-maelle", "style"),
-    Output("exp33-calculator-empty-monoco", "style"),
-    Output("exp33-calculator-empty-sciel", "style"),
-    Output("exp33-calculator-empty-verso", "style"),
-    Output("exp33-calculator-control-sciel-foretell", "style"),
-    Output("exp33-calculator-control-sciel-twilight", "style"),
-    Output("exp33-calculator-control-sciel-full-life", "style"),
-    Output("exp33-calculator-control-verso-rank", "style"),
-    Output("exp33-calculator-control-verso-shots", "style"),
-    Output("exp33-calculator-control-verso-uses", "style"),
-    Output("exp33-calculator-control-verso-stunned", "style"),
-    Output("exp33-calculator-control-verso-speed-bonus", "style"),
-    Output("exp33-calculator-control-verso-missing-health", "style"),
+    *[Output(f"exp33-calculator-item-{character}", "style") for character in CALCULATOR_DATA],
+    *[
+        Output(character_control_wrapper_id(control), "style")
+        for controls in CHARACTER_CONTROLS.values()
+        for control in controls
+    ],
+    *[Output(f"exp33-calculator-empty-{character}", "style") for character in CALCULATOR_DATA],
     Input("exp33-calculator-character", "value"),
     Input("exp33-calculator-skill", "value"),
     Input("exp33-calculator-compare-skill", "value"),
     Input("exp33-calculator-weapon", "value"),
     Input("exp33-calculator-weapon-level", "value"),
+    State("exp33-calculator-visibility-map", "data"),
+    prevent_initial_call=True,
 )
-def sync_visible_controls(
-    character: str | None,
-    skill: str | None,
-    compare_skill: str | None,
-    weapon: str | None,
-    weapon_level: str | None,
-) -> VisibleControlsUpdate:
-    """Show only the setup controls relevant to the selected skills.
 
-    Args:
-        character: The selected calculator character id.
-        skill: The currently selected skill name.
-        compare_skill: The optional secondary skill used for comparison.
-        weapon: The currently selected weapon name, if any.
-        weapon_level: The selected weapon unlock level.
-
-    Returns:
-        A Dash callback tuple containing the active accordion item plus the
-        visibility styles for every character setup section and control wrapper.
-        When a compare skill is active, controls required by either selected
-        skill stay visible.
-    """
-
-    active_character = character or DEFAULT_CHARACTER
-    available_skills = {option["value"] for option in skill_options_for(active_character)}
-    active_compare_skill = compare_skill if compare_skill in available_skills else None
-    active_item, styles = build_character_section_styles(active_character)
-    primary_row = get_row(active_character, skill)
-    style_sets = [build_skill_control_styles(active_character, primary_row)]
-    if active_compare_skill:
-        compare_row = get_row(active_character, active_compare_skill)
-        style_sets.append(build_skill_control_styles(active_character, compare_row))
-
-    control_styles = merge_control_styles(*style_sets)
-    for control in required_weapon_character_controls(active_character, weapon, weapon_level):
-        control_styles[control] = VISIBLE_STYLE
-
-    return (
-        active_item,
-        styles["gustave"],
-        styles["lune"],
-        styles["maelle"],
-        styles["monoco"],
-        styles["sciel"],
-        styles["verso"],
-        control_style(control_styles, "gustave_charges"),
-        control_style(control_styles, "lune_stains"),
-        control_style(control_styles, "lune_earth_stains"),
-        control_style(control_styles, "lune_fire_stains"),
-        control_style(control_styles, "lune_ice_stains"),
-        control_style(control_styles, "lune_lightning_stains"),
-        control_style(control_styles, "lune_light_stains"),
-        control_style(control_styles, "lune_turns"),
-        control_style(control_styles, "lune_all_crits"),
-        control_style(control_styles, "maelle_stance"),
-        control_style(control_styles, "maelle_burn_stacks"),
-        control_style(control_styles, "maelle_hits_taken"),
-        control_style(control_styles, "maelle_marked"),
-        control_style(control_styles, "maelle_all_crits"),
-        control_style(control_styles, "monoco_turns"),
-        control_style(control_styles, "monoco_mask"),
-        control_style(control_styles, "monoco_stunned"),
-        control_style(control_styles, "monoco_marked"),
-        control_style(control_styles, "monoco_powerless"),
-        control_style(control_styles, "monoco_burning"),
-        control_style(control_styles, "monoco_low_life"),
-        control_style(control_styles, "monoco_full_life"),
-        control_style(control_styles, "monoco_all_crits"),
-        empty_state_style(control_styles, "gustave"),
-        empty_state_style(control_styles, "lune"),
-        empty_state_style(control_styles, "maelle"),
-        empty_state_style(control_styles, "monoco"),
-        empty_state_style(control_styles, "sciel"),
-        empty_state_style(control_styles, "verso"),
-        control_style(control_styles, "sciel_foretell"),
-        control_style(control_styles, "sciel_twilight"),
-        control_style(control_styles, "sciel_full_life"),
-        control_style(control_styles, "verso_rank"),
-        control_style(control_styles, "verso_shots"),
-        control_style(control_styles, "verso_uses"),
-        control_style(control_styles, "verso_stunned"),
-        control_style(control_styles, "verso_speed_bonus"),
-        control_style(control_styles, "verso_missing_health"),
-    )
-
-
-@callback(
+clientside_callback(
+    ClientsideFunction(namespace="exp33Calculator", function_name="syncVisibleBonusControls"),
     Output("exp33-calculator-control-weapon-level", "style"),
     Output("exp33-calculator-pictos-collapse", "is_open"),
-    Output("exp33-calculator-picto-control-attack-type", "style"),
-    Output("exp33-calculator-picto-control-below-10-health", "style"),
-    Output("exp33-calculator-picto-control-target-burning", "style"),
-    Output("exp33-calculator-picto-control-target-stunned", "style"),
-    Output("exp33-calculator-picto-control-exhausted", "style"),
-    Output("exp33-calculator-picto-control-full-health", "style"),
-    Output("exp33-calculator-picto-control-unhit", "style"),
-    Output("exp33-calculator-picto-control-inverted", "style"),
-    Output("exp33-calculator-picto-control-consume-ap", "style"),
-    Output("exp33-calculator-picto-control-shield-points", "style"),
-    Output("exp33-calculator-picto-control-fighting-alone", "style"),
-    Output("exp33-calculator-picto-control-all-allies-alive", "style"),
-    Output("exp33-calculator-picto-control-status-effects", "style"),
-    Output("exp33-calculator-picto-control-dodge-stacks", "style"),
-    Output("exp33-calculator-picto-control-parry-stacks", "style"),
-    Output("exp33-calculator-picto-control-warming-up-stacks", "style"),
-    Output("exp33-calculator-picto-control-first-hit", "style"),
-    Output("exp33-calculator-weapon-control-unhit-turns", "style"),
-    Output("exp33-calculator-weapon-control-stain-consume-stacks", "style"),
-    Output("exp33-calculator-weapon-control-light-stains", "style"),
-    Output("exp33-calculator-weapon-control-dark-stains", "style"),
-    Output("exp33-calculator-weapon-control-self-burn-stacks", "style"),
-    Output("exp33-calculator-weapon-control-moon-charges", "style"),
-    Output("exp33-calculator-weapon-control-cursed", "style"),
-    Output("exp33-calculator-weapon-control-ap-consumed", "style"),
-    Output("exp33-calculator-weapon-control-critical-hit", "style"),
-    Output("exp33-calculator-weapon-control-monoco-mask-type", "style"),
+    *[Output(picto_control_wrapper_id(control), "style") for control in PICTO_CONTROLS],
+    *[Output(weapon_control_wrapper_id(control), "style") for control in WEAPON_CONTROLS],
     Output("exp33-calculator-bonus-empty", "style"),
     Input("exp33-calculator-character", "value"),
     Input("exp33-calculator-pictos", "value"),
     Input("exp33-calculator-weapon", "value"),
     Input("exp33-calculator-weapon-level", "value"),
+    State("exp33-calculator-visibility-map", "data"),
+    prevent_initial_call=True,
 )
-def sync_visible_bonus_controls(
-    character: str | None,
-    pictos: list[str] | None,
-    weapon: str | None,
-    weapon_level: str | None,
-) -> tuple[Any, ...]:
-    """Show only the bonus-setup controls required by the current selection.
 
-    Args:
-        character: The selected calculator character id.
-        pictos: The selected Picto names from the multi-select.
-        weapon: The currently selected weapon name, if any.
-        weapon_level: The selected weapon unlock level.
+# Folds every control into the state store without a server round trip. Only
+# values that differ from the page defaults are kept, and an unchanged diff
+# leaves the store alone so the result callback does not fire. Each change
+# also gets a new request ticket for coalescing.
+clientside_callback(
+    ClientsideFunction(namespace="exp33Calculator", function_name="syncCalculatorState"),
+    Output(CALCULATOR_STATE_ID, "data"),
+    Output(REQUEST_TICKET_ID, "data"),
+    [Input(component_id, prop) for component_id, prop in CALCULATOR_CONTROLS],
+    State(CONTROL_DEFAULTS_ID, "data"),
+    State(CALCULATOR_STATE_ID, "data"),
+    prevent_initial_call=True,
+)
 
-    Returns:
-        A Dash callback tuple containing the collapse state and visibility
-        styles for each Picto and weapon setup control.
-    """
 
-    selected_character = character or DEFAULT_CHARACTER
-    required_controls = required_picto_controls(pictos) | required_weapon_controls(
-        selected_character,
-        weapon,
-        normalize_weapon_level(weapon_level),
-    )
-    has_selection = bool(pictos) or bool(weapon)
+def patched_bodies(panels: CalculatorResultPanels | list[Any]) -> list[Any]:
+    """Return the serialized result-card bodies that are sent as patches."""
+
+    return [panels[index] for index in PATCHED_PANELS]
 
-    def style_for(control: str) -> StyleRule:
-        """Return the visible style only for required Picto controls.
 
-        Args:
-            control: The logical Picto control name to inspect.
+@callback(
+    *[Output(component_id, prop) for component_id, prop in RESULT_OUTPUTS],
+    Output(RENDERED_VIEWS_ID, "data"),
+    Input(CALCULATOR_STATE_ID, "data"),
+    State(RENDERED_VIEWS_ID, "data"),
+    State(REQUEST_TICKET_ID, "data"),
+    prevent_initial_call=True,
+)
+def update_calculator_result(
+    calculator_state: CalculatorControls | None,
+    rendered_views: RenderedViews | None,
+    request_ticket: RequestTicket | None,
+) -> tuple[Any, ...]:
+    """Render every result panel from the consolidated control state.
 
-        Returns:
-            The visible style when the control is required, otherwise the hidden
-            style.
-        """
+    The result-card bodies are sent as ``dash.Patch`` diffs against the
+    bodies the browser already shows. Those are looked up by the digest in
+    ``rendered_views`` among the bodies this worker sent recently; when they
+    are not found, the full bodies are sent.
 
-        return VISIBLE_STYLE if control in required_controls else HIDDEN_STYLE
+    Requests that a newer change from the same page has replaced are dropped
+    with ``PreventUpdate``: before rendering, between the heavier panels, and
+    before the response is built.
 
-    return (
-        VISIBLE_STYLE if weapon else HIDDEN_STYLE,
-        has_selection,
-        style_for("attack_type"),
-        style_for("below_10_health"),
-        style_for("target_burning"),
-        style_for("target_stunned"),
-        style_for("exhausted"),
-        style_for("full_health"),
-        style_for("unhit"),
-        style_for("inverted"),
-        style_for("consume_ap"),
-        style_for("shield_points"),
-        style_for("fighting_alone"),
-        style_for("all_allies_alive"),
-        style_for("status_effects"),
-        style_for("dodge_stacks"),
-        style_for("parry_stacks"),
-        style_for("warming_up_stacks"),
-        style_for("first_hit"),
-        style_for("unhit_turns"),
-        style_for("stain_consume_stacks"),
-        style_for("light_stains"),
-        style_for("dark_stains"),
-        style_for("self_burn_stacks"),
-        style_for("moon_charges"),
-        style_for("cursed"),
-        style_for("ap_consumed"),
-        style_for("critical_hit"),
-        style_for("monoco_mask_type"),
-        VISIBLE_STYLE if has_selection and not required_controls else HIDDEN_STYLE,
+    Args:
+        calculator_state: The controls that differ from the page defaults,
+            keyed by ``control_key``.
+        rendered_views: The digest of the bodies on screen, or
+            ``None`` before the first render.
+        request_ticket: The page session and sequence number of this change.
+
+    Returns:
+        The panels returned by ``render_calculator_result``, with patched
+        bodies, followed by the new ``rendered_views`` record.
+    """
+
+    if not claim_request(request_ticket):
+        raise PreventUpdate
+    panels = list(
+        render_calculator_result(
+            **resolve_controls(calculator_state, CONTROL_DEFAULTS),
+            superseded=lambda: is_superseded(request_ticket),
+        )
     )
+    if is_superseded(request_ticket):
+        raise PreventUpdate
+    bodies = patched_bodies(panels)
+    if PATCH_RESULT_VIEWS:
+        for index, output in zip(PATCHED_PANELS, patch_bodies(recall_bodies(rendered_views), bodies)):
+            panels[index] = output
 
+    rendered: RenderedViews = {"digest": remember_bodies(bodies)}
+    return (*panels, rendered)
 
-@callback(
-    Output("exp33-calculator-compare-overview-card", "style"),
-    Output("exp33-calculator-compare-overview-body", "children"),
-    Output("exp33-calculator-primary-column", "lg"),
-    Output("exp33-calculator-result-body", "children"),
-    Output("exp33-calculator-summary-body", "children"),
-    Output("exp33-calculator-compare-column", "style"),
-    Output("exp33-calculator-compare-result-body", "children"),
-    Output("exp33-calculator-compare-summary-body", "children"),
-    Input("exp33-calculator-character", "value"),
-    Input("exp33-calculator-skill", "value"),
-    Input("exp33-calculator-compare-skill", "value"),
-    Input("exp33-calculator-attack", "value"),
-    Input("exp33-calculator-enemy-affinity", "value"),
-    Input("exp33-calculator-weapon", "value"),
-    Input("exp33-calculator-weapon-level", "value"),
-    Input("exp33-calculator-pictos", "value"),
-    Input("exp33-calculator-picto-attack-type", "value"),
-    Input("exp33-calculator-picto-below-10-health", "checked"),
-    Input("exp33-calculator-picto-target-burning", "checked"),
-    Input("exp33-calculator-picto-target-stunned", "checked"),
-    Input("exp33-calculator-picto-exhausted", "checked"),
-    Input("exp33-calculator-picto-full-health", "checked"),
-    Input("exp33-calculator-picto-unhit", "checked"),
-    Input("exp33-calculator-picto-inverted", "checked"),
-    Input("exp33-calculator-picto-consume-ap", "checked"),
-    Input("exp33-calculator-picto-shield-points", "value"),
-    Input("exp33-calculator-picto-fighting-alone", "checked"),
-    Input("exp33-calculator-picto-all-allies-alive", "checked"),
-    Input("exp33-calculator-picto-status-effects", "value"),
-    Input("exp33-calculator-picto-dodge-stacks", "value"),
-    Input("exp33-calculator-picto-parry-stacks", "value"),
-    Input("exp33-calculator-picto-warming-up-stacks", "value"),
-    Input("exp33-calculator-picto-first-hit", "checked"),
-    Input("exp33-calculator-weapon-unhit-turns", "value"),
-    Input("exp33-calculator-weapon-stain-consume-stacks", "value"),
-    Input("exp33-calculator-weapon-light-stains", "value"),
-    Input("exp33-calculator-weapon-dark-stains", "value"),
-    Input("exp33-calculator-weapon-self-burn-stacks", "value"),
-    Input("exp33-calculator-weapon-moon-charges", "value"),
-    Input("exp33-calculator-weapon-cursed", "checked"),
-    Input("exp33-calculator-weapon-ap-consumed", "value"),
-    Input("exp33-calculator-weapon-critical-hit", "checked"),
-    Input("exp33-calculator-weapon-monoco-mask-type", "value"),
-    Input("exp33-calculator-gustave-charges", "value"),
-    Input("exp33-calculator-lune-stains", "value"),
-    Input("exp33-calculator-lune-earth-stains", "value"),
-    Input("exp33-calculator-lune-fire-stains", "value"),
-    Input("exp33-calculator-lune-ice-stains", "value"),
-    Input("exp33-calculator-lune-lightning-stains", "value"),
-    Input("exp33-calculator-lune-light-stains", "value"),
-    Input("exp33-calculator-lune-turns", "value"),
-    Input("exp33-calculator-lune-all-crits", "checked"),
-    Input("exp33-calculator-maelle-stance", "value"),
-    Input("exp33-calculator-maelle-burn-stacks", "value"),
-    Input("exp33-calculator-maelle-hits-taken", "value"),
-    Input("exp33-calculator-maelle-marked", "checked"),
-    Input("exp33-calculator-maelle-all-crits", "checked"),
-    Input("exp33-calculator-monoco-turns", "value"),
-    Input("exp33-calculator-monoco-mask", "checked"),
-    Input("exp33-calculator-monoco-stunned", "checked"),
-    Input("exp33-calculator-monoco-marked", "checked"),
-    Input("exp33-calculator-monoco-powerless", "checked"),
-    Input("exp33-calculator-monoco-burning", "checked"),
-    Input("exp33-calculator-monoco-low-life", "checked"),
-    Input("exp33-calculator-monoco-full-life", "checked"),
-    Input("exp33-calculator-monoco-all-crits", "checked"),
-    Input("exp33-calculator-sciel-foretell", "value"),
-    Input("exp33-calculator-sciel-twilight", "checked"),
-    Input("exp33-calculator-sciel-full-life", "checked"),
-    Input("exp33-calculator-verso-rank", "value"),
-    Input("exp33-calculator-verso-shots", "value"),
-    Input("exp33-calculator-verso-uses", "value"),
-    Input("exp33-calculator-verso-stunned", "checked"),
-    Input("exp33-calculator-verso-speed-bonus", "checked"),
-    Input("exp33-calculator-verso-missing-health", "value"),
-)
-def update_calculator_result(
+
+def render_calculator_result(
     character: str | None,
     skill: str | None,
     compare_skill: str | None,
+    compare_skills: list[str] | None,
+    rank_all: ToggleInput,
+    optimize_slots: NumericInput,
+    optimize_weapons: ToggleInput,
+    optimize_skills: list[str] | None,
+    sweep_x: str | None,
+    sweep_y: str | None,
+    rotation_skills: str | None,
+    rotation_runs: NumericInput,
+    rotation_start_ap: NumericInput,
+    rotation_crit_rate: NumericInput,
+    rotation_plan_turns: NumericInput,
     attack: NumericInput,
     enemy_affinity: str | None,
     weapon: str | None,
@@ -1024,6 +1094,7 @@ def update_calculator_result(
     verso_stunned: ToggleInput,
     verso_speed_bonus: ToggleInput,
     verso_missing_health: NumericInput,
+    superseded: Callable[[], bool] | None = None,
 ) -> CalculatorResultPanels:
     """Recalculate the selected skill and rebuild the calculator panels.
 
@@ -1031,6 +1102,25 @@ def update_calculator_result(
         character: The selected calculator character id.
         skill: The currently selected skill name.
         compare_skill: The optional secondary skill used for side-by-side comparison.
+        compare_skills: The skills shown together in the comparison grid.
+        rank_all: Whether to evaluate and rank every skill for the current setup.
+        optimize_slots: The Picto/Lumina slot budget for the optimizer, or
+            ``0`` to skip it.
+        optimize_weapons: Whether the optimizer also searches every weapon
+            and unlock level.
+        optimize_skills: The optional skill mix the optimizer ranks builds
+            for instead of the primary skill alone.
+        sweep_x: The setup field swept along the heatmap columns, or
+            ``None`` to skip the sweep.
+        sweep_y: The optional setup field swept along the heatmap rows.
+        rotation_skills: Rotations to simulate, one comma-separated skill
+            list per line.
+        rotation_runs: Simulated runs per rotation.
+        rotation_start_ap: AP available on each rotation's first turn.
+        rotation_crit_rate: Per-hit crit chance in percent, or empty to keep
+            the setup's all-crits toggles.
+        rotation_plan_turns: Turns to plan the highest-damage rotation
+            over, or empty or zero to skip planning.
         attack: The raw attack power input.
         enemy_affinity: The selected enemy elemental affinity modifier.
         weapon: The selected weapon name.
@@ -1095,14 +1185,24 @@ def update_calculator_result(
         verso_stunned: Whether Verso's target is stunned.
         verso_speed_bonus: Whether Verso has the full speed bonus active.
         verso_missing_health: Verso's missing HP percentage for Berserk Slash.
+        superseded: Optional check run before each of the heavier panels;
+            when it returns ``True`` rendering stops with ``PreventUpdate``.
 
     Returns:
         A tuple containing:
         ``(compare_overview_style, compare_overview_body, primary_width,
         primary_result_body, primary_summary_body, compare_column_style,
-        compare_result_body, compare_summary_body)``.
+        compare_result_body, compare_summary_body, rank_body,
+        optimize_body, sweep_body, rotation_body, plan_body,
+        compare_grid_body)``.
         When no compare skill is selected, the compare overview and compare
-        column outputs are hidden and their bodies are empty.
+        column outputs are hidden and their bodies are empty. The rank body is
+        empty unless ranking is switched on, the optimize body is empty
+        unless a slot budget is set, the sweep body is empty unless a
+        sweep field is selected, the rotation body is empty unless a
+        rotation is entered, the plan body is empty unless a plan
+        length is set, and the compare grid is empty unless skills are
+        picked for it.
     """
 
     selected_character = character or DEFAULT_CHARACTER
@@ -1111,131 +1211,176 @@ def update_calculator_result(
     attack_value = parse_number(attack) or CALCULATOR_DATA[selected_character]["default_attack"]
     normalized_enemy_affinity = normalize_affinity(enemy_affinity)
 
-    states = build_calculator_states(
-        gustave_charges,
-        lune_stains,
-        lune_earth_stains,
-        lune_fire_stains,
-        lune_ice_stains,
-        lune_lightning_stains,
-        lune_light_stains,
-        lune_turns,
-        lune_all_crits,
-        maelle_stance,
-        maelle_burn_stacks,
-        maelle_hits_taken,
-        maelle_marked,
-        maelle_all_crits,
-        monoco_turns,
-        monoco_mask,
-        monoco_stunned,
-        monoco_marked,
-        monoco_powerless,
-        monoco_burning,
-        monoco_low_life,
-        monoco_full_life,
-        monoco_all_crits,
+    character_state = build_character_state(
+        selected_character,
+        {
+            "gustave_charges": gustave_charges,
+            "lune_stains": lune_stains,
+            "lune_earth_stains": lune_earth_stains,
+            "lune_fire_stains": lune_fire_stains,
+            "lune_ice_stains": lune_ice_stains,
+            "lune_lightning_stains": lune_lightning_stains,
+            "lune_light_stains": lune_light_stains,
+            "lune_turns": lune_turns,
+            "lune_all_crits": lune_all_crits,
+            "maelle_stance": maelle_stance,
+            "maelle_burn_stacks": maelle_burn_stacks,
+            "maelle_hits_taken": maelle_hits_taken,
+            "maelle_marked": maelle_marked,
+            "maelle_all_crits": maelle_all_crits,
+            "monoco_turns": monoco_turns,
+            "monoco_mask": monoco_mask,
+            "monoco_stunned": monoco_stunned,
+            "monoco_marked": monoco_marked,
+            "monoco_powerless": monoco_powerless,
+            "monoco_burning": monoco_burning,
+            "monoco_low_life": monoco_low_life,
+            "monoco_full_life": monoco_full_life,
+            "monoco_all_crits": monoco_all_crits,
+            "sciel_foretell": sciel_foretell,
+            "sciel_twilight": sciel_twilight,
+            "sciel_full_life": sciel_full_life,
+            "verso_rank": verso_rank,
+            "verso_shots": verso_shots,
+            "verso_uses": verso_uses,
+            "verso_stunned": verso_stunned,
+            "verso_speed_bonus": verso_speed_bonus,
+            "verso_missing_health": verso_missing_health,
+        },
+    )
+    selected_state = character_state.as_state()
+
+    shared_picto_state = build_picto_state(
+        "Skill",
+        picto_below_10_health,
+        picto_target_burning,
+        picto_target_stunned,
+        picto_exhausted,
+        picto_full_health,
+        picto_unhit,
+        picto_inverted,
+        picto_consume_ap,
+        picto_shield_points,
+        picto_fighting_alone,
+        picto_all_allies_alive,
+        picto_status_effects,
+        picto_dodge_stacks,
+        picto_parry_stacks,
+        picto_warming_up_stacks,
+        picto_first_hit,
+    )
+    shared_weapon_state = build_weapon_state(
+        "Skill",
+        picto_shield_points,
+        weapon_unhit_turns,
+        weapon_stain_consume_stacks,
+        weapon_light_stains,
+        weapon_dark_stains,
+        weapon_self_burn_stacks,
         sciel_foretell,
         sciel_twilight,
-        sciel_full_life,
+        weapon_moon_charges,
+        weapon_cursed,
+        weapon_ap_consumed,
+        weapon_critical_hit,
+        weapon_monoco_mask_type,
         verso_rank,
-        verso_shots,
-        verso_uses,
-        verso_stunned,
-        verso_speed_bonus,
-        verso_missing_health,
     )
 
-    def evaluate_skill_view(selected_skill: str | None) -> EvaluatedSkillView:
-        """Evaluate one selected skill against the shared calculator state.
-
-        Args:
-            selected_skill: The skill to resolve for the active character.
-
-        Returns:
-            A fully evaluated payload containing the resolved row, affinity,
-            summaries, result, current AP cost, and total multiplicative bonus.
-        """
-
-        row = get_row(selected_character, selected_skill)
-        affinity = resolve_affinity(row, normalized_enemy_affinity)
-        resolved_picto_attack_type = resolve_picto_attack_type(row, picto_attack_type)
-        picto_state = build_picto_state(
-            resolved_picto_attack_type,
-            picto_below_10_health,
-            picto_target_burning,
-            picto_target_stunned,
-            picto_exhausted,
-            picto_full_health,
-            picto_unhit,
-            picto_inverted,
-            picto_consume_ap,
-            picto_shield_points,
-            picto_fighting_alone,
-            picto_all_allies_alive,
-            picto_status_effects,
-            picto_dodge_stacks,
-            picto_parry_stacks,
-            picto_warming_up_stacks,
-            picto_first_hit,
+    frozen_picto_state = freeze_mapping(shared_picto_state)
+    frozen_weapon_state = freeze_mapping(shared_weapon_state)
+
+    def view_inputs(selected_skill: str | None) -> CalculatorInputs:
+        """Build the canonical cache key for one skill under the shared setup."""
+
+        return CalculatorInputs(
+            character=selected_character,
+            skill=get_row(selected_character, selected_skill).skill,
+            attack=attack_value,
+            affinity=normalized_enemy_affinity,
+            weapon=weapon,
+            weapon_level=str(normalize_weapon_level(weapon_level)),
+            pictos=tuple(pictos or ()),
+            attack_type_override=picto_attack_type,
+            state=character_state,
+            picto_state=frozen_picto_state,
+            weapon_state=frozen_weapon_state,
         )
-        weapon_state = build_weapon_state(
-            resolved_picto_attack_type,
-            picto_shield_points,
-            weapon_unhit_turns,
-            weapon_stain_consume_stacks,
-            weapon_light_stains,
-            weapon_dark_stains,
-            weapon_self_burn_stacks,
-            sciel_foretell,
-            sciel_twilight,
-            weapon_moon_charges,
-            weapon_cursed,
-            weapon_ap_consumed,
-            weapon_critical_hit,
-            weapon_monoco_mask_type,
-            verso_rank,
+
+    def stop_if_superseded() -> None:
+        """Abandon the render once a newer request has replaced this one."""
+
+        if superseded is not None and superseded():
+            raise PreventUpdate
+
+    primary_inputs = view_inputs(skill)
+    primary_view = evaluate_skill_view(primary_inputs)
+    primary_result_body = primary_view["result_body"]
+    primary_summary_body = primary_view["summary_body"]
+
+    # Each heavy panel is cached on the part of the setup it reads, so a
+    # change to one panel's controls, or to a field a panel ignores, leaves
+    # the other panels as cache hits.
+    setup_inputs = replace(primary_inputs, skill="")
+
+    stop_if_superseded()
+    rank_body: ComponentChildren = []
+    if rank_all:
+        rank_body = render_ranking(primary_inputs)
+
+    stop_if_superseded()
+    optimize_body: ComponentChildren = []
+    slot_budget = clamp_int(optimize_slots, 0, MAX_PICTO_SLOTS)
+    if slot_budget:
+        skill_mix = tuple(name for name in optimize_skills if name in available_skills) if optimize_skills else None
+        searches_builds = bool(optimize_weapons) or skill_mix is not None
+        optimize_body = render_optimizer(
+            primary_inputs if searches_builds else replace(primary_inputs, attack=0.0),
+            slot_budget,
+            bool(optimize_weapons),
+            skill_mix,
         )
 
-        picto_summary = evaluate_pictos(pictos, picto_state)
-        weapon_summary = evaluate_weapon(selected_character, weapon, weapon_level, row, weapon_state)
-        skill_result = calculate_skill_result(
-            selected_character,
-            row,
-            states[selected_character],
-            weapon_summary["suppress_verso_rank_bonus"],
+    stop_if_superseded()
+    sweep_body: ComponentChildren = []
+    sweep_fields = SWEEP_FIELDS.get(selected_character, {})
+    if sweep_x in sweep_fields:
+        sweep_body = render_sweep(
+            replace(primary_inputs, attack=0.0),
+            sweep_x,
+            sweep_y if sweep_y in sweep_fields else None,
         )
-        skill_result = apply_weapon_bonus(skill_result, weapon_summary)
-        skill_result = apply_picto_bonus(skill_result, picto_summary)
-        current_cost = calculate_current_cost(selected_character, row, states[selected_character])
-
-        return {
-            "row": row,
-            "affinity": affinity,
-            "picto_summary": picto_summary,
-            "weapon_summary": weapon_summary,
-            "skill_result": skill_result,
-            "current_cost": current_cost,
-            "total_bonus_factor": picto_summary["total_factor"] * weapon_summary["total_factor"],
-        }
-
-    primary_view = evaluate_skill_view(skill)
-    primary_result_body = build_result_body(
-        selected_character,
-        primary_view["row"],
-        attack_value,
-        primary_view["current_cost"],
-        primary_view["skill_result"],
-        primary_view["picto_summary"],
-        primary_view["weapon_summary"],
-        primary_view["affinity"],
-    )
-    primary_summary_body = build_summary_body(
-        primary_view["row"],
-        attack_value,
-        primary_view["total_bonus_factor"],
-        primary_view["affinity"],
-    )
+
+    stop_if_superseded()
+    start_ap = parse_number(rotation_start_ap)
+    start_ap = DEFAULT_START_AP if start_ap is None else clamp_int(start_ap, 0, MAX_AP)
+    crit_percent = parse_number(rotation_crit_rate)
+    crit_rate = None if crit_percent is None else min(max(crit_percent, 0), 100) / 100
+    rotation_body: ComponentChildren = []
+    if clean_text(rotation_skills):
+        rotations, unknown = parse_rotations(selected_character, rotation_skills)
+        runs = parse_number(rotation_runs)
+        runs = DEFAULT_ROTATION_RUNS if runs is None else clamp_int(runs, 1, MAX_ROTATION_RUNS)
+        rotation_body = render_rotations(
+            setup_inputs,
+            tuple(tuple(rotation) for rotation in rotations),
+            tuple(unknown),
+            runs,
+            start_ap,
+            crit_rate,
+        )
+
+    stop_if_superseded()
+    plan_body: ComponentChildren = []
+    plan_turns = parse_number(rotation_plan_turns)
+    if plan_turns:
+        plan_body = render_rotation_plan(setup_inputs, clamp_int(plan_turns, 1, MAX_PLAN_TURNS), start_ap, crit_rate)
+
+    stop_if_superseded()
+    compare_grid_body: ComponentChildren = []
+    grid_skills = [name for name in compare_skills or [] if name in available_skills]
+    if grid_skills:
+        compare_grid_body = render_skill_grid(primary_inputs, tuple(grid_skills))
 
     if not active_compare_skill:
         return (
@@ -1247,44 +1392,45 @@ def update_calculator_result(
             HIDDEN_STYLE,
             [],
             [],
+            rank_body,
+            optimize_body,
+            sweep_body,
+            rotation_body,
+            plan_body,
+            compare_grid_body,
         )
 
-    compare_view = evaluate_skill_view(active_compare_skill)
-    compare_result_body = build_result_body(
-        selected_character,
-        compare_view["row"],
-        attack_value,
-        compare_view["current_cost"],
-        compare_view["skill_result"],
-        compare_view["picto_summary"],
-        compare_view["weapon_summary"],
-        compare_view["affinity"],
-    )
-    compare_summary_body = build_summary_body(
-        compare_view["row"],
-        attack_value,
-        compare_view["total_bonus_factor"],
-        compare_view["affinity"],
-    )
+    compare_inputs = view_inputs(active_compare_skill)
+    compare_view = evaluate_skill_view(compare_inputs)
+    compare_result_body = compare_view["result_body"]
+    compare_summary_body = compare_view["summary_body"]
 
     return (
         VISIBLE_STYLE,
-        build_comparison_overview(
-            primary_view["row"],
-            attack_value,
-            primary_view["current_cost"],
-            primary_view["skill_result"],
-            primary_view["affinity"],
-            compare_view["row"],
-            attack_value,
-            compare_view["current_cost"],
-            compare_view["skill_result"],
-            compare_view["affinity"],
-        ),
+        render_comparison_overview(primary_inputs, compare_inputs),
         6,
         primary_result_body,
         primary_summary_body,
         VISIBLE_STYLE,
         compare_result_body,
         compare_summary_body,
+        rank_body,
+        optimize_body,
+        sweep_body,
+        rotation_body,
+        plan_body,
+        compare_grid_body,
     )
+
+
+# Render the default setup once at startup and serve it inside the layout, so
+# the result callback skips its initial call. With gunicorn's ``--preload``
+# this also warms the view cache before the workers fork.
+INITIAL_PANELS = render_calculator_result(**resolve_controls(None, CONTROL_DEFAULTS))
+apply_initial_outputs(
+    [layout],
+    {
+        **dict(zip(RESULT_OUTPUTS, INITIAL_PANELS)),
+        (RENDERED_VIEWS_ID, "data"): {"digest": remember_bodies(patched_bodies(INITIAL_PANELS))},
+    },
+)
@@ -0,0 +1,121 @@
+"""Drop calculator requests that a newer request from the same page has replaced.
+
+Every change to the consolidated control state is stamped in the browser with
+a per-page session id and an increasing sequence number. The latest sequence
+seen for each session is kept in an anonymous shared memory map. With
+gunicorn's ``--preload`` the map is created before the workers fork, so all
+workers see the same table. A request whose sequence is already behind the
+table is dropped before it renders, and one that falls behind while rendering
+is dropped before its response is built.
+"""
+
+from __future__ import annotations
+import hashlib
+import mmap
+import multiprocessing
+import struct
+from typing import Any, TypedDict
+
+# Sessions tracked at once. A session whose slot is taken by another session
+# simply stops being coalesced until it wins the slot back.
+COALESCE_SLOTS = 4096
+
+COUNTERS = struct.Struct("<3Q")
+SLOT = struct.Struct("<QQ")
+
+
+class RequestTicket(TypedDict):
+    """The browser's stamp on one control-state change."""
+
+    session: str
+    seq: int
+
+
+class CoalesceStats(TypedDict):
+    """Coalescing counters summed over every worker sharing the table."""
+
+    requests: int
+    coalesced: int
+    superseded: int
+
+
+coalesce_lock = multiprocessing.Lock()
+coalesce_table = mmap.mmap(-1, COUNTERS.size + SLOT.size * COALESCE_SLOTS)
+
+
+def parse_ticket(ticket: Any) -> tuple[int, int] | None:
+    """Return a ticket's session hash and sequence, or ``None`` when it is malformed."""
+
+    if not isinstance(ticket, dict) or not isinstance(ticket.get("session"), str):
+        return None
+    seq = ticket.get("seq")
+    if not isinstance(seq, int) or isinstance(seq, bool) or seq < 0:
+        return None
+    session = int.from_bytes(hashlib.blake2b(ticket["session"].encode(), digest_size=8).digest(), "little")
+    return session or 1, seq
+
+
+def slot_offset(session: int) -> int:
+    """Return the byte offset of a session's slot."""
+
+    return COUNTERS.size + SLOT.size * (session % COALESCE_SLOTS)
+
+
+def count(field: int) -> None:
+    """Increment one shared counter; the caller holds ``coalesce_lock``."""
+
+    counters = list(COUNTERS.unpack_from(coalesce_table, 0))
+    counters[field] += 1
+    COUNTERS.pack_into(coalesce_table, 0, *counters)
+
+
+def claim_request(ticket: RequestTicket | None) -> bool:
+    """Record a request as its session's latest.
+
+    Args:
+        ticket: The request's ticket, or ``None`` for clients that do not
+            send one.
+
+    Returns:
+        ``False`` when a newer request from the same session was already
+        seen, in which case this one should not render.
+    """
+
+    parsed = parse_ticket(ticket)
+    if parsed is None:
+        return True
+    session, seq = parsed
+    offset = slot_offset(session)
+    with coalesce_lock:
+        count(0)
+        stored_session, stored_seq = SLOT.unpack_from(coalesce_table, offset)
+        if stored_session == session and stored_seq > seq:
+            count(1)
+            return False
+        SLOT.pack_into(coalesce_table, offset, session, seq)
+    return True
+
+
+def is_superseded(ticket: RequestTicket | None) -> bool:
+    """Return whether a newer request from the same session arrived since ``claim_request``.
+
+    A ``True`` result is counted as a superseded request.
+    """
+
+    parsed = parse_ticket(ticket)
+    if parsed is None:
+        return False
+    session, seq = parsed
+    with coalesce_lock:
+        stored_session, stored_seq = SLOT.unpack_from(coalesce_table, slot_offset(session))
+        if stored_session != session or stored_seq <= seq:
+            return False
+        count(2)
+    return True
+
+
+def coalesce_stats() -> CoalesceStats:
+    """Return the coalescing counters shared by every worker."""
+
+    requests, coalesced, superseded = COUNTERS.unpack_from(coalesce_table, 0)
+    return {"requests": requests, "coalesced": coalesced, "superseded": superseded}
@@ -0,0 +1,163 @@
+"""Limit how many uesave conversions run at once across all workers.
+
+Each upload runs ``uesave`` in its own subprocess. A fixed set of slot files
+caps the number of conversions running at the same time, and a second set
+caps how many uploads may wait for one. A process holds a slot by keeping an
+exclusive ``flock`` on its file, so the kernel frees the slot when the holder
+exits, even when it is killed. When every queue file is taken, or no slot
+file frees up in time, the upload is rejected straight away with a message.
+
+Admission only ever looks at the locks. The waiting and running depths and
+the other counters live in a table created at import time, as in
+``coalesce``, so with gunicorn's ``--preload`` every worker shares them.
+Reading them never touches a slot file, so a metrics scrape cannot make an
+upload see a taken slot. A holder killed outright skips its decrement, which
+leaves those two gauges high until restart but never blocks a slot.
+"""
+
+from __future__ import annotations
+from collections.abc import Iterator
+from contextlib import contextmanager
+import fcntl
+import mmap
+import multiprocessing
+import os
+from pathlib import Path
+import struct
+import tempfile
+import time
+from typing import TypedDict
+
+# Conversions allowed to run at once, and uploads allowed to wait for one.
+# Each conversion runs in a job process, so these bound the uesave processes
+# and their memory rather than request workers.
+UESAVE_CONCURRENCY = int(os.environ.get("UESAVE_CONCURRENCY") or 2)
+UESAVE_QUEUE_SIZE = int(os.environ.get("UESAVE_QUEUE_SIZE") or 4)
+UESAVE_QUEUE_TIMEOUT_SECONDS = 10
+# How often a waiting upload retries the slot files.
+SLOT_POLL_SECONDS = 0.05
+CONVERSION_SLOT_DIR = Path(
+    os.environ.get("LUDEX_CONVERSION_SLOT_DIR") or Path(tempfile.gettempdir()) / "ludex-exp33-uesave-slots"
+)
+
+GATE_FIELDS = ("waiting", "running", "max_waiting", "admitted", "rejected", "timed_out", "wait_ns", "convert_ns")
+GATE = struct.Struct(f"<{len(GATE_FIELDS)}Q")
+
+
+class ConversionRejected(RuntimeError):
+    """Raised when an upload cannot get a uesave slot."""
+
+
+class ConversionStats(TypedDict):
+    """uesave admission counters shared by every worker."""
+
+    waiting: int
+    running: int
+    max_waiting: int
+    admitted: int
+    rejected: int
+    timed_out: int
+    mean_wait_ms: float
+    mean_conversion_ms: float
+
+
+gate_lock = multiprocessing.Lock()
+gate_table = mmap.mmap(-1, GATE.size)
+
+
+def update_gate(**deltas: int) -> None:
+    """Add to named counters in the shared table; the caller holds ``gate_lock``."""
+
+    counters = dict(zip(GATE_FIELDS, GATE.unpack_from(gate_table, 0)))
+    for name, delta in deltas.items():
+        counters[name] = max(counters[name] + delta, 0)
+    counters["max_waiting"] = max(counters["max_waiting"], counters["waiting"])
+    GATE.pack_into(gate_table, 0, *counters.values())
+
+
+def slot_paths(kind: str, count: int) -> list[Path]:
+    """Return the lock files of one kind of slot, ``"queue"`` or ``"run"``."""
+
+    return [CONVERSION_SLOT_DIR / f"{kind}-{index}.lock" for index in range(count)]
+
+
+def try_lock(paths: list[Path]) -> int | None:
+    """Take an exclusive lock on the first free file, without blocking.
+
+    Returns:
+        The open descriptor holding the lock, or ``None`` when every file is
+        locked. Closing the descriptor releases the lock.
+    """
+
+    CONVERSION_SLOT_DIR.mkdir(parents=True, exist_ok=True)
+    for path in paths:
+        descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(descriptor)
+            continue
+        return descriptor
+    return None
+
+
+@contextmanager
+def conversion_slot() -> Iterator[None]:
+    """Hold one uesave slot for the duration of a conversion.
+
+    Raises:
+        ConversionRejected: If the wait queue is full, or no slot frees up
+            within ``UESAVE_QUEUE_TIMEOUT_SECONDS``.
+    """
+
+    queue_paths = slot_paths("queue", UESAVE_QUEUE_SIZE)
+    queued = try_lock(queue_paths)
+    if queued is None:
+        with gate_lock:
+            update_gate(rejected=1)
+        raise ConversionRejected("Too many saves are being imported right now. Try again in a moment.")
+
+    run_paths = slot_paths("run", UESAVE_CONCURRENCY)
+    slot = None
+    started = time.perf_counter_ns()
+    deadline = time.monotonic() + UESAVE_QUEUE_TIMEOUT_SECONDS
+    with gate_lock:
+        update_gate(waiting=1)
+    try:
+        while (slot := try_lock(run_paths)) is None and time.monotonic() < deadline:
+            time.sleep(SLOT_POLL_SECONDS)
+    finally:
+        os.close(queued)
+        waited = time.perf_counter_ns() - started
+        with gate_lock:
+            if slot is not None:
+                update_gate(waiting=-1, running=1, admitted=1, wait_ns=waited)
+            else:
+                update_gate(waiting=-1, timed_out=1, wait_ns=waited)
+    if slot is None:
+        raise ConversionRejected("The save importer is busy. Try again in a moment.")
+
+    started = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        os.close(slot)
+        with gate_lock:
+            update_gate(running=-1, convert_ns=time.perf_counter_ns() - started)
+
+
+def conversion_stats() -> ConversionStats:
+    """Return the uesave admission counters shared by every worker."""
+
+    waiting, running, max_waiting, admitted, rejected, timed_out, wait_ns, convert_ns = GATE.unpack_from(gate_table, 0)
+    queued = admitted + timed_out
+    return {
+        "waiting": waiting,
+        "running": running,
+        "max_waiting": max_waiting,
+        "admitted": admitted,
+        "rejected": rejected,
+        "timed_out": timed_out,
+        "mean_wait_ms": wait_ns / queued / 1e6 if queued else 0.0,
+        "mean_conversion_ms": convert_ns / admitted / 1e6 if admitted else 0.0,
+    }
@@ -1,11 +1,15 @@
 from __future__ import annotations
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
 from games.expedition33.helpers import clean_frame, format_value
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, TypeAlias, TypedDict
 import pandas as pd
 import re
+import sys
 
-CalculatorRow: TypeAlias = dict[str, Any]
 CalculatorState: TypeAlias = dict[str, Any]
 ComponentChildren: TypeAlias = list[Any]
 SkillOption: TypeAlias = dict[str, str]
@@ -16,6 +20,129 @@ ToggleInput: TypeAlias = bool | None
 ControlStyles: TypeAlias = dict[str, StyleRule]
 
 
+class SkillMode(StrEnum):
+    """Character-specific formula modes read from the sheet's ``* Mode`` columns."""
+
+    ALL_CRITS = "all_crits"
+    ASCENDING_ASSAULT = "ascending_assault"
+    BERSERK = "berserk"
+    BURN = "burn"
+    BURNING_CANVAS = "burning_canvas"
+    COMBUSTION = "combustion"
+    CONSUME = "consume"
+    CONSUME_ALL = "consume_all"
+    CONSUME_CRIT = "consume_crit"
+    COST_MASK = "cost_mask"
+    CRIT = "crit"
+    DIRECT = "direct"
+    DURATION_CONSUME = "duration_consume"
+    END_BRINGER = "end_bringer"
+    FIRE_RAGE = "fire_rage"
+    FOLLOW_UP = "follow_up"
+    MARKED = "marked"
+    MASK = "mask"
+    MASK_ALL_CRITS = "mask_all_crits"
+    MASK_BURNING = "mask_burning"
+    MASK_FULL_LIFE = "mask_full_life"
+    MASK_LOW_LIFE = "mask_low_life"
+    MASK_MARKED = "mask_marked"
+    MASK_POWERLESS = "mask_powerless"
+    MASK_STUNNED = "mask_stunned"
+    RANK_COST = "rank_cost"
+    RANK_DAMAGE = "rank_damage"
+    REQUIRES_STAINS = "requires_stains"
+    REVENGE = "revenge"
+    SPEED_BURST = "speed_burst"
+    STEELED_STRIKE = "steeled_strike"
+    STORM_CALLER = "storm_caller"
+    STUNNED = "stunned"
+    UTILITY = "utility"
+    UTILITY_EXTRA_TURN = "utility_extra_turn"
+
+
+MODE_COLUMNS = ("Lune Mode", "Maelle Mode", "Monoco Mode", "Verso Mode")
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SkillRecord(Mapping[str, Any]):
+    """One skill row compiled once at load time.
+
+    The formula inputs are parsed into typed attributes so evaluations never
+    re-parse sheet strings. The record still behaves as a read-only mapping of
+    the non-empty CSV cells for display code and weapon row filters.
+
+    Attributes:
+        raw: The non-empty sheet cells keyed by column name.
+        skill: The cleaned skill name.
+        mode: The character formula mode, or an empty string.
+        damage_multi: The ``Damage Multi`` base multiplier.
+        dmg_con: The conditional multiplier (``Dmg Con1`` or ``ConDmg``).
+        dmg_max: Lune and Monoco's ``Dmg Max`` breakpoint.
+        dm_max: Maelle's ``DmMax`` breakpoint.
+        twilight_dmg: Sciel's ``TwilightDmg`` breakpoint.
+        srank_max: Verso's ``SRankMAX`` breakpoint.
+        all_crit_dmg: Lune's ``All Crit Dmg`` breakpoint.
+        condition: The conditional label (``Condition 1`` or ``Condition``).
+        max_condition: The maximum label (``Con Max Dmg`` or ``ConTwilight``).
+        notes: The sheet notes.
+        mask: Monoco's mask type.
+        element: The damage element (``Damage Element`` or ``Element``).
+        attack_type: The explicit ``Attack Type`` column.
+        cost: The raw AP cost text.
+        cost_value: The parsed AP cost.
+        consume_stains: Lune's consumable stains.
+        required_stains: Lune's required stains.
+        base_turns: Lune's base duration in turns.
+        max_turns: Lune's consume-extended duration in turns.
+        base_scaling: The per-hit scaling used by derived formulas.
+        hit_count: The number of hits used by derived formulas.
+    """
+
+    raw: Mapping[str, Any]
+    skill: str
+    mode: SkillMode | str
+    damage_multi: float | None
+    dmg_con: float | None
+    dmg_max: float | None
+    dm_max: float | None
+    twilight_dmg: float | None
+    srank_max: float | None
+    all_crit_dmg: float | None
+    condition: str
+    max_condition: str
+    notes: str
+    mask: str
+    element: str
+    attack_type: str
+    cost: str
+    cost_value: float | None
+    consume_stains: tuple[str, ...]
+    required_stains: tuple[str, ...]
+    base_turns: float | None
+    max_turns: float | None
+    base_scaling: float | None
+    hit_count: float | None
+
+    # Records are unique per sheet row, so identity is their equality and hash.
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __reduce__(self) -> tuple[Any, tuple[dict[str, Any]]]:
+        return compile_skill_record, (dict(self.raw),)
+
+
+CalculatorRow: TypeAlias = SkillRecord
+
+
 class CalculationResult(TypedDict):
     """Normalized payload describing the selected damage scenario."""
 
@@ -25,6 +152,19 @@ class CalculationResult(TypedDict):
     warning: str | None
 
 
+class SkillRanking(TypedDict):
+    """One evaluated row in the "rank all skills" table."""
+
+    skill: str
+    multiplier: float | None
+    damage: float | None
+    cost: str
+    cost_value: float | None
+    damage_per_ap: float | None
+    scenario: str
+    warning: str | None
+
+
 class SheetScenario(TypedDict):
     """A spreadsheet breakpoint displayed in the summary table."""
 
@@ -145,7 +285,7 @@ def extract_first_int(value: Any) -> int | None:
     return int(match.group(1)) if match else None
 
 
-def number_from_row(row: CalculatorRow, *keys: str) -> float | None:
+def number_from_row(row: Mapping[str, Any], *keys: str) -> float | None:
     """Read the first parseable numeric value from a calculator row.
 
     Args:
@@ -164,7 +304,7 @@ def number_from_row(row: CalculatorRow, *keys: str) -> float | None:
     return None
 
 
-def text_from_row(row: CalculatorRow, *keys: str) -> str:
+def text_from_row(row: Mapping[str, Any], *keys: str) -> str:
     """Read the first non-empty text value from a calculator row.
 
     Args:
@@ -183,6 +323,70 @@ def text_from_row(row: CalculatorRow, *keys: str) -> str:
     return ""
 
 
+def split_pipe_values(value: Any) -> list[str]:
+    """Split a pipe-delimited sheet field into normalized entries."""
+
+    text = clean_text(value)
+    if not text:
+        return []
+    return [part.strip() for part in text.split("|") if part.strip() and part.strip() != "-"]
+
+
+def parse_mode(value: Any) -> SkillMode | str:
+    """Resolve a sheet mode cell to its enum member.
+
+    Unknown modes fall through as interned strings so new sheet values never
+    break loading; the calculators then treat them as unmodeled.
+    """
+
+    text = clean_text(value)
+    try:
+        return SkillMode(text)
+    except ValueError:
+        return sys.intern(text)
+
+
+def compile_skill_record(record: Mapping[str, Any]) -> SkillRecord:
+    """Compile one raw CSV record into a typed skill record.
+
+    Args:
+        record: The raw column-to-value mapping for one sheet row, with empty
+            cells already normalized to ``None``.
+
+    Returns:
+        A frozen record with every formula input pre-parsed.
+    """
+
+    raw = {sys.intern(key): value for key, value in record.items() if value is not None}
+    raw["Skill"] = clean_text(raw.get("Skill"))
+    return SkillRecord(
+        raw=MappingProxyType(raw),
+        skill=raw["Skill"],
+        mode=parse_mode(text_from_row(raw, *MODE_COLUMNS)),
+        damage_multi=number_from_row(raw, "Damage Multi"),
+        dmg_con=number_from_row(raw, "Dmg Con1", "ConDmg"),
+        dmg_max=number_from_row(raw, "Dmg Max"),
+        dm_max=number_from_row(raw, "DmMax"),
+        twilight_dmg=number_from_row(raw, "TwilightDmg"),
+        srank_max=number_from_row(raw, "SRankMAX"),
+        all_crit_dmg=number_from_row(raw, "All Crit Dmg"),
+        condition=text_from_row(raw, "Condition 1", "Condition"),
+        max_condition=text_from_row(raw, "Con Max Dmg", "ConTwilight"),
+        notes=text_from_row(raw, "Notes"),
+        mask=text_from_row(raw, "Mask"),
+        element=text_from_row(raw, "Damage Element", "Element"),
+        attack_type=text_from_row(raw, "Attack Type"),
+        cost=text_from_row(raw, "Cost"),
+        cost_value=number_from_row(raw, "Cost"),
+        consume_stains=tuple(split_pipe_values(raw.get("Consume Stains"))),
+        required_stains=tuple(split_pipe_values(raw.get("Required Stains"))),
+        base_turns=number_from_row(raw, "Base Turns"),
+        max_turns=number_from_row(raw, "Max Turns"),
+        base_scaling=number_from_row(raw, "Base Scaling"),
+        hit_count=number_from_row(raw, "Hit Count"),
+    )
+
+
 def clamp_int(value: Any, minimum: int, maximum: int) -> int:
     """Clamp user input to an allowed integer range.
 
@@ -193,11 +397,14 @@ def clamp_int(value: Any, minimum: int, maximum: int) -> int:
 
     Returns:
         An integer constrained to the inclusive ``minimum`` and ``maximum``
-        bounds. Invalid inputs fall back to ``minimum``.
+        bounds. Infinite inputs clamp to the matching bound, and other
+        invalid inputs fall back to ``minimum``.
     """
 
     try:
         number = int(value)
+    except OverflowError:
+        return maximum if value > 0 else minimum
     except (TypeError, ValueError):
         return minimum
     return max(minimum, min(number, maximum))
@@ -239,7 +446,7 @@ def calculate_damage(attack: float | None, multiplier: float | None) -> float |
 def skill_element(row: CalculatorRow) -> str:
     """Read the skill's elemental typing from the loaded sheet row."""
 
-    return clean_text(text_from_row(row, "Damage Element", "Element"))
+    return row.element
 
 
 def normalize_affinity(value: str | None) -> str:
@@ -312,9 +519,9 @@ def base_result(
         condition text.
     """
 
-    condition = text_from_row(row, "Condition 1", "Condition")
+    condition = row.condition
     return result(
-        number_from_row(row, "Damage Multi"),
+        row.damage_multi,
         scenario or ("Base value" if not condition else f"Base value | breakpoint: {condition}"),
         source,
     )
@@ -324,8 +531,8 @@ def load_calculator_data() -> dict[str, CalculatorPayload]:
     """Load and normalize all calculator CSV data.
 
     Returns:
-        A mapping of character ids to their default attack values, raw records,
-        and skill lookup dictionaries.
+        A mapping of character ids to their default attack values, compiled
+        skill records, and skill lookup dictionaries.
     """
 
     payloads: dict[str, CalculatorPayload] = {}
@@ -340,8 +547,7 @@ def load_calculator_data() -> dict[str, CalculatorPayload]:
             skill = clean_text(record.get("Skill"))
             if not skill or skill.lower().startswith("skill tierlist"):
                 continue
-            record["Skill"] = skill
-            records.append(record)
+            records.append(compile_skill_record(record))
 
         default_attack = None
         for key in ("Test Basic Attack Dmg", "Base Attack", "Test Basic Attack"):
@@ -356,7 +562,7 @@ def load_calculator_data() -> dict[str, CalculatorPayload]:
         payloads[character] = {
             "default_attack": float(default_attack or 1000),
             "records": records,
-            "skills": {record["Skill"]: record for record in records},
+            "skills": {record.skill: record for record in records},
         }
 
     return payloads
@@ -377,7 +583,7 @@ def skill_options_for(character: str) -> list[SkillOption]:
     """
 
     return sorted(
-        [{"label": record["Skill"], "value": record["Skill"]} for record in CALCULATOR_DATA[character]["records"]],
+        [{"label": record.skill, "value": record.skill} for record in CALCULATOR_DATA[character]["records"]],
         key=lambda option: option["label"].lower(),
     )
 
@@ -450,7 +656,6 @@ def build_sheet_rows(row: CalculatorRow) -> list[SheetScenario]:
     """
 
     entries: list[SheetScenario] = []
-    lune_mode = text_from_row(row, "Lune Mode")
 
     def add_entry(label: str, value: float | None) -> None:
         """Append a unique summary entry when the value is usable.
@@ -469,10 +674,10 @@ def build_sheet_rows(row: CalculatorRow) -> list[SheetScenario]:
             return
         entries.append({"label": label, "value": value})
 
-    if lune_mode == "duration_consume":
-        per_turn = number_from_row(row, "Damage Multi")
-        base_turns = clamp_int(number_from_row(row, "Base Turns"), 1, 10)
-        max_turns = clamp_int(number_from_row(row, "Max Turns"), base_turns, 10)
+    if row.mode == SkillMode.DURATION_CONSUME:
+        per_turn = row.damage_multi
+        base_turns = clamp_int(row.base_turns, 1, 10)
+        max_turns = clamp_int(row.max_turns, base_turns, 10)
         add_entry("1 turn", per_turn)
         if per_turn is not None and base_turns > 1:
             add_entry(f"{base_turns} turns", round(per_turn * base_turns, 2))
@@ -480,30 +685,32 @@ def build_sheet_rows(row: CalculatorRow) -> list[SheetScenario]:
             add_entry(f"Consume | {max_turns} turns", round(per_turn * max_turns, 2))
         return entries
 
-    add_entry("Base", number_from_row(row, "Damage Multi"))
+    base_value = row.damage_multi
+    add_entry("Base", base_value)
 
-    all_crit_value = number_from_row(row, "All Crit Dmg")
-    if all_crit_value is not None and all_crit_value != number_from_row(row, "Damage Multi"):
+    all_crit_value = row.all_crit_dmg
+    if all_crit_value is not None and all_crit_value != base_value:
         add_entry("All hits crit", all_crit_value)
 
-    conditional_value = number_from_row(row, "Dmg Con1", "ConDmg")
-    conditional_label = text_from_row(row, "Condition 1", "Condition")
-    if conditional_value is not None and conditional_value != number_from_row(row, "Damage Multi"):
-        add_entry(conditional_label or "Conditional", conditional_value)
+    conditional_value = row.dmg_con
+    if conditional_value is not None and conditional_value != base_value:
+        add_entry(row.condition or "Conditional", conditional_value)
 
-    maelle_value = number_from_row(row, "DmMax")
-    maelle_label = text_from_row(row, "Condition")
-    if maelle_value is not None and maelle_value != number_from_row(row, "Damage Multi"):
-        add_entry(maelle_label or "Maximum", maelle_value)
+    maelle_value = row.dm_max
+    if maelle_value is not None and maelle_value != base_value:
+        add_entry(row.condition or "Maximum", maelle_value)
 
-    max_value = number_from_row(row, "Dmg Max", "TwilightDmg", "SRankMAX")
-    max_label = text_from_row(row, "Con Max Dmg", "ConTwilight")
+    max_value = next(
+        (value for value in (row.dmg_max, row.twilight_dmg, row.srank_max) if value is not None),
+        None,
+    )
+    max_label = row.max_condition
     if max_value is not None:
-        if "TwilightDmg" in row and max_value == number_from_row(row, "TwilightDmg"):
+        if max_value == row.twilight_dmg:
             add_entry(max_label or "Twilight", max_value)
-        elif "SRankMAX" in row and max_value == number_from_row(row, "SRankMAX"):
+        elif max_value == row.srank_max:
             add_entry(max_label or "S Rank", max_value)
-        elif max_value != number_from_row(row, "Damage Multi"):
+        elif max_value != base_value:
             add_entry(max_label or "Maximum", max_value)
 
     return entries
@@ -521,19 +728,13 @@ def calculate_current_cost(character: str, row: CalculatorRow, state: Calculator
         The AP cost string after applying any character-specific reductions.
     """
 
-    raw_cost = clean_text(row.get("Cost"))
-    numeric_cost = parse_number(row.get("Cost"))
-    skill = clean_text(row.get("Skill"))
-
-    def split_pipe_values(value: Any) -> list[str]:
-        text = clean_text(value)
-        if not text:
-            return []
-        return [part.strip() for part in text.split("|") if part.strip() and part.strip() != "-"]
+    raw_cost = row.cost
+    numeric_cost = row.cost_value
+    skill = row.skill
 
-    def lune_can_consume(requirements_text: Any) -> bool:
+    def lune_can_consume(stains: tuple[str, ...]) -> bool:
         requirements: dict[str, int] = {}
-        for stain in split_pipe_values(requirements_text):
+        for stain in stains:
             normalized = stain.lower()
             if normalized == "all":
                 continue
@@ -569,13 +770,13 @@ def calculate_current_cost(character: str, row: CalculatorRow, state: Calculator
     if numeric_cost is None:
         return raw_cost or "-"
 
-    if character == "lune" and skill in {"Healing Light", "Rebirth"} and lune_can_consume(row.get("Consume Stains")):
+    if character == "lune" and skill in {"Healing Light", "Rebirth"} and lune_can_consume(row.consume_stains):
         return "0"
 
     if character == "maelle" and state.get("stance") == "Virtuoso" and skill in {"Momentum Strike", "Percee"}:
         return format_value(max(numeric_cost - 3, 0))
 
-    if character == "monoco" and text_from_row(row, "Monoco Mode") == "cost_mask" and state.get("mask_active"):
+    if character == "monoco" and row.mode == SkillMode.COST_MASK and state.get("mask_active"):
         return "0"
 
     if character == "verso":
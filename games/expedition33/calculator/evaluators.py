@@ -0,0 +1,1178 @@
+from __future__ import annotations
+from collections.abc import Callable
+from games.expedition33.calculator.core import (
+    CALCULATOR_DATA,
+    RANK_ORDER,
+    CalculationResult,
+    CalculatorRow,
+    CalculatorState,
+    SkillMode,
+    SkillRanking,
+    base_result,
+    calculate_current_cost,
+    calculate_damage,
+    clamp_int,
+    clean_text,
+    extract_first_int,
+    parse_number,
+    parse_rank_requirement,
+    resolve_affinity,
+    result,
+)
+from games.expedition33.calculator.logic import (
+    SCIEL_FORETELL_RATES,
+    apply_monoco_mask_bonus,
+    apply_picto_bonus,
+    apply_verso_rank_bonus,
+    apply_weapon_bonus,
+    calculate_skill_result,
+    effective_sciel_foretell,
+    format_lune_stains,
+    has_explicit_monoco_mask_breakpoint,
+    monoco_secondary_only_multiplier,
+    resolve_picto_attack_type,
+)
+from games.expedition33.calculator.pictos import PictoSummary, evaluate_pictos
+from games.expedition33.calculator.tables import load_outcome_tables, table_evaluator
+from games.expedition33.calculator.weapons import WeaponSummary, evaluate_weapon, weapon_row_keys
+from typing import Any, TypeAlias
+
+SkillEvaluator: TypeAlias = Callable[[CalculatorState, bool], CalculationResult]
+StainCheck: TypeAlias = Callable[[CalculatorState], bool]
+# (truthy state flags, minimum turns, minimum stains, result) evaluated in order.
+SkillRule: TypeAlias = tuple[tuple[str, ...], int, int, CalculationResult]
+# A static result plus its copies with Verso's general rank bonus applied.
+RankedResult: TypeAlias = tuple[CalculationResult, dict[str, CalculationResult]]
+
+LUNE_STAIN_FIELDS = {
+    "earth": "earth_stains",
+    "fire": "fire_stains",
+    "ice": "ice_stains",
+    "lightning": "lightning_stains",
+    "light": "light_stains",
+}
+MAELLE_STANCE_FACTORS = {"Offensive": 1.5, "Virtuoso": 3.0}
+VERSO_UNRANKED_SKILLS = {"Ranged Attack", "Basic Attack", "Counter"}
+
+# Monoco skills whose sheet breakpoints are keyed by name rather than mode:
+# (maximum flags, maximum minimum turns, maximum label) and
+# (conditional flags, conditional minimum turns, conditional label).
+MONOCO_SKILL_RULES: dict[str, tuple[tuple[tuple[str, ...], int, str], tuple[tuple[str, ...], int, str] | None]] = {
+    "Mighty Strike": ((("stunned",), 1, "Stunned target"), None),
+    "Sakapate Estoc": ((("mask_active", "stunned"), 1, "Masked and stunned"), (("mask_active",), 1, "Mask active")),
+    "Sakapate Fire": ((("mask_active",), 3, "Mask active with 3 Burn turns"), (("mask_active",), 1, "Mask active")),
+    "Cultist Slashes": ((("mask_active", "low_life"), 1, "Mask active at low life"), (("mask_active",), 1, "Mask active")),
+    "Sakapate Slam": ((("mask_active", "marked"), 1, "Masked and marked target"), (("mask_active",), 1, "Mask active")),
+    "Obscur Sword": ((("mask_active", "powerless"), 1, "Masked and powerless target"), (("mask_active",), 1, "Mask active")),
+    "Danseuse Waltz": ((("mask_active", "burning"), 1, "Mask active vs burning target"), (("mask_active",), 1, "Mask active")),
+    "Chevalier Thrusts": ((("mask_active", "all_crits"), 1, "Mask active and all crits"), (("mask_active",), 1, "Mask active")),
+    "Sakapate Explosion": ((("mask_active", "all_crits"), 1, "Mask active and all crits"), (("mask_active",), 1, "Mask active")),
+    "Cultist Blood": ((("mask_active", "full_life"), 1, "Mask active at full life"), (("mask_active",), 1, "Mask active")),
+    "Abberation Light": ((("mask_active",), 3, "Mask active with 3 Burn turns"), ((), 3, "3 Burn turns")),
+    "Braseleur Smash": ((("mask_active",), 3, "Mask active with 3 Burn turns"), (("mask_active",), 1, "Mask active")),
+}
+MONOCO_MASK_MODES = {
+    SkillMode.MASK_STUNNED: ("stunned target", "stunned"),
+    SkillMode.MASK_MARKED: ("marked target", "marked"),
+    SkillMode.MASK_POWERLESS: ("powerless target", "powerless"),
+    SkillMode.MASK_BURNING: ("burning target", "burning"),
+    SkillMode.MASK_LOW_LIFE: ("low life", "low_life"),
+    SkillMode.MASK_FULL_LIFE: ("full life", "full_life"),
+    SkillMode.MASK_ALL_CRITS: ("all crits", "all_crits"),
+}
+
+
+def constant_evaluator(skill_result: CalculationResult) -> SkillEvaluator:
+    """Build an evaluator for a row whose result never depends on state."""
+
+    def evaluate(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+        return skill_result
+
+    return evaluate
+
+
+def rule_evaluator(rules: list[SkillRule], fallback: CalculationResult, max_turns: int) -> SkillEvaluator:
+    """Build an evaluator that returns the first satisfied static breakpoint.
+
+    Args:
+        rules: The ordered breakpoints, each gated on truthy state flags and
+            minimum ``turns`` / ``stains`` counts.
+        fallback: The result used when no rule is satisfied.
+        max_turns: The upper clamp applied to the ``turns`` state field.
+
+    Returns:
+        An evaluator that only reads the state fields the rules mention.
+    """
+
+    if not rules:
+        return constant_evaluator(fallback)
+    reads_turns = any(min_turns > 1 for _, min_turns, _, _ in rules)
+    reads_stains = any(min_stains > 0 for _, _, min_stains, _ in rules)
+
+    def evaluate(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+        turns = clamp_int(state.get("turns"), 1, max_turns) if reads_turns else 1
+        stains = clamp_int(state.get("stains"), 0, 4) if reads_stains else 0
+        for flags, min_turns, min_stains, skill_result in rules:
+            if turns >= min_turns and stains >= min_stains and all(state.get(flag) for flag in flags):
+                return skill_result
+        return fallback
+
+    return evaluate
+
+
+def compile_lune_stain_check(stains: tuple[str, ...]) -> StainCheck:
+    """Compile a Lune stain requirement into a state predicate.
+
+    Mirrors ``can_satisfy_lune_stains``: light stains are spent first on
+    light requirements, and any spare light stains cover elemental deficits.
+    """
+
+    requirements: dict[str, int] = {}
+    for stain in stains:
+        normalized = stain.lower()
+        if normalized == "all":
+            continue
+        requirements[normalized] = requirements.get(normalized, 0) + 1
+
+    if not requirements:
+        return lambda state: False
+
+    light_required = requirements.pop("light", 0)
+    elemental = [(LUNE_STAIN_FIELDS.get(stain), needed) for stain, needed in requirements.items()]
+
+    def check(state: CalculatorState) -> bool:
+        jokers = clamp_int(state.get("light_stains"), 0, 4) - light_required
+        if jokers < 0:
+            return False
+        for field, needed in elemental:
+            available = clamp_int(state.get(field), 0, 4) if field else 0
+            if available >= needed:
+                continue
+            jokers -= needed - available
+            if jokers < 0:
+                return False
+        return True
+
+    return check
+
+
+def compile_gustave(row: CalculatorRow) -> SkillEvaluator:
+    """Compile one Gustave row; mirrors ``calculate_gustave``."""
+
+    if not row.skill.startswith("Overcharge"):
+        return constant_evaluator(base_result(row))
+
+    base_multiplier = row.damage_multi or 0
+    by_charges = [
+        result(round(base_multiplier * (1 + (0.2 * charges)), 2), f"{charges} Charges", "Derived from note text")
+        for charges in range(0, 11)
+    ]
+
+    def evaluate(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+        return by_charges[clamp_int(state.get("charges"), 0, 10)]
+
+    return evaluate
+
+
+def compile_lune(row: CalculatorRow) -> SkillEvaluator:
+    """Compile one Lune row; mirrors ``calculate_lune``."""
+
+    skill = row.skill
+    mode = row.mode
+    base_multiplier = row.damage_multi
+    conditional = row.dmg_con
+    maximum = row.dmg_max
+    all_crit_multiplier = row.all_crit_dmg
+    condition = row.condition.lower()
+    max_condition = row.max_condition.lower()
+    consume_ready = compile_lune_stain_check(row.consume_stains)
+
+    if mode == SkillMode.UTILITY:
+        return constant_evaluator(result(None, "No direct damage", "Sheet"))
+
+    if mode == SkillMode.UTILITY_EXTRA_TURN:
+        warned = result(
+            base_multiplier,
+            "Direct hit only",
+            "Damage Multi",
+            "Additional turn from consume is not folded into this damage number.",
+        )
+        plain = result(base_multiplier, "Direct hit only", "Damage Multi", None)
+
+        def evaluate_extra_turn(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return warned if consume_ready(state) else plain
+
+        return evaluate_extra_turn
+
+    if mode == SkillMode.BURN or skill.startswith("Burn "):
+        by_ticks = [None] + [
+            result(round((base_multiplier or 0) * ticks, 2), f"{ticks} Burn tick(s)", "Derived from burn rows")
+            for ticks in range(1, 4)
+        ]
+
+        def evaluate_burn(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return by_ticks[clamp_int(state.get("turns"), 1, 3)]
+
+        return evaluate_burn
+
+    if mode == SkillMode.REQUIRES_STAINS:
+        required_ready = compile_lune_stain_check(row.required_stains)
+        missing = result(
+            None,
+            "Missing required stains",
+            "Required Stains",
+            f"Requires {format_lune_stains(row.required_stains)}. Light stains can substitute missing elemental stains.",
+        )
+        met = result(base_multiplier, "Required stains met", "Damage Multi")
+
+        def evaluate_required(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return met if required_ready(state) else missing
+
+        return evaluate_required
+
+    base_sequence = result(base_multiplier, "Base hit sequence", "Damage Multi")
+    consumed = result(conditional, row.condition or "Consume ready", "Dmg Con1") if conditional is not None else None
+    all_crit = result(all_crit_multiplier, "All hits crit", "All Crit Dmg") if all_crit_multiplier is not None else None
+
+    if mode == SkillMode.CONSUME:
+        if consumed is None:
+            return constant_evaluator(base_sequence)
+
+        def evaluate_consume(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return consumed if consume_ready(state) else base_sequence
+
+        return evaluate_consume
+
+    if mode == SkillMode.CRIT:
+        if all_crit is None:
+            return constant_evaluator(base_sequence)
+
+        def evaluate_crit(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return all_crit if state.get("all_crits") else base_sequence
+
+        return evaluate_crit
+
+    if mode == SkillMode.CONSUME_CRIT:
+        consume_all_crit = (
+            result(maximum, row.max_condition or "Consume + all crits", "Dmg Max") if maximum is not None else None
+        )
+
+        def evaluate_consume_crit(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            all_crits = bool(state.get("all_crits"))
+            ready = consume_ready(state)
+            if all_crits and ready and consume_all_crit is not None:
+                return consume_all_crit
+            if all_crits and all_crit is not None:
+                return all_crit
+            if ready and consumed is not None:
+                return consumed
+            return base_sequence
+
+        return evaluate_consume_crit
+
+    if mode == SkillMode.DURATION_CONSUME:
+        base_turns = clamp_int(row.base_turns, 1, 10)
+        max_turns = clamp_int(row.max_turns, base_turns, 10)
+        by_turns: dict[tuple[bool, int], CalculationResult] = {}
+        for ready in (False, True):
+            allowed_turns = max_turns if ready else base_turns
+            for turns in range(1, 6):
+                applied_turns = min(turns, allowed_turns)
+                warning = None
+                if turns > allowed_turns:
+                    warning = f"Capped at {allowed_turns} turn(s) for the selected stain state."
+                scenario = f"{applied_turns} turn(s)"
+                if ready:
+                    scenario = f"{scenario} | consume ready"
+                by_turns[ready, turns] = result(
+                    round((base_multiplier or 0) * applied_turns, 2),
+                    scenario,
+                    "Damage Multi x turns",
+                    warning,
+                )
+
+        def evaluate_duration(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return by_turns[consume_ready(state), clamp_int(state.get("turns"), 1, 5)]
+
+        return evaluate_duration
+
+    if mode == SkillMode.STORM_CALLER:
+        by_procs: dict[tuple[bool, int], CalculationResult] = {}
+        for ready in (False, True):
+            per_proc = conditional if ready and conditional is not None else base_multiplier
+            for turns in range(1, 6):
+                scenario = f"{turns} end-turn proc(s)"
+                if ready:
+                    scenario = f"{scenario} | consume ready"
+                by_procs[ready, turns] = result(
+                    round((per_proc or 0) * turns, 2),
+                    scenario,
+                    "Derived from per-proc scaling",
+                    "Reactive 0.2 follow-up hits from other damage events are not modeled.",
+                )
+
+        def evaluate_storm(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return by_procs[consume_ready(state), clamp_int(state.get("turns"), 1, 5)]
+
+        return evaluate_storm
+
+    if mode == SkillMode.CONSUME_ALL:
+        by_stains = [
+            result(
+                round((base_multiplier or 0) * (1 + stains), 2),
+                "Base hit sequence" if stains == 0 else f"Consume {stains} stain(s)",
+                "Derived from consume-all scaling",
+            )
+            for stains in range(0, 5)
+        ]
+
+        def evaluate_consume_all(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return by_stains[clamp_int(state.get("stains"), 0, 4)]
+
+        return evaluate_consume_all
+
+    if mode == SkillMode.FIRE_RAGE:
+        warning = "Per-turn stacking remains unclear in the sheet, so only the immediate hit is modeled."
+        immediate = result(base_multiplier, "Immediate hit only", "Damage Multi", warning)
+        if conditional is None:
+            return constant_evaluator(immediate)
+        raged = result(conditional, row.condition or "Consume ready", "Dmg Con1", warning)
+
+        def evaluate_fire_rage(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return raged if consume_ready(state) else immediate
+
+        return evaluate_fire_rage
+
+    rules: list[SkillRule] = []
+    if skill in {"Fire Rage", "Fire Rage Stained"}:
+        stained = skill == "Fire Rage Stained"
+        if maximum is not None:
+            rules.append(((), 3, 1 if stained else 0, result(maximum, "Stained Turn 3" if stained else "Turn 3", "Dmg Max")))
+        if conditional is not None:
+            rules.append(((), 2, 2 if stained else 0, result(conditional, "2 Stains on Turn 2" if stained else "Turn 2", "Dmg Con1")))
+        tail = rule_evaluator(rules, base_result(row, "Turn 1"), 5)
+    else:
+        max_threshold = extract_first_int(max_condition)
+        cond_threshold = extract_first_int(condition)
+        if maximum is not None:
+            max_result = result(maximum, row.max_condition or "Maximum", "Dmg Max")
+            if "crit" in max_condition:
+                rules.append((("all_crits",), 1, max_threshold or 0, max_result))
+            if "burn" in max_condition:
+                rules.append(((), 3, max_threshold or 0, max_result))
+            if "t3" in max_condition:
+                rules.append(((), 3, 0, max_result))
+            if max_threshold is not None and "stain" in max_condition:
+                rules.append(((), 1, max_threshold, max_result))
+        if conditional is not None:
+            conditional_result = result(conditional, row.condition or "Conditional", "Dmg Con1")
+            if "t2" in condition:
+                rules.append(((), 2, 0, conditional_result))
+            if cond_threshold is not None and "stain" in condition:
+                rules.append(((), 1, cond_threshold, conditional_result))
+            if condition.startswith("grad"):
+                rules.append(((), 1, 0, conditional_result))
+        tail = rule_evaluator(rules, base_result(row), 5)
+
+    if condition != "turn start dmg" or conditional is None:
+        return tail
+
+    by_turn_start = [None] + [
+        result(
+            round((base_multiplier or 0) + (conditional * turns), 2),
+            f"{turns} turn(s) with stains",
+            "Derived from Damage Multi + Dmg Con1",
+        )
+        for turns in range(1, 6)
+    ]
+
+    def evaluate_turn_start(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+        if clamp_int(state.get("stains"), 0, 4) > 0:
+            return by_turn_start[clamp_int(state.get("turns"), 1, 5)]
+        return tail(state, disable_rank_bonus)
+
+    return evaluate_turn_start
+
+
+def compile_maelle(row: CalculatorRow) -> SkillEvaluator:
+    """Compile one Maelle row; mirrors ``calculate_maelle``."""
+
+    skill = row.skill
+    mode = row.mode
+    base_multiplier = row.damage_multi
+    maximum = row.dm_max
+    is_burn = skill.startswith("Burn ")
+
+    def with_stances(skill_result: CalculationResult) -> dict[str, CalculationResult]:
+        """Pre-apply every stance bonus to a static result."""
+
+        multiplier = skill_result.get("multiplier")
+        if multiplier is None or is_burn:
+            return {}
+        return {
+            stance: result(
+                round(multiplier * factor, 2),
+                f"{skill_result['scenario']} | {stance} stance",
+                f"{skill_result['source']} + stance bonus",
+                skill_result.get("warning"),
+            )
+            for stance, factor in MAELLE_STANCE_FACTORS.items()
+        }
+
+    def staged(skill_results: list[CalculationResult]) -> list[tuple[CalculationResult, dict[str, CalculationResult]]]:
+        return [(skill_result, with_stances(skill_result)) for skill_result in skill_results]
+
+    def stance_of(state: CalculatorState) -> str:
+        return clean_text(state.get("stance"))
+
+    if mode in {SkillMode.BURNING_CANVAS, SkillMode.COMBUSTION}:
+        if mode == SkillMode.BURNING_CANVAS:
+            base_scaling = row.base_scaling or base_multiplier or 0
+            hit_count = clamp_int(row.hit_count, 1, 20)
+            by_stacks = staged(
+                [
+                    result(
+                        round(
+                            sum(base_scaling * (1 + (0.1 * (burn_stacks + hit_index))) for hit_index in range(hit_count)),
+                            2,
+                        ),
+                        f"{burn_stacks} starting Burn stack(s)",
+                        "Derived from note text",
+                    )
+                    for burn_stacks in range(0, 101)
+                ]
+            )
+        else:
+            by_stacks = staged(
+                [
+                    result(
+                        round((base_multiplier or 0) * (1 + (0.4 * min(burn_stacks, 10))), 2),
+                        f"Consume {min(burn_stacks, 10)} Burn",
+                        "Derived from note text",
+                    )
+                    for burn_stacks in range(0, 101)
+                ]
+            )
+
+        def evaluate_burn_stacks(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            skill_result, stanced = by_stacks[clamp_int(state.get("burn_stacks"), 0, 100)]
+            return stanced.get(stance_of(state), skill_result)
+
+        return evaluate_burn_stacks
+
+    if mode == SkillMode.REVENGE:
+        by_hits = staged(
+            [
+                result(
+                    round((base_multiplier or 0) * (1 + (1.5 * hits_taken)), 2),
+                    f"{hits_taken} hit(s) taken last round",
+                    "Derived from note text",
+                )
+                for hits_taken in range(0, 6)
+            ]
+        )
+
+        def evaluate_revenge(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            skill_result, stanced = by_hits[clamp_int(state.get("hits_taken"), 0, 5)]
+            return stanced.get(stance_of(state), skill_result)
+
+        return evaluate_revenge
+
+    if is_burn:
+        by_ticks = [None] + [
+            result(round((base_multiplier or 0) * turns, 2), f"{turns} Burn tick(s)", "Derived from burn rows")
+            for turns in range(1, 4)
+        ]
+
+        def evaluate_burn(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return by_ticks[clamp_int(state.get("turns"), 1, 3)]
+
+        return evaluate_burn
+
+    base, base_stanced = staged([base_result(row)])[0]
+    gate = {SkillMode.MARKED: ("marked", "Marked target"), SkillMode.ALL_CRITS: ("all_crits", "All crits")}.get(mode)
+    if gate is None or maximum is None:
+
+        def evaluate_base(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return base_stanced.get(stance_of(state), base)
+
+        return evaluate_base
+
+    flag, label = gate
+    gated, gated_stanced = staged([result(maximum, label, "DmMax")])[0]
+
+    def evaluate_gated(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+        if state.get(flag):
+            return gated_stanced.get(stance_of(state), gated)
+        return base_stanced.get(stance_of(state), base)
+
+    return evaluate_gated
+
+
+def compile_monoco(row: CalculatorRow) -> SkillEvaluator:
+    """Compile one Monoco row; mirrors ``calculate_monoco``."""
+
+    skill = row.skill
+    mode = row.mode
+    base_multiplier = row.damage_multi
+    conditional = row.dmg_con
+    maximum = row.dmg_max
+    base = base_result(row)
+
+    if skill.startswith("Burn "):
+        by_ticks = [None] + [
+            result(round((base_multiplier or 0) * turns, 2), f"{turns} Burn tick(s)", "Derived from burn rows")
+            for turns in range(1, 4)
+        ]
+
+        def evaluate_burn(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return by_ticks[clamp_int(state.get("turns"), 1, 3)]
+
+        return evaluate_burn
+
+    if mode == SkillMode.UTILITY:
+        return constant_evaluator(result(None, "No direct damage", "Sheet"))
+
+    if mode == SkillMode.COST_MASK:
+        return constant_evaluator(result(base_multiplier, "Direct hit only", "Damage Multi"))
+
+    mask_active_result = result(conditional, "Mask active", "Dmg Con1") if conditional is not None else None
+    rules: list[SkillRule] = []
+
+    if mode == SkillMode.STUNNED:
+        if maximum is not None:
+            rules.append((("stunned",), 1, 0, result(maximum, "Stunned target", "Dmg Max")))
+        return rule_evaluator(rules, base, 3)
+
+    if mode == SkillMode.MASK:
+        if mask_active_result is not None:
+            rules.append((("mask_active",), 1, 0, mask_active_result))
+        return rule_evaluator(rules, base, 3)
+
+    if mode in MONOCO_MASK_MODES:
+        active_label, flag = MONOCO_MASK_MODES[mode]
+        secondary_only = monoco_secondary_only_multiplier(row)
+        if maximum is not None:
+            rules.append((("mask_active", flag), 1, 0, result(maximum, f"Mask active + {active_label}", "Dmg Max")))
+        if secondary_only is not None:
+            rules.append(((flag,), 1, 0, result(secondary_only, active_label, "Derived from Dmg Max / mask factor")))
+        if mask_active_result is not None:
+            rules.append((("mask_active",), 1, 0, mask_active_result))
+        return rule_evaluator(rules, base, 3)
+
+    maximum_rule, conditional_rule = MONOCO_SKILL_RULES.get(skill, (None, None))
+    if maximum_rule is not None and maximum is not None:
+        flags, min_turns, label = maximum_rule
+        rules.append((flags, min_turns, 0, result(maximum, label, "Dmg Max")))
+    if conditional_rule is not None and conditional is not None:
+        flags, min_turns, label = conditional_rule
+        rules.append((flags, min_turns, 0, result(conditional, label, "Dmg Con1")))
+    if mask_active_result is not None and has_explicit_monoco_mask_breakpoint(row):
+        rules.append((("mask_active",), 1, 0, mask_active_result))
+    rules.append((("mask_active",), 1, 0, apply_monoco_mask_bonus(row, base)))
+    return rule_evaluator(rules, base, 3)
+
+
+def compile_sciel(row: CalculatorRow) -> SkillEvaluator:
+    """Compile one Sciel row; mirrors ``calculate_sciel``."""
+
+    skill = row.skill
+    base_multiplier = row.damage_multi
+    conditional = row.dmg_con
+    twilight_value = row.twilight_dmg
+    base = base_result(row)
+
+    def read_foretell(state: CalculatorState) -> int:
+        return max(clamp_int(state.get("foretell"), 0, 999), 0)
+
+    if skill in SCIEL_FORETELL_RATES:
+        rate = SCIEL_FORETELL_RATES[skill]
+
+        def evaluate_rate(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            foretell = read_foretell(state)
+            twilight = bool(state.get("twilight"))
+            effective_foretell = effective_sciel_foretell(foretell, twilight)
+            multiplier = (base_multiplier or 0) * (1 + (rate * effective_foretell))
+            if not twilight:
+                return result(round(multiplier, 2), f"{foretell} Foretell", "Derived from note text")
+            return result(
+                round(multiplier * 1.5, 2),
+                f"{effective_foretell} Twilight-effective Foretell from {foretell} applied Foretell, Twilight",
+                "Derived from note text + Twilight",
+            )
+
+        return evaluate_rate
+
+    if skill == "Our Sacrifice":
+
+        def evaluate_sacrifice(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            foretell = read_foretell(state)
+            twilight = bool(state.get("twilight"))
+            effective_foretell = effective_sciel_foretell(foretell, twilight)
+            multiplier = (base_multiplier or 0) * (1 + (0.3 * effective_foretell))
+            scenario_parts = [f"{effective_foretell} Twilight-effective Foretell" if twilight else f"{foretell} Foretell"]
+            if state.get("full_life"):
+                multiplier *= 3.97
+                scenario_parts.append("Full life")
+            if twilight:
+                multiplier *= 1.5
+                scenario_parts.append(f"Twilight from {foretell} applied Foretell")
+            return result(round(multiplier, 2), ", ".join(scenario_parts), "Derived from note text")
+
+        return evaluate_sacrifice
+
+    if skill == "Sealed Fate":
+
+        def evaluate_sealed(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            foretell = read_foretell(state)
+            if foretell < 1:
+                return base
+            twilight = bool(state.get("twilight"))
+            if twilight and twilight_value is not None:
+                effective_foretell = effective_sciel_foretell(foretell, twilight)
+                return result(twilight_value, f"{effective_foretell} Twilight-effective Foretell, Twilight", "TwilightDmg")
+            if conditional is not None:
+                return result(conditional, f"{foretell} Foretell", "ConDmg")
+            return base
+
+        return evaluate_sealed
+
+    if skill == "Firing Shadow":
+
+        def evaluate_firing(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            foretell = read_foretell(state)
+            twilight = bool(state.get("twilight"))
+            consumed_foretell = min(effective_sciel_foretell(foretell, twilight), 3)
+            multiplier = (base_multiplier or 0) * (1 + (consumed_foretell / 3))
+            if not twilight:
+                return result(round(multiplier, 2), f"{consumed_foretell} Foretell consumed", "Derived from note text")
+            return result(
+                round(multiplier * 1.5, 2),
+                f"{consumed_foretell} Twilight-effective Foretell consumed from {foretell} applied Foretell",
+                "Derived from note text",
+            )
+
+        return evaluate_firing
+
+    if twilight_value is None:
+        return constant_evaluator(base)
+
+    def evaluate_twilight(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+        if state.get("twilight"):
+            return result(twilight_value, f"Twilight from {read_foretell(state)} applied Foretell", "TwilightDmg")
+        return base
+
+    return evaluate_twilight
+
+
+def compile_verso(row: CalculatorRow) -> SkillEvaluator:
+    """Compile one Verso row; mirrors ``calculate_verso``.
+
+    Static results carry a pre-applied copy for every rank, so the general
+    rank bonus becomes a dictionary lookup.
+    """
+
+    skill = row.skill
+    mode = row.mode
+    base_multiplier = row.damage_multi
+    conditional = row.dmg_con
+    maximum = row.srank_max
+    required_rank = parse_rank_requirement(row.condition)
+
+    def ranked(skill_result: CalculationResult) -> RankedResult:
+        return skill_result, {rank: apply_verso_rank_bonus(rank, skill_result) for rank in RANK_ORDER}
+
+    def bonus(entry: RankedResult, rank: str, enabled: bool) -> CalculationResult:
+        skill_result, by_rank = entry
+        return by_rank.get(rank, skill_result) if enabled else skill_result
+
+    def rank_of(state: CalculatorState) -> str:
+        return clean_text(state.get("rank")) or "D"
+
+    base = ranked(base_result(row))
+    required_result = (
+        ranked(result(conditional, f"{required_rank} Rank", "ConDmg")) if conditional is not None else None
+    )
+
+    if mode == SkillMode.UTILITY:
+        return constant_evaluator(result(None, "No direct damage", "Sheet"))
+
+    if mode in {SkillMode.DIRECT, SkillMode.RANK_COST}:
+
+        def evaluate_direct(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return bonus(base, rank_of(state), not disable_rank_bonus)
+
+        return evaluate_direct
+
+    if mode == SkillMode.RANK_DAMAGE:
+
+        def evaluate_rank_damage(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            rank = rank_of(state)
+            if not disable_rank_bonus and rank == required_rank and required_result is not None:
+                return bonus(required_result, rank, True)
+            return bonus(base, rank, not disable_rank_bonus)
+
+        return evaluate_rank_damage
+
+    if mode == SkillMode.END_BRINGER:
+        stunned_result = ranked(result(conditional, "Stunned target", "ConDmg")) if conditional is not None else None
+
+        def evaluate_end_bringer(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            if state.get("stunned") and stunned_result is not None:
+                return bonus(stunned_result, rank_of(state), not disable_rank_bonus)
+            return bonus(base, rank_of(state), not disable_rank_bonus)
+
+        return evaluate_end_bringer
+
+    if mode == SkillMode.FOLLOW_UP:
+        by_shots = [
+            ranked(
+                result(
+                    round((base_multiplier or 0) * (1 + (0.5 * shots)), 2),
+                    "Base value" if shots == 0 else f"{shots} ranged shot(s)",
+                    "Derived from note text",
+                )
+            )
+            for shots in range(0, 11)
+        ]
+
+        def evaluate_follow_up(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return bonus(by_shots[clamp_int(state.get("shots"), 0, 10)], rank_of(state), not disable_rank_bonus)
+
+        return evaluate_follow_up
+
+    if mode == SkillMode.ASCENDING_ASSAULT:
+        by_uses = [None] + [
+            ranked(
+                result(
+                    round((base_multiplier or 0) * (1 + (0.3 * min(max(uses - 1, 0), 5))), 2),
+                    "Base value" if uses <= 1 else f"Use {uses}",
+                    "Derived from note text",
+                )
+            )
+            for uses in range(1, 7)
+        ]
+
+        def evaluate_ascending(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            return bonus(by_uses[clamp_int(state.get("uses"), 1, 6)], rank_of(state), not disable_rank_bonus)
+
+        return evaluate_ascending
+
+    if mode == SkillMode.SPEED_BURST:
+        speed_maximum = result(maximum, f"{required_rank} Rank + max speed bonus", "SRankMAX") if maximum is not None else None
+        speed_result = ranked(result(round((base_multiplier or 0) * 2, 2), "Max speed bonus", "Derived from note text"))
+
+        def evaluate_speed_burst(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            rank = rank_of(state)
+            rank_ready = not disable_rank_bonus and rank == required_rank
+            if state.get("speed_bonus"):
+                if rank_ready and speed_maximum is not None:
+                    return speed_maximum
+                return bonus(speed_result, rank, not disable_rank_bonus)
+            if rank_ready and required_result is not None:
+                return bonus(required_result, rank, not disable_rank_bonus)
+            return bonus(base, rank, not disable_rank_bonus)
+
+        return evaluate_speed_burst
+
+    if mode == SkillMode.STEELED_STRIKE:
+        warning = "This attack still assumes Verso completed the charge without taking damage."
+        full_charge = (
+            ranked(result(conditional, "S Rank after full charge", "ConDmg", warning)) if conditional is not None else None
+        )
+        charged = ranked(result(base_multiplier, "Charge completed", "Damage Multi", warning))
+
+        def evaluate_steeled(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            rank = rank_of(state)
+            if not disable_rank_bonus and rank == required_rank and full_charge is not None:
+                return bonus(full_charge, rank, True)
+            return bonus(charged, rank, not disable_rank_bonus)
+
+        return evaluate_steeled
+
+    if mode == SkillMode.BERSERK:
+
+        def evaluate_berserk(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            rank = rank_of(state)
+            missing_health = clamp_int(state.get("missing_health"), 0, 99)
+            multiplier = base_multiplier or 0
+            scenario_parts = [f"{missing_health}% missing HP"]
+            if not disable_rank_bonus and rank == required_rank:
+                multiplier *= 1 + (0.15 * missing_health)
+                scenario_parts.append(f"{required_rank} Rank")
+            return apply_verso_rank_bonus(
+                rank,
+                result(round(multiplier, 2), " | ".join(scenario_parts), "Derived from note text"),
+                not disable_rank_bonus,
+            )
+
+        return evaluate_berserk
+
+    def maximum_result(label: str) -> CalculationResult | None:
+        return result(maximum, label, "SRankMAX") if maximum is not None else None
+
+    def conditional_result(label: str) -> RankedResult | None:
+        return ranked(result(conditional, label, "ConDmg")) if conditional is not None else None
+
+    if skill == "End Bringer":
+        stunned_maximum = maximum_result("Stunned target at S Rank")
+        stunned_result = conditional_result("Stunned target")
+
+        def evaluate_end_bringer_skill(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            rank = rank_of(state)
+            if state.get("stunned"):
+                if rank == "S" and stunned_maximum is not None:
+                    return stunned_maximum
+                if stunned_result is not None:
+                    return bonus(stunned_result, rank, not disable_rank_bonus)
+            return bonus(base, rank, not disable_rank_bonus)
+
+        return evaluate_end_bringer_skill
+
+    if skill == "Steeled Strike":
+        setup_maximum = maximum_result("S Rank with full setup")
+        s_rank_result = conditional_result("S Rank")
+
+        def evaluate_steeled_skill(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            rank = rank_of(state)
+            if rank == "S":
+                if setup_maximum is not None and clamp_int(state.get("uses"), 1, 6) >= 2:
+                    return setup_maximum
+                if s_rank_result is not None:
+                    return bonus(s_rank_result, rank, not disable_rank_bonus)
+            return bonus(base, rank, not disable_rank_bonus)
+
+        return evaluate_steeled_skill
+
+    if skill == "Follow Up":
+        shots_maximum = maximum_result("10 shots at S Rank")
+        by_shots = [None] + [
+            ranked(
+                result(
+                    round((base_multiplier or 0) * (1 + (0.5 * shots)), 2),
+                    f"{shots} ranged shot(s)",
+                    "Derived from note text",
+                )
+            )
+            for shots in range(1, 11)
+        ]
+
+        def evaluate_follow_up_skill(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            rank = rank_of(state)
+            shots = clamp_int(state.get("shots"), 0, 10)
+            if rank == "S" and shots >= 10 and shots_maximum is not None:
+                return shots_maximum
+            if shots > 0:
+                return bonus(by_shots[shots], rank, not disable_rank_bonus)
+            return bonus(base, rank, not disable_rank_bonus)
+
+        return evaluate_follow_up_skill
+
+    if skill == "Ascending Assault":
+        uses_maximum = maximum_result("6th use at S Rank")
+        sixth_use = conditional_result("6th use")
+        by_uses = [None, None] + [
+            ranked(
+                result(
+                    round((base_multiplier or 0) * (1 + (0.3 * min(uses - 1, 5))), 2),
+                    f"Use {uses}",
+                    "Derived from note text",
+                )
+            )
+            for uses in range(2, 7)
+        ]
+
+        def evaluate_ascending_skill(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            rank = rank_of(state)
+            uses = clamp_int(state.get("uses"), 1, 6)
+            if rank == "S" and uses >= 6 and uses_maximum is not None:
+                return uses_maximum
+            if uses >= 6 and sixth_use is not None:
+                return bonus(sixth_use, rank, not disable_rank_bonus)
+            if uses >= 2:
+                return bonus(by_uses[uses], rank, not disable_rank_bonus)
+            return bonus(base, rank, not disable_rank_bonus)
+
+        return evaluate_ascending_skill
+
+    if skill == "Speed Burst":
+        speed_maximum = maximum_result("C Rank with full speed bonus")
+        c_rank_result = conditional_result("C Rank")
+
+        def evaluate_speed_burst_skill(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+            rank = rank_of(state)
+            if state.get("speed_bonus") and speed_maximum is not None:
+                return speed_maximum
+            if rank == "C" and c_rank_result is not None:
+                return bonus(c_rank_result, rank, not disable_rank_bonus)
+            return bonus(base, rank, not disable_rank_bonus)
+
+        return evaluate_speed_burst_skill
+
+    s_rank_maximum = maximum_result("S Rank") if skill not in VERSO_UNRANKED_SKILLS else None
+
+    def evaluate_generic(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+        rank = rank_of(state)
+        if rank == "S" and s_rank_maximum is not None:
+            return s_rank_maximum
+        if rank == required_rank and required_result is not None:
+            return bonus(required_result, rank, not disable_rank_bonus)
+        return bonus(base, rank, not disable_rank_bonus)
+
+    return evaluate_generic
+
+
+COMPILERS: dict[str, Callable[[CalculatorRow], SkillEvaluator]] = {
+    "gustave": compile_gustave,
+    "lune": compile_lune,
+    "maelle": compile_maelle,
+    "monoco": compile_monoco,
+    "sciel": compile_sciel,
+    "verso": compile_verso,
+}
+
+
+def compile_skill_evaluator(character: str, row: CalculatorRow) -> SkillEvaluator:
+    """Resolve a row's rule chain once into a specialized evaluator.
+
+    Args:
+        character: The calculator character id.
+        row: The skill row to compile.
+
+    Returns:
+        A callable taking the normalized character state and the Verso
+        rank-bonus suppression flag. It returns the same result as
+        ``calculate_skill_result`` for every state, but only reads the state
+        fields the row's branch family uses. Returned results are shared
+        between calls and must be treated as read-only.
+    """
+
+    return COMPILERS[character](row)
+
+
+SKILL_EVALUATORS: dict[CalculatorRow, SkillEvaluator] = {
+    row: compile_skill_evaluator(character, row)
+    for character, payload in CALCULATOR_DATA.items()
+    for row in payload["records"]
+}
+# Rows covered by the shipped outcome tables answer from a table read and only
+# run their compiled evaluator for states outside the tabulated ranges.
+for table_row, outcome_table in load_outcome_tables().items():
+    SKILL_EVALUATORS[table_row] = table_evaluator(outcome_table, SKILL_EVALUATORS[table_row])
+
+
+def evaluate_skill_result(
+    character: str,
+    row: CalculatorRow,
+    state: CalculatorState,
+    disable_verso_rank_bonus: bool = False,
+) -> CalculationResult:
+    """Evaluate a skill through its compiled evaluator.
+
+    Rows that were not loaded into ``CALCULATOR_DATA`` fall back to
+    ``calculate_skill_result``.
+    """
+
+    evaluator = SKILL_EVALUATORS.get(row)
+    if evaluator is None:
+        return calculate_skill_result(character, row, state, disable_verso_rank_bonus)
+    return evaluator(state, disable_verso_rank_bonus)
+
+
+def evaluate_skill_rows(
+    character: str,
+    rows: list[CalculatorRow],
+    state: CalculatorState,
+    selected_pictos: list[str] | None,
+    picto_state: dict[str, Any],
+    weapon: str | None,
+    weapon_level: str | int | None,
+    weapon_state: dict[str, Any],
+    attack: float | None,
+    enemy_affinity: str | None = None,
+    attack_type_override: str | None = None,
+) -> list[SkillRanking]:
+    """Evaluate several skill rows against one shared setup.
+
+    Args:
+        character: The calculator character id.
+        rows: The rows to evaluate.
+        state: The normalized character state shared by every row.
+        selected_pictos: The Picto names selected in the UI.
+        picto_state: The normalized Picto state. Its ``attack_type`` is
+            replaced per row with the resolved attack type.
+        weapon: The selected weapon name, if any.
+        weapon_level: The selected weapon unlock level.
+        weapon_state: The normalized weapon state. Its ``attack_type`` is
+            replaced per row with the resolved attack type.
+        attack: The effective attack power used for damage estimates.
+        enemy_affinity: The selected enemy elemental affinity.
+        attack_type_override: The optional Picto attack-type override.
+
+    Returns:
+        One entry per row, in ``rows`` order. Picto summaries only depend on
+        the resolved attack type and weapon summaries only on the attack type
+        plus the row columns the weapon reads, so each distinct summary is
+        evaluated once and shared across rows.
+    """
+
+    picto_summaries: dict[str, PictoSummary] = {}
+    weapon_summaries: dict[tuple[str, ...], WeaponSummary] = {}
+    row_keys = weapon_row_keys(character, weapon)
+    entries: list[SkillRanking] = []
+
+    for row in rows:
+        attack_type = resolve_picto_attack_type(row, attack_type_override)
+
+        picto_summary = picto_summaries.get(attack_type)
+        if picto_summary is None:
+            picto_summary = evaluate_pictos(selected_pictos, {**picto_state, "attack_type": attack_type})
+            picto_summaries[attack_type] = picto_summary
+
+        weapon_key = (attack_type, *(clean_text(row.get(key)) for key in row_keys))
+        weapon_summary = weapon_summaries.get(weapon_key)
+        if weapon_summary is None:
+            weapon_summary = evaluate_weapon(
+                character,
+                weapon,
+                weapon_level,
+                row,
+                {**weapon_state, "attack_type": attack_type},
+            )
+            weapon_summaries[weapon_key] = weapon_summary
+
+        skill_result = SKILL_EVALUATORS[row](state, weapon_summary["suppress_verso_rank_bonus"])
+        skill_result = apply_weapon_bonus(skill_result, weapon_summary)
+        skill_result = apply_picto_bonus(skill_result, picto_summary)
+
+        multiplier = skill_result.get("multiplier")
+        effective_multiplier = None
+        if isinstance(multiplier, (int, float)):
+            effective_multiplier = round(multiplier * resolve_affinity(row, enemy_affinity)["factor"], 2)
+        damage = calculate_damage(attack, effective_multiplier)
+        cost = calculate_current_cost(character, row, state)
+        cost_value = parse_number(cost)
+        damage_per_ap = None
+        if damage is not None and cost_value not in (None, 0):
+            damage_per_ap = round(damage / cost_value, 2)
+
+        entries.append(
+            {
+                "skill": row.skill,
+                "multiplier": effective_multiplier,
+                "damage": damage,
+                "cost": cost,
+                "cost_value": cost_value,
+                "damage_per_ap": damage_per_ap,
+                "scenario": clean_text(skill_result.get("scenario")),
+                "warning": skill_result.get("warning"),
+            }
+        )
+
+    return entries
+
+
+def rank_character_skills(
+    character: str,
+    state: CalculatorState,
+    selected_pictos: list[str] | None,
+    picto_state: dict[str, Any],
+    weapon: str | None,
+    weapon_level: str | int | None,
+    weapon_state: dict[str, Any],
+    attack: float | None,
+    enemy_affinity: str | None = None,
+    attack_type_override: str | None = None,
+) -> list[SkillRanking]:
+    """Evaluate every skill row for one character and rank them by damage.
+
+    Args:
+        character: The calculator character id.
+        state: The normalized character state shared by every row.
+        selected_pictos: The Picto names selected in the UI.
+        picto_state: The normalized Picto state.
+        weapon: The selected weapon name, if any.
+        weapon_level: The selected weapon unlock level.
+        weapon_state: The normalized weapon state.
+        attack: The effective attack power used for damage estimates.
+        enemy_affinity: The selected enemy elemental affinity.
+        attack_type_override: The optional Picto attack-type override.
+
+    Returns:
+        One ranking entry per skill row from ``evaluate_skill_rows``, sorted
+        by effective multiplier (and therefore estimated damage) with rows
+        that deal no direct damage last.
+    """
+
+    rankings = evaluate_skill_rows(
+        character,
+        CALCULATOR_DATA[character]["records"],
+        state,
+        selected_pictos,
+        picto_state,
+        weapon,
+        weapon_level,
+        weapon_state,
+        attack,
+        enemy_affinity,
+        attack_type_override,
+    )
+    rankings.sort(
+        key=lambda entry: (
+            entry["multiplier"] is None,
+            -(entry["multiplier"] or 0),
+            entry["skill"].lower(),
+        )
+    )
+    return rankings
+
+
+def compare_character_skills(
+    character: str,
+    skills: list[str],
+    state: CalculatorState,
+    selected_pictos: list[str] | None,
+    picto_state: dict[str, Any],
+    weapon: str | None,
+    weapon_level: str | int | None,
+    weapon_state: dict[str, Any],
+    attack: float | None,
+    enemy_affinity: str | None = None,
+    attack_type_override: str | None = None,
+) -> list[SkillRanking]:
+    """Evaluate a chosen set of skills side by side in one shared pass.
+
+    Args:
+        character: The calculator character id.
+        skills: The skill names to compare. Unknown and repeated names are
+            skipped.
+        state: The normalized character state shared by every row.
+        selected_pictos: The Picto names selected in the UI.
+        picto_state: The normalized Picto state.
+        weapon: The selected weapon name, if any.
+        weapon_level: The selected weapon unlock level.
+        weapon_state: The normalized weapon state.
+        attack: The effective attack power used for damage estimates.
+        enemy_affinity: The selected enemy elemental affinity.
+        attack_type_override: The optional Picto attack-type override.
+
+    Returns:
+        One entry per compared skill from ``evaluate_skill_rows``, in the
+        order the skills were given.
+    """
+
+    skill_rows = CALCULATOR_DATA[character]["skills"]
+    rows = [skill_rows[skill] for skill in dict.fromkeys(skills) if skill in skill_rows]
+    return evaluate_skill_rows(
+        character,
+        rows,
+        state,
+        selected_pictos,
+        picto_state,
+        weapon,
+        weapon_level,
+        weapon_state,
+        attack,
+        enemy_affinity,
+        attack_type_override,
+    )
@@ -0,0 +1,416 @@
+"""Read selected properties straight from an Unreal Engine GVAS save.
+
+Only the top-level properties asked for are decoded; every other property is
+skipped using the size in its tag, so most of the save is never touched. The
+decoded values use the plain mapped-JSON form the ``save_import`` accessors
+already accept:
+
+- Maps become lists of ``{"key": ..., "value": ...}`` entries.
+- Arrays and sets become lists, and structs become dicts.
+- Names, strings, and enum labels become strings; numbers stay numbers.
+
+Struct fields are keyed ``<name>_<array index>``, the same keys uesave
+writes. Field values the reader has no decoder for, such as text or object
+references, are left out. Anything that does not parse cleanly raises
+``GvasError``, so callers can fall back to uesave.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+import struct
+from typing import Any, TypeAlias
+
+# A property type and its parameters: ``("ArrayProperty", (("NameProperty", ()),))``.
+PropertyType: TypeAlias = tuple[str, tuple["PropertyType", ...]]
+
+GVAS_MAGIC = b"GVAS"
+SUPPORTED_SAVE_GAME_VERSIONS = (2, 3)
+# UE5 object versions that change how properties are written.
+LARGE_WORLD_COORDINATES = 1004
+PROPERTY_TAG_EXTENSION = 1011
+PROPERTY_TAG_COMPLETE_TYPE_NAME = 1012
+# EPropertyTagFlags in the complete-type-name tag layout.
+TAG_HAS_ARRAY_INDEX = 0x01
+TAG_HAS_GUID = 0x02
+TAG_HAS_EXTENSIONS = 0x04
+TAG_BOOL_TRUE = 0x10
+# EPropertyTagExtension bit followed by two bytes of overridable state.
+EXTENSION_OVERRIDABLE = 0x02
+
+SCALARS = {
+    "Int8Property": struct.Struct("<b"),
+    "Int16Property": struct.Struct("<h"),
+    "IntProperty": struct.Struct("<i"),
+    "Int64Property": struct.Struct("<q"),
+    "UInt16Property": struct.Struct("<H"),
+    "UInt32Property": struct.Struct("<I"),
+    "UInt64Property": struct.Struct("<Q"),
+    "FloatProperty": struct.Struct("<f"),
+    "DoubleProperty": struct.Struct("<d"),
+}
+STRING_TYPES = ("NameProperty", "StrProperty", "EnumProperty")
+# Engine structs written as raw bytes instead of tagged properties, with
+# their size before and after large world coordinates.
+NATIVE_STRUCT_SIZES = {
+    "Guid": (16, 16),
+    "DateTime": (8, 8),
+    "Timespan": (8, 8),
+    "IntPoint": (8, 8),
+    "IntVector": (12, 12),
+    "Color": (4, 4),
+    "LinearColor": (16, 16),
+    "Vector": (12, 24),
+    "Vector2D": (8, 16),
+    "Vector4": (16, 32),
+    "Rotator": (12, 24),
+    "Quat": (16, 32),
+}
+INT32 = struct.Struct("<i")
+UINT8 = struct.Struct("<B")
+SKIPPED = object()
+
+
+class GvasError(ValueError):
+    """Raised when a save cannot be read natively."""
+
+
+@dataclass(frozen=True, slots=True)
+class PropertyTag:
+    """The header written in front of every property value."""
+
+    name: str
+    type: PropertyType
+    size: int
+    index: int
+    bool_value: bool
+
+
+class GvasReader:
+    """A cursor over the bytes of one save."""
+
+    __slots__ = ("data", "offset", "ue5_version")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.offset = 0
+        self.ue5_version = 0
+
+    @property
+    def complete_types(self) -> bool:
+        """Whether tags carry full type names, including container and enum parameters."""
+
+        return self.ue5_version >= PROPERTY_TAG_COMPLETE_TYPE_NAME
+
+    def skip(self, size: int) -> None:
+        """Move past ``size`` bytes."""
+
+        if size < 0 or self.offset + size > len(self.data):
+            raise GvasError(f"Unexpected end of save at byte {self.offset}.")
+        self.offset += size
+
+    def unpack(self, layout: struct.Struct) -> Any:
+        """Read one value with a single-field struct layout."""
+
+        start = self.offset
+        self.skip(layout.size)
+        return layout.unpack_from(self.data, start)[0]
+
+    def int32(self) -> int:
+        """Read a signed 32-bit integer."""
+
+        return self.unpack(INT32)
+
+    def uint8(self) -> int:
+        """Read one byte."""
+
+        return self.unpack(UINT8)
+
+    def fstring(self) -> str:
+        """Read a length-prefixed, null-terminated ``FString``."""
+
+        length = self.int32()
+        if length == 0:
+            return ""
+        width, encoding = (1, "latin-1") if length > 0 else (2, "utf-16-le")
+        start = self.offset
+        self.skip(abs(length) * width)
+        raw = self.data[start:self.offset]
+        if any(raw[-width:]):
+            raise GvasError(f"Unterminated string at byte {start}.")
+        return bytes(raw[:-width]).decode(encoding)
+
+    def peek_fstring(self) -> str | None:
+        """Return the next ``FString`` without consuming it, or ``None`` when there is none."""
+
+        start = self.offset
+        try:
+            return self.fstring()
+        except GvasError:
+            return None
+        finally:
+            self.offset = start
+
+
+def read_header(reader: GvasReader) -> None:
+    """Read the save header and record the UE5 object version the body was written with."""
+
+    if bytes(reader.data[:4]) != GVAS_MAGIC:
+        raise GvasError("File is not an uncompressed GVAS save.")
+    reader.skip(4)
+    save_game_version = reader.int32()
+    if save_game_version not in SUPPORTED_SAVE_GAME_VERSIONS:
+        raise GvasError(f"Unsupported save game version {save_game_version}.")
+    reader.int32()  # UE4 package version
+    reader.ue5_version = reader.int32() if save_game_version >= 3 else 0
+    reader.skip(10)  # Engine major, minor, and patch versions and changelist
+    reader.fstring()  # Engine branch
+    if reader.int32() != 3:
+        raise GvasError("Unsupported custom version format.")
+    custom_versions = reader.int32()
+    reader.skip(20 * custom_versions)  # Custom version GUIDs and numbers
+    reader.fstring()  # Save game class
+
+
+def read_type_name(reader: GvasReader) -> PropertyType:
+    """Read a complete type name: a tree of names, each followed by its parameter count."""
+
+    name = reader.fstring()
+    count = reader.int32()
+    if count < 0 or count > 8:
+        raise GvasError(f"Malformed type name {name!r}.")
+    return name, tuple(read_type_name(reader) for _ in range(count))
+
+
+def read_tag_extensions(reader: GvasReader) -> None:
+    """Skip the property extensions written since UE 5.4."""
+
+    if reader.uint8() & EXTENSION_OVERRIDABLE:
+        reader.skip(2)
+
+
+def read_tag(reader: GvasReader) -> PropertyTag | None:
+    """Read one property tag, or ``None`` at the ``None`` tag that ends a property list."""
+
+    name = reader.fstring()
+    if name == "None":
+        return None
+
+    if reader.complete_types:
+        property_type = read_type_name(reader)
+        size = reader.int32()
+        flags = reader.uint8()
+        index = reader.int32() if flags & TAG_HAS_ARRAY_INDEX else 0
+        if flags & TAG_HAS_GUID:
+            reader.skip(16)
+        if flags & TAG_HAS_EXTENSIONS:
+            read_tag_extensions(reader)
+        return PropertyTag(name, property_type, size, index, bool(flags & TAG_BOOL_TRUE))
+
+    type_name = reader.fstring()
+    size = reader.int32()
+    index = reader.int32()
+    parameters: tuple[PropertyType, ...] = ()
+    bool_value = False
+    if type_name == "StructProperty":
+        parameters = ((reader.fstring(), ()),)
+        reader.skip(16)  # Struct GUID
+    elif type_name == "BoolProperty":
+        bool_value = bool(reader.uint8())
+    elif type_name in ("ByteProperty", "EnumProperty"):
+        enum_name = reader.fstring()
+        parameters = ((enum_name, ()),) if enum_name != "None" else ()
+    elif type_name in ("ArrayProperty", "SetProperty", "OptionalProperty"):
+        parameters = ((reader.fstring(), ()),)
+    elif type_name == "MapProperty":
+        parameters = ((reader.fstring(), ()), (reader.fstring(), ()))
+    if reader.uint8():
+        reader.skip(16)  # Property GUID
+    if reader.ue5_version >= PROPERTY_TAG_EXTENSION:
+        read_tag_extensions(reader)
+    return PropertyTag(name, (type_name, parameters), size, index, bool_value)
+
+
+def read_properties(reader: GvasReader, wanted: frozenset[str] | None = None) -> dict[str, Any]:
+    """Read a tagged property list up to its ``None`` tag.
+
+    Args:
+        reader: The reader, positioned at the first tag.
+        wanted: Top-level keys to decode, or ``None`` to decode every field.
+            When given, every other property is skipped and reading stops as
+            soon as all wanted keys were found.
+
+    Returns:
+        The decoded values keyed ``<name>_<array index>``, or by the bare
+        name when that is the wanted key.
+    """
+
+    properties: dict[str, Any] = {}
+    while (tag := read_tag(reader)) is not None:
+        key = tag.name if wanted is not None and tag.name in wanted else f"{tag.name}_{tag.index}"
+        if wanted is not None and key not in wanted:
+            reader.skip(tag.size)
+            continue
+        value = read_sized_value(reader, tag)
+        if value is not SKIPPED:
+            properties[key] = value
+        if wanted is not None and wanted.issubset(properties):
+            break
+    return properties
+
+
+def read_sized_value(reader: GvasReader, tag: PropertyTag) -> Any:
+    """Read the value behind a tag, checking it used exactly ``tag.size`` bytes.
+
+    Returns:
+        The decoded value, or ``SKIPPED`` for types the reader does not decode
+        and for structs that are not tagged property lists.
+    """
+
+    kind, parameters = tag.type
+    start = reader.offset
+    end = start + tag.size
+    if end > len(reader.data):
+        raise GvasError(f"Property {tag.name!r} runs past the end of the save.")
+
+    if kind == "BoolProperty":
+        value: Any = tag.bool_value
+    elif kind == "ByteProperty":
+        value = reader.uint8() if tag.size == 1 else reader.fstring()
+    elif kind in SCALARS or kind in STRING_TYPES:
+        value = read_element(reader, tag.type, False)
+    elif kind == "StructProperty":
+        try:
+            value = read_struct(reader, parameters[0][0] if parameters else "")
+        except GvasError:
+            value = SKIPPED
+        if reader.offset != end:
+            value = SKIPPED
+    elif kind in ("ArrayProperty", "SetProperty", "MapProperty"):
+        value = read_container(reader, tag, end)
+    else:
+        value = SKIPPED
+
+    if value is SKIPPED:
+        reader.offset = end
+    elif reader.offset != end:
+        raise GvasError(f"Property {tag.name!r} used {reader.offset - start} of its {tag.size} bytes.")
+    return value
+
+
+def read_container(reader: GvasReader, tag: PropertyTag, end: int) -> Any:
+    """Read an array, set, or map value.
+
+    Older tags do not say whether a byte element is an enum label or a raw
+    byte, so when the first reading does not end exactly at ``end`` the
+    other reading is tried.
+    """
+
+    start = reader.offset
+    attempts = (False,) if reader.complete_types else (True, False)
+    for byte_labels in attempts:
+        reader.offset = start
+        try:
+            value = read_container_body(reader, tag, byte_labels)
+        except GvasError:
+            continue
+        if reader.offset == end:
+            return value
+    raise GvasError(f"Could not read {tag.type[0]} {tag.name!r}.")
+
+
+def read_container_body(reader: GvasReader, tag: PropertyTag, byte_labels: bool) -> Any:
+    """Decode a container value under one byte-element reading."""
+
+    kind, parameters = tag.type
+    if kind == "MapProperty":
+        key_type, value_type = parameters
+        for _ in range(reader.int32()):  # Keys removed relative to the class default
+            read_element(reader, key_type, byte_labels)
+        return [
+            {"key": read_element(reader, key_type, byte_labels), "value": read_element(reader, value_type, byte_labels)}
+            for _ in range(reader.int32())
+        ]
+
+    (inner_type,) = parameters
+    if kind == "SetProperty":
+        for _ in range(reader.int32()):
+            read_element(reader, inner_type, byte_labels)
+    count = reader.int32()
+    if inner_type[0] == "StructProperty" and (not reader.complete_types or reader.peek_fstring() == tag.name):
+        inner_tag = read_tag(reader)
+        if inner_tag is None:
+            raise GvasError(f"Missing element tag in {tag.name!r}.")
+        inner_type = inner_tag.type
+    layout = SCALARS.get(inner_type[0])
+    if layout is None and inner_type == ("ByteProperty", ()) and not (byte_labels and not reader.complete_types):
+        layout = UINT8
+    if layout is not None and count >= 0:
+        # Plain numbers and raw bytes are stored back to back.
+        start = reader.offset
+        reader.skip(layout.size * count)
+        return list(struct.unpack_from(f"<{count}{layout.format[-1]}", reader.data, start))
+    return [read_element(reader, inner_type, byte_labels) for _ in range(count)]
+
+
+def read_element(reader: GvasReader, property_type: PropertyType, byte_labels: bool) -> Any:
+    """Read one untagged value, as stored inside containers.
+
+    Args:
+        reader: The reader, positioned at the value.
+        property_type: The value's type.
+        byte_labels: Whether byte values without an enum in their type are
+            enum labels rather than raw bytes.
+    """
+
+    kind, parameters = property_type
+    layout = SCALARS.get(kind)
+    if layout is not None:
+        return reader.unpack(layout)
+    if kind in STRING_TYPES:
+        return reader.fstring()
+    if kind == "ByteProperty":
+        return reader.fstring() if parameters or (byte_labels and not reader.complete_types) else reader.uint8()
+    if kind == "BoolProperty":
+        return bool(reader.uint8())
+    if kind == "StructProperty":
+        return read_struct(reader, parameters[0][0] if parameters else "")
+    raise GvasError(f"Unsupported element type {kind}.")
+
+
+def read_struct(reader: GvasReader, struct_name: str) -> Any:
+    """Read a struct value: raw bytes for known engine structs, tagged properties otherwise.
+
+    Engine structs are skipped and read as ``None``; the import never uses them.
+    """
+
+    sizes = NATIVE_STRUCT_SIZES.get(struct_name)
+    if sizes is not None:
+        reader.skip(sizes[reader.ue5_version >= LARGE_WORLD_COORDINATES])
+        return None
+    return read_properties(reader)
+
+
+def read_save_properties(save_bytes: bytes, names: frozenset[str]) -> dict[str, Any]:
+    """Decode selected top-level properties of a GVAS save.
+
+    Args:
+        save_bytes: The raw ``.sav`` contents.
+        names: The top-level property keys to decode, as uesave names them
+            (for example ``CharactersCollection_0``).
+
+    Returns:
+        ``{"root": {"properties": ...}}`` holding the properties found, in the
+        shape ``build_import_payload`` reads.
+
+    Raises:
+        GvasError: If the save is not an uncompressed GVAS file or a wanted
+            property cannot be decoded.
+    """
+
+    reader = GvasReader(save_bytes)
+    try:
+        read_header(reader)
+        properties = read_properties(reader, names)
+    except (struct.error, UnicodeDecodeError, RecursionError) as exc:
+        raise GvasError(f"Malformed save: {exc}") from exc
+    return {"root": {"properties": properties}}
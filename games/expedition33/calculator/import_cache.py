@@ -0,0 +1,147 @@
+"""Reuse parsed save imports when the same ``.sav`` is uploaded again.
+
+Parsed payloads are keyed by the SHA-256 of the decoded save bytes and of the
+files the import depends on, so editing the skill CSVs, the Picto or weapon
+definitions, the name matching, or the save reader invalidates every entry.
+Each worker keeps a small in-memory LRU in front of a directory of JSON files
+shared by all workers. The directory is trimmed to ``IMPORT_CACHE_BYTES``, dropping the
+least recently read entries first.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Any, TypedDict
+
+from loguru import logger
+
+from games.expedition33.calculator.core import CSV_DIR
+from games.expedition33.calculator.tables import source_fingerprint
+
+IMPORT_CACHE_DIR = Path(os.environ.get("LUDEX_IMPORT_CACHE_DIR") or Path(tempfile.gettempdir()) / "ludex-exp33-parsed-saves")
+IMPORT_CACHE_BYTES = 64 * 1024 * 1024
+# Parsed payloads kept in memory per worker process.
+IMPORT_MEMORY_CACHE_SIZE = 64
+# Files whose contents shape a parsed import.
+IMPORT_SOURCES = (
+    *sorted(CSV_DIR.glob("*.csv")),
+    Path(__file__).with_name("pictos.py"),
+    Path(__file__).with_name("weapons.py"),
+    Path(__file__).with_name("save_import.py"),
+    Path(__file__).with_name("gvas.py"),
+    Path(__file__).with_name("json_stream.py"),
+)
+IMPORT_DATA_VERSION = source_fingerprint(IMPORT_SOURCES)
+
+
+class ImportCacheStats(TypedDict):
+    """Hit/miss counters for the parsed-import cache."""
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    evicted: int
+    memory_entries: int
+
+
+memory_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+import_cache_counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evicted": 0}
+
+
+def import_cache_digest() -> hashlib._Hash:
+    """Return a hash that yields a save's cache key once the save bytes are fed to it."""
+
+    return hashlib.sha256(IMPORT_DATA_VERSION.encode())
+
+
+def import_cache_key(save_bytes: bytes) -> str:
+    """Return the cache key of one decoded save under the current calculator data."""
+
+    digest = import_cache_digest()
+    digest.update(save_bytes)
+    return digest.hexdigest()
+
+
+def remember(key: str, payload: dict[str, Any]) -> None:
+    """Put a payload at the front of this worker's LRU."""
+
+    memory_cache[key] = payload
+    memory_cache.move_to_end(key)
+    while len(memory_cache) > IMPORT_MEMORY_CACHE_SIZE:
+        memory_cache.popitem(last=False)
+
+
+def cached_import(key: str) -> dict[str, Any] | None:
+    """Return a previously parsed payload, or ``None`` when it is not cached.
+
+    Cached payloads are shared between requests and must be treated as
+    read-only.
+    """
+
+    payload = memory_cache.get(key)
+    if payload is not None:
+        memory_cache.move_to_end(key)
+        import_cache_counters["memory_hits"] += 1
+        return payload
+
+    path = IMPORT_CACHE_DIR / f"{key}.json"
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        os.utime(path)
+    except (OSError, json.JSONDecodeError):
+        import_cache_counters["misses"] += 1
+        return None
+    import_cache_counters["disk_hits"] += 1
+    remember(key, payload)
+    return payload
+
+
+def cache_import(key: str, payload: dict[str, Any]) -> None:
+    """Store a parsed payload in memory and on disk.
+
+    Disk failures are logged and otherwise ignored; the import itself has
+    already succeeded.
+    """
+
+    remember(key, payload)
+    try:
+        IMPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=IMPORT_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as file:
+            json.dump(payload, file, separators=(",", ":"))
+        os.replace(temporary, IMPORT_CACHE_DIR / f"{key}.json")
+        trim_import_cache()
+    except OSError as exc:
+        logger.warning("Could not cache parsed save import: {}", exc)
+
+
+def trim_import_cache() -> None:
+    """Delete the least recently read entries until the directory fits ``IMPORT_CACHE_BYTES``."""
+
+    entries = []
+    for path in IMPORT_CACHE_DIR.glob("*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= IMPORT_CACHE_BYTES:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        import_cache_counters["evicted"] += 1
+
+
+def import_cache_stats() -> ImportCacheStats:
+    """Return this worker's parsed-import cache counters."""
+
+    return {**import_cache_counters, "memory_entries": len(memory_cache)}
@@ -0,0 +1,384 @@
+"""Run save imports as background jobs that any worker can poll or cancel.
+
+An import can wait ``UESAVE_QUEUE_TIMEOUT_SECONDS`` for a uesave slot and
+then convert for ``UESAVE_TIMEOUT_SECONDS``. Running it inside the upload
+callback holds a request worker for all of that. ``start_import_job`` looks
+the upload up in ``import_cache`` first, and a save imported before finishes
+on the spot. Otherwise it forks a job process that only reads the save and
+returns at once. The job writes its stage to a JSON file in a directory
+shared by every gunicorn worker, so the poll and cancel callbacks work from
+whichever worker receives them. The parsed payload is left in a result file,
+and the first worker to poll it afterwards caches it, stores it in
+``import_store``, and records the token. The cache and the store, and their
+counters, therefore live in the workers and not in short-lived job processes.
+
+The job process leads its own process group, which uesave joins. Cancelling
+leaves a marker file that the job checks at every stage, and sends
+``CANCEL_SIGNAL`` to the group. The job process ignores the signal, and uesave
+exits on it, so the conversion stops while the job still releases its uesave
+slot normally. The job file records the job process's pid together with its
+start time, and the group is only signalled while a process with that pid
+and start time is running, so a pid reused after the job exits is never
+signalled. Job files expire ``IMPORT_JOB_TTL_SECONDS`` after their last
+update.
+"""
+
+from __future__ import annotations
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import secrets
+import signal
+import tempfile
+import time
+from typing import Any, TypedDict
+
+from loguru import logger
+
+from games.expedition33.calculator.import_cache import cache_import, cached_import
+from games.expedition33.calculator.import_store import TOKEN_PATTERN, store_import
+from games.expedition33.calculator.save_import import SaveImportError, SaveImportPayload, parse_save_bytes
+from games.expedition33.calculator.save_uploads import discard_upload, take_upload, upload_record
+
+IMPORT_JOB_DIR = Path(os.environ.get("LUDEX_IMPORT_JOB_DIR") or Path(tempfile.gettempdir()) / "ludex-exp33-import-jobs")
+IMPORT_JOB_TTL_SECONDS = 15 * 60
+# Share of the progress bar filled when each stage starts.
+IMPORT_STAGES = {
+    "starting": (0.05, "Starting import"),
+    "loading": (0.1, "Loading upload"),
+    "reading": (0.25, "Reading save"),
+    "waiting": (0.4, "Waiting for the save converter"),
+    "converting": (0.6, "Converting save"),
+    "storing": (0.9, "Storing import"),
+}
+# The job process ignores this signal; uesave, in the same process group, exits on it.
+CANCEL_SIGNAL = signal.SIGUSR1
+# Handlers gunicorn installs in its workers; a job process restores the defaults.
+WORKER_SIGNALS = (signal.SIGTERM, signal.SIGINT, signal.SIGQUIT, signal.SIGABRT, signal.SIGWINCH)
+
+
+class ImportCancelled(Exception):
+    """Raised inside a job process once its import was cancelled."""
+
+
+class ImportJobStatus(TypedDict):
+    """The state of one import job, as written to its job file."""
+
+    state: str
+    stage: str
+    message: str
+    pid: int | None
+    started: int | None
+    token: str | None
+    filename: str | None
+    characters: list[str]
+    preferred_character: str | None
+
+
+class ParsedImport(TypedDict):
+    """A job process's parsed payload, as written to its result file."""
+
+    cache_key: str
+    payload: SaveImportPayload
+
+
+class ImportJobStats(TypedDict):
+    """Counters for the import jobs started and polled by one worker."""
+
+    started: int
+    cached: int
+    cancelled: int
+    polls: int
+    running: int
+
+
+job_counters = {"started": 0, "cached": 0, "cancelled": 0, "polls": 0}
+job_processes = multiprocessing.get_context("fork")
+
+
+def job_path(job_id: str) -> Path:
+    """Return the file holding one job's status."""
+
+    return IMPORT_JOB_DIR / f"{job_id}.json"
+
+
+def cancel_path(job_id: str) -> Path:
+    """Return the marker file that asks one job to stop."""
+
+    return IMPORT_JOB_DIR / f"{job_id}.cancel"
+
+
+def result_path(job_id: str) -> Path:
+    """Return the file a job process leaves its parsed payload in."""
+
+    return IMPORT_JOB_DIR / f"{job_id}.result"
+
+
+def finish_path(job_id: str) -> Path:
+    """Return the marker of the worker storing one job's payload."""
+
+    return IMPORT_JOB_DIR / f"{job_id}.finishing"
+
+
+def job_status(state: str, stage: str, message: str = "", **fields: Any) -> ImportJobStatus:
+    """Build a job status with the fields a finished job fills in left empty."""
+
+    status: ImportJobStatus = {
+        "state": state,
+        "stage": stage,
+        "message": message,
+        "pid": None,
+        "started": None,
+        "token": None,
+        "filename": None,
+        "characters": [],
+        "preferred_character": None,
+    }
+    status.update(fields)  # type: ignore[typeddict-item]
+    return status
+
+
+def write_job_file(path: Path, data: ImportJobStatus | ParsedImport) -> None:
+    """Replace a file in the job directory in one rename, so readers never see a partial file."""
+
+    handle, temporary = tempfile.mkstemp(dir=IMPORT_JOB_DIR, suffix=".tmp")
+    with os.fdopen(handle, "w", encoding="utf-8") as file:
+        json.dump(data, file, separators=(",", ":"))
+    os.replace(temporary, path)
+
+
+def write_job(job_id: str, status: ImportJobStatus) -> None:
+    """Replace a job's status file."""
+
+    write_job_file(job_path(job_id), status)
+
+
+def read_job(job_id: str) -> ImportJobStatus | None:
+    """Read a job's status file, or return ``None`` when it is missing or unreadable."""
+
+    try:
+        return json.loads(job_path(job_id).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def new_job(status: ImportJobStatus) -> str:
+    """Write the first status of a new job and return its id."""
+
+    IMPORT_JOB_DIR.mkdir(parents=True, exist_ok=True)
+    evict_jobs()
+    job_id = secrets.token_urlsafe(12)
+    write_job(job_id, status)
+    return job_id
+
+
+def done_status(payload: SaveImportPayload) -> ImportJobStatus:
+    """Store an imported payload and build the status of the finished job."""
+
+    return job_status(
+        "done",
+        "done",
+        token=store_import(payload),
+        filename=payload["filename"],
+        characters=list(payload["characters"]),
+        preferred_character=payload["preferred_character"],
+    )
+
+
+def start_import_job(upload_token: str) -> str:
+    """Import one upload, and return the id of the job to poll.
+
+    A save already in ``import_cache`` is stored straight away. Otherwise a
+    job process is forked to read it, after reaping this worker's job
+    processes that have exited.
+    """
+
+    try:
+        upload = upload_record(upload_token)
+    except SaveImportError as exc:
+        return fail_import_job(str(exc))
+    cached = cached_import(upload["cache_key"])
+    if cached is not None:
+        discard_upload(upload_token)
+        job_counters["cached"] += 1
+        return new_job(done_status({**cached, "filename": upload["filename"]}))
+
+    multiprocessing.active_children()
+    job_id = new_job(job_status("running", "starting"))
+    job_processes.Process(target=run_import_job, args=(job_id, upload_token)).start()
+    job_counters["started"] += 1
+    return job_id
+
+
+def fail_import_job(message: str) -> str:
+    """Record a job that failed before it could start, such as a rejected upload.
+
+    The page then reports the failure the same way as a failed import.
+    """
+
+    return new_job(job_status("failed", "failed", message))
+
+
+def run_import_job(job_id: str, upload_token: str) -> None:
+    """Read one upload in a job process, and leave the payload in its result file."""
+
+    os.setpgid(0, 0)
+    for signum in WORKER_SIGNALS:
+        signal.signal(signum, signal.SIG_DFL)
+    signal.signal(CANCEL_SIGNAL, lambda signum, frame: None)
+    started = process_start_time(os.getpid())
+
+    def report(stage: str) -> None:
+        """Record the stage the import reached, or stop if it was cancelled."""
+
+        if cancel_path(job_id).exists():
+            raise ImportCancelled
+        write_job(job_id, job_status("running", stage, pid=os.getpid(), started=started))
+
+    try:
+        report("loading")
+        save_bytes, upload = take_upload(upload_token)
+        payload = parse_save_bytes(save_bytes, upload["filename"], report)
+        report("storing")
+        parsed: ParsedImport = {"cache_key": upload["cache_key"], "payload": payload}
+        write_job_file(result_path(job_id), parsed)
+    except ImportCancelled:
+        write_job(job_id, job_status("cancelled", "cancelled", "Save import cancelled."))
+    except SaveImportError as exc:
+        if cancel_path(job_id).exists():
+            write_job(job_id, job_status("cancelled", "cancelled", "Save import cancelled."))
+        else:
+            write_job(job_id, job_status("failed", "failed", str(exc)))
+    except Exception as exc:
+        logger.exception("Unexpected failure while importing uploaded save: {}", exc)
+        write_job(job_id, job_status("failed", "failed", "Uploaded save could not be imported."))
+
+
+def finish_job(job_id: str, status: ImportJobStatus) -> ImportJobStatus:
+    """Cache and store the payload a job process left, and record the finished job.
+
+    Only the first worker to create the job's finishing marker does this;
+    the others keep reporting the running status until it is done.
+    """
+
+    try:
+        os.close(os.open(finish_path(job_id), os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+    except FileExistsError:
+        return status
+    try:
+        parsed: ParsedImport = json.loads(result_path(job_id).read_text(encoding="utf-8"))
+        cache_import(parsed["cache_key"], parsed["payload"])
+        status = done_status(parsed["payload"])
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Could not store save import job {}: {}", job_id, exc)
+        status = job_status("failed", "failed", "Uploaded save could not be imported.")
+    write_job(job_id, status)
+    result_path(job_id).unlink(missing_ok=True)
+    finish_path(job_id).unlink(missing_ok=True)
+    return status
+
+
+def load_job(job_id: str | None) -> ImportJobStatus | None:
+    """Return a job's current status, reaping this worker's finished job processes.
+
+    A job that was asked to stop reads as cancelled straight away. A job
+    whose payload is ready is finished by ``finish_job``, and a job whose
+    process died without recording an outcome reads as failed.
+
+    Returns:
+        The status, or ``None`` when the id is missing, malformed, or expired.
+    """
+
+    if not isinstance(job_id, str) or not TOKEN_PATTERN.fullmatch(job_id):
+        return None
+    job_counters["polls"] += 1
+    multiprocessing.active_children()
+    status = read_job(job_id)
+    if status is None or status["state"] != "running":
+        return status
+    if cancel_path(job_id).exists():
+        return job_status("cancelled", "cancelled", "Save import cancelled.")
+    if result_path(job_id).exists():
+        return finish_job(job_id, status)
+    if finish_path(job_id).exists():
+        return status
+    if status["pid"] is not None and not job_process_running(status):
+        # Another worker may have finished the job since it was read.
+        latest = read_job(job_id)
+        if latest is not None and latest["state"] != "running":
+            return latest
+        return job_status("failed", "failed", "Save import stopped unexpectedly.")
+    return status
+
+
+def process_alive(pid: int) -> bool:
+    """Return whether a process with this pid still exists."""
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def process_start_time(pid: int) -> int | None:
+    """Return when a process started, in clock ticks since boot, or ``None`` if it does not exist."""
+
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text(encoding="ascii", errors="replace")
+    except OSError:
+        return None
+    # The command name may hold spaces and parentheses; the fields after it do not.
+    return int(stat[stat.rindex(")") + 2 :].split()[19])
+
+
+def job_process_running(status: ImportJobStatus) -> bool:
+    """Return whether the process that wrote a status still runs, rather than a later one given its pid.
+
+    Without ``/proc`` no start time is recorded, and only the pid is checked.
+    """
+
+    if status["pid"] is None:
+        return False
+    if status["started"] is None:
+        return process_alive(status["pid"])
+    return process_start_time(status["pid"]) == status["started"]
+
+
+def cancel_job(job_id: str | None) -> None:
+    """Ask a running job to stop, and stop its uesave conversion if one is running."""
+
+    status = load_job(job_id)
+    if status is None or status["state"] != "running":
+        return
+    cancel_path(job_id).touch()
+    job_counters["cancelled"] += 1
+    # The pid came from a file: only signal it if the job still runs in that same process.
+    latest = read_job(job_id)
+    if latest is None or latest["state"] != "running" or not job_process_running(latest):
+        return
+    try:
+        os.killpg(latest["pid"], CANCEL_SIGNAL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def evict_jobs() -> None:
+    """Delete job and cancel-marker files not updated within ``IMPORT_JOB_TTL_SECONDS``."""
+
+    now = time.time()
+    for path in IMPORT_JOB_DIR.iterdir():
+        try:
+            if now - path.stat().st_mtime > IMPORT_JOB_TTL_SECONDS:
+                path.unlink()
+        except OSError as exc:
+            logger.warning("Could not evict import job {}: {}", path.name, exc)
+
+
+def import_job_stats() -> ImportJobStats:
+    """Return this worker's import-job counters and its running job processes."""
+
+    return {**job_counters, "running": len(multiprocessing.active_children())}
@@ -0,0 +1,117 @@
+"""Keep imported save payloads on the server, behind a short token.
+
+The browser only holds the token. Payloads are written as JSON files to a
+directory shared by every gunicorn worker, so any worker can resolve a token
+minted by another. Entries expire ``IMPORT_TTL_SECONDS`` after their last
+read, and the oldest entries are dropped once the store holds more than
+``IMPORT_STORE_SIZE`` imports.
+"""
+
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+import re
+import secrets
+import tempfile
+import time
+from typing import TypedDict
+
+from loguru import logger
+
+from games.expedition33.calculator.save_import import SaveImportPayload
+
+IMPORT_STORE_DIR = Path(os.environ.get("LUDEX_IMPORT_STORE_DIR") or Path(tempfile.gettempdir()) / "ludex-exp33-imports")
+IMPORT_TTL_SECONDS = 6 * 60 * 60
+IMPORT_STORE_SIZE = 2048
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_-]{16}")
+
+
+class ImportStoreStats(TypedDict):
+    """Counters for the server-side import store."""
+
+    stored: int
+    hits: int
+    misses: int
+    evicted: int
+    entries: int
+
+
+import_counters = {"stored": 0, "hits": 0, "misses": 0, "evicted": 0}
+
+
+def import_path(token: str) -> Path:
+    """Return the file holding one token's payload."""
+
+    return IMPORT_STORE_DIR / f"{token}.json"
+
+
+def store_import(payload: SaveImportPayload) -> str:
+    """Save an imported payload and return the token that refers to it.
+
+    The file is written under a temporary name and renamed into place, so a
+    concurrent read never sees a partial payload.
+    """
+
+    IMPORT_STORE_DIR.mkdir(parents=True, exist_ok=True)
+    evict_imports()
+    token = secrets.token_urlsafe(12)
+    handle, temporary = tempfile.mkstemp(dir=IMPORT_STORE_DIR, suffix=".tmp")
+    with os.fdopen(handle, "w", encoding="utf-8") as file:
+        json.dump(payload, file, separators=(",", ":"))
+    os.replace(temporary, import_path(token))
+    import_counters["stored"] += 1
+    return token
+
+
+def load_import(token: str | None) -> SaveImportPayload | None:
+    """Return the payload behind a token and renew its expiry.
+
+    Returns:
+        The stored payload, or ``None`` when the token is missing, malformed,
+        expired, or was evicted.
+    """
+
+    if not isinstance(token, str) or not TOKEN_PATTERN.fullmatch(token):
+        return None
+    path = import_path(token)
+    try:
+        if time.time() - path.stat().st_mtime > IMPORT_TTL_SECONDS:
+            raise FileNotFoundError(path)
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        os.utime(path)
+    except (OSError, json.JSONDecodeError):
+        import_counters["misses"] += 1
+        return None
+    import_counters["hits"] += 1
+    return payload
+
+
+def evict_imports() -> None:
+    """Delete expired imports, then the least recently read ones beyond the size limit."""
+
+    now = time.time()
+    entries = []
+    for path in IMPORT_STORE_DIR.iterdir():
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    for index, (modified, path) in enumerate(entries):
+        # Leave the size limit room for the entry about to be stored.
+        if now - modified > IMPORT_TTL_SECONDS or index >= IMPORT_STORE_SIZE - 1:
+            try:
+                path.unlink()
+            except OSError as exc:
+                logger.warning("Could not evict imported save {}: {}", path.name, exc)
+                continue
+            import_counters["evicted"] += 1
+
+
+def import_store_stats() -> ImportStoreStats:
+    """Return this worker's import-store counters and the shared entry count."""
+
+    entries = sum(1 for _ in IMPORT_STORE_DIR.glob("*.json")) if IMPORT_STORE_DIR.is_dir() else 0
+    return {**import_counters, "entries": entries}
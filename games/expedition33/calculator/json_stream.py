@@ -0,0 +1,194 @@
+"""Pull selected members out of a large JSON document as it streams in.
+
+The document is read in chunks and walked object by object. Members on the
+way to the wanted object are entered, and every value is decoded with the C
+``json`` scanner. Values beside the wanted members are dropped at once, and
+any that do not fit in one chunk are entered and dropped piece by piece.
+Memory therefore stays around one chunk plus the wanted members, however
+large the document is.
+"""
+
+from __future__ import annotations
+from collections.abc import Iterator
+import codecs
+import json
+from typing import Any, BinaryIO
+
+STREAM_CHUNK_BYTES = 1024 * 1024
+WHITESPACE = " \t\n\r"
+
+
+class JsonStream:
+    """A window of decoded JSON text over a binary stream."""
+
+    __slots__ = ("source", "decoder", "scanner", "text", "pos", "done")
+
+    def __init__(self, source: BinaryIO) -> None:
+        self.source = source
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.scanner = json.JSONDecoder()
+        self.text = ""
+        self.pos = 0
+        self.done = False
+
+    def fill(self) -> None:
+        """Append the next chunk, growing the read with the pending text.
+
+        Reads grow with the text still waiting to be decoded, so a large
+        value is rescanned only a logarithmic number of times.
+
+        Raises:
+            ValueError: If the stream already ended.
+        """
+
+        if self.done:
+            raise ValueError(f"JSON ended early at character {self.pos}.")
+        chunk = self.source.read(max(STREAM_CHUNK_BYTES, len(self.text) - self.pos))
+        self.text = self.text[self.pos:] + self.decoder.decode(chunk or b"", final=not chunk)
+        self.pos = 0
+        self.done = not chunk
+
+    def next_char(self) -> str:
+        """Consume and return the next non-whitespace character."""
+
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                self.pos += 1
+                return self.text[self.pos - 1]
+            self.fill()
+
+    def expect(self, expected: str) -> None:
+        """Consume one structural character.
+
+        Raises:
+            ValueError: If the next character is a different one.
+        """
+
+        found = self.next_char()
+        if found != expected:
+            raise ValueError(f"Expected {expected!r} but found {found!r} in JSON.")
+
+    def peek_char(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+
+        found = self.next_char()
+        self.pos -= 1
+        return found
+
+    def value(self) -> Any:
+        """Decode the value at the cursor.
+
+        A number near the end of the window might continue in the next
+        chunk: ``1`` can be the start of ``1.5e-7``, and the scanner stops
+        before a dangling ``.`` or ``e-``. A value is therefore only accepted
+        once the window holds three more characters or the stream has ended.
+        """
+
+        self.peek_char()
+        while True:
+            try:
+                value, end = self.scanner.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.done:
+                    raise
+            else:
+                if end + 2 < len(self.text) or self.done:
+                    self.pos = end
+                    return value
+            self.fill()
+
+    def skip(self) -> None:
+        """Move the cursor past the value at the cursor, keeping nothing.
+
+        A container that fits in the window is decoded in one call and
+        dropped. A larger one is entered and its members skipped one by one,
+        so the window never has to grow to hold it.
+        """
+
+        first = self.peek_char()
+        if first not in "[{":
+            self.value()
+            return
+        try:
+            _, self.pos = self.scanner.raw_decode(self.text, self.pos)
+            return
+        except json.JSONDecodeError:
+            if self.done:
+                raise
+        if first == "{":
+            for _ in self.members():
+                self.skip()
+            return
+        self.expect("[")
+        if self.peek_char() == "]":
+            self.pos += 1
+            return
+        while True:
+            self.skip()
+            separator = self.next_char()
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' but found {separator!r} in JSON.")
+
+    def members(self) -> Iterator[str]:
+        """Yield each key of the object at the cursor.
+
+        The caller must consume the member's value before asking for the
+        next key.
+        """
+
+        self.expect("{")
+        if self.peek_char() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            separator = self.next_char()
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' but found {separator!r} in JSON.")
+
+
+def extract_members(source: BinaryIO, path: tuple[str, ...], names: frozenset[str]) -> dict[str, Any]:
+    """Decode selected members of one nested object from a JSON stream.
+
+    Args:
+        source: The binary stream holding one JSON object.
+        path: Keys leading from the top-level object to the wanted object.
+        names: Keys of the wanted object whose values are kept.
+
+    Returns:
+        The kept values by key. Reading stops once all of them were found,
+        leaving the rest of ``source`` unread.
+
+    Raises:
+        ValueError: If the text is not valid JSON or ``path`` does not lead
+            to an object.
+    """
+
+    stream = JsonStream(source)
+    found: dict[str, Any] = {}
+
+    def walk(depth: int) -> bool:
+        """Walk the object at the cursor; return ``True`` once everything wanted was found."""
+
+        for key in stream.members():
+            if depth < len(path) and key == path[depth]:
+                if walk(depth + 1):
+                    return True
+            elif depth == len(path) and key in names:
+                found[key] = stream.value()
+                if len(found) == len(names):
+                    return True
+            else:
+                stream.skip()
+        return False
+
+    walk(0)
+    return found
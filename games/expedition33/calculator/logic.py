@@ -5,16 +5,15 @@ from games.expedition33.calculator.core import (
     CalculatorState,
     ControlStyles,
     HIDDEN_STYLE,
+    SkillMode,
     VISIBLE_STYLE,
     base_result,
     clamp_int,
     clean_text,
     extract_first_int,
-    number_from_row,
     parse_rank_requirement,
     rank_matches,
     result,
-    text_from_row,
 )
 from games.expedition33.calculator.pictos import PictoSummary
 from games.expedition33.calculator.weapons import WeaponSummary
@@ -38,15 +37,6 @@ LUNE_STAIN_KEYS = (
 )
 
 
-def split_pipe_values(value: object) -> list[str]:
-    """Split a pipe-delimited sheet field into normalized entries."""
-
-    text = clean_text(value)
-    if not text:
-        return []
-    return [part.strip() for part in text.split("|") if part.strip() and part.strip() != "-"]
-
-
 def lune_stain_inventory(state: CalculatorState) -> dict[str, int]:
     """Read Lune's current stain counts from calculator state."""
 
@@ -59,10 +49,9 @@ def lune_stain_inventory(state: CalculatorState) -> dict[str, int]:
     }
 
 
-def format_lune_stains(value: object) -> str:
-    """Format a stain requirement string for UI text."""
+def format_lune_stains(stains: tuple[str, ...]) -> str:
+    """Format a pre-split stain requirement for UI text."""
 
-    stains = split_pipe_values(value)
     if not stains:
         return "stains"
     if len(stains) == 1 and stains[0].lower() == "all":
@@ -70,11 +59,11 @@ def format_lune_stains(value: object) -> str:
     return " + ".join(stains)
 
 
-def can_satisfy_lune_stains(requirements_text: object, state: CalculatorState) -> bool:
-    """Check whether Lune's current stains satisfy a requirement list."""
+def can_satisfy_lune_stains(stains: tuple[str, ...], state: CalculatorState) -> bool:
+    """Check whether Lune's current stains satisfy a pre-split requirement list."""
 
     requirements: dict[str, int] = {}
-    for stain in split_pipe_values(requirements_text):
+    for stain in stains:
         normalized = stain.lower()
         if normalized == "all":
             continue
@@ -114,10 +103,10 @@ def calculate_gustave(row: CalculatorRow, state: CalculatorState) -> Calculation
         scenario for the selected skill.
     """
 
-    skill = clean_text(row.get("Skill"))
+    skill = row.skill
     if skill.startswith("Overcharge"):
         charges = clamp_int(state.get("charges"), 0, 10)
-        base_multiplier = number_from_row(row, "Damage Multi") or 0
+        base_multiplier = row.damage_multi or 0
         multiplier = base_multiplier * (1 + (0.2 * charges))
         return result(round(multiplier, 2), f"{charges} Charges", "Derived from note text")
 
@@ -136,63 +125,63 @@ def calculate_lune(row: CalculatorRow, state: CalculatorState) -> CalculationRes
         scenario for the selected skill.
     """
 
-    skill = clean_text(row.get("Skill"))
-    mode = text_from_row(row, "Lune Mode")
-    base_multiplier = number_from_row(row, "Damage Multi")
-    conditional = number_from_row(row, "Dmg Con1")
-    maximum = number_from_row(row, "Dmg Max")
-    all_crit_multiplier = number_from_row(row, "All Crit Dmg")
-    condition = text_from_row(row, "Condition 1").lower()
-    max_condition = text_from_row(row, "Con Max Dmg").lower()
+    skill = row.skill
+    mode = row.mode
+    base_multiplier = row.damage_multi
+    conditional = row.dmg_con
+    maximum = row.dmg_max
+    all_crit_multiplier = row.all_crit_dmg
+    condition = row.condition.lower()
+    max_condition = row.max_condition.lower()
     stains = clamp_int(state.get("stains"), 0, 4)
     turns = clamp_int(state.get("turns"), 1, 5)
     all_crits = bool(state.get("all_crits"))
-    consume_ready = can_satisfy_lune_stains(text_from_row(row, "Consume Stains"), state)
-    required_ready = can_satisfy_lune_stains(text_from_row(row, "Required Stains"), state)
+    consume_ready = can_satisfy_lune_stains(row.consume_stains, state)
+    required_ready = can_satisfy_lune_stains(row.required_stains, state)
 
-    if mode == "utility":
+    if mode == SkillMode.UTILITY:
         return result(None, "No direct damage", "Sheet")
 
-    if mode == "utility_extra_turn":
+    if mode == SkillMode.UTILITY_EXTRA_TURN:
         warning = "Additional turn from consume is not folded into this damage number." if consume_ready else None
         return result(base_multiplier, "Direct hit only", "Damage Multi", warning)
 
-    if mode == "burn" or skill.startswith("Burn "):
+    if mode == SkillMode.BURN or skill.startswith("Burn "):
         ticks = clamp_int(state.get("turns"), 1, 3)
         return result(round((base_multiplier or 0) * ticks, 2), f"{ticks} Burn tick(s)", "Derived from burn rows")
 
-    if mode == "requires_stains":
+    if mode == SkillMode.REQUIRES_STAINS:
         if not required_ready:
             return result(
                 None,
                 "Missing required stains",
                 "Required Stains",
-                f"Requires {format_lune_stains(text_from_row(row, 'Required Stains'))}. Light stains can substitute missing elemental stains.",
+                f"Requires {format_lune_stains(row.required_stains)}. Light stains can substitute missing elemental stains.",
             )
         return result(base_multiplier, "Required stains met", "Damage Multi")
 
-    if mode == "consume":
+    if mode == SkillMode.CONSUME:
         if consume_ready and conditional is not None:
-            return result(conditional, text_from_row(row, "Condition 1") or "Consume ready", "Dmg Con1")
+            return result(conditional, row.condition or "Consume ready", "Dmg Con1")
         return result(base_multiplier, "Base hit sequence", "Damage Multi")
 
-    if mode == "crit":
+    if mode == SkillMode.CRIT:
         if all_crits and all_crit_multiplier is not None:
             return result(all_crit_multiplier, "All hits crit", "All Crit Dmg")
         return result(base_multiplier, "Base hit sequence", "Damage Multi")
 
-    if mode == "consume_crit":
+    if mode == SkillMode.CONSUME_CRIT:
         if all_crits and consume_ready and maximum is not None:
-            return result(maximum, text_from_row(row, "Con Max Dmg") or "Consume + all crits", "Dmg Max")
+            return result(maximum, row.max_condition or "Consume + all crits", "Dmg Max")
         if all_crits and all_crit_multiplier is not None:
             return result(all_crit_multiplier, "All hits crit", "All Crit Dmg")
         if consume_ready and conditional is not None:
-            return result(conditional, text_from_row(row, "Condition 1") or "Consume ready", "Dmg Con1")
+            return result(conditional, row.condition or "Consume ready", "Dmg Con1")
         return result(base_multiplier, "Base hit sequence", "Damage Multi")
 
-    if mode == "duration_consume":
-        base_turns = clamp_int(number_from_row(row, "Base Turns"), 1, 10)
-        max_turns = clamp_int(number_from_row(row, "Max Turns"), base_turns, 10)
+    if mode == SkillMode.DURATION_CONSUME:
+        base_turns = clamp_int(row.base_turns, 1, 10)
+        max_turns = clamp_int(row.max_turns, base_turns, 10)
         allowed_turns = max_turns if consume_ready else base_turns
         applied_turns = min(turns, allowed_turns)
         total = round((base_multiplier or 0) * applied_turns, 2)
@@ -204,7 +193,7 @@ def calculate_lune(row: CalculatorRow, state: CalculatorState) -> CalculationRes
             scenario = f"{scenario} | consume ready"
         return result(total, scenario, "Damage Multi x turns", warning)
 
-    if mode == "storm_caller":
+    if mode == SkillMode.STORM_CALLER:
         per_proc = conditional if consume_ready and conditional is not None else base_multiplier
         total = round((per_proc or 0) * turns, 2)
         scenario = f"{turns} end-turn proc(s)"
@@ -217,16 +206,16 @@ def calculate_lune(row: CalculatorRow, state: CalculatorState) -> CalculationRes
             "Reactive 0.2 follow-up hits from other damage events are not modeled.",
         )
 
-    if mode == "consume_all":
+    if mode == SkillMode.CONSUME_ALL:
         consumed_stains = stains
         multiplier = round((base_multiplier or 0) * (1 + consumed_stains), 2)
         scenario = "Base hit sequence" if consumed_stains == 0 else f"Consume {consumed_stains} stain(s)"
         return result(multiplier, scenario, "Derived from consume-all scaling")
 
-    if mode == "fire_rage":
+    if mode == SkillMode.FIRE_RAGE:
         warning = "Per-turn stacking remains unclear in the sheet, so only the immediate hit is modeled."
         if consume_ready and conditional is not None:
-            return result(conditional, text_from_row(row, "Condition 1") or "Consume ready", "Dmg Con1", warning)
+            return result(conditional, row.condition or "Consume ready", "Dmg Con1", warning)
         return result(base_multiplier, "Immediate hit only", "Damage Multi", warning)
 
     if condition == "turn start dmg" and stains > 0 and conditional is not None:
@@ -252,21 +241,21 @@ def calculate_lune(row: CalculatorRow, state: CalculatorState) -> CalculationRes
 
     if maximum is not None:
         if "crit" in max_condition and all_crits and (max_threshold is None or stains >= max_threshold):
-            return result(maximum, text_from_row(row, "Con Max Dmg") or "Maximum", "Dmg Max")
+            return result(maximum, row.max_condition or "Maximum", "Dmg Max")
         if "burn" in max_condition and turns >= 3 and (max_threshold is None or stains >= max_threshold):
-            return result(maximum, text_from_row(row, "Con Max Dmg") or "Maximum", "Dmg Max")
+            return result(maximum, row.max_condition or "Maximum", "Dmg Max")
         if "t3" in max_condition and turns >= 3:
-            return result(maximum, text_from_row(row, "Con Max Dmg") or "Maximum", "Dmg Max")
+            return result(maximum, row.max_condition or "Maximum", "Dmg Max")
         if max_threshold is not None and "stain" in max_condition and stains >= max_threshold:
-            return result(maximum, text_from_row(row, "Con Max Dmg") or "Maximum", "Dmg Max")
+            return result(maximum, row.max_condition or "Maximum", "Dmg Max")
 
     if conditional is not None:
         if "t2" in condition and turns >= 2:
-            return result(conditional, text_from_row(row, "Condition 1") or "Conditional", "Dmg Con1")
+            return result(conditional, row.condition or "Conditional", "Dmg Con1")
         if cond_threshold is not None and "stain" in condition and stains >= cond_threshold:
-            return result(conditional, text_from_row(row, "Condition 1") or "Conditional", "Dmg Con1")
+            return result(conditional, row.condition or "Conditional", "Dmg Con1")
         if condition.startswith("grad"):
-            return result(conditional, text_from_row(row, "Condition 1") or "Conditional", "Dmg Con1")
+            return result(conditional, row.condition or "Conditional", "Dmg Con1")
 
     return base_result(row)
 
@@ -283,10 +272,10 @@ def calculate_maelle(row: CalculatorRow, state: CalculatorState) -> CalculationR
         scenario for the selected skill.
     """
 
-    skill = clean_text(row.get("Skill"))
-    mode = text_from_row(row, "Maelle Mode")
-    base_multiplier = number_from_row(row, "Damage Multi")
-    maximum = number_from_row(row, "DmMax")
+    skill = row.skill
+    mode = row.mode
+    base_multiplier = row.damage_multi
+    maximum = row.dm_max
     stance = clean_text(state.get("stance")) or "Stanceless"
     burn_stacks = clamp_int(state.get("burn_stacks"), 0, 100)
     hits_taken = clamp_int(state.get("hits_taken"), 0, 5)
@@ -321,9 +310,9 @@ def calculate_maelle(row: CalculatorRow, state: CalculatorState) -> CalculationR
             skill_result.get("warning"),
         )
 
-    if mode == "burning_canvas":
-        base_scaling = number_from_row(row, "Base Scaling") or base_multiplier or 0
-        hit_count = clamp_int(number_from_row(row, "Hit Count"), 1, 20)
+    if mode == SkillMode.BURNING_CANVAS:
+        base_scaling = row.base_scaling or base_multiplier or 0
+        hit_count = clamp_int(row.hit_count, 1, 20)
         multiplier = sum(
             base_scaling * (1 + (0.1 * (burn_stacks + hit_index)))
             for hit_index in range(hit_count)
@@ -336,21 +325,21 @@ def calculate_maelle(row: CalculatorRow, state: CalculatorState) -> CalculationR
             )
         )
 
-    if mode == "combustion":
+    if mode == SkillMode.COMBUSTION:
         multiplier = round((base_multiplier or 0) * (1 + (0.4 * min(burn_stacks, 10))), 2)
         return with_stance(result(multiplier, f"Consume {min(burn_stacks, 10)} Burn", "Derived from note text"))
 
-    if mode == "revenge":
+    if mode == SkillMode.REVENGE:
         multiplier = round((base_multiplier or 0) * (1 + (1.5 * hits_taken)), 2)
         return with_stance(result(multiplier, f"{hits_taken} hit(s) taken last round", "Derived from note text"))
 
     if skill.startswith("Burn "):
         return result(round((base_multiplier or 0) * turns, 2), f"{turns} Burn tick(s)", "Derived from burn rows")
 
-    if mode == "marked" and marked and maximum is not None:
+    if mode == SkillMode.MARKED and marked and maximum is not None:
         return with_stance(result(maximum, "Marked target", "DmMax"))
 
-    if mode == "all_crits" and all_crits and maximum is not None:
+    if mode == SkillMode.ALL_CRITS and all_crits and maximum is not None:
         return with_stance(result(maximum, "All crits", "DmMax"))
 
     return with_stance(base_result(row))
@@ -359,8 +348,8 @@ def calculate_maelle(row: CalculatorRow, state: CalculatorState) -> CalculationR
 def monoco_mask_factor(row: CalculatorRow) -> float | None:
     """Infer Monoco's mask damage factor from sheet breakpoints."""
 
-    base_multiplier = number_from_row(row, "Damage Multi")
-    masked_multiplier = number_from_row(row, "Dmg Con1")
+    base_multiplier = row.damage_multi
+    masked_multiplier = row.dmg_con
     if base_multiplier in (None, 0) or masked_multiplier is None:
         return None
     return masked_multiplier / base_multiplier
@@ -369,7 +358,7 @@ def monoco_mask_factor(row: CalculatorRow) -> float | None:
 def monoco_secondary_only_multiplier(row: CalculatorRow) -> float | None:
     """Infer a Monoco secondary-condition multiplier without mask bonus."""
 
-    maximum = number_from_row(row, "Dmg Max")
+    maximum = row.dmg_max
     mask_factor = monoco_mask_factor(row)
     if maximum is None or mask_factor in (None, 0):
         return None
@@ -387,11 +376,7 @@ def uses_mask_condition(row: CalculatorRow) -> bool:
         ``False``.
     """
 
-    texts = (
-        text_from_row(row, "Condition 1"),
-        text_from_row(row, "Con Max Dmg"),
-        text_from_row(row, "Notes"),
-    )
+    texts = (row.condition, row.max_condition, row.notes)
     return any("mask" in text.lower() for text in texts if text)
 
 
@@ -406,7 +391,7 @@ def monoco_mask_type(row: CalculatorRow) -> str:
         has no mask value.
     """
 
-    return clean_text(row.get("Mask")).strip()
+    return row.mask
 
 
 def has_explicit_monoco_mask_breakpoint(row: CalculatorRow) -> bool:
@@ -420,10 +405,7 @@ def has_explicit_monoco_mask_breakpoint(row: CalculatorRow) -> bool:
         breakpoint, otherwise ``False``.
     """
 
-    texts = (
-        text_from_row(row, "Condition 1"),
-        text_from_row(row, "Con Max Dmg"),
-    )
+    texts = (row.condition, row.max_condition)
     return any("mask" in text.lower() for text in texts if text)
 
 
@@ -483,11 +465,11 @@ def calculate_monoco(row: CalculatorRow, state: CalculatorState) -> CalculationR
         scenario for the selected skill.
     """
 
-    skill = clean_text(row.get("Skill"))
-    mode = text_from_row(row, "Monoco Mode")
-    base_multiplier = number_from_row(row, "Damage Multi")
-    conditional = number_from_row(row, "Dmg Con1")
-    maximum = number_from_row(row, "Dmg Max")
+    skill = row.skill
+    mode = row.mode
+    base_multiplier = row.damage_multi
+    conditional = row.dmg_con
+    maximum = row.dmg_max
     mask_active = bool(state.get("mask_active"))
     turns = clamp_int(state.get("turns"), 1, 3)
     stunned = bool(state.get("stunned"))
@@ -526,41 +508,41 @@ def calculate_monoco(row: CalculatorRow, state: CalculatorState) -> CalculationR
     if skill.startswith("Burn "):
         return result(round((base_multiplier or 0) * turns, 2), f"{turns} Burn tick(s)", "Derived from burn rows")
 
-    if mode == "utility":
+    if mode == SkillMode.UTILITY:
         return result(None, "No direct damage", "Sheet")
 
-    if mode == "cost_mask":
+    if mode == SkillMode.COST_MASK:
         return result(base_multiplier, "Direct hit only", "Damage Multi")
 
-    if mode == "stunned":
+    if mode == SkillMode.STUNNED:
         if stunned and maximum is not None:
             return result(maximum, "Stunned target", "Dmg Max")
         return base_result(row)
 
-    if mode == "mask":
+    if mode == SkillMode.MASK:
         if mask_active and conditional is not None:
             return result(conditional, "Mask active", "Dmg Con1")
         return base_result(row)
 
-    if mode == "mask_stunned":
+    if mode == SkillMode.MASK_STUNNED:
         return mask_mode_result("stunned target", stunned)
 
-    if mode == "mask_marked":
+    if mode == SkillMode.MASK_MARKED:
         return mask_mode_result("marked target", marked)
 
-    if mode == "mask_powerless":
+    if mode == SkillMode.MASK_POWERLESS:
         return mask_mode_result("powerless target", powerless)
 
-    if mode == "mask_burning":
+    if mode == SkillMode.MASK_BURNING:
         return mask_mode_result("burning target", burning)
 
-    if mode == "mask_low_life":
+    if mode == SkillMode.MASK_LOW_LIFE:
         return mask_mode_result("low life", low_life)
 
-    if mode == "mask_full_life":
+    if mode == SkillMode.MASK_FULL_LIFE:
         return mask_mode_result("full life", full_life)
 
-    if mode == "mask_all_crits":
+    if mode == SkillMode.MASK_ALL_CRITS:
         return mask_mode_result("all crits", all_crits)
 
     if skill == "Mighty Strike" and stunned and maximum is not None:
@@ -666,10 +648,10 @@ def calculate_sciel(row: CalculatorRow, state: CalculatorState) -> CalculationRe
         scenario for the selected skill.
     """
 
-    skill = clean_text(row.get("Skill"))
-    base_multiplier = number_from_row(row, "Damage Multi")
-    conditional = number_from_row(row, "ConDmg")
-    twilight_value = number_from_row(row, "TwilightDmg")
+    skill = row.skill
+    base_multiplier = row.damage_multi
+    conditional = row.dmg_con
+    twilight_value = row.twilight_dmg
     foretell = max(clamp_int(state.get("foretell"), 0, 999), 0)
     twilight = bool(state.get("twilight"))
     full_life = bool(state.get("full_life"))
@@ -782,26 +764,26 @@ def calculate_verso(
         scenario for the selected skill.
     """
 
-    skill = clean_text(row.get("Skill"))
-    mode = text_from_row(row, "Verso Mode")
-    base_multiplier = number_from_row(row, "Damage Multi")
-    conditional = number_from_row(row, "ConDmg")
-    maximum = number_from_row(row, "SRankMAX")
+    skill = row.skill
+    mode = row.mode
+    base_multiplier = row.damage_multi
+    conditional = row.dmg_con
+    maximum = row.srank_max
     rank = clean_text(state.get("rank")) or "D"
     stunned = bool(state.get("stunned"))
     speed_bonus = bool(state.get("speed_bonus"))
     shots = clamp_int(state.get("shots"), 0, 10)
     uses = clamp_int(state.get("uses"), 1, 6)
     missing_health = clamp_int(state.get("missing_health"), 0, 99)
-    required_rank = parse_rank_requirement(text_from_row(row, "Condition"))
+    required_rank = parse_rank_requirement(row.condition)
 
-    if mode == "utility":
+    if mode == SkillMode.UTILITY:
         return result(None, "No direct damage", "Sheet")
 
-    if mode == "direct":
+    if mode == SkillMode.DIRECT:
         return apply_verso_rank_bonus(rank, base_result(row), not disable_rank_bonus)
 
-    if mode == "rank_damage":
+    if mode == SkillMode.RANK_DAMAGE:
         if not disable_rank_bonus and rank_matches(rank, required_rank) and conditional is not None:
             return apply_verso_rank_bonus(
                 rank,
@@ -810,10 +792,10 @@ def calculate_verso(
             )
         return apply_verso_rank_bonus(rank, base_result(row), not disable_rank_bonus)
 
-    if mode == "rank_cost":
+    if mode == SkillMode.RANK_COST:
         return apply_verso_rank_bonus(rank, base_result(row), not disable_rank_bonus)
 
-    if mode == "end_bringer":
+    if mode == SkillMode.END_BRINGER:
         if stunned and conditional is not None:
             return apply_verso_rank_bonus(
                 rank,
@@ -822,7 +804,7 @@ def calculate_verso(
             )
         return apply_verso_rank_bonus(rank, base_result(row), not disable_rank_bonus)
 
-    if mode == "follow_up":
+    if mode == SkillMode.FOLLOW_UP:
         multiplier = round((base_multiplier or 0) * (1 + (0.5 * shots)), 2)
         scenario = "Base value" if shots == 0 else f"{shots} ranged shot(s)"
         return apply_verso_rank_bonus(
@@ -831,7 +813,7 @@ def calculate_verso(
             not disable_rank_bonus,
         )
 
-    if mode == "ascending_assault":
+    if mode == SkillMode.ASCENDING_ASSAULT:
         bonus_uses = max(uses - 1, 0)
         multiplier = round((base_multiplier or 0) * (1 + (0.3 * min(bonus_uses, 5))), 2)
         scenario = "Base value" if uses <= 1 else f"Use {uses}"
@@ -841,7 +823,7 @@ def calculate_verso(
             not disable_rank_bonus,
         )
 
-    if mode == "speed_burst":
+    if mode == SkillMode.SPEED_BURST:
         rank_ready = not disable_rank_bonus and rank_matches(rank, required_rank)
         if speed_bonus and rank_ready and maximum is not None:
             return result(maximum, f"{required_rank} Rank + max speed bonus", "SRankMAX")
@@ -859,7 +841,7 @@ def calculate_verso(
             )
         return apply_verso_rank_bonus(rank, base_result(row), not disable_rank_bonus)
 
-    if mode == "steeled_strike":
+    if mode == SkillMode.STEELED_STRIKE:
         if not disable_rank_bonus and rank_matches(rank, required_rank) and conditional is not None:
             return apply_verso_rank_bonus(
                 rank,
@@ -882,7 +864,7 @@ def calculate_verso(
             not disable_rank_bonus,
         )
 
-    if mode == "berserk":
+    if mode == SkillMode.BERSERK:
         multiplier = base_multiplier or 0
         scenario_parts = [f"{missing_health}% missing HP"]
         if not disable_rank_bonus and rank_matches(rank, required_rank):
@@ -990,11 +972,11 @@ def resolve_picto_attack_type(row: CalculatorRow, override: str | None) -> str:
     if override and override != "Auto":
         return override
 
-    explicit_attack_type = clean_text(row.get("Attack Type"))
+    explicit_attack_type = row.attack_type
     if explicit_attack_type:
         return explicit_attack_type
 
-    skill = clean_text(row.get("Skill")).lower()
+    skill = row.skill.lower()
     if skill == "basic attack":
         return "Base Attack"
     if skill == "counter":
@@ -1069,9 +1051,9 @@ def build_skill_control_styles(character: str, row: CalculatorRow) -> ControlSty
         A mapping of control ids to visibility styles used by the setup panel.
     """
 
-    skill = clean_text(row.get("Skill"))
-    condition = text_from_row(row, "Condition 1", "Condition").lower()
-    max_condition = text_from_row(row, "Con Max Dmg", "ConTwilight").lower()
+    skill = row.skill
+    condition = row.condition.lower()
+    max_condition = row.max_condition.lower()
     styles: ControlStyles = {}
 
     def set_visibility(control: str, is_visible: bool) -> None:
@@ -1092,74 +1074,74 @@ def build_skill_control_styles(character: str, row: CalculatorRow) -> ControlSty
         return styles
 
     if character == "lune":
-        mode = text_from_row(row, "Lune Mode")
-        uses_exact_stains = mode in {"consume", "consume_crit", "duration_consume", "fire_rage", "storm_caller", "requires_stains"}
+        mode = row.mode
+        uses_exact_stains = mode in {SkillMode.CONSUME, SkillMode.CONSUME_CRIT, SkillMode.DURATION_CONSUME, SkillMode.FIRE_RAGE, SkillMode.STORM_CALLER, SkillMode.REQUIRES_STAINS}
 
-        set_visibility("lune_stains", mode == "consume_all")
+        set_visibility("lune_stains", mode == SkillMode.CONSUME_ALL)
         for stain_key in LUNE_STAIN_KEYS:
             set_visibility(f"lune_{stain_key}", uses_exact_stains)
-        set_visibility("lune_turns", mode in {"duration_consume", "storm_caller", "burn"} or skill.startswith("Burn "))
-        set_visibility("lune_all_crits", mode in {"crit", "consume_crit"})
+        set_visibility("lune_turns", mode in {SkillMode.DURATION_CONSUME, SkillMode.STORM_CALLER, SkillMode.BURN} or skill.startswith("Burn "))
+        set_visibility("lune_all_crits", mode in {SkillMode.CRIT, SkillMode.CONSUME_CRIT})
         return styles
 
     if character == "maelle":
-        mode = text_from_row(row, "Maelle Mode")
-        set_visibility("maelle_stance", not skill.startswith("Burn ") and number_from_row(row, "Damage Multi") is not None)
-        set_visibility("maelle_burn_stacks", mode in {"burning_canvas", "combustion"})
-        set_visibility("maelle_hits_taken", mode == "revenge")
-        set_visibility("maelle_marked", mode == "marked")
-        set_visibility("maelle_all_crits", mode == "all_crits")
+        mode = row.mode
+        set_visibility("maelle_stance", not skill.startswith("Burn ") and row.damage_multi is not None)
+        set_visibility("maelle_burn_stacks", mode in {SkillMode.BURNING_CANVAS, SkillMode.COMBUSTION})
+        set_visibility("maelle_hits_taken", mode == SkillMode.REVENGE)
+        set_visibility("maelle_marked", mode == SkillMode.MARKED)
+        set_visibility("maelle_all_crits", mode == SkillMode.ALL_CRITS)
         return styles
 
     if character == "monoco":
-        mode = text_from_row(row, "Monoco Mode")
+        mode = row.mode
         set_visibility("monoco_turns", skill.startswith("Burn "))
         set_visibility(
             "monoco_mask",
             mode in {
-                "cost_mask",
-                "mask",
-                "mask_stunned",
-                "mask_marked",
-                "mask_powerless",
-                "mask_burning",
-                "mask_low_life",
-                "mask_full_life",
-                "mask_all_crits",
+                SkillMode.COST_MASK,
+                SkillMode.MASK,
+                SkillMode.MASK_STUNNED,
+                SkillMode.MASK_MARKED,
+                SkillMode.MASK_POWERLESS,
+                SkillMode.MASK_BURNING,
+                SkillMode.MASK_LOW_LIFE,
+                SkillMode.MASK_FULL_LIFE,
+                SkillMode.MASK_ALL_CRITS,
             }
             or (not mode and (uses_mask_condition(row) or can_apply_generic_monoco_mask_bonus(row))),
         )
-        set_visibility("monoco_stunned", mode in {"stunned", "mask_stunned"} or skill == "Mighty Strike")
-        set_visibility("monoco_marked", mode == "mask_marked")
-        set_visibility("monoco_powerless", mode == "mask_powerless")
-        set_visibility("monoco_burning", mode == "mask_burning")
-        set_visibility("monoco_low_life", mode == "mask_low_life")
-        set_visibility("monoco_full_life", mode == "mask_full_life")
-        set_visibility("monoco_all_crits", mode == "mask_all_crits")
+        set_visibility("monoco_stunned", mode in {SkillMode.STUNNED, SkillMode.MASK_STUNNED} or skill == "Mighty Strike")
+        set_visibility("monoco_marked", mode == SkillMode.MASK_MARKED)
+        set_visibility("monoco_powerless", mode == SkillMode.MASK_POWERLESS)
+        set_visibility("monoco_burning", mode == SkillMode.MASK_BURNING)
+        set_visibility("monoco_low_life", mode == SkillMode.MASK_LOW_LIFE)
+        set_visibility("monoco_full_life", mode == SkillMode.MASK_FULL_LIFE)
+        set_visibility("monoco_all_crits", mode == SkillMode.MASK_ALL_CRITS)
         return styles
 
     if character == "sciel":
         set_visibility("sciel_foretell", skill in SCIEL_FORETELL_RATES or skill in {"Our Sacrifice", "Sealed Fate", "Firing Shadow"})
-        set_visibility("sciel_twilight", number_from_row(row, "TwilightDmg") is not None)
+        set_visibility("sciel_twilight", row.twilight_dmg is not None)
         set_visibility("sciel_full_life", skill == "Our Sacrifice")
         return styles
 
     if character == "verso":
-        mode = text_from_row(row, "Verso Mode")
-        set_visibility("verso_rank", mode in {"rank_damage", "rank_cost", "follow_up", "ascending_assault", "speed_burst", "steeled_strike", "berserk"} or (
+        mode = row.mode
+        set_visibility("verso_rank", mode in {SkillMode.RANK_DAMAGE, SkillMode.RANK_COST, SkillMode.FOLLOW_UP, SkillMode.ASCENDING_ASSAULT, SkillMode.SPEED_BURST, SkillMode.STEELED_STRIKE, SkillMode.BERSERK} or (
             not mode
             and skill not in {"Ranged Attack", "Basic Attack", "Counter"}
             and (
-                parse_rank_requirement(text_from_row(row, "Condition")) is not None
-                or number_from_row(row, "SRankMAX") is not None
+                parse_rank_requirement(row.condition) is not None
+                or row.srank_max is not None
                 or skill in {"Follow Up", "Ascending Assault", "Speed Burst", "End Bringer", "Steeled Strike"}
             )
         ))
-        set_visibility("verso_shots", mode == "follow_up" or (not mode and skill == "Follow Up"))
-        set_visibility("verso_uses", mode == "ascending_assault" or (not mode and skill in {"Steeled Strike", "Ascending Assault"}))
-        set_visibility("verso_stunned", mode == "end_bringer" or skill == "End Bringer")
-        set_visibility("verso_speed_bonus", mode == "speed_burst" or skill == "Speed Burst")
-        set_visibility("verso_missing_health", mode == "berserk")
+        set_visibility("verso_shots", mode == SkillMode.FOLLOW_UP or (not mode and skill == "Follow Up"))
+        set_visibility("verso_uses", mode == SkillMode.ASCENDING_ASSAULT or (not mode and skill in {"Steeled Strike", "Ascending Assault"}))
+        set_visibility("verso_stunned", mode == SkillMode.END_BRINGER or skill == "End Bringer")
+        set_visibility("verso_speed_bonus", mode == SkillMode.SPEED_BURST or skill == "Speed Burst")
+        set_visibility("verso_missing_health", mode == SkillMode.BERSERK)
         return styles
 
     return styles
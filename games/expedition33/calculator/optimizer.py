@@ -0,0 +1,465 @@
+from __future__ import annotations
+from games.expedition33.calculator.core import (
+    CALCULATOR_DATA,
+    CalculationResult,
+    CalculatorRow,
+    CalculatorState,
+    calculate_damage,
+    clean_text,
+    resolve_affinity,
+)
+from games.expedition33.calculator.evaluators import evaluate_skill_result
+from games.expedition33.calculator.logic import (
+    apply_picto_bonus,
+    apply_weapon_bonus,
+    resolve_picto_attack_type,
+)
+from games.expedition33.calculator.pictos import PICTO_DEFINITIONS, PictoSummary, evaluate_pictos
+from games.expedition33.calculator.weapons import (
+    WEAPON_DEFINITIONS,
+    WEAPON_LEVEL_OPTIONS,
+    WeaponSummary,
+    evaluate_weapon,
+    weapon_row_keys,
+)
+from typing import Any, TypedDict
+import heapq
+import math
+
+MAX_PICTO_SLOTS = 12
+DEFAULT_TOP_N = 5
+
+
+class PictoLoadout(TypedDict):
+    """One ranked Picto combination returned by the optimizer."""
+
+    pictos: list[str]
+    picto_factor: float
+    multiplier: float | None
+
+
+class BuildLoadout(TypedDict):
+    """One ranked weapon, unlock level, and Picto build."""
+
+    weapon: str | None
+    weapon_level: str
+    pictos: list[str]
+    damage: float | None
+    multipliers: dict[str, float | None]
+
+
+def picto_factors(
+    candidates: list[str] | None,
+    picto_state: dict[str, Any],
+) -> list[tuple[str, float]]:
+    """Evaluate each candidate Picto on its own against the current state.
+
+    Args:
+        candidates: The Picto names to consider, or ``None`` for every
+            supported Picto.
+        picto_state: The normalized Picto state with the resolved attack type.
+
+    Returns:
+        ``(name, factor)`` pairs for Pictos that increase damage, sorted by
+        factor from strongest to weakest. Pictos with a factor of ``1`` or
+        less can never improve a loadout, so they are dropped up front.
+    """
+
+    names = candidates if candidates is not None else sorted(PICTO_DEFINITIONS, key=str.lower)
+    factors = []
+    for name in names:
+        factor = evaluate_pictos([name], picto_state)["total_factor"]
+        if factor > 1:
+            factors.append((name, factor))
+    factors.sort(key=lambda item: (-item[1], item[0].lower()))
+    return factors
+
+
+def _push_candidate(
+    heap: list[tuple[float, tuple[str, ...]]],
+    top_n: int,
+    product: float,
+    names: tuple[str, ...],
+) -> None:
+    """Keep the ``top_n`` best combinations in a min-heap."""
+
+    entry = (product, tuple(sorted(names, key=str.lower)))
+    if len(heap) < top_n:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+
+def _branch_and_bound(
+    factors: list[tuple[str, float]],
+    slot_budget: int,
+    top_n: int,
+) -> list[tuple[float, tuple[str, ...]]]:
+    """Search Picto subsets, pruning branches that cannot reach the top N.
+
+    Args:
+        factors: ``(name, factor)`` pairs sorted from strongest to weakest.
+        slot_budget: The maximum number of Pictos in a loadout.
+        top_n: How many combinations to keep.
+
+    Returns:
+        Up to ``top_n`` ``(product, names)`` entries as an unsorted heap.
+    """
+
+    heap: list[tuple[float, tuple[str, ...]]] = []
+    chosen: list[str] = []
+    _push_candidate(heap, top_n, 1.0, ())
+
+    def upper_bound(index: int, current: float, remaining: int) -> float:
+        # Factors are sorted, so the best completion takes the next ones.
+        return current * math.prod(factor for _, factor in factors[index:index + remaining])
+
+    def search(index: int, current: float, remaining: int) -> None:
+        if remaining == 0 or index >= len(factors):
+            return
+        if len(heap) == top_n and upper_bound(index, current, remaining) <= heap[0][0]:
+            return
+
+        name, factor = factors[index]
+        chosen.append(name)
+        _push_candidate(heap, top_n, current * factor, tuple(chosen))
+        search(index + 1, current * factor, remaining - 1)
+        chosen.pop()
+        search(index + 1, current, remaining)
+
+    search(0, 1.0, slot_budget)
+    return heap
+
+
+def search_picto_subsets(
+    factors: list[tuple[str, float]],
+    slot_budget: int,
+    top_n: int = DEFAULT_TOP_N,
+) -> list[tuple[float, tuple[str, ...]]]:
+    """Find the highest-product Picto subsets within a slot budget.
+
+    Args:
+        factors: ``(name, factor)`` pairs sorted from strongest to weakest.
+        slot_budget: The maximum number of Pictos in a loadout.
+        top_n: How many combinations to return.
+
+    Returns:
+        Up to ``top_n`` ``(product, names)`` pairs sorted best first. The
+        search runs in the calling worker: pruning keeps it well under a
+        millisecond for the shipped Picto catalog.
+    """
+
+    slot_budget = max(0, min(slot_budget, len(factors)))
+    heap = _branch_and_bound(factors, slot_budget, max(top_n, 1))
+    return sorted(heap, key=lambda entry: (-entry[0], len(entry[1]), entry[1]))
+
+
+def optimize_pictos(
+    character: str,
+    row: CalculatorRow,
+    state: CalculatorState,
+    picto_state: dict[str, Any],
+    slot_budget: int,
+    top_n: int = DEFAULT_TOP_N,
+    weapon: str | None = None,
+    weapon_level: str | int | None = None,
+    weapon_state: dict[str, Any] | None = None,
+    attack_type_override: str | None = None,
+    candidates: list[str] | None = None,
+) -> list[PictoLoadout]:
+    """Return the Picto loadouts that maximize one skill's final multiplier.
+
+    Args:
+        character: The calculator character id.
+        row: The selected skill row.
+        state: The normalized character state.
+        picto_state: The normalized Picto state. Its ``attack_type`` is
+            replaced with the attack type resolved for ``row``.
+        slot_budget: The maximum number of Pictos in a loadout.
+        top_n: How many loadouts to return.
+        weapon: The selected weapon name, if any.
+        weapon_level: The selected weapon unlock level.
+        weapon_state: The normalized weapon state, if a weapon is selected.
+        attack_type_override: The optional Picto attack-type override.
+        candidates: The Picto names to consider, or ``None`` for all of them.
+
+    Returns:
+        Up to ``top_n`` loadouts sorted from strongest to weakest. Every
+        Picto factor is multiplicative and independent of the others, so the
+        search ranks subsets by the product of single-Picto factors and only
+        re-runs the full pipeline for the winners. Skills without a direct
+        damage multiplier return an empty list.
+    """
+
+    attack_type = resolve_picto_attack_type(row, attack_type_override)
+    resolved_picto_state = {**picto_state, "attack_type": attack_type}
+    weapon_summary = evaluate_weapon(
+        character,
+        weapon,
+        weapon_level,
+        row,
+        {**(weapon_state or {}), "attack_type": attack_type},
+    )
+    skill_result = evaluate_skill_result(character, row, state, weapon_summary["suppress_verso_rank_bonus"])
+    skill_result = apply_weapon_bonus(skill_result, weapon_summary)
+    if skill_result.get("multiplier") is None:
+        return []
+
+    factors = picto_factors(candidates, resolved_picto_state)
+    loadouts: list[PictoLoadout] = []
+    for _, names in search_picto_subsets(factors, slot_budget, top_n):
+        picto_summary = evaluate_pictos(list(names), resolved_picto_state)
+        loadouts.append(
+            {
+                "pictos": list(names),
+                "picto_factor": picto_summary["total_factor"],
+                "multiplier": apply_picto_bonus(skill_result, picto_summary)["multiplier"],
+            }
+        )
+    return loadouts
+
+
+def build_candidates(character: str, weapons: list[str | None] | None = None) -> list[tuple[str | None, str]]:
+    """List the weapon and unlock-level pairs a build search covers.
+
+    Args:
+        character: The calculator character id.
+        weapons: The weapon names to search, or ``None`` for every supported
+            weapon of that character.
+
+    Returns:
+        ``(weapon, level)`` pairs for every weapon at every unlock tier.
+    """
+
+    names = weapons if weapons is not None else list(WEAPON_DEFINITIONS.get(character, {}))
+    return [(name, option["value"]) for name in names for option in WEAPON_LEVEL_OPTIONS]
+
+
+def _weighted_branch_and_bound(
+    weights: tuple[float, ...],
+    factors: list[tuple[str, tuple[float, ...]]],
+    slot_budget: int,
+    top_n: int,
+    tag: tuple[str, str],
+    heap: list[tuple[float, tuple[str, str], tuple[str, ...]]] | None = None,
+) -> list[tuple[float, tuple[str, str], tuple[str, ...]]]:
+    """Search Picto subsets that maximize a weighted sum of products.
+
+    Pictos only see a skill through its attack type, so a skill mix reduces
+    to one weight per attack-type group: ``score = sum(W[g] * prod(f[g]))``.
+    A single group is the plain product search from ``_branch_and_bound``.
+
+    Args:
+        weights: The damage weight of each attack-type group for this build.
+        factors: ``(name, per_group_factors)`` pairs for candidate Pictos.
+        slot_budget: The maximum number of Pictos in a loadout.
+        top_n: How many builds to keep.
+        tag: The ``(weapon, level)`` pair stored with every entry.
+        heap: An existing top-N heap to extend, so bounds carry across
+            builds searched in the same process.
+
+    Returns:
+        The updated min-heap of ``(score, tag, names)`` entries.
+    """
+
+    heap = [] if heap is None else heap
+    groups = range(len(weights))
+    ordered = sorted(
+        factors,
+        key=lambda item: (-sum(weight * factor for weight, factor in zip(weights, item[1])), item[0].lower()),
+    )
+    # best[i][g][r] is the largest product of r factors for group g among
+    # ordered[i:]. Factors below 1 are clipped because they can be skipped.
+    best = []
+    for index in range(len(ordered) + 1):
+        per_group = []
+        for group in groups:
+            top = sorted((max(item[1][group], 1.0) for item in ordered[index:]), reverse=True)[:slot_budget]
+            products = [1.0]
+            for factor in top:
+                products.append(products[-1] * factor)
+            products.extend([products[-1]] * (slot_budget + 1 - len(products)))
+            per_group.append(products)
+        best.append(per_group)
+
+    def push(score: float, names: tuple[str, ...]) -> None:
+        entry = (score, tag, tuple(sorted(names, key=str.lower)))
+        if len(heap) < top_n:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    chosen: list[str] = []
+
+    def search(index: int, current: tuple[float, ...], remaining: int) -> None:
+        if remaining == 0 or index >= len(ordered):
+            return
+        if len(heap) == top_n:
+            bound = sum(weights[g] * current[g] * best[index][g][remaining] for g in groups)
+            if bound <= heap[0][0]:
+                return
+
+        name, item_factors = ordered[index]
+        included = tuple(current[g] * item_factors[g] for g in groups)
+        chosen.append(name)
+        push(sum(weights[g] * included[g] for g in groups), tuple(chosen))
+        search(index + 1, included, remaining - 1)
+        chosen.pop()
+        search(index + 1, current, remaining)
+
+    push(sum(weights), ())
+    search(0, tuple(1.0 for _ in groups), slot_budget)
+    return heap
+
+
+def optimize_builds(
+    character: str,
+    skill_weights: dict[str, float],
+    state: CalculatorState,
+    picto_state: dict[str, Any],
+    weapon_state: dict[str, Any],
+    attack: float | None,
+    slot_budget: int,
+    top_n: int = DEFAULT_TOP_N,
+    enemy_affinity: str | None = None,
+    attack_type_override: str | None = None,
+    builds: list[tuple[str | None, str]] | None = None,
+    candidates: list[str] | None = None,
+) -> list[BuildLoadout]:
+    """Rank whole weapon, unlock level, and Picto builds by expected damage.
+
+    Args:
+        character: The calculator character id.
+        skill_weights: The skill mix to optimize for, mapping skill names to
+            relative weights. A single skill ranks builds for that skill.
+        state: The normalized character state.
+        picto_state: The normalized Picto state. Its ``attack_type`` is
+            replaced per skill with the resolved attack type.
+        weapon_state: The normalized weapon state. Its ``attack_type`` is
+            replaced per skill with the resolved attack type.
+        attack: The effective attack power used for damage estimates.
+        slot_budget: The maximum number of Pictos in a loadout.
+        top_n: How many builds to return.
+        enemy_affinity: The selected enemy elemental affinity.
+        attack_type_override: The optional Picto attack-type override.
+        builds: The ``(weapon, level)`` pairs to search, or ``None`` for every
+            supported weapon at every unlock tier.
+        candidates: The Picto names to consider, or ``None`` for all of them.
+
+    Returns:
+        Up to ``top_n`` builds sorted by expected damage per cast, where the
+        skill weights are normalized into a probability mix. Weapon summaries
+        are cached per attack type and weapon-relevant row column, and skill
+        results per Verso rank-bonus suppression, so each distinct
+        evaluation runs once across the whole search. When two unlock tiers
+        of a weapon score the same, only the lower tier is searched.
+    """
+
+    skills = CALCULATOR_DATA[character]["skills"]
+    total_weight = sum(weight for skill, weight in skill_weights.items() if skill in skills and weight > 0)
+    if not total_weight or attack is None:
+        return []
+    mix = [
+        (skill, skills[skill], weight / total_weight)
+        for skill, weight in skill_weights.items()
+        if skill in skills and weight > 0
+    ]
+    attack_types = [resolve_picto_attack_type(row, attack_type_override) for _, row, _ in mix]
+    groups = sorted(set(attack_types))
+    group_index = {attack_type: index for index, attack_type in enumerate(groups)}
+    affinity_factors = [resolve_affinity(row, enemy_affinity)["factor"] for _, row, _ in mix]
+
+    names = candidates if candidates is not None else sorted(PICTO_DEFINITIONS, key=str.lower)
+    factors: list[tuple[str, tuple[float, ...]]] = []
+    for name in names:
+        per_group = tuple(
+            evaluate_pictos([name], {**picto_state, "attack_type": attack_type})["total_factor"]
+            for attack_type in groups
+        )
+        if any(factor > 1 for factor in per_group):
+            factors.append((name, per_group))
+
+    weapon_summaries: dict[tuple[Any, ...], WeaponSummary] = {}
+    skill_results: dict[tuple[int, bool], CalculationResult] = {}
+
+    def evaluate_rows(weapon: str | None, level: str) -> list[CalculationResult]:
+        row_keys = weapon_row_keys(character, weapon)
+        evaluated = []
+        for index, (_, row, _) in enumerate(mix):
+            attack_type = attack_types[index]
+            summary_key = (weapon, level, attack_type, *(clean_text(row.get(key)) for key in row_keys))
+            weapon_summary = weapon_summaries.get(summary_key)
+            if weapon_summary is None:
+                weapon_summary = evaluate_weapon(
+                    character,
+                    weapon,
+                    level,
+                    row,
+                    {**weapon_state, "attack_type": attack_type},
+                )
+                weapon_summaries[summary_key] = weapon_summary
+
+            result_key = (index, weapon_summary["suppress_verso_rank_bonus"])
+            skill_result = skill_results.get(result_key)
+            if skill_result is None:
+                skill_result = evaluate_skill_result(character, row, state, result_key[1])
+                skill_results[result_key] = skill_result
+            evaluated.append(apply_weapon_bonus(skill_result, weapon_summary))
+        return evaluated
+
+    search_space: list[tuple[tuple[float, ...], tuple[str, str]]] = []
+    for weapon, level in builds if builds is not None else build_candidates(character):
+        weights = [0.0] * len(groups)
+        for index, skill_result in enumerate(evaluate_rows(weapon, level)):
+            multiplier = skill_result.get("multiplier")
+            if multiplier is not None:
+                weights[group_index[attack_types[index]]] += mix[index][2] * attack * multiplier * affinity_factors[index]
+        previous = search_space[-1] if search_space else None
+        if previous and previous[1][0] == (weapon or "") and previous[0] == tuple(weights):
+            continue
+        search_space.append((tuple(weights), (weapon or "", level)))
+
+    if not any(any(weights) for weights, _ in search_space):
+        return []
+
+    slot_budget = max(0, min(slot_budget, len(factors)))
+    top_n = max(top_n, 1)
+    heap: list[tuple[float, tuple[str, str], tuple[str, ...]]] = []
+    # Searching the strongest builds first tightens the shared bound.
+    for weights, tag in sorted(search_space, key=lambda item: -sum(item[0])):
+        _weighted_branch_and_bound(weights, factors, slot_budget, top_n, tag, heap)
+
+    # Re-run the winners through the full pipeline so rounding matches the
+    # result card exactly.
+    loadouts: list[BuildLoadout] = []
+    for _, (weapon_name, level), picto_names in heap:
+        weapon = weapon_name or None
+        picto_summaries: dict[str, PictoSummary] = {}
+        multipliers: dict[str, float | None] = {}
+        damage = 0.0
+        for index, skill_result in enumerate(evaluate_rows(weapon, level)):
+            attack_type = attack_types[index]
+            picto_summary = picto_summaries.get(attack_type)
+            if picto_summary is None:
+                picto_summary = evaluate_pictos(list(picto_names), {**picto_state, "attack_type": attack_type})
+                picto_summaries[attack_type] = picto_summary
+            multiplier = apply_picto_bonus(skill_result, picto_summary).get("multiplier")
+            effective_multiplier = None
+            if isinstance(multiplier, (int, float)):
+                effective_multiplier = round(multiplier * affinity_factors[index], 2)
+            multipliers[mix[index][0]] = effective_multiplier
+            skill_damage = calculate_damage(attack, effective_multiplier)
+            if skill_damage is not None:
+                damage += mix[index][2] * skill_damage
+        loadouts.append(
+            {
+                "weapon": weapon,
+                "weapon_level": level,
+                "pictos": list(picto_names),
+                "damage": round(damage, 2),
+                "multipliers": multipliers,
+            }
+        )
+
+    loadouts.sort(key=lambda entry: (-(entry["damage"] or 0), entry["weapon"] or "", len(entry["pictos"])))
+    return loadouts
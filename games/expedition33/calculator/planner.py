@@ -0,0 +1,263 @@
+from __future__ import annotations
+from games.expedition33.calculator.core import (
+    CALCULATOR_DATA,
+    CalculatorRow,
+    CalculatorState,
+    calculate_current_cost,
+    clamp_int,
+    clean_text,
+)
+from games.expedition33.calculator.rotation import (
+    AP_PER_TURN,
+    DEFAULT_START_AP,
+    FALLBACK_SKILLS,
+    MAX_AP,
+    RotationState,
+    TurnEvaluator,
+    ap_after_cast,
+    apply_skill_effects,
+    build_turn_evaluator,
+    parse_cost,
+    prepare_turn_state,
+)
+from typing import Any, TypeAlias, TypedDict
+
+MAX_PLAN_TURNS = 10
+
+# Hashable form of the carried character, weapon, and cast-count state.
+StateKey: TypeAlias = tuple[tuple[tuple[str, Any], ...], tuple[tuple[str, Any], ...], tuple[tuple[str, int], ...]]
+# (AP cost, Gradient cost, expected damage, multiplier, interned state after the cast)
+Transition: TypeAlias = tuple[int, int, float, float | None, int]
+
+
+class PlannedTurn(TypedDict):
+    """One turn of an optimized rotation."""
+
+    turn: int
+    skill: str
+    ap: int
+    cost: str
+    multiplier: float | None
+    damage: float
+
+
+class RotationPlan(TypedDict):
+    """The highest-damage rotation found for a turn budget."""
+
+    skills: list[str]
+    turns: list[PlannedTurn]
+    expected_damage: float
+    states: int
+    transitions: int
+
+
+def castable_rows(character: str) -> list[CalculatorRow]:
+    """Return the rows a character can pick on a turn.
+
+    Burn tick rows and rows without a cost (such as Counter) are sheet
+    breakpoints rather than casts, except for the free Basic and Ranged
+    Attacks.
+    """
+
+    return [
+        row
+        for row in CALCULATOR_DATA[character]["records"]
+        if not row.skill.lower().startswith("burn ")
+        and (row.skill in FALLBACK_SKILLS or parse_cost(row.cost) != (0, 0) or row.cost_value == 0)
+    ]
+
+
+def freeze_rotation_state(rotation_state: RotationState) -> StateKey:
+    """Return the memo key of everything but the AP and Gradient pools."""
+
+    return (
+        tuple(sorted(rotation_state["state"].items())),
+        tuple(sorted(rotation_state["weapon_state"].items())),
+        tuple(sorted(rotation_state["casts"].items())),
+    )
+
+
+def thaw_rotation_state(key: StateKey) -> RotationState:
+    """Rebuild a mutable rotation state from its memo key."""
+
+    state, weapon_state, casts = key
+    return {"state": dict(state), "weapon_state": dict(weapon_state), "ap": 0, "gradient_charges": 0, "casts": dict(casts)}
+
+
+def expected_turn(
+    character: str,
+    row: CalculatorRow,
+    rotation_state: RotationState,
+    evaluate_turn: TurnEvaluator,
+    crit_rate: float | None,
+) -> tuple[float, float | None]:
+    """Return a cast's expected damage and its applied multiplier.
+
+    With a crit rate, skills with an "all hits crit" toggle weigh both
+    outcomes by the chance that every hit crits.
+    """
+
+    turn_state = prepare_turn_state(character, row, rotation_state, None, None)
+    if crit_rate is None or "all_crits" not in turn_state:
+        multiplier, damage, _ = evaluate_turn(row, turn_state, rotation_state["weapon_state"])
+        return damage or 0.0, multiplier
+
+    chance = crit_rate ** max(clamp_int(row.hit_count, 1, 20), 1)
+    crit_multiplier, crit_damage, _ = evaluate_turn(row, {**turn_state, "all_crits": True}, rotation_state["weapon_state"])
+    plain_multiplier, plain_damage, _ = evaluate_turn(row, {**turn_state, "all_crits": False}, rotation_state["weapon_state"])
+    expected = chance * (crit_damage or 0.0) + (1 - chance) * (plain_damage or 0.0)
+    return expected, crit_multiplier if chance >= 0.5 else plain_multiplier
+
+
+def plan_rotation(
+    character: str,
+    turns: int,
+    state: CalculatorState,
+    selected_pictos: list[str] | None,
+    picto_state: dict[str, Any],
+    weapon: str | None,
+    weapon_level: str | int | None,
+    weapon_state: dict[str, Any],
+    attack: float | None,
+    enemy_affinity: str | None = None,
+    attack_type_override: str | None = None,
+    start_ap: int = DEFAULT_START_AP,
+    ap_per_turn: int = AP_PER_TURN,
+    gradient_charges: int = 0,
+    crit_rate: float | None = None,
+) -> RotationPlan:
+    """Find the highest expected-damage skill sequence over a turn budget.
+
+    Args:
+        character: The calculator character id.
+        turns: The number of turns to plan, capped at ``MAX_PLAN_TURNS``.
+        state: The normalized character state at the start of the fight.
+        selected_pictos: The Picto names selected in the UI.
+        picto_state: The normalized Picto state.
+        weapon: The selected weapon name, if any.
+        weapon_level: The selected weapon unlock level.
+        weapon_state: The normalized weapon state.
+        attack: The effective attack power used for damage estimates.
+        enemy_affinity: The selected enemy elemental affinity.
+        attack_type_override: The optional Picto attack-type override.
+        start_ap: AP available on the first turn.
+        ap_per_turn: AP regained at the start of every later turn.
+        gradient_charges: Gradient Charges available for Gradient skills.
+        crit_rate: Per-hit crit chance from 0 to 1, or ``None`` to keep the
+            setup's "all hits crit" toggles.
+
+    Returns:
+        The best sequence and its per-turn breakdown, plus the number of
+        memoized states and cached transitions the search visited. The
+        search is a dynamic program over ``(turn, carried state, AP,
+        Gradient Charges)``. Carried state uses the same rules as the
+        rotation simulator, with ranged effects at their lower bound. Each
+        carried state's transitions are evaluated once and shared across
+        turns and AP levels.
+    """
+
+    turns = clamp_int(turns, 0, MAX_PLAN_TURNS)
+    rows = castable_rows(character)
+    # AP after each row's own effects, by AP left once its cost is paid.
+    ap_left = [[ap_after_cast(character, row, ap, None) for ap in range(MAX_AP + 1)] for row in rows]
+    costs: dict[str, tuple[int, int]] = {}
+    evaluate_turn = build_turn_evaluator(
+        character,
+        selected_pictos,
+        picto_state,
+        weapon,
+        weapon_level,
+        attack,
+        enemy_affinity,
+        attack_type_override,
+    )
+    # Carried states are interned to ints so the memo keys stay cheap to hash.
+    state_ids: dict[StateKey, int] = {}
+    state_keys: list[StateKey] = []
+    state_moves: list[list[Transition] | None] = []
+    memo: dict[tuple[int, int, int, int], tuple[float, int, int]] = {}
+
+    def intern(key: StateKey) -> int:
+        state_id = state_ids.get(key)
+        if state_id is None:
+            state_id = state_ids[key] = len(state_keys)
+            state_keys.append(key)
+            state_moves.append(None)
+        return state_id
+
+    def moves(state_id: int) -> list[Transition]:
+        """Return every row's cost, expected damage, and next state from one carried state."""
+
+        cached = state_moves[state_id]
+        if cached is not None:
+            return cached
+        cached = []
+        for row in rows:
+            rotation_state = thaw_rotation_state(state_keys[state_id])
+            cost = calculate_current_cost(character, row, rotation_state["state"])
+            if cost not in costs:
+                costs[cost] = parse_cost(cost)
+            ap_cost, gradient_cost = costs[cost]
+            damage, multiplier = expected_turn(character, row, rotation_state, evaluate_turn, crit_rate)
+            apply_skill_effects(character, row, rotation_state, multiplier is not None, None)
+            cached.append((ap_cost, gradient_cost, damage, multiplier, intern(freeze_rotation_state(rotation_state))))
+        state_moves[state_id] = cached
+        return cached
+
+    def best(turn: int, state_id: int, ap: int, gradient: int) -> tuple[float, int, int]:
+        """Return the best remaining damage, the row index to cast, and the AP after regen."""
+
+        if turn >= turns:
+            return 0.0, -1, ap
+        memo_key = (turn, state_id, ap, gradient)
+        cached = memo.get(memo_key)
+        if cached is not None:
+            return cached
+
+        result = (0.0, -1, ap)
+        regen = ap_per_turn if turn + 1 < turns else 0
+        for index, (ap_cost, gradient_cost, damage, _, next_id) in enumerate(moves(state_id)):
+            if ap_cost > ap or gradient_cost > gradient:
+                continue
+            next_ap = min(ap_left[index][ap - ap_cost] + regen, MAX_AP)
+            value = damage + best(turn + 1, next_id, next_ap, gradient - gradient_cost)[0]
+            if result[1] < 0 or value > result[0]:
+                result = (value, index, next_ap)
+        memo[memo_key] = result
+        return result
+
+    state_id = intern(
+        freeze_rotation_state(
+            {"state": dict(state), "weapon_state": dict(weapon_state), "ap": 0, "gradient_charges": 0, "casts": {}}
+        )
+    )
+    ap = clamp_int(start_ap, 0, MAX_AP)
+    gradient = clamp_int(gradient_charges, 0, 3)
+    total = best(0, state_id, ap, gradient)[0]
+
+    planned: list[PlannedTurn] = []
+    for turn in range(turns):
+        _, index, next_ap = best(turn, state_id, ap, gradient)
+        if index < 0:
+            break
+        row = rows[index]
+        _, gradient_cost, damage, multiplier, next_id = moves(state_id)[index]
+        planned.append(
+            {
+                "turn": turn + 1,
+                "skill": row.skill,
+                "ap": ap,
+                "cost": clean_text(calculate_current_cost(character, row, dict(state_keys[state_id][0]))) or "-",
+                "multiplier": multiplier,
+                "damage": round(damage, 2),
+            }
+        )
+        state_id, ap, gradient = next_id, next_ap, gradient - gradient_cost
+
+    return {
+        "skills": [entry["skill"] for entry in planned],
+        "turns": planned,
+        "expected_damage": round(total, 2),
+        "states": len(memo),
+        "transitions": sum(len(entry) for entry in state_moves if entry is not None),
+    }
@@ -0,0 +1,663 @@
+from __future__ import annotations
+from collections.abc import Callable
+from games.expedition33.calculator.core import (
+    CALCULATOR_DATA,
+    RANK_ORDER,
+    CalculatorRow,
+    CalculatorState,
+    SkillMode,
+    calculate_current_cost,
+    calculate_damage,
+    clamp_int,
+    clean_text,
+    parse_number,
+    resolve_affinity,
+    split_pipe_values,
+)
+from games.expedition33.calculator.evaluators import evaluate_skill_result
+from games.expedition33.calculator.logic import (
+    LUNE_STAIN_KEYS,
+    apply_picto_bonus,
+    apply_weapon_bonus,
+    can_satisfy_lune_stains,
+    resolve_picto_attack_type,
+)
+from games.expedition33.calculator.pictos import PictoSummary, evaluate_pictos
+from games.expedition33.calculator.weapons import WeaponSummary, evaluate_weapon, weapon_row_keys
+from typing import Any, TypedDict
+import math
+import random
+import re
+import numpy as np
+
+MAX_AP = 9
+DEFAULT_START_AP = 3
+AP_PER_TURN = 1
+BASIC_ATTACK_AP = 1
+MAX_ROTATION_TURNS = 20
+DEFAULT_ROTATION_RUNS = 1000
+MAX_ROTATION_RUNS = 10_000
+MAX_ROTATIONS = 8
+# Simulated turns allowed per request, across all rotations and runs. A turn
+# costs about 45 microseconds, so this keeps one request near two seconds of
+# a sync worker; runs are trimmed to fit.
+ROTATION_TURN_BUDGET = 40_000
+
+# Skills cast in place of an unaffordable one, in order of preference.
+FALLBACK_SKILLS = ("Basic Attack", "Ranged Attack")
+RANKS = sorted(RANK_ORDER, key=RANK_ORDER.__getitem__)
+LUNE_MAX_STAINS = 4
+GUSTAVE_MAX_CHARGES = 10
+MAELLE_MAX_BURN_STACKS = 100
+MAELLE_STANCES = {"Offensive", "Defensive", "Virtuoso", "Stanceless"}
+SCIEL_MAX_FORETELL = 10
+VERSO_MAX_USES = 6
+# Skill modes whose damage depends on how often the skill was cast before.
+COUNTED_MODES = {SkillMode.ASCENDING_ASSAULT}
+
+BURN_PATTERN = re.compile(r"Applies (\d+) Burn( per hit)?", re.IGNORECASE)
+STANCE_BURN_PATTERN = re.compile(r"(\w+) Stance: Applies (\d+) more Burn( per hit)?", re.IGNORECASE)
+RANGE_PATTERN = re.compile(r"^(-?\d+)(?:-(\d+))?$")
+
+
+class SkillEffect(TypedDict, total=False):
+    """Between-turn effects of one skill that the sheet does not encode."""
+
+    ap_gain: tuple[int, int]
+    refill_ap: bool
+    rank_change: int
+    set_rank: str
+    charge_gain: tuple[int, int]
+    consume_burn: int
+    keep_virtuoso: bool
+
+
+# Keyed by (character, skill). Ranges are inclusive and rolled per cast.
+SKILL_EFFECTS: dict[tuple[str, str], SkillEffect] = {
+    ("gustave", "Powerful"): {"charge_gain": (0, 2)},
+    ("gustave", "Recovery"): {"charge_gain": (0, 2)},
+    ("maelle", "Combustion"): {"consume_burn": 10},
+    ("maelle", "Fleuret Fury"): {"keep_virtuoso": True},
+    ("maelle", "Last Chance"): {"refill_ap": True},
+    ("maelle", "Mezzo Forte"): {"ap_gain": (1, 3)},
+    ("maelle", "Swift Stride"): {"ap_gain": (0, 2)},
+    ("verso", "Burden"): {"rank_change": 1},
+    ("verso", "Leadership"): {"rank_change": -1},
+    ("verso", "Light Holder"): {"rank_change": 1},
+    ("verso", "Overload"): {"refill_ap": True, "set_rank": "S"},
+    ("verso", "Paradigm Shift"): {"ap_gain": (1, 3)},
+}
+
+
+class RotationState(TypedDict):
+    """Mutable state carried from one simulated turn to the next."""
+
+    state: CalculatorState
+    weapon_state: dict[str, Any]
+    ap: int
+    gradient_charges: int
+    casts: dict[str, int]  # only skills in COUNTED_MODES
+
+
+class RotationTurn(TypedDict):
+    """One simulated turn of a rotation."""
+
+    turn: int
+    skill: str
+    requested: str
+    ap: int
+    cost: str
+    multiplier: float | None
+    damage: float | None
+    scenario: str
+    note: str | None
+
+
+class RotationResult(TypedDict):
+    """One simulated run of a rotation."""
+
+    skills: list[str]
+    turns: list[RotationTurn]
+    total_damage: float
+    ap_spent: int
+    substitutions: int
+
+
+class RotationStats(TypedDict):
+    """Damage statistics of one rotation over many simulated runs."""
+
+    skills: list[str]
+    runs: int
+    mean: float
+    std: float
+    minimum: float
+    p10: float
+    median: float
+    p90: float
+    maximum: float
+    per_turn: list[float]
+    substitution_rate: float
+
+
+TurnEvaluator = Callable[[CalculatorRow, CalculatorState, dict[str, Any]], tuple[float | None, float | None, str]]
+
+
+def roll(bounds: tuple[int, int], rng: random.Random | None) -> int:
+    """Roll an inclusive range, or take its lower bound without a generator."""
+
+    low, high = bounds
+    return rng.randint(low, high) if rng is not None and high > low else low
+
+
+def parse_cost(cost: str) -> tuple[int, int]:
+    """Split a displayed cost into ``(AP, Gradient Charges)``."""
+
+    text = clean_text(cost).upper()
+    if text.endswith("GC"):
+        return 0, clamp_int(parse_number(text.removesuffix("GC")), 0, 3)
+    value = parse_number(text)
+    return (0, 0) if value is None else (max(int(math.ceil(value)), 0), 0)
+
+
+def resolve_rotation_skill(character: str, name: str) -> CalculatorRow | None:
+    """Resolve a skill name from a rotation, ignoring case and spacing."""
+
+    skills = CALCULATOR_DATA[character]["skills"]
+    if name in skills:
+        return skills[name]
+    wanted = " ".join(name.split()).lower()
+    return next((row for skill, row in skills.items() if skill.lower() == wanted), None)
+
+
+def parse_rotations(character: str, text: str | None) -> tuple[list[list[str]], list[str]]:
+    """Parse one comma-separated rotation per line.
+
+    Returns:
+        The first ``MAX_ROTATIONS`` rotations as resolved skill names, capped
+        at ``MAX_ROTATION_TURNS`` turns each, and the names that matched no
+        skill.
+    """
+
+    rotations: list[list[str]] = []
+    unknown: list[str] = []
+    for line in (text or "").splitlines():
+        skills = []
+        for name in (part.strip() for part in line.split(",")):
+            if not name:
+                continue
+            row = resolve_rotation_skill(character, name)
+            if row is None:
+                unknown.append(name)
+            else:
+                skills.append(row.skill)
+        if skills:
+            rotations.append(skills[:MAX_ROTATION_TURNS])
+        if len(rotations) == MAX_ROTATIONS:
+            break
+    return rotations, unknown
+
+
+def build_turn_evaluator(
+    character: str,
+    selected_pictos: list[str] | None,
+    picto_state: dict[str, Any],
+    weapon: str | None,
+    weapon_level: str | int | None,
+    attack: float | None,
+    enemy_affinity: str | None = None,
+    attack_type_override: str | None = None,
+) -> TurnEvaluator:
+    """Build a damage evaluator for single turns that shares summaries across turns.
+
+    Returns:
+        A callable taking a row, the character state, and the weapon state for
+        that turn. It returns the applied multiplier, the estimated damage,
+        and the scenario label. Picto summaries are cached per attack type.
+        Weapon summaries are cached per attack type, weapon-read row columns,
+        and weapon state.
+    """
+
+    picto_summaries: dict[str, PictoSummary] = {}
+    weapon_summaries: dict[tuple[Any, ...], WeaponSummary] = {}
+    row_keys = weapon_row_keys(character, weapon)
+
+    def evaluate(row: CalculatorRow, state: CalculatorState, weapon_state: dict[str, Any]) -> tuple[float | None, float | None, str]:
+        attack_type = resolve_picto_attack_type(row, attack_type_override)
+        picto_summary = picto_summaries.get(attack_type)
+        if picto_summary is None:
+            picto_summary = evaluate_pictos(selected_pictos, {**picto_state, "attack_type": attack_type})
+            picto_summaries[attack_type] = picto_summary
+
+        weapon_key = (attack_type, *(clean_text(row.get(key)) for key in row_keys), *sorted(weapon_state.items()))
+        weapon_summary = weapon_summaries.get(weapon_key)
+        if weapon_summary is None:
+            weapon_summary = evaluate_weapon(character, weapon, weapon_level, row, {**weapon_state, "attack_type": attack_type})
+            weapon_summaries[weapon_key] = weapon_summary
+
+        skill_result = evaluate_skill_result(character, row, state, weapon_summary["suppress_verso_rank_bonus"])
+        skill_result = apply_weapon_bonus(skill_result, weapon_summary)
+        skill_result = apply_picto_bonus(skill_result, picto_summary)
+        multiplier = skill_result.get("multiplier")
+        if not isinstance(multiplier, (int, float)):
+            return None, None, clean_text(skill_result.get("scenario"))
+        effective_multiplier = round(multiplier * resolve_affinity(row, enemy_affinity)["factor"], 2)
+        return effective_multiplier, calculate_damage(attack, effective_multiplier), clean_text(skill_result.get("scenario"))
+
+    return evaluate
+
+
+def prepare_turn_state(
+    character: str,
+    row: CalculatorRow,
+    rotation_state: RotationState,
+    crit_rate: float | None,
+    rng: random.Random | None,
+) -> CalculatorState:
+    """Derive the character state a skill is evaluated against this turn.
+
+    Monoco's mask bonus applies when the skill's Mask matches the mask left
+    by the previous skill (Almighty skills always match), Verso's repeat-use
+    skills see their cast count, and with a crit rate every multi-hit skill
+    rolls whether all of its hits crit.
+    """
+
+    state = dict(rotation_state["state"])
+    if character == "monoco":
+        mask = clean_text(row.mask)
+        state["mask_active"] = bool(mask) and (mask == "Almighty" or mask == rotation_state["weapon_state"].get("monoco_mask_type"))
+    if character == "verso" and row.mode == SkillMode.ASCENDING_ASSAULT:
+        state["uses"] = min(rotation_state["casts"].get(row.skill, 0) + 1, VERSO_MAX_USES)
+    if crit_rate is not None and "all_crits" in state:
+        hits = max(clamp_int(row.hit_count, 1, 20), 1)
+        chance = crit_rate ** hits
+        state["all_crits"] = rng.random() < chance if rng is not None else chance >= 0.5
+    return state
+
+
+def apply_stain_changes(row: CalculatorRow, state: CalculatorState) -> None:
+    """Consume and create Lune's stains for one cast, in place.
+
+    Consumption happens first and only when the requirement is met. Light
+    stains cover any missing element. New stains are then added up to the
+    cap of four.
+    """
+
+    inventory = {key: clamp_int(state.get(key), 0, LUNE_MAX_STAINS) for key in LUNE_STAIN_KEYS}
+    consumed = [stain.lower() for stain in row.consume_stains]
+    if "all" in consumed:
+        inventory = dict.fromkeys(inventory, 0)
+    elif consumed and can_satisfy_lune_stains(row.consume_stains, state):
+        for stain in sorted(consumed, key=lambda name: name == "light"):
+            key = f"{stain}_stains"
+            if stain != "light" and inventory.get(key, 0) > 0:
+                inventory[key] -= 1
+            else:
+                inventory["light_stains"] -= 1
+
+    for stain in split_pipe_values(row.get("Creates Stains")):
+        key = f"{stain.lower()}_stains"
+        if key in inventory and sum(inventory.values()) < LUNE_MAX_STAINS:
+            inventory[key] += 1
+
+    state.update(inventory)
+    state["stains"] = sum(inventory.values())
+
+
+def apply_foretell_change(row: CalculatorRow, foretell: int, rng: random.Random | None) -> int:
+    """Return Sciel's Foretell after one cast, following the sheet's Foretell column."""
+
+    text = clean_text(row.get("Foretell")).lower()
+    if not text:
+        return foretell
+    if text.startswith("consume"):
+        amount = text.removeprefix("consume").strip()
+        if amount == "all":
+            return 0
+        match = RANGE_PATTERN.match(amount)
+        return max(foretell - int(match.group(2) or match.group(1)), 0) if match else 0
+    match = RANGE_PATTERN.match(text)
+    if not match:
+        return foretell
+    low = int(match.group(1))
+    change = roll((low, int(match.group(2))), rng) if match.group(2) else low
+    return min(max(foretell + change, 0), SCIEL_MAX_FORETELL)
+
+
+def apply_burn_change(row: CalculatorRow, stance: str | None, burn_stacks: int) -> int:
+    """Return the target's Burn stacks after one of Maelle's casts."""
+
+    notes = row.notes
+    hits = max(clamp_int(row.hit_count, 1, 20), 1)
+    applied = 0
+    for match in BURN_PATTERN.finditer(notes):
+        applied += int(match.group(1)) * (hits if match.group(2) else 1)
+    for match in STANCE_BURN_PATTERN.finditer(notes):
+        if match.group(1).lower() == clean_text(stance).lower():
+            applied += int(match.group(2)) * (hits if match.group(3) else 1)
+    consumed = SKILL_EFFECTS.get(("maelle", row.skill), {}).get("consume_burn", 0)
+    return min(max(burn_stacks - consumed, 0) + applied, MAELLE_MAX_BURN_STACKS)
+
+
+def shift_rank(rank: Any, steps: int) -> str:
+    """Move Verso's rank by ``steps`` grades, staying within D to S."""
+
+    position = RANK_ORDER.get(clean_text(rank).upper(), 0) + steps
+    return RANKS[min(max(position, 0), len(RANKS) - 1)]
+
+
+def apply_skill_effects(
+    character: str,
+    row: CalculatorRow,
+    rotation_state: RotationState,
+    dealt_damage: bool,
+    rng: random.Random | None,
+) -> None:
+    """Advance the carried state after a cast, in place.
+
+    Lune's stains follow the sheet's ``Consume Stains`` and ``Creates
+    Stains`` columns. Sciel's Foretell follows the ``Foretell`` column, up to
+    ten stacks. Maelle switches to the skill's ``Stance`` and applies the Burn
+    its notes describe. Monoco's mask becomes the skill's Mask. Gustave gains
+    one Overcharge charge per hit and Overcharge spends them all. Verso
+    climbs one rank per damaging cast unless the skill moves his rank
+    itself. AP is handled separately by ``ap_after_cast``.
+    """
+
+    state = rotation_state["state"]
+    weapon_state = rotation_state["weapon_state"]
+    effect = SKILL_EFFECTS.get((character, row.skill), {})
+    if row.mode in COUNTED_MODES:
+        # Counts past the cap play identically, so keep equivalent states equal.
+        rotation_state["casts"][row.skill] = min(rotation_state["casts"].get(row.skill, 0) + 1, VERSO_MAX_USES - 1)
+
+    if character == "lune":
+        apply_stain_changes(row, state)
+    elif character == "sciel":
+        state["foretell"] = apply_foretell_change(row, clamp_int(state.get("foretell"), 0, SCIEL_MAX_FORETELL), rng)
+        weapon_state["foretell"] = state["foretell"]
+    elif character == "maelle":
+        state["burn_stacks"] = apply_burn_change(row, state.get("stance"), clamp_int(state.get("burn_stacks"), 0, MAELLE_MAX_BURN_STACKS))
+        stance = clean_text(row.get("Stance"))
+        if stance in MAELLE_STANCES and not (effect.get("keep_virtuoso") and state.get("stance") == "Virtuoso"):
+            state["stance"] = stance
+    elif character == "monoco":
+        mask = clean_text(row.mask)
+        if mask and mask != "Almighty":
+            weapon_state["monoco_mask_type"] = mask
+    elif character == "gustave":
+        charges = clamp_int(state.get("charges"), 0, GUSTAVE_MAX_CHARGES)
+        if row.skill.startswith("Overcharge"):
+            charges = 0
+        elif "charge_gain" in effect:
+            charges += roll(effect["charge_gain"], rng)
+        elif dealt_damage:
+            charges += max(clamp_int(row.hit_count, 1, 20), 1)
+        state["charges"] = min(charges, GUSTAVE_MAX_CHARGES)
+    elif character == "verso":
+        if "set_rank" in effect:
+            state["rank"] = effect["set_rank"]
+        elif "rank_change" in effect:
+            state["rank"] = shift_rank(state.get("rank"), effect["rank_change"])
+        elif dealt_damage:
+            state["rank"] = shift_rank(state.get("rank"), 1)
+        weapon_state["rank"] = state["rank"]
+
+
+def ap_after_cast(character: str, row: CalculatorRow, ap: int, rng: random.Random | None) -> int:
+    """Return the AP left after a cast's own AP effects, once its cost is paid.
+
+    Basic and Ranged Attacks grant ``BASIC_ATTACK_AP``. Gains and refills
+    come from ``SKILL_EFFECTS``.
+    """
+
+    effect = SKILL_EFFECTS.get((character, row.skill), {})
+    if effect.get("refill_ap"):
+        return MAX_AP
+    if row.skill in FALLBACK_SKILLS:
+        ap += BASIC_ATTACK_AP
+    if "ap_gain" in effect:
+        ap += roll(effect["ap_gain"], rng)
+    return min(ap, MAX_AP)
+
+
+def fallback_row(character: str) -> CalculatorRow | None:
+    """Return the free skill cast when a rotation step is unaffordable."""
+
+    skills = CALCULATOR_DATA[character]["skills"]
+    return next((skills[name] for name in FALLBACK_SKILLS if name in skills), None)
+
+
+def simulate_rotation(
+    character: str,
+    skills: list[str],
+    state: CalculatorState,
+    weapon_state: dict[str, Any],
+    evaluate_turn: TurnEvaluator,
+    start_ap: int = DEFAULT_START_AP,
+    ap_per_turn: int = AP_PER_TURN,
+    gradient_charges: int = 0,
+    crit_rate: float | None = None,
+    rng: random.Random | None = None,
+) -> RotationResult:
+    """Play one rotation turn by turn.
+
+    Args:
+        character: The calculator character id.
+        skills: The skill names to cast in order, one per turn.
+        state: The normalized character state at the start of the fight.
+        weapon_state: The normalized weapon state. Weapon passives see the
+            same Foretell, rank, and Monoco mask as the simulated character.
+        evaluate_turn: The damage evaluator from ``build_turn_evaluator``.
+        start_ap: AP available on the first turn.
+        ap_per_turn: AP regained at the start of every later turn.
+        gradient_charges: Gradient Charges available for Gradient skills.
+        crit_rate: Per-hit crit chance from 0 to 1 used to roll the "all hits
+            crit" toggles, or ``None`` to keep the setup's toggles.
+        rng: The random source for ranged effects and crits. Without one,
+            ranged effects take their lower bound.
+
+    Returns:
+        The per-turn log plus totals. A skill the character cannot afford is
+        replaced by a Basic Attack (or Ranged Attack for Lune), which grants
+        ``BASIC_ATTACK_AP``.
+    """
+
+    rotation_state: RotationState = {
+        "state": dict(state),
+        "weapon_state": dict(weapon_state),
+        "ap": clamp_int(start_ap, 0, MAX_AP),
+        "gradient_charges": clamp_int(gradient_charges, 0, 3),
+        "casts": {},
+    }
+    fallback = fallback_row(character)
+    turns: list[RotationTurn] = []
+    total_damage = 0.0
+    ap_spent = 0
+    substitutions = 0
+
+    for turn, requested in enumerate(skills, start=1):
+        if turn > 1:
+            rotation_state["ap"] = min(rotation_state["ap"] + ap_per_turn, MAX_AP)
+        row = CALCULATOR_DATA[character]["skills"][requested]
+        cost = calculate_current_cost(character, row, rotation_state["state"])
+        ap_cost, gradient_cost = parse_cost(cost)
+        note = None
+        if ap_cost > rotation_state["ap"] or gradient_cost > rotation_state["gradient_charges"]:
+            note = "Not enough Gradient Charges" if gradient_cost else f"Not enough AP ({rotation_state['ap']}/{ap_cost})"
+            substitutions += 1
+            row = fallback
+            ap_cost, gradient_cost = 0, 0
+            cost = "-"
+
+        ap_before = rotation_state["ap"]
+        if row is None:
+            turns.append({"turn": turn, "skill": "-", "requested": requested, "ap": ap_before, "cost": cost, "multiplier": None, "damage": None, "scenario": "", "note": note})
+            continue
+
+        turn_state = prepare_turn_state(character, row, rotation_state, crit_rate, rng)
+        multiplier, damage, scenario = evaluate_turn(row, turn_state, rotation_state["weapon_state"])
+        rotation_state["ap"] = ap_after_cast(character, row, rotation_state["ap"] - ap_cost, rng)
+        rotation_state["gradient_charges"] -= gradient_cost
+        apply_skill_effects(character, row, rotation_state, damage is not None, rng)
+
+        ap_spent += ap_cost
+        total_damage += damage or 0.0
+        turns.append(
+            {
+                "turn": turn,
+                "skill": row.skill,
+                "requested": requested,
+                "ap": ap_before,
+                "cost": cost,
+                "multiplier": multiplier,
+                "damage": damage,
+                "scenario": scenario,
+                "note": note,
+            }
+        )
+
+    return {
+        "skills": list(skills),
+        "turns": turns,
+        "total_damage": round(total_damage, 2),
+        "ap_spent": ap_spent,
+        "substitutions": substitutions,
+    }
+
+
+def _simulate_runs(
+    character: str,
+    skills: list[str],
+    rotation_index: int,
+    run_range: range,
+    seed: int,
+    setup: dict[str, Any],
+) -> tuple[list[float], list[list[float]], int]:
+    """Simulate a range of runs for one rotation.
+
+    Returns:
+        The total damage of every run, each run's per-turn damage, and the
+        number of substituted turns.
+    """
+
+    evaluate_turn = build_turn_evaluator(
+        character,
+        setup["pictos"],
+        setup["picto_state"],
+        setup["weapon"],
+        setup["weapon_level"],
+        setup["attack"],
+        setup["enemy_affinity"],
+        setup["attack_type_override"],
+    )
+    totals: list[float] = []
+    per_turn: list[list[float]] = []
+    substitutions = 0
+    for run in run_range:
+        result = simulate_rotation(
+            character,
+            skills,
+            setup["state"],
+            setup["weapon_state"],
+            evaluate_turn,
+            setup["start_ap"],
+            setup["ap_per_turn"],
+            setup["gradient_charges"],
+            setup["crit_rate"],
+            random.Random(f"{seed}:{rotation_index}:{run}"),
+        )
+        totals.append(result["total_damage"])
+        per_turn.append([entry["damage"] or 0.0 for entry in result["turns"]])
+        substitutions += result["substitutions"]
+    return totals, per_turn, substitutions
+
+
+def simulate_rotations(
+    character: str,
+    rotations: list[list[str]],
+    state: CalculatorState,
+    selected_pictos: list[str] | None,
+    picto_state: dict[str, Any],
+    weapon: str | None,
+    weapon_level: str | int | None,
+    weapon_state: dict[str, Any],
+    attack: float | None,
+    enemy_affinity: str | None = None,
+    attack_type_override: str | None = None,
+    runs: int = DEFAULT_ROTATION_RUNS,
+    start_ap: int = DEFAULT_START_AP,
+    ap_per_turn: int = AP_PER_TURN,
+    gradient_charges: int = 0,
+    crit_rate: float | None = None,
+    seed: int = 33,
+) -> list[RotationStats]:
+    """Simulate many runs of several rotations and summarize their damage.
+
+    Args:
+        character: The calculator character id.
+        rotations: The rotations to compare, each a list of skill names.
+        state: The normalized character state at the start of the fight.
+        selected_pictos: The Picto names selected in the UI.
+        picto_state: The normalized Picto state.
+        weapon: The selected weapon name, if any.
+        weapon_level: The selected weapon unlock level.
+        weapon_state: The normalized weapon state.
+        attack: The effective attack power used for damage estimates.
+        enemy_affinity: The selected enemy elemental affinity.
+        attack_type_override: The optional Picto attack-type override.
+        runs: Simulated runs per rotation.
+        start_ap: AP available on the first turn.
+        ap_per_turn: AP regained at the start of every later turn.
+        gradient_charges: Gradient Charges available for Gradient skills.
+        crit_rate: Per-hit crit chance from 0 to 1, or ``None`` to keep the
+            setup's "all hits crit" toggles.
+        seed: The base seed. Every run draws from its own generator.
+
+    Returns:
+        One statistics entry per rotation, sorted by mean total damage. Only
+        the first ``MAX_ROTATIONS`` rotations are simulated, and ``runs`` is
+        lowered until the batch fits ``ROTATION_TURN_BUDGET``; each entry
+        reports the runs actually simulated.
+    """
+
+    rotations = [skills[:MAX_ROTATION_TURNS] for skills in rotations[:MAX_ROTATIONS]]
+    total_turns = max(sum(len(skills) for skills in rotations), 1)
+    runs = max(1, min(runs, MAX_ROTATION_RUNS, ROTATION_TURN_BUDGET // total_turns))
+    setup = {
+        "state": state,
+        "pictos": selected_pictos,
+        "picto_state": picto_state,
+        "weapon": weapon,
+        "weapon_level": weapon_level,
+        "weapon_state": weapon_state,
+        "attack": attack,
+        "enemy_affinity": enemy_affinity,
+        "attack_type_override": attack_type_override,
+        "start_ap": start_ap,
+        "ap_per_turn": ap_per_turn,
+        "gradient_charges": gradient_charges,
+        "crit_rate": crit_rate,
+    }
+    stats: list[RotationStats] = []
+    for index, skills in enumerate(rotations):
+        totals, per_turn, substitutions = _simulate_runs(character, skills, index, range(runs), seed, setup)
+        values = np.array(totals)
+        p10, median, p90 = np.percentile(values, [10, 50, 90])
+        stats.append(
+            {
+                "skills": skills,
+                "runs": runs,
+                "mean": round(float(values.mean()), 2),
+                "std": round(float(values.std()), 2),
+                "minimum": round(float(values.min()), 2),
+                "p10": round(float(p10), 2),
+                "median": round(float(median), 2),
+                "p90": round(float(p90), 2),
+                "maximum": round(float(values.max()), 2),
+                "per_turn": [round(float(value), 2) for value in np.mean(per_turn, axis=0)],
+                "substitution_rate": round(substitutions / (runs * len(skills)), 4),
+            }
+        )
+
+    stats.sort(key=lambda entry: -entry["mean"])
+    return stats
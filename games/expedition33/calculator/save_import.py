@@ -1,20 +1,23 @@
 from __future__ import annotations
 
-import base64
-import binascii
-import json
+from collections.abc import Callable
 import os
 from pathlib import Path
 import platform
 import re
 import shutil
 import subprocess
-from typing import Any, TypedDict
+import tempfile
+import threading
+from typing import IO, Any, TypedDict
 import unicodedata
 
 from loguru import logger
 
+from games.expedition33.calculator.conversion_gate import ConversionRejected, conversion_slot
 from games.expedition33.calculator.core import CALCULATOR_DATA, DEFAULT_CHARACTER
+from games.expedition33.calculator.gvas import GvasError, read_save_properties
+from games.expedition33.calculator.json_stream import STREAM_CHUNK_BYTES, extract_members
 from games.expedition33.calculator.pictos import PICTO_DEFINITIONS
 from games.expedition33.calculator.weapons import WEAPON_DEFINITIONS, normalize_weapon_level
 
@@ -54,6 +57,14 @@ class SaveImportPayload(TypedDict):
 ROOT_DIR = Path(__file__).resolve().parents[3]
 MAX_SAVE_UPLOAD_BYTES = 10 * 1024 * 1024
 UESAVE_TIMEOUT_SECONDS = 10
+# Read saves in-process with ``gvas`` first, and only run uesave when that
+# fails. Off unless the server runs with ``LUDEX_NATIVE_SAVE_READER=1``, until
+# ``verify_saves`` has passed on real saves.
+NATIVE_SAVE_READER = os.environ.get("LUDEX_NATIVE_SAVE_READER") == "1"
+# Top-level save properties ``build_import_payload`` reads.
+IMPORT_PROPERTIES = frozenset({"CharactersCollection_0", "WeaponProgressions_0"})
+# Where uesave's JSON output keeps the top-level save properties.
+UESAVE_PROPERTIES_PATH = ("root", "properties")
 DEFAULT_UESAVE_BINARIES = {
     ("Linux", "x86_64"): ROOT_DIR / "tools" / "uesave" / "uesave_cli-x86_64-unknown-linux-gnu" / "uesave",
 }
@@ -189,58 +200,145 @@ SKILL_LOOKUPS = {
 }
 
 
-def decode_upload_contents(contents: str) -> bytes:
-    """Decode Dash upload contents into raw save bytes."""
+def ignore_stage(stage: str) -> None:
+    """Default import progress callback, for imports nobody is watching."""
 
-    _, _, encoded = contents.partition(",")
-    if not encoded:
-        raise SaveImportError("Upload payload was empty.")
-    if estimated_decoded_size(encoded) > MAX_SAVE_UPLOAD_BYTES:
-        raise SaveImportError("Uploaded save is too large.")
 
-    try:
-        return base64.b64decode(encoded, validate=True)
-    except (binascii.Error, ValueError) as exc:
-        raise SaveImportError("Uploaded file could not be base64-decoded.") from exc
+def parse_save_bytes(
+    save_bytes: bytes,
+    filename: str | None = None,
+    report: Callable[[str], None] = ignore_stage,
+) -> SaveImportPayload:
+    """Read raw `.sav` bytes into normalized calculator state, without the cache.
+
+    New saves are read natively when that is switched on and works, and
+    converted with uesave otherwise.
 
+    Args:
+        save_bytes: The save file's contents.
+        filename: The uploaded file's name.
+        report: Called with ``"reading"``, ``"waiting"``, and ``"converting"``
+            as the import reaches each stage. Exceptions it raises abort the
+            import.
 
-def parse_uploaded_save(contents: str, filename: str | None = None) -> SaveImportPayload:
-    """Convert uploaded `.sav` contents into normalized calculator state."""
+    Raises:
+        SaveImportError: If the save cannot be read, or holds no supported
+            characters.
+    """
 
-    validate_upload_filename(filename)
-    save_bytes = decode_upload_contents(contents)
-    save_json = convert_save_bytes_to_json(save_bytes)
-    payload = build_import_payload(save_json, filename or "uploaded.sav")
-    if not payload["characters"]:
-        raise SaveImportError("No supported Expedition 33 characters were found in the uploaded save.")
+    report("reading")
+    payload = read_native_payload(save_bytes, filename or "uploaded.sav")
+    if payload is None:
+        save_json = convert_save_bytes_to_json(save_bytes, report)
+        payload = build_import_payload(save_json, filename or "uploaded.sav")
+        if not payload["characters"]:
+            raise SaveImportError("No supported Expedition 33 characters were found in the uploaded save.")
     return payload
 
 
-def convert_save_bytes_to_json(save_bytes: bytes) -> dict[str, Any]:
-    """Run the official uesave CLI against raw bytes and parse the JSON output."""
+def read_native_payload(save_bytes: bytes, filename: str) -> SaveImportPayload | None:
+    """Build the import payload with the in-process GVAS reader.
+
+    Returns:
+        The payload, or ``None`` when the native reader is switched off,
+        cannot read the save, or finds no supported characters.
+    """
+
+    if not NATIVE_SAVE_READER:
+        return None
+    try:
+        payload = build_import_payload(read_save_properties(save_bytes, IMPORT_PROPERTIES), filename)
+    except GvasError as exc:
+        logger.info("Native save reader fell back to uesave: {}", exc)
+        return None
+    return payload if payload["characters"] else None
+
+
+def convert_save_bytes_to_json(save_bytes: bytes, report: Callable[[str], None] = ignore_stage) -> dict[str, Any]:
+    """Run the official uesave CLI against raw bytes and read the properties the import uses.
+
+    Conversions wait for a slot from ``conversion_gate``, which caps how many
+    run at once across all workers. ``report`` is called with ``"waiting"``
+    before the wait and ``"converting"`` once a slot is held.
+    """
 
     executable = resolve_uesave_binary()
+    report("waiting")
     try:
-        process = subprocess.run(
-            [str(executable), "to-json", "--no-warn", "-i", "-", "-o", "-"],
-            input=save_bytes,
-            capture_output=True,
-            check=False,
-            timeout=UESAVE_TIMEOUT_SECONDS,
-        )
-    except subprocess.TimeoutExpired as exc:
-        logger.warning("uesave timed out while parsing uploaded save: {}", exc)
-        raise SaveImportError("Uploaded save took too long to parse.") from exc
-    if process.returncode != 0:
-        error_text = process.stderr.decode("utf-8", errors="replace").strip()
+        with conversion_slot():
+            report("converting")
+            properties, json_error, returncode, error_text, timed_out = stream_uesave_properties(executable, save_bytes)
+    except ConversionRejected as exc:
+        logger.warning("Rejected uploaded save: {}", exc)
+        raise SaveImportError(str(exc)) from None
+    if timed_out:
+        logger.warning("uesave timed out after {} seconds while parsing uploaded save", UESAVE_TIMEOUT_SECONDS)
+        raise SaveImportError("Uploaded save took too long to parse.")
+    if returncode != 0:
         logger.warning("uesave failed to parse uploaded save: {}", error_text or "<empty stderr>")
         raise SaveImportError("Uploaded save could not be parsed.") from None
+    if json_error is not None:
+        logger.warning("uesave returned invalid JSON while parsing uploaded save: {}", json_error)
+        raise SaveImportError("uesave returned invalid JSON for the uploaded save.") from json_error
+    return {"root": {"properties": properties}}
+
+
+def stream_uesave_properties(
+    executable: Path,
+    save_bytes: bytes,
+) -> tuple[dict[str, Any], ValueError | None, int, str, bool]:
+    """Run ``uesave to-json`` and stream ``IMPORT_PROPERTIES`` out of its output.
+
+    The save is fed to uesave from a thread while the main thread reads its
+    output through ``json_stream``. Once the wanted properties are found the
+    rest of the output is read and discarded, so the exit status still
+    reflects the whole conversion. A timer kills uesave after
+    ``UESAVE_TIMEOUT_SECONDS``.
+
+    Returns:
+        A tuple of ``(properties, json_error, returncode, stderr_text,
+        timed_out)``.
+    """
+
+    timed_out = threading.Event()
+    with tempfile.TemporaryFile() as stderr, subprocess.Popen(
+        [str(executable), "to-json", "--no-warn", "-i", "-", "-o", "-"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=stderr,
+    ) as process:
+        timer = threading.Timer(UESAVE_TIMEOUT_SECONDS, lambda: (timed_out.set(), process.kill()))
+        feeder = threading.Thread(target=feed_stdin, args=(process.stdin, save_bytes), daemon=True)
+        timer.start()
+        feeder.start()
+        properties: dict[str, Any] = {}
+        json_error: ValueError | None = None
+        try:
+            properties = extract_members(process.stdout, UESAVE_PROPERTIES_PATH, IMPORT_PROPERTIES)
+        except ValueError as exc:
+            json_error = exc
+        finally:
+            while process.stdout.read(STREAM_CHUNK_BYTES):
+                pass
+            returncode = process.wait()
+            timer.cancel()
+            feeder.join()
+        stderr.seek(0)
+        error_text = stderr.read().decode("utf-8", errors="replace").strip()
+    return properties, json_error, returncode, error_text, timed_out.is_set()
+
+
+def feed_stdin(stdin: IO[bytes], save_bytes: bytes) -> None:
+    """Write the save to uesave and close its input; uesave may exit before reading it all."""
 
     try:
-        return json.loads(process.stdout.decode("utf-8"))
-    except json.JSONDecodeError as exc:
-        logger.warning("uesave returned invalid JSON while parsing uploaded save: {}", exc)
-        raise SaveImportError("uesave returned invalid JSON for the uploaded save.") from exc
+        stdin.write(save_bytes)
+    except BrokenPipeError:
+        pass
+    try:
+        stdin.close()
+    except BrokenPipeError:
+        pass
 
 
 def validate_upload_filename(filename: str | None) -> None:
@@ -252,13 +350,6 @@ def validate_upload_filename(filename: str | None) -> None:
         raise SaveImportError("Only .sav files are supported.")
 
 
-def estimated_decoded_size(encoded: str) -> int:
-    """Estimate the decoded size without allocating the full byte array first."""
-
-    padding = len(encoded) - len(encoded.rstrip("="))
-    return (len(encoded) * 3) // 4 - padding
-
-
 def resolve_uesave_binary() -> Path:
     """Locate the bundled or user-provided uesave executable."""
 
@@ -0,0 +1,223 @@
+"""Receive save uploads as raw bytes on a Flask route.
+
+The calculator page posts the chosen ``File`` straight to
+``SAVE_UPLOAD_ROUTE``, so the save never passes through a Dash callback or a
+base64 data URL. ``receive_upload`` streams it to a file in ``UPLOAD_DIR``,
+``UPLOAD_CHUNK_BYTES`` at a time, checking the size and computing the
+``import_cache`` key along the way, and returns a token. The directory is
+capped at ``UPLOAD_DIR_FILES`` uploads and ``UPLOAD_DIR_BYTES``; uploads
+beyond that are turned away until older ones are claimed or expire. Each
+upload reserves its place by creating its temporary file before counting
+the directory, so workers receiving uploads at once all see each other. The
+import job claims the save with ``take_upload``, or drops it with
+``discard_upload`` when ``upload_record`` shows it was imported before.
+Uploads no job claims expire after ``UPLOAD_TTL_SECONDS``.
+"""
+
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+import secrets
+import tempfile
+import time
+from typing import BinaryIO, TypedDict
+
+from loguru import logger
+
+from games.expedition33.calculator.import_cache import import_cache_digest
+from games.expedition33.calculator.import_store import TOKEN_PATTERN
+from games.expedition33.calculator.save_import import (
+    MAX_SAVE_UPLOAD_BYTES,
+    SaveImportError,
+    validate_upload_filename,
+)
+
+# Mirrored by SAVE_UPLOAD_URL in calculatorClientside.js.
+SAVE_UPLOAD_ROUTE = "/exp33/calculator/save-upload"
+UPLOAD_DIR = Path(os.environ.get("LUDEX_UPLOAD_DIR") or Path(tempfile.gettempdir()) / "ludex-exp33-uploads")
+UPLOAD_CHUNK_BYTES = 64 * 1024
+UPLOAD_TTL_SECONDS = 15 * 60
+# Unclaimed uploads kept at once, and the disk space they may take. An
+# upload still streaming in counts as a full ``MAX_SAVE_UPLOAD_BYTES``.
+UPLOAD_DIR_FILES = 32
+UPLOAD_DIR_BYTES = 256 * 1024 * 1024
+# Largest request body the server reads: one raw save. Dash callback
+# requests stay far below it.
+MAX_UPLOAD_REQUEST_BYTES = MAX_SAVE_UPLOAD_BYTES
+
+
+class UploadTooLarge(SaveImportError):
+    """Raised when an upload exceeds ``MAX_SAVE_UPLOAD_BYTES``."""
+
+
+class UploadQuotaExceeded(SaveImportError):
+    """Raised when ``UPLOAD_DIR`` holds as many uploads as it may."""
+
+
+class SaveUpload(TypedDict):
+    """What was recorded about one received upload."""
+
+    filename: str
+    cache_key: str
+    size: int
+
+
+class UploadStats(TypedDict):
+    """Counters for the uploads one worker received."""
+
+    received: int
+    rejected: int
+    over_quota: int
+    received_bytes: int
+
+
+upload_counters = {"received": 0, "rejected": 0, "over_quota": 0, "received_bytes": 0}
+
+
+def upload_paths(token: str) -> tuple[Path, Path]:
+    """Return the save file and the metadata file of one upload."""
+
+    return UPLOAD_DIR / f"{token}.sav", UPLOAD_DIR / f"{token}.json"
+
+
+def receive_upload(stream: BinaryIO, filename: str | None, content_length: int | None = None) -> str:
+    """Stream one save upload to disk and return the token that claims it.
+
+    Args:
+        stream: The raw request body.
+        filename: The uploaded file's name.
+        content_length: The declared body size, checked before reading.
+
+    Raises:
+        UploadTooLarge: If the upload exceeds ``MAX_SAVE_UPLOAD_BYTES``.
+        UploadQuotaExceeded: If ``UPLOAD_DIR`` is full.
+        SaveImportError: If the filename is not a `.sav` or the upload is
+            empty.
+    """
+
+    try:
+        validate_upload_filename(filename)
+        if content_length is not None and content_length > MAX_SAVE_UPLOAD_BYTES:
+            raise UploadTooLarge("Uploaded save is too large.")
+        UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        evict_uploads()
+        handle, temporary = tempfile.mkstemp(dir=UPLOAD_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                check_upload_quota()
+                token = secrets.token_urlsafe(12)
+                save_path, meta_path = upload_paths(token)
+                digest = import_cache_digest()
+                size = 0
+                while chunk := stream.read(UPLOAD_CHUNK_BYTES):
+                    size += len(chunk)
+                    if size > MAX_SAVE_UPLOAD_BYTES:
+                        raise UploadTooLarge("Uploaded save is too large.")
+                    digest.update(chunk)
+                    file.write(chunk)
+            if not size:
+                raise SaveImportError("Upload payload was empty.")
+            os.replace(temporary, save_path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+    except UploadQuotaExceeded:
+        upload_counters["over_quota"] += 1
+        raise
+    except SaveImportError:
+        upload_counters["rejected"] += 1
+        raise
+
+    upload: SaveUpload = {"filename": filename or "uploaded.sav", "cache_key": digest.hexdigest(), "size": size}
+    handle, temporary = tempfile.mkstemp(dir=UPLOAD_DIR, suffix=".tmp")
+    with os.fdopen(handle, "w", encoding="utf-8") as file:
+        json.dump(upload, file)
+    os.replace(temporary, meta_path)
+    upload_counters["received"] += 1
+    upload_counters["received_bytes"] += size
+    return token
+
+
+def check_upload_quota() -> None:
+    """Refuse the upload just reserved if ``UPLOAD_DIR`` is now over its file or byte cap.
+
+    The caller's own temporary file is already in the directory and counted,
+    so two uploads racing for the last place both see each other.
+
+    Raises:
+        UploadQuotaExceeded: If the uploads present could exceed either cap.
+    """
+
+    count = size = 0
+    for path in UPLOAD_DIR.iterdir():
+        try:
+            if path.suffix == ".sav":
+                size += path.stat().st_size
+            elif path.suffix == ".tmp":
+                size += MAX_SAVE_UPLOAD_BYTES
+            else:
+                continue
+        except OSError:
+            continue
+        count += 1
+    if count > UPLOAD_DIR_FILES or size > UPLOAD_DIR_BYTES:
+        raise UploadQuotaExceeded("Too many saves are being uploaded right now. Try again in a moment.")
+
+
+def upload_record(token: str) -> SaveUpload:
+    """Return what was recorded about one upload, without claiming it.
+
+    Raises:
+        SaveImportError: If the token is malformed, or the upload expired or
+            was already taken.
+    """
+
+    if not TOKEN_PATTERN.fullmatch(token):
+        raise SaveImportError("Uploaded save was not found. Upload it again.")
+    try:
+        return json.loads(upload_paths(token)[1].read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise SaveImportError("Uploaded save was not found. Upload it again.") from exc
+
+
+def take_upload(token: str) -> tuple[bytes, SaveUpload]:
+    """Read one upload and delete it from disk.
+
+    Raises:
+        SaveImportError: If the token is malformed, or the upload expired or
+            was already taken.
+    """
+
+    upload = upload_record(token)
+    try:
+        save_bytes = upload_paths(token)[0].read_bytes()
+    except OSError as exc:
+        raise SaveImportError("Uploaded save was not found. Upload it again.") from exc
+    discard_upload(token)
+    return save_bytes, upload
+
+
+def discard_upload(token: str) -> None:
+    """Delete one upload's files, for a save that needs no reading."""
+
+    for path in upload_paths(token):
+        path.unlink(missing_ok=True)
+
+
+def evict_uploads() -> None:
+    """Delete upload files not claimed within ``UPLOAD_TTL_SECONDS``."""
+
+    now = time.time()
+    for path in UPLOAD_DIR.iterdir():
+        try:
+            if now - path.stat().st_mtime > UPLOAD_TTL_SECONDS:
+                path.unlink()
+        except OSError as exc:
+            logger.warning("Could not evict save upload {}: {}", path.name, exc)
+
+
+def upload_stats() -> UploadStats:
+    """Return this worker's upload counters."""
+
+    return {**upload_counters}
@@ -0,0 +1,228 @@
+from __future__ import annotations
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from games.expedition33.calculator.core import CalculatorState, clamp_int, clean_text
+from typing import Any, ClassVar
+
+LUNE_STAIN_CONTROLS = {
+    "earth_stains": "lune_earth_stains",
+    "fire_stains": "lune_fire_stains",
+    "ice_stains": "lune_ice_stains",
+    "lightning_stains": "lune_lightning_stains",
+    "light_stains": "lune_light_stains",
+}
+
+
+def bounded(minimum: int, maximum: int) -> Callable[[Any], int]:
+    """Return a normalizer clamping a count to the range the calculators read."""
+
+    return lambda value: clamp_int(value, minimum, maximum)
+
+
+def labelled(default: str) -> Callable[[Any], str]:
+    """Return a normalizer trimming a label, with the calculators' default when empty."""
+
+    return lambda value: clean_text(value) or default
+
+
+@dataclass(frozen=True, slots=True)
+class CharacterState:
+    """Normalized combat state for one character.
+
+    Subclasses list their state fields, the control each one reads, and how
+    its value is normalized. Every field is mapped onto the values the
+    calculators tell apart: counts are clamped to the range they read, flags
+    become booleans, and labels are trimmed. Instances are hashable, and
+    setups that give the same results compare equal.
+    """
+
+    # State field -> control key, for fields read straight from a control.
+    CONTROLS: ClassVar[dict[str, str]] = {}
+    # State field -> normalizer applied to its control value.
+    NORMALIZERS: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+
+    @classmethod
+    def from_controls(cls, controls: Mapping[str, Any]) -> CharacterState:
+        """Read and normalize this character's fields from control values keyed by ``control_key``."""
+
+        return cls(**{name: cls.NORMALIZERS[name](controls.get(control)) for name, control in cls.CONTROLS.items()})
+
+    def as_state(self) -> CalculatorState:
+        """Return the state dictionary the calculator logic expects."""
+
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(frozen=True, slots=True)
+class GustaveState(CharacterState):
+    """Gustave's Overcharge state."""
+
+    CONTROLS: ClassVar[dict[str, str]] = {"charges": "gustave_charges"}
+    NORMALIZERS: ClassVar[dict[str, Callable[[Any], Any]]] = {"charges": bounded(0, 10)}
+
+    charges: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class LuneState(CharacterState):
+    """Lune's stain and turn state.
+
+    ``stains`` is the typed stain total capped at 4 when any typed stain is
+    set, and the fallback stain count otherwise.
+    """
+
+    CONTROLS: ClassVar[dict[str, str]] = {"turns": "lune_turns", "all_crits": "lune_all_crits"}
+    NORMALIZERS: ClassVar[dict[str, Callable[[Any], Any]]] = {"turns": bounded(1, 5), "all_crits": bool}
+
+    stains: int = 0
+    turns: int = 1
+    all_crits: bool = False
+    earth_stains: int = 0
+    fire_stains: int = 0
+    ice_stains: int = 0
+    lightning_stains: int = 0
+    light_stains: int = 0
+
+    @classmethod
+    def from_controls(cls, controls: Mapping[str, Any]) -> LuneState:
+        """Read Lune's fields, clamping the stain counts to 0-4."""
+
+        typed_stains = {name: clamp_int(controls.get(control), 0, 4) for name, control in LUNE_STAIN_CONTROLS.items()}
+        typed_total = sum(typed_stains.values())
+        return cls(
+            stains=min(4, typed_total) if typed_total > 0 else clamp_int(controls.get("lune_stains"), 0, 4),
+            **{name: cls.NORMALIZERS[name](controls.get(control)) for name, control in cls.CONTROLS.items()},
+            **typed_stains,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MaelleState(CharacterState):
+    """Maelle's stance, Burn, and target state."""
+
+    CONTROLS: ClassVar[dict[str, str]] = {
+        "stance": "maelle_stance",
+        "burn_stacks": "maelle_burn_stacks",
+        "hits_taken": "maelle_hits_taken",
+        "marked": "maelle_marked",
+        "all_crits": "maelle_all_crits",
+    }
+    NORMALIZERS: ClassVar[dict[str, Callable[[Any], Any]]] = {
+        "stance": labelled("Stanceless"),
+        "burn_stacks": bounded(0, 100),
+        "hits_taken": bounded(0, 5),
+        "marked": bool,
+        "all_crits": bool,
+    }
+
+    stance: str = "Stanceless"
+    burn_stacks: int = 0
+    hits_taken: int = 0
+    marked: bool = False
+    all_crits: bool = False
+    turns: int = 3
+
+
+@dataclass(frozen=True, slots=True)
+class MonocoState(CharacterState):
+    """Monoco's mask and target state."""
+
+    CONTROLS: ClassVar[dict[str, str]] = {
+        "turns": "monoco_turns",
+        "mask_active": "monoco_mask",
+        "stunned": "monoco_stunned",
+        "marked": "monoco_marked",
+        "powerless": "monoco_powerless",
+        "burning": "monoco_burning",
+        "low_life": "monoco_low_life",
+        "full_life": "monoco_full_life",
+        "all_crits": "monoco_all_crits",
+    }
+    NORMALIZERS: ClassVar[dict[str, Callable[[Any], Any]]] = {
+        "turns": bounded(1, 3),
+        **{name: bool for name in CONTROLS if name != "turns"},
+    }
+
+    turns: int = 1
+    mask_active: bool = False
+    stunned: bool = False
+    marked: bool = False
+    powerless: bool = False
+    burning: bool = False
+    low_life: bool = False
+    full_life: bool = False
+    all_crits: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ScielState(CharacterState):
+    """Sciel's Foretell and Twilight state."""
+
+    CONTROLS: ClassVar[dict[str, str]] = {
+        "foretell": "sciel_foretell",
+        "twilight": "sciel_twilight",
+        "full_life": "sciel_full_life",
+    }
+    NORMALIZERS: ClassVar[dict[str, Callable[[Any], Any]]] = {
+        "foretell": bounded(0, 999),
+        "twilight": bool,
+        "full_life": bool,
+    }
+
+    foretell: int = 0
+    twilight: bool = False
+    full_life: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class VersoState(CharacterState):
+    """Verso's rank and skill-use state."""
+
+    CONTROLS: ClassVar[dict[str, str]] = {
+        "rank": "verso_rank",
+        "shots": "verso_shots",
+        "uses": "verso_uses",
+        "stunned": "verso_stunned",
+        "speed_bonus": "verso_speed_bonus",
+        "missing_health": "verso_missing_health",
+    }
+    NORMALIZERS: ClassVar[dict[str, Callable[[Any], Any]]] = {
+        "rank": labelled("D"),
+        "shots": bounded(0, 10),
+        "uses": bounded(1, 6),
+        "stunned": bool,
+        "speed_bonus": bool,
+        "missing_health": bounded(0, 99),
+    }
+
+    rank: str = "D"
+    shots: int = 0
+    uses: int = 1
+    stunned: bool = False
+    speed_bonus: bool = False
+    missing_health: int = 0
+
+
+CHARACTER_STATES: dict[str, type[CharacterState]] = {
+    "gustave": GustaveState,
+    "lune": LuneState,
+    "maelle": MaelleState,
+    "monoco": MonocoState,
+    "sciel": ScielState,
+    "verso": VersoState,
+}
+
+
+def build_character_state(character: str, controls: Mapping[str, Any]) -> CharacterState:
+    """Normalize the state of one character from the calculator controls.
+
+    Args:
+        character: The calculator character id.
+        controls: Control values keyed by ``control_key``. Only the
+            character's own controls are read.
+
+    Returns:
+        The character's typed, hashable state.
+    """
+
+    return CHARACTER_STATES[character].from_controls(controls)
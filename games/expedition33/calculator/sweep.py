@@ -0,0 +1,217 @@
+from __future__ import annotations
+from games.expedition33.calculator.core import CalculatorRow, CalculatorState, clamp_int, resolve_affinity
+from games.expedition33.calculator.evaluators import evaluate_skill_result
+from games.expedition33.calculator.logic import (
+    LUNE_STAIN_KEYS,
+    apply_picto_bonus,
+    apply_weapon_bonus,
+    resolve_picto_attack_type,
+)
+from games.expedition33.calculator.pictos import evaluate_pictos
+from games.expedition33.calculator.weapons import WeaponSummary, evaluate_weapon
+from typing import Any, TypedDict
+import numpy as np
+
+BOOLEAN_VALUES = [False, True]
+RANK_VALUES = ["D", "C", "B", "A", "S"]
+MAELLE_STANCE_VALUES = ["Offensive", "Defensive", "Virtuoso", "Stanceless"]
+# Sciel's foretell has no UI maximum; sweep the range players actually reach.
+SCIEL_FORETELL_SWEEP_MAX = 40
+
+# State fields that weapon passives also read under the same key.
+WEAPON_STATE_FIELDS = {
+    "sciel": {"foretell", "twilight"},
+    "verso": {"rank"},
+}
+
+
+class SweepField(TypedDict):
+    """One character-state field the sweep engine can vary."""
+
+    label: str
+    values: list[Any]
+
+
+class SweepResult(TypedDict):
+    """A swept grid of effective multipliers for one skill."""
+
+    x_field: str
+    y_field: str
+    x_values: list[Any]
+    y_values: list[Any]
+    matrix: np.ndarray
+
+
+SWEEP_FIELDS: dict[str, dict[str, SweepField]] = {
+    "gustave": {
+        "charges": {"label": "Charges", "values": list(range(0, 11))},
+    },
+    "lune": {
+        "stains": {"label": "Total stains", "values": list(range(0, 5))},
+        "earth_stains": {"label": "Earth stains", "values": list(range(0, 5))},
+        "fire_stains": {"label": "Fire stains", "values": list(range(0, 5))},
+        "ice_stains": {"label": "Ice stains", "values": list(range(0, 5))},
+        "lightning_stains": {"label": "Lightning stains", "values": list(range(0, 5))},
+        "light_stains": {"label": "Light stains", "values": list(range(0, 5))},
+        "turns": {"label": "Turns / procs / burn ticks", "values": list(range(1, 6))},
+        "all_crits": {"label": "All hits crit", "values": BOOLEAN_VALUES},
+    },
+    "maelle": {
+        "stance": {"label": "Current stance", "values": MAELLE_STANCE_VALUES},
+        "burn_stacks": {"label": "Burn stacks", "values": list(range(0, 101))},
+        "hits_taken": {"label": "Hits taken last round", "values": list(range(0, 6))},
+        "marked": {"label": "Target is marked", "values": BOOLEAN_VALUES},
+        "all_crits": {"label": "All hits crit", "values": BOOLEAN_VALUES},
+    },
+    "monoco": {
+        "turns": {"label": "Burn / setup turns", "values": list(range(1, 4))},
+        "mask_active": {"label": "Mask active", "values": BOOLEAN_VALUES},
+        "stunned": {"label": "Target is stunned", "values": BOOLEAN_VALUES},
+        "marked": {"label": "Target is marked", "values": BOOLEAN_VALUES},
+        "powerless": {"label": "Target is powerless", "values": BOOLEAN_VALUES},
+        "burning": {"label": "Target is burning", "values": BOOLEAN_VALUES},
+        "low_life": {"label": "Monoco is low life", "values": BOOLEAN_VALUES},
+        "full_life": {"label": "Monoco is full life", "values": BOOLEAN_VALUES},
+        "all_crits": {"label": "All hits crit", "values": BOOLEAN_VALUES},
+    },
+    "sciel": {
+        "foretell": {"label": "Foretell", "values": list(range(0, SCIEL_FORETELL_SWEEP_MAX + 1))},
+        "twilight": {"label": "Twilight active", "values": BOOLEAN_VALUES},
+        "full_life": {"label": "Allies at full life", "values": BOOLEAN_VALUES},
+    },
+    "verso": {
+        "rank": {"label": "Current rank", "values": RANK_VALUES},
+        "shots": {"label": "Ranged shots this turn", "values": list(range(0, 11))},
+        "uses": {"label": "Uses / setup turns", "values": list(range(1, 7))},
+        "stunned": {"label": "Target is stunned", "values": BOOLEAN_VALUES},
+        "speed_bonus": {"label": "Max speed bonus active", "values": BOOLEAN_VALUES},
+        "missing_health": {"label": "Missing HP %", "values": list(range(0, 100))},
+    },
+}
+
+
+def sweep_point_state(character: str, state: CalculatorState, overrides: dict[str, Any]) -> CalculatorState:
+    """Apply swept values to a state, keeping derived fields consistent.
+
+    Lune's total ``stains`` is derived from the typed stain counts when any
+    are set, mirroring ``LuneState.from_controls``.
+    """
+
+    point_state = {**state, **overrides}
+    if character == "lune" and any(key in overrides for key in LUNE_STAIN_KEYS):
+        typed_stains = sum(clamp_int(point_state.get(key), 0, 4) for key in LUNE_STAIN_KEYS)
+        if typed_stains:
+            point_state["stains"] = min(4, typed_stains)
+        elif any(clamp_int(state.get(key), 0, 4) for key in LUNE_STAIN_KEYS):
+            point_state["stains"] = 0
+    return point_state
+
+
+def sweep_field_options(character: str) -> list[dict[str, str]]:
+    """Return select options for the sweepable fields of one character."""
+
+    return [
+        {"label": field["label"], "value": key}
+        for key, field in SWEEP_FIELDS.get(character, {}).items()
+    ]
+
+
+def format_sweep_value(value: Any) -> str:
+    """Format a swept field value for axis labels."""
+
+    if isinstance(value, bool):
+        return "On" if value else "Off"
+    return str(value)
+
+
+def sweep_skill(
+    character: str,
+    row: CalculatorRow,
+    state: CalculatorState,
+    x_field: str,
+    y_field: str | None,
+    selected_pictos: list[str] | None,
+    picto_state: dict[str, Any],
+    weapon: str | None,
+    weapon_level: str | int | None,
+    weapon_state: dict[str, Any],
+    enemy_affinity: str | None = None,
+    attack_type_override: str | None = None,
+) -> SweepResult:
+    """Evaluate one skill across a grid of two character-state fields.
+
+    Args:
+        character: The calculator character id.
+        row: The selected skill row.
+        state: The normalized character state the grid varies from.
+        x_field: The state field swept along the columns.
+        y_field: The state field swept along the rows, or ``None`` for a
+            single-row sweep.
+        selected_pictos: The Picto names selected in the UI.
+        picto_state: The normalized Picto state. Its ``attack_type`` is
+            replaced with the attack type resolved for ``row``.
+        weapon: The selected weapon name, if any.
+        weapon_level: The selected weapon unlock level.
+        weapon_state: The normalized weapon state. Its ``attack_type`` is
+            replaced with the attack type resolved for ``row``.
+        enemy_affinity: The selected enemy elemental affinity.
+        attack_type_override: The optional Picto attack-type override.
+
+    Returns:
+        The swept axes plus a ``(len(y_values), len(x_values))`` float matrix
+        of effective multipliers, with ``NaN`` where the skill deals no
+        direct damage. Pictos never read character state, so their summary
+        is evaluated once; weapon summaries are only re-evaluated for the
+        fields weapon passives also read.
+    """
+
+    fields = SWEEP_FIELDS[character]
+    x_values = fields[x_field]["values"]
+    y_values = fields[y_field]["values"] if y_field and y_field != x_field else [None]
+
+    attack_type = resolve_picto_attack_type(row, attack_type_override)
+    picto_summary = evaluate_pictos(selected_pictos, {**picto_state, "attack_type": attack_type})
+    affinity_factor = resolve_affinity(row, enemy_affinity)["factor"]
+    weapon_fields = WEAPON_STATE_FIELDS.get(character, set())
+    weapon_summaries: dict[tuple[Any, ...], WeaponSummary] = {}
+
+    matrix = np.full((len(y_values), len(x_values)), np.nan)
+    for y_index, y_value in enumerate(y_values):
+        for x_index, x_value in enumerate(x_values):
+            overrides = {x_field: x_value}
+            if y_value is not None:
+                overrides[y_field] = y_value
+            point_state = sweep_point_state(character, state, overrides)
+
+            weapon_overrides = {key: value for key, value in overrides.items() if key in weapon_fields}
+            weapon_key = tuple(sorted(weapon_overrides.items()))
+            weapon_summary = weapon_summaries.get(weapon_key)
+            if weapon_summary is None:
+                weapon_summary = evaluate_weapon(
+                    character,
+                    weapon,
+                    weapon_level,
+                    row,
+                    {**weapon_state, **weapon_overrides, "attack_type": attack_type},
+                )
+                weapon_summaries[weapon_key] = weapon_summary
+
+            skill_result = evaluate_skill_result(
+                character,
+                row,
+                point_state,
+                weapon_summary["suppress_verso_rank_bonus"],
+            )
+            skill_result = apply_weapon_bonus(skill_result, weapon_summary)
+            skill_result = apply_picto_bonus(skill_result, picto_summary)
+            multiplier = skill_result.get("multiplier")
+            if isinstance(multiplier, (int, float)):
+                matrix[y_index, x_index] = round(multiplier * affinity_factor, 2)
+
+    return {
+        "x_field": x_field,
+        "y_field": y_field if y_values != [None] else "",
+        "x_values": x_values,
+        "y_values": y_values,
+        "matrix": matrix,
+    }
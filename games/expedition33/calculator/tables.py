@@ -0,0 +1,128 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from games.expedition33.calculator.core import CALCULATOR_DATA, CSV_DIR, CalculationResult, CalculatorRow, CalculatorState
+from loguru import logger
+from pathlib import Path
+from typing import Any
+import hashlib
+import json
+import numpy as np
+
+TABLE_PATH = CSV_DIR / "outcome_tables.npz"
+# Files whose contents determine every tabulated result, plus the compiled
+# evaluators the tables sit in front of and fall back to. Editing any of them
+# marks the shipped tables stale until they are rebuilt.
+TABLE_SOURCES = (
+    *sorted(CSV_DIR.glob("*.csv")),
+    Path(__file__).with_name("core.py"),
+    Path(__file__).with_name("logic.py"),
+    Path(__file__).with_name("evaluators.py"),
+)
+# Table axis standing in for the Verso rank-bonus suppression flag.
+RANK_BONUS_AXIS = "disable_rank_bonus"
+RESULT_KEYS = ("multiplier", "scenario", "source", "warning")
+MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class OutcomeTable:
+    """Precomputed results of one skill row over its relevant state fields.
+
+    Attributes:
+        axes: ``(state field, value -> position, stride)`` per table axis.
+        cells: Result ids in row-major order over ``axes``.
+        results: The distinct results of the row's character, by id.
+    """
+
+    axes: tuple[tuple[str, dict[Hashable, int], int], ...]
+    cells: array
+    results: tuple[CalculationResult, ...]
+
+    def lookup(self, state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult | None:
+        """Return the tabulated result, or ``None`` for states outside the table."""
+
+        index = 0
+        for key, positions, stride in self.axes:
+            position = positions.get(disable_rank_bonus if key == RANK_BONUS_AXIS else state.get(key, MISSING), -1)
+            if position < 0:
+                return None
+            index += position * stride
+        return self.results[self.cells[index]]
+
+
+def source_fingerprint(paths: Iterable[Path] = TABLE_SOURCES) -> str:
+    """Hash the files the outcome tables are derived from."""
+
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def result_key(skill_result: CalculationResult) -> tuple[Any, ...]:
+    """Return the interning key of one calculation result."""
+
+    return tuple(skill_result[key] for key in RESULT_KEYS)
+
+
+def load_outcome_tables(path: Path = TABLE_PATH) -> dict[CalculatorRow, OutcomeTable]:
+    """Load the shipped outcome tables for every loaded skill row.
+
+    Args:
+        path: The ``.npz`` file written by ``build_tables``.
+
+    Returns:
+        A mapping from skill record to its table. It is empty, and a warning is
+        logged, when the file is missing or was built from different sources,
+        so callers fall back to the compiled evaluators.
+    """
+
+    if not path.exists():
+        logger.warning("Outcome tables not found at {}; using compiled evaluators", path)
+        return {}
+
+    with np.load(path, allow_pickle=False) as archive:
+        meta = json.loads(str(archive["meta"]))
+        if meta["fingerprint"] != source_fingerprint():
+            logger.warning("Outcome tables at {} are stale; rebuild them with build_tables", path)
+            return {}
+
+        tables: dict[CalculatorRow, OutcomeTable] = {}
+        for character, payload in meta["characters"].items():
+            records = CALCULATOR_DATA[character]["records"]
+            results = tuple(dict(zip(RESULT_KEYS, values)) for values in payload["results"])
+            domains = payload["domains"]
+            for index, (row, table_row) in enumerate(zip(records, payload["rows"], strict=True)):
+                if row.skill != table_row["skill"]:
+                    logger.warning("Outcome tables at {} do not match the loaded {} rows", path, character)
+                    return {}
+                cells = archive[f"{character}/{index}"]
+                sizes = [len(domains[key]) for key in table_row["axes"]]
+                strides = [int(np.prod(sizes[position + 1:])) for position in range(len(sizes))]
+                tables[row] = OutcomeTable(
+                    axes=tuple(
+                        (key, {value: position for position, value in enumerate(domains[key])}, stride)
+                        for key, stride in zip(table_row["axes"], strides)
+                    ),
+                    cells=array(cells.dtype.char, cells.tobytes()),
+                    results=results,
+                )
+    return tables
+
+
+def table_evaluator(
+    table: OutcomeTable,
+    fallback: Callable[[CalculatorState, bool], CalculationResult],
+) -> Callable[[CalculatorState, bool], CalculationResult]:
+    """Build an evaluator that reads ``table`` and defers to ``fallback`` outside it."""
+
+    lookup = table.lookup
+
+    def evaluate(state: CalculatorState, disable_rank_bonus: bool = False) -> CalculationResult:
+        skill_result = lookup(state, disable_rank_bonus)
+        return fallback(state, disable_rank_bonus) if skill_result is None else skill_result
+
+    return evaluate
@@ -7,18 +7,43 @@ from dash import dcc, html
 from games.expedition33.calculator.core import HIDDEN_STYLE
 from games.expedition33.calculator.ui.bonus_controls import bonus_controls
 from games.expedition33.calculator.ui.character_controls import calculator_controls
+from games.expedition33.calculator.ui.state_store import (
+    apply_initial_outputs,
+    build_control_defaults_store,
+    calculator_state_store,
+    collect_control_defaults,
+    rendered_views_store,
+    request_ticket_store,
+)
 from games.expedition33.calculator.ui.setup_fields import (
     attack_input,
     character_select,
     compare_skill_dropdown,
+    compare_skills_dropdown,
     enemy_affinity_select,
+    optimize_skills_dropdown,
+    optimize_slots_input,
+    optimize_weapons_switch,
     pictos_select,
+    rank_all_switch,
+    rotation_crit_input,
+    rotation_plan_turns_input,
+    rotation_runs_input,
+    rotation_skills_textarea,
+    rotation_start_ap_input,
+    save_import_job_store,
+    save_import_poll,
     save_import_store,
     save_upload,
+    save_upload_result_store,
     skill_dropdown,
+    sweep_x_select,
+    sweep_y_select,
     weapon_level_select,
+    visibility_map_store,
     weapon_select,
 )
+from games.expedition33.calculator.visibility import resolve_visibility
 from games.expedition33.helpers import build_title_card
 
 
@@ -120,6 +145,30 @@ def build_save_import_section() -> html.Div:
                 color="secondary",
                 className="mt-2 mb-0 py-2",
             ),
+            html.Div(
+                html.Div(
+                    [
+                        dbc.Progress(
+                            id="exp33-calculator-save-import-progress-bar",
+                            value=0,
+                            max=1,
+                            striped=True,
+                            animated=True,
+                            className="flex-grow-1",
+                        ),
+                        dmc.Button(
+                            "Cancel",
+                            id="exp33-calculator-save-import-cancel",
+                            variant="subtle",
+                            color="red",
+                            size="xs",
+                        ),
+                    ],
+                    className="d-flex align-items-center gap-2 mt-2",
+                ),
+                id="exp33-calculator-save-import-progress",
+                style=HIDDEN_STYLE,
+            ),
             dbc.Alert(
                 id="exp33-calculator-save-import-status",
                 is_open=False,
@@ -241,6 +290,110 @@ def build_results_column() -> dbc.Col:
                 ],
                 className="g-4",
             ),
+            dbc.Card(
+                [
+                    dbc.CardHeader("Compare Skills"),
+                    dbc.CardBody(
+                        [
+                            compare_skills_dropdown,
+                            html.Div(
+                                "Evaluates every picked skill in one pass against the same setup. "
+                                "Importing a save picks the character's equipped skills.",
+                                className="form-text mb-2",
+                            ),
+                            html.Div(id="exp33-calculator-compare-grid-body"),
+                        ]
+                    ),
+                ],
+                className="mb-4",
+            ),
+            dbc.Card(
+                [
+                    dbc.CardHeader("Rank All Skills"),
+                    dbc.CardBody(
+                        [
+                            rank_all_switch,
+                            html.Div(
+                                "Uses the same character, setup, weapon, Pictos, and enemy affinity for every skill.",
+                                className="form-text mb-2",
+                            ),
+                            html.Div(id="exp33-calculator-rank-body"),
+                        ]
+                    ),
+                ],
+                className="mb-4",
+            ),
+            dbc.Card(
+                [
+                    dbc.CardHeader("Optimize Pictos"),
+                    dbc.CardBody(
+                        [
+                            optimize_slots_input,
+                            html.Div(optimize_skills_dropdown, className="mt-2"),
+                            html.Div(optimize_weapons_switch, className="mt-2"),
+                            html.Div(
+                                "Finds the Picto/Lumina combinations that maximize the primary skill's multiplier, "
+                                "or the expected damage of a skill mix. Conditional Pictos only count when their "
+                                "current setup toggles make them active.",
+                                className="form-text mb-2",
+                            ),
+                            html.Div(id="exp33-calculator-optimize-body"),
+                        ]
+                    ),
+                ],
+                className="mb-4",
+            ),
+            dbc.Card(
+                [
+                    dbc.CardHeader("State Sweep"),
+                    dbc.CardBody(
+                        [
+                            dbc.Row(
+                                [
+                                    dbc.Col(sweep_x_select, md=6),
+                                    dbc.Col(sweep_y_select, md=6),
+                                ],
+                                className="g-2",
+                            ),
+                            html.Div(
+                                "Plots the primary skill's applied multiplier over every value of one or two setup "
+                                "fields, keeping every other input as it is.",
+                                className="form-text mb-2",
+                            ),
+                            html.Div(id="exp33-calculator-sweep-body"),
+                        ]
+                    ),
+                ],
+                className="mb-4",
+            ),
+            dbc.Card(
+                [
+                    dbc.CardHeader("Rotation Simulator"),
+                    dbc.CardBody(
+                        [
+                            rotation_skills_textarea,
+                            dbc.Row(
+                                [
+                                    dbc.Col(rotation_runs_input, md=3),
+                                    dbc.Col(rotation_start_ap_input, md=3),
+                                    dbc.Col(rotation_crit_input, md=3),
+                                    dbc.Col(rotation_plan_turns_input, md=3),
+                                ],
+                                className="g-2 mt-1",
+                            ),
+                            html.Div(
+                                "Plays each rotation turn by turn from the current setup, tracking AP, stains, "
+                                "Foretell, rank, stance, mask, and charges. Unaffordable skills become a Basic Attack. "
+                                "Plan turns searches every affordable sequence for the highest expected damage.",
+                                className="form-text mb-2",
+                            ),
+                            html.Div(id="exp33-calculator-rotation-body"),
+                            html.Div(id="exp33-calculator-rotation-plan-body", className="mt-3"),
+                        ]
+                    ),
+                ],
+                className="mb-4",
+            ),
         ],
         lg=7,
         className="mb-4",
@@ -250,25 +403,49 @@ def build_results_column() -> dbc.Col:
 def build_layout() -> dbc.Container:
     """Build the full calculator page layout."""
 
+    content = [
+        save_import_store,
+        save_import_job_store,
+        save_import_poll,
+        save_upload_result_store,
+        calculator_state_store,
+        rendered_views_store,
+        request_ticket_store,
+        visibility_map_store,
+        build_title_card("Skill Damage Calculator"),
+        build_sources_alert(),
+        dcc.Markdown(
+            "Choose a character, pick a skill, then adjust the relevant combat state. "
+            "The result card shows the applied breakpoint or derived formula and estimates damage from your current Attack Power, weapon passives, and Pictos."
+        ),
+        dbc.Row(
+            [
+                dbc.Col(build_setup_card(), lg=5, className="mb-4"),
+                build_results_column(),
+            ],
+            className="g-4",
+        ),
+    ]
     return dbc.Container(
-        [
-            save_import_store,
-            build_title_card("Skill Damage Calculator"),
-            build_sources_alert(),
-            dcc.Markdown(
-                "Choose a character, pick a skill, then adjust the relevant combat state. "
-                "The result card shows the applied breakpoint or derived formula and estimates damage from your current Attack Power, weapon passives, and Pictos."
-            ),
-            dbc.Row(
-                [
-                    dbc.Col(build_setup_card(), lg=5, className="mb-4"),
-                    build_results_column(),
-                ],
-                className="g-4",
-            ),
-        ],
+        [*content, build_control_defaults_store(collect_control_defaults(content))],
         fluid=True,
     )
 
 
 layout = build_layout()
+CONTROL_DEFAULTS = collect_control_defaults([layout])
+# Paint the default selection's control visibility into the layout so the
+# clientside visibility callbacks can skip their initial call. The default
+# result panels are painted in by ``callbacks.py``, which renders them.
+apply_initial_outputs(
+    [layout],
+    resolve_visibility(
+        visibility_map_store.data,
+        CONTROL_DEFAULTS["character"],
+        CONTROL_DEFAULTS["skill"],
+        CONTROL_DEFAULTS["compare_skill"],
+        CONTROL_DEFAULTS["weapon"],
+        CONTROL_DEFAULTS["weapon_level"],
+        CONTROL_DEFAULTS["pictos"],
+    ),
+)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+from typing import Any, TypedDict
+
+from dash import Patch, no_update
+from plotly.io.json import to_json_plotly
+
+from games.expedition33.calculator.core import ComponentChildren
+
+# Patch the result-card bodies instead of resending them. Turn off to always
+# send full component trees.
+PATCH_RESULT_VIEWS = True
+# Result-card bodies this worker sent, kept by digest as the base for the
+# next patch.
+SENT_BODIES_CACHE_SIZE = 256
+
+
+class PatchStats(TypedDict):
+    """Response-size counters for the patched result-card bodies."""
+
+    bodies: int
+    patched: int
+    unchanged: int
+    unknown_base: int
+    full_bytes: int
+    sent_bytes: int
+
+
+class RenderedViews(TypedDict):
+    """What the browser currently shows, as echoed back by the client.
+
+    Attributes:
+        digest: A hash of the shown bodies' component JSON.
+    """
+
+    digest: str
+
+
+patch_counters: PatchStats = {
+    "bodies": 0,
+    "patched": 0,
+    "unchanged": 0,
+    "unknown_base": 0,
+    "full_bytes": 0,
+    "sent_bytes": 0,
+}
+sent_bodies: OrderedDict[str, list[Any]] = OrderedDict()
+
+
+def component_json(children: ComponentChildren) -> Any:
+    """Serialize a component tree to the JSON Dash sends to the browser."""
+
+    return json.loads(to_json_plotly(children))
+
+
+def views_digest(bodies: list[Any]) -> str:
+    """Hash serialized result-card bodies."""
+
+    return hashlib.blake2b(json.dumps(bodies, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+
+def remember_bodies(bodies: list[Any]) -> str:
+    """Keep serialized bodies about to be sent, and return their digest."""
+
+    digest = views_digest(bodies)
+    sent_bodies[digest] = bodies
+    sent_bodies.move_to_end(digest)
+    while len(sent_bodies) > SENT_BODIES_CACHE_SIZE:
+        sent_bodies.popitem(last=False)
+    return digest
+
+
+def recall_bodies(rendered_views: RenderedViews | None) -> list[Any] | None:
+    """Return the bodies the browser shows, if this worker sent them recently.
+
+    Returns:
+        The serialized bodies, or ``None`` when they are unknown here, such
+        as before the first render or when another worker sent them.
+    """
+
+    if not rendered_views:
+        return None
+    bodies = sent_bodies.get(rendered_views.get("digest"))
+    if bodies is None:
+        patch_counters["unknown_base"] += 1
+        return None
+    sent_bodies.move_to_end(rendered_views["digest"])
+    return bodies
+
+
+def collect_changes(old: Any, new: Any, path: tuple[str | int, ...], changes: list[tuple[tuple[str | int, ...], Any]]) -> None:
+    """Collect the smallest set of ``(path, value)`` assignments turning ``old`` into ``new``.
+
+    Components of the same type are compared prop by prop and equal-length
+    lists item by item. Anything else that differs is replaced whole.
+    """
+
+    if old == new:
+        return
+    if (
+        isinstance(old, dict)
+        and isinstance(new, dict)
+        and "props" in old
+        and "props" in new
+        and old.get("type") == new.get("type")
+        and old.get("namespace") == new.get("namespace")
+        and old["props"].keys() == new["props"].keys()
+    ):
+        for key, value in new["props"].items():
+            collect_changes(old["props"][key], value, (*path, "props", key), changes)
+        return
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            collect_changes(old_item, new_item, (*path, index), changes)
+        return
+    changes.append((path, new))
+
+
+def build_patch(old: Any, new: Any) -> Patch | None:
+    """Build a ``dash.Patch`` turning the serialized ``old`` children into ``new``.
+
+    Returns:
+        The patch, or ``None`` when the whole tree changes.
+    """
+
+    changes: list[tuple[tuple[str | int, ...], Any]] = []
+    collect_changes(old, new, (), changes)
+    if any(not path for path, _ in changes):
+        return None
+
+    patch = Patch()
+    for path, value in changes:
+        target = patch
+        for key in path[:-1]:
+            target = target[key]
+        target[path[-1]] = value
+    return patch
+
+
+def patch_bodies(previous: list[Any] | None, current: list[Any]) -> list[Any]:
+    """Choose, per body, the smallest of no update, a patch, or the full tree.
+
+    Args:
+        previous: The serialized bodies the browser shows, or ``None`` when
+            they are unknown.
+        current: The serialized bodies to show.
+
+    Returns:
+        One callback output per body.
+    """
+
+    outputs = []
+    for index, new in enumerate(current):
+        full = to_json_plotly(new)
+        output: Any = new
+        sent = len(full)
+        if previous is not None:
+            old = previous[index]
+            if old == new:
+                output, sent = no_update, 0
+                patch_counters["unchanged"] += 1
+            else:
+                patch = build_patch(old, new)
+                patch_size = len(to_json_plotly(patch)) if patch is not None else sent
+                if patch_size < sent:
+                    output, sent = patch, patch_size
+                    patch_counters["patched"] += 1
+        patch_counters["bodies"] += 1
+        patch_counters["full_bytes"] += len(full)
+        patch_counters["sent_bytes"] += sent
+        outputs.append(output)
+    return outputs
+
+
+def patch_stats() -> PatchStats:
+    """Return this worker's result-body patch counters."""
+
+    return dict(patch_counters)
@@ -5,7 +5,9 @@ from typing import Any
 
 import dash_bootstrap_components as dbc
 import dash_mantine_components as dmc
-from dash import html
+import numpy as np
+import plotly.graph_objects as go
+from dash import dcc, html
 
 from games.expedition33.calculator.core import (
     AffinityDetails,
@@ -20,9 +22,14 @@ from games.expedition33.calculator.core import (
     format_multiplier,
     parse_number,
     skill_element,
+    SkillRanking,
 )
+from games.expedition33.calculator.optimizer import BuildLoadout, PictoLoadout
 from games.expedition33.calculator.pictos import PictoSummary
-from games.expedition33.calculator.weapons import WeaponSummary
+from games.expedition33.calculator.planner import RotationPlan
+from games.expedition33.calculator.rotation import RotationStats
+from games.expedition33.calculator.sweep import SWEEP_FIELDS, SweepResult, format_sweep_value
+from games.expedition33.calculator.weapons import WEAPON_LEVEL_OPTIONS, WeaponSummary
 from games.expedition33.helpers import format_value
 
 
@@ -294,6 +301,380 @@ def build_summary_body(
     ]
 
 
+def build_ranking_table(rankings: list[SkillRanking], selected_skill: str | None) -> ComponentChildren:
+    """Build the "rank all skills" table for the current setup."""
+
+    table_rows = [
+        html.Tr(
+            [
+                html.Td(index if entry["multiplier"] is not None else "-"),
+                html.Td(entry["skill"]),
+                html.Td(format_multiplier(entry["multiplier"])),
+                html.Td(format_value(entry["damage"])),
+                html.Td(entry["cost"] or "-"),
+                html.Td(format_value(entry["damage_per_ap"])),
+                html.Td(
+                    [
+                        html.Div(entry["scenario"] or "Base value"),
+                        html.Div(entry["warning"], className="form-text mt-0") if entry["warning"] else None,
+                    ]
+                ),
+            ],
+            className="table-active" if entry["skill"] == selected_skill else None,
+        )
+        for index, entry in enumerate(rankings, start=1)
+    ]
+
+    return [
+        dbc.Table(
+            [
+                html.Thead(
+                    html.Tr(
+                        [
+                            html.Th("#"),
+                            html.Th("Skill"),
+                            html.Th("Applied Multiplier"),
+                            html.Th("Estimated Damage"),
+                            html.Th("AP Cost"),
+                            html.Th("Damage / AP"),
+                            html.Th("Scenario"),
+                        ]
+                    )
+                ),
+                html.Tbody(table_rows),
+            ],
+            bordered=False,
+            hover=True,
+            responsive=True,
+            size="sm",
+            className="mb-0",
+        )
+    ]
+
+
+def build_skill_comparison_grid(entries: list[SkillRanking], selected_skill: str | None) -> ComponentChildren:
+    """Build the side-by-side grid for the compared skills.
+
+    Skills keep the order they were picked in. Each damaging skill also shows
+    its damage as a share of the strongest compared skill.
+    """
+
+    if not entries:
+        return []
+
+    best_damage = max((entry["damage"] for entry in entries if entry["damage"] is not None), default=None)
+    table_rows = [
+        html.Tr(
+            [
+                html.Td(entry["skill"], className="fw-semibold" if entry["damage"] == best_damage else None),
+                html.Td(format_multiplier(entry["multiplier"])),
+                html.Td(format_value(entry["damage"])),
+                html.Td(
+                    f"{entry['damage'] / best_damage:.0%}"
+                    if entry["damage"] is not None and best_damage
+                    else "-"
+                ),
+                html.Td(entry["cost"] or "-"),
+                html.Td(format_value(entry["damage_per_ap"])),
+                html.Td(
+                    [
+                        html.Div(entry["scenario"] or "Base value"),
+                        html.Div(entry["warning"], className="form-text mt-0") if entry["warning"] else None,
+                    ]
+                ),
+            ],
+            className="table-active" if entry["skill"] == selected_skill else None,
+        )
+        for entry in entries
+    ]
+
+    return [
+        dbc.Table(
+            [
+                html.Thead(
+                    html.Tr(
+                        [
+                            html.Th("Skill"),
+                            html.Th("Applied Multiplier"),
+                            html.Th("Estimated Damage"),
+                            html.Th("vs Best"),
+                            html.Th("AP Cost"),
+                            html.Th("Damage / AP"),
+                            html.Th("Scenario"),
+                        ]
+                    )
+                ),
+                html.Tbody(table_rows),
+            ],
+            bordered=False,
+            hover=True,
+            responsive=True,
+            size="sm",
+            className="mb-0",
+        )
+    ]
+
+
+def build_picto_loadout_table(loadouts: list[PictoLoadout], selected_pictos: list[str] | None) -> ComponentChildren:
+    """Build the Picto optimizer results table for the primary skill."""
+
+    if not loadouts:
+        return [html.Div("This skill has no direct damage multiplier to optimize.", className="text-muted")]
+
+    current = set(selected_pictos or [])
+    table_rows = [
+        html.Tr(
+            [
+                html.Td(index),
+                html.Td(", ".join(entry["pictos"]) or "No damage Pictos apply"),
+                html.Td(format_multiplier(entry["picto_factor"])),
+                html.Td(format_multiplier(entry["multiplier"])),
+            ],
+            className="table-active" if set(entry["pictos"]) == current else None,
+        )
+        for index, entry in enumerate(loadouts, start=1)
+    ]
+
+    return [
+        dbc.Table(
+            [
+                html.Thead(
+                    html.Tr(
+                        [
+                            html.Th("#"),
+                            html.Th("Pictos/Lumina"),
+                            html.Th("Picto Bonus"),
+                            html.Th("Multiplier"),
+                        ]
+                    )
+                ),
+                html.Tbody(table_rows),
+            ],
+            bordered=False,
+            hover=True,
+            responsive=True,
+            size="sm",
+            className="mb-0",
+        )
+    ]
+
+
+def build_build_loadout_table(
+    loadouts: list[BuildLoadout],
+    selected_weapon: str | None,
+    selected_level: str | None,
+    selected_pictos: list[str] | None,
+) -> ComponentChildren:
+    """Build the weapon and Picto build optimizer results table."""
+
+    if not loadouts:
+        return [html.Div("The selected skills have no direct damage multiplier to optimize.", className="text-muted")]
+
+    level_labels = {option["value"]: option["label"] for option in WEAPON_LEVEL_OPTIONS}
+    current = (selected_weapon, selected_level, set(selected_pictos or []))
+    table_rows = [
+        html.Tr(
+            [
+                html.Td(index),
+                html.Td(
+                    [
+                        html.Div(entry["weapon"] or "No weapon"),
+                        html.Div(level_labels.get(entry["weapon_level"], entry["weapon_level"]), className="form-text mt-0")
+                        if entry["weapon"]
+                        else None,
+                    ]
+                ),
+                html.Td(", ".join(entry["pictos"]) or "No damage Pictos apply"),
+                html.Td(format_value(entry["damage"])),
+            ],
+            className="table-active"
+            if (entry["weapon"], entry["weapon_level"], set(entry["pictos"])) == current
+            else None,
+        )
+        for index, entry in enumerate(loadouts, start=1)
+    ]
+
+    return [
+        dbc.Table(
+            [
+                html.Thead(
+                    html.Tr(
+                        [
+                            html.Th("#"),
+                            html.Th("Weapon"),
+                            html.Th("Pictos/Lumina"),
+                            html.Th("Expected Damage"),
+                        ]
+                    )
+                ),
+                html.Tbody(table_rows),
+            ],
+            bordered=False,
+            hover=True,
+            responsive=True,
+            size="sm",
+            className="mb-0",
+        )
+    ]
+
+
+def build_sweep_heatmap(character: str, sweep: SweepResult) -> ComponentChildren:
+    """Build the state-sweep heatmap for the primary skill."""
+
+    matrix = sweep["matrix"]
+    if np.isnan(matrix).all():
+        return [html.Div("This skill has no direct damage multiplier to sweep.", className="text-muted")]
+
+    fields = SWEEP_FIELDS[character]
+    x_labels = [format_sweep_value(value) for value in sweep["x_values"]]
+    y_labels = [format_sweep_value(value) for value in sweep["y_values"]] if sweep["y_field"] else [""]
+    z = [[None if np.isnan(value) else float(value) for value in row] for row in matrix]
+
+    figure = go.Figure(
+        go.Heatmap(
+            z=z,
+            x=x_labels,
+            y=y_labels,
+            colorscale="Viridis",
+            colorbar={"title": {"text": "Multiplier"}},
+            hovertemplate="%{x} / %{y}: %{z:.2f}x<extra></extra>",
+            texttemplate="%{z:.2f}" if matrix.size <= 60 else None,
+        )
+    )
+    figure.update_layout(
+        margin={"l": 10, "r": 10, "t": 10, "b": 10},
+        height=max(180, 60 * len(y_labels) + 80) if len(y_labels) <= 8 else 420,
+        xaxis={"title": {"text": fields[sweep["x_field"]]["label"]}, "type": "category"},
+        yaxis={"title": {"text": fields[sweep["y_field"]]["label"] if sweep["y_field"] else ""}, "type": "category"},
+    )
+    return [dcc.Graph(figure=figure, config={"displayModeBar": False})]
+
+
+def build_rotation_table(
+    stats: list[RotationStats],
+    unknown: list[str],
+    requested_runs: int | None = None,
+) -> ComponentChildren:
+    """Build the rotation simulator results table.
+
+    Args:
+        stats: The simulated rotations, best first.
+        unknown: Skill names that matched no skill.
+        requested_runs: The runs asked for, to note when the simulation
+            budget trimmed them.
+    """
+
+    notice = (
+        html.Div(f"Skipped unknown skills: {', '.join(unknown)}", className="form-text text-warning mb-2")
+        if unknown
+        else None
+    )
+    if stats and requested_runs and stats[0]["runs"] < requested_runs:
+        notice = [
+            notice,
+            html.Div(
+                f"Simulated {stats[0]['runs']:,} runs per rotation instead of {requested_runs:,} to stay within the simulation budget.",
+                className="form-text text-warning mb-2",
+            ),
+        ]
+    if not stats:
+        return [notice or html.Div("Enter at least one rotation to simulate.", className="text-muted")]
+
+    table_rows = [
+        html.Tr(
+            [
+                html.Td(index),
+                html.Td(" > ".join(entry["skills"])),
+                html.Td(format_value(entry["mean"])),
+                html.Td(f"{format_value(entry['p10'])} - {format_value(entry['p90'])}"),
+                html.Td(f"{format_value(entry['minimum'])} - {format_value(entry['maximum'])}"),
+                html.Td(" / ".join(format_value(value) for value in entry["per_turn"])),
+                html.Td(f"{entry['substitution_rate']:.0%}"),
+            ]
+        )
+        for index, entry in enumerate(stats, start=1)
+    ]
+
+    return [
+        notice,
+        dbc.Table(
+            [
+                html.Thead(
+                    html.Tr(
+                        [
+                            html.Th("#"),
+                            html.Th("Rotation"),
+                            html.Th("Mean Damage"),
+                            html.Th("P10 - P90"),
+                            html.Th("Min - Max"),
+                            html.Th("Mean per Turn"),
+                            html.Th("Basic Attack Turns"),
+                        ]
+                    )
+                ),
+                html.Tbody(table_rows),
+            ],
+            bordered=False,
+            hover=True,
+            responsive=True,
+            size="sm",
+            className="mb-0",
+        ),
+        html.Div(f"{stats[0]['runs']} runs per rotation.", className="form-text mt-1"),
+    ]
+
+
+def build_rotation_plan(plan: RotationPlan) -> ComponentChildren:
+    """Build the optimized rotation table."""
+
+    if not plan["turns"]:
+        return [html.Div("No castable skills for this setup.", className="text-muted")]
+
+    table_rows = [
+        html.Tr(
+            [
+                html.Td(entry["turn"]),
+                html.Td(entry["skill"]),
+                html.Td(entry["ap"]),
+                html.Td(entry["cost"]),
+                html.Td(format_multiplier(entry["multiplier"])),
+                html.Td(format_value(entry["damage"])),
+            ]
+        )
+        for entry in plan["turns"]
+    ]
+
+    return [
+        html.Div(
+            f"Best rotation: {format_value(plan['expected_damage'])} expected damage",
+            className="fw-semibold mb-1",
+        ),
+        dbc.Table(
+            [
+                html.Thead(
+                    html.Tr(
+                        [
+                            html.Th("Turn"),
+                            html.Th("Skill"),
+                            html.Th("AP"),
+                            html.Th("Cost"),
+                            html.Th("Multiplier"),
+                            html.Th("Expected Damage"),
+                        ]
+                    )
+                ),
+                html.Tbody(table_rows),
+            ],
+            bordered=False,
+            hover=True,
+            responsive=True,
+            size="sm",
+            className="mb-0",
+        ),
+        html.Div(f"Searched {plan['states']} states.", className="form-text mt-1"),
+    ]
+
+
 def build_compare_metric_tile(label: str, value: str, hint: str) -> html.Div:
     """Build a compact comparison metric tile."""
 
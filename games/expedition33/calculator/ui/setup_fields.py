@@ -11,7 +11,19 @@ from games.expedition33.calculator.core import (
     HIDDEN_STYLE,
     skill_options_for,
 )
+from games.expedition33.calculator.optimizer import MAX_PICTO_SLOTS
 from games.expedition33.calculator.pictos import PICTO_OPTIONS
+from games.expedition33.calculator.planner import MAX_PLAN_TURNS
+from games.expedition33.calculator.rotation import (
+    DEFAULT_ROTATION_RUNS,
+    DEFAULT_START_AP,
+    MAX_AP,
+    MAX_ROTATION_RUNS,
+    MAX_ROTATION_TURNS,
+    MAX_ROTATIONS,
+)
+from games.expedition33.calculator.sweep import sweep_field_options
+from games.expedition33.calculator.visibility import build_visibility_map
 from games.expedition33.calculator.weapons import WEAPON_LEVEL_OPTIONS, weapon_options_for
 
 
@@ -39,15 +51,34 @@ compare_skill_dropdown = dcc.Dropdown(
     placeholder="Optional second skill for comparison",
 )
 
-save_upload = dcc.Upload(
-    id="exp33-calculator-save-upload",
-    children=dmc.Button("Import .sav", variant="light"),
-    accept=".sav,.SAV",
-    multiple=False,
+compare_skills_dropdown = dcc.Dropdown(
+    id="exp33-calculator-compare-skills",
+    options=skill_options_for(DEFAULT_CHARACTER),
+    value=[],
+    multi=True,
+    placeholder="Skills to compare side by side",
 )
 
+# calculatorClientside.js opens a file picker on click and posts the chosen
+# file to SAVE_UPLOAD_ROUTE as it is.
+save_upload = dmc.Button("Import .sav", id="exp33-calculator-save-upload", variant="light")
+
+# Holds only the import-store token of an uploaded save; the payload stays
+# on the server.
 save_import_store = dcc.Store(id="exp33-calculator-save-import-store")
 
+# Holds the upload route's response for the latest file: its upload token,
+# or an error message.
+save_upload_result_store = dcc.Store(id="exp33-calculator-save-upload-result")
+
+# Holds the id of the background job importing the latest upload.
+save_import_job_store = dcc.Store(id="exp33-calculator-save-import-job")
+
+# Polls the import job while it runs; enabled only while a job is running.
+save_import_poll = dcc.Interval(id="exp33-calculator-save-import-poll", interval=500, disabled=True)
+
+visibility_map_store = dcc.Store(id="exp33-calculator-visibility-map", data=build_visibility_map())
+
 attack_input = dmc.NumberInput(
     id="exp33-calculator-attack",
     label="Attack Power",
@@ -103,3 +134,100 @@ weapon_level_select = html.Div(
     id="exp33-calculator-control-weapon-level",
     style=HIDDEN_STYLE,
 )
+
+rank_all_switch = dmc.Switch(
+    id="exp33-calculator-rank-all",
+    label="Rank every skill for this setup",
+    checked=False,
+)
+
+optimize_slots_input = dmc.NumberInput(
+    id="exp33-calculator-optimize-slots",
+    label="Picto/Lumina slots",
+    value=0,
+    min=0,
+    max=MAX_PICTO_SLOTS,
+    step=1,
+    description="Set to 0 to turn the optimizer off.",
+)
+
+optimize_weapons_switch = dmc.Switch(
+    id="exp33-calculator-optimize-weapons",
+    label="Also search weapons and unlock levels",
+    checked=False,
+)
+
+optimize_skills_dropdown = dcc.Dropdown(
+    id="exp33-calculator-optimize-skills",
+    options=skill_options_for(DEFAULT_CHARACTER),
+    value=[],
+    multi=True,
+    placeholder="Optional skill mix (defaults to the primary skill)",
+)
+
+sweep_x_select = dmc.Select(
+    id="exp33-calculator-sweep-x",
+    label="Sweep across",
+    data=sweep_field_options(DEFAULT_CHARACTER),
+    value=None,
+    clearable=True,
+    placeholder="Select a setup field to turn the sweep on",
+)
+
+sweep_y_select = dmc.Select(
+    id="exp33-calculator-sweep-y",
+    label="And down",
+    data=sweep_field_options(DEFAULT_CHARACTER),
+    value=None,
+    clearable=True,
+    placeholder="Optional second setup field",
+)
+
+rotation_skills_textarea = dmc.Textarea(
+    id="exp33-calculator-rotation-skills",
+    label="Rotations",
+    value="",
+    autosize=True,
+    minRows=2,
+    debounce=500,
+    placeholder="One rotation per line, skills separated by commas",
+    description=f"Up to {MAX_ROTATIONS} rotations of {MAX_ROTATION_TURNS} turns each. Leave empty to turn the simulator off.",
+)
+
+rotation_runs_input = dmc.NumberInput(
+    id="exp33-calculator-rotation-runs",
+    label="Runs per rotation",
+    value=DEFAULT_ROTATION_RUNS,
+    min=1,
+    max=MAX_ROTATION_RUNS,
+    step=100,
+)
+
+rotation_start_ap_input = dmc.NumberInput(
+    id="exp33-calculator-rotation-start-ap",
+    label="Starting AP",
+    value=DEFAULT_START_AP,
+    min=0,
+    max=MAX_AP,
+    step=1,
+)
+
+rotation_crit_input = dmc.NumberInput(
+    id="exp33-calculator-rotation-crit-rate",
+    label="Crit chance %",
+    value="",
+    min=0,
+    max=100,
+    step=5,
+    description="Empty keeps the setup's all-crits toggles.",
+)
+
+rotation_plan_turns_input = dmc.NumberInput(
+    id="exp33-calculator-rotation-plan-turns",
+    label="Plan turns",
+    value=0,
+    min=0,
+    max=MAX_PLAN_TURNS,
+    step=1,
+    description="Searches for the best rotation. 0 turns it off.",
+)
@@ -0,0 +1,201 @@
+"""Consolidated calculator control state.
+
+Every control the result callback reads is listed in ``CALCULATOR_CONTROLS``.
+A clientside callback folds their values into one ``dcc.Store`` holding only
+the controls that differ from the page defaults, so the result callback
+receives a single compact dict instead of one input per control.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeAlias
+
+from dash import dcc
+from dash.development.base_component import Component
+
+CONTROL_PREFIX = "exp33-calculator-"
+CALCULATOR_STATE_ID = "exp33-calculator-state"
+CONTROL_DEFAULTS_ID = "exp33-calculator-control-defaults"
+RENDERED_VIEWS_ID = "exp33-calculator-rendered-views"
+REQUEST_TICKET_ID = "exp33-calculator-request-ticket"
+
+# Changed control values keyed by ``control_key``.
+CalculatorControls: TypeAlias = dict[str, Any]
+
+# (component id, property) of every control the result callback reads, in
+# ``render_calculator_result`` parameter order.
+CALCULATOR_CONTROLS: tuple[tuple[str, str], ...] = (
+    ("exp33-calculator-character", "value"),
+    ("exp33-calculator-skill", "value"),
+    ("exp33-calculator-compare-skill", "value"),
+    ("exp33-calculator-compare-skills", "value"),
+    ("exp33-calculator-rank-all", "checked"),
+    ("exp33-calculator-optimize-slots", "value"),
+    ("exp33-calculator-optimize-weapons", "checked"),
+    ("exp33-calculator-optimize-skills", "value"),
+    ("exp33-calculator-sweep-x", "value"),
+    ("exp33-calculator-sweep-y", "value"),
+    ("exp33-calculator-rotation-skills", "value"),
+    ("exp33-calculator-rotation-runs", "value"),
+    ("exp33-calculator-rotation-start-ap", "value"),
+    ("exp33-calculator-rotation-crit-rate", "value"),
+    ("exp33-calculator-rotation-plan-turns", "value"),
+    ("exp33-calculator-attack", "value"),
+    ("exp33-calculator-enemy-affinity", "value"),
+    ("exp33-calculator-weapon", "value"),
+    ("exp33-calculator-weapon-level", "value"),
+    ("exp33-calculator-pictos", "value"),
+    ("exp33-calculator-picto-attack-type", "value"),
+    ("exp33-calculator-picto-below-10-health", "checked"),
+    ("exp33-calculator-picto-target-burning", "checked"),
+    ("exp33-calculator-picto-target-stunned", "checked"),
+    ("exp33-calculator-picto-exhausted", "checked"),
+    ("exp33-calculator-picto-full-health", "checked"),
+    ("exp33-calculator-picto-unhit", "checked"),
+    ("exp33-calculator-picto-inverted", "checked"),
+    ("exp33-calculator-picto-consume-ap", "checked"),
+    ("exp33-calculator-picto-shield-points", "value"),
+    ("exp33-calculator-picto-fighting-alone", "checked"),
+    ("exp33-calculator-picto-all-allies-alive", "checked"),
+    ("exp33-calculator-picto-status-effects", "value"),
+    ("exp33-calculator-picto-dodge-stacks", "value"),
+    ("exp33-calculator-picto-parry-stacks", "value"),
+    ("exp33-calculator-picto-warming-up-stacks", "value"),
+    ("exp33-calculator-picto-first-hit", "checked"),
+    ("exp33-calculator-weapon-unhit-turns", "value"),
+    ("exp33-calculator-weapon-stain-consume-stacks", "value"),
+    ("exp33-calculator-weapon-light-stains", "value"),
+    ("exp33-calculator-weapon-dark-stains", "value"),
+    ("exp33-calculator-weapon-self-burn-stacks", "value"),
+    ("exp33-calculator-weapon-moon-charges", "value"),
+    ("exp33-calculator-weapon-cursed", "checked"),
+    ("exp33-calculator-weapon-ap-consumed", "value"),
+    ("exp33-calculator-weapon-critical-hit", "checked"),
+    ("exp33-calculator-weapon-monoco-mask-type", "value"),
+    ("exp33-calculator-gustave-charges", "value"),
+    ("exp33-calculator-lune-stains", "value"),
+    ("exp33-calculator-lune-earth-stains", "value"),
+    ("exp33-calculator-lune-fire-stains", "value"),
+    ("exp33-calculator-lune-ice-stains", "value"),
+    ("exp33-calculator-lune-lightning-stains", "value"),
+    ("exp33-calculator-lune-light-stains", "value"),
+    ("exp33-calculator-lune-turns", "value"),
+    ("exp33-calculator-lune-all-crits", "checked"),
+    ("exp33-calculator-maelle-stance", "value"),
+    ("exp33-calculator-maelle-burn-stacks", "value"),
+    ("exp33-calculator-maelle-hits-taken", "value"),
+    ("exp33-calculator-maelle-marked", "checked"),
+    ("exp33-calculator-maelle-all-crits", "checked"),
+    ("exp33-calculator-monoco-turns", "value"),
+    ("exp33-calculator-monoco-mask", "checked"),
+    ("exp33-calculator-monoco-stunned", "checked"),
+    ("exp33-calculator-monoco-marked", "checked"),
+    ("exp33-calculator-monoco-powerless", "checked"),
+    ("exp33-calculator-monoco-burning", "checked"),
+    ("exp33-calculator-monoco-low-life", "checked"),
+    ("exp33-calculator-monoco-full-life", "checked"),
+    ("exp33-calculator-monoco-all-crits", "checked"),
+    ("exp33-calculator-sciel-foretell", "value"),
+    ("exp33-calculator-sciel-twilight", "checked"),
+    ("exp33-calculator-sciel-full-life", "checked"),
+    ("exp33-calculator-verso-rank", "value"),
+    ("exp33-calculator-verso-shots", "value"),
+    ("exp33-calculator-verso-uses", "value"),
+    ("exp33-calculator-verso-stunned", "checked"),
+    ("exp33-calculator-verso-speed-bonus", "checked"),
+    ("exp33-calculator-verso-missing-health", "value"),
+)
+
+calculator_state_store = dcc.Store(id=CALCULATOR_STATE_ID)
+# Which controls the result-card bodies on screen were rendered from, so the
+# next update can be sent as a patch against them.
+rendered_views_store = dcc.Store(id=RENDERED_VIEWS_ID)
+# The page session and sequence number of the latest state change, used to
+# drop result requests a newer change has already replaced.
+request_ticket_store = dcc.Store(id=REQUEST_TICKET_ID)
+
+
+def control_key(component_id: str) -> str:
+    """Return the state key of a control, e.g. ``lune_fire_stains``."""
+
+    return component_id.removeprefix(CONTROL_PREFIX).replace("-", "_")
+
+
+def iter_components(node: Any) -> Iterable[Component]:
+    """Yield a component and every component nested in its children."""
+
+    if isinstance(node, Component):
+        yield node
+        yield from iter_components(getattr(node, "children", None))
+    elif isinstance(node, (list, tuple)):
+        for child in node:
+            yield from iter_components(child)
+
+
+def index_components(roots: Iterable[Component]) -> dict[str, Component]:
+    """Map every string component id in a layout to its component."""
+
+    return {
+        component.id: component
+        for component in iter_components(list(roots))
+        if isinstance(getattr(component, "id", None), str)
+    }
+
+
+def collect_control_defaults(roots: Iterable[Component]) -> CalculatorControls:
+    """Read the initial value of every calculator control from a layout.
+
+    Args:
+        roots: Layout components that together contain every control.
+
+    Returns:
+        The initial values keyed by ``control_key``, in
+        ``CALCULATOR_CONTROLS`` order.
+
+    Raises:
+        KeyError: A control is missing from the layout.
+    """
+
+    components = index_components(roots)
+    return {
+        control_key(component_id): getattr(components[component_id], prop, None)
+        for component_id, prop in CALCULATOR_CONTROLS
+    }
+
+
+def build_control_defaults_store(defaults: CalculatorControls) -> dcc.Store:
+    """Build the store the clientside state sync diffs control values against."""
+
+    return dcc.Store(id=CONTROL_DEFAULTS_ID, data=defaults)
+
+
+def resolve_controls(changed: Mapping[str, Any] | None, defaults: CalculatorControls) -> CalculatorControls:
+    """Merge the changed controls from the state store over the page defaults.
+
+    Unknown keys are ignored, so a stale or hand-crafted payload can only
+    set controls the page actually has.
+    """
+
+    controls = dict(defaults)
+    controls.update((key, value) for key, value in (changed or {}).items() if key in defaults)
+    return controls
+
+
+def apply_initial_outputs(roots: Iterable[Component], outputs: Mapping[tuple[str, str], Any]) -> None:
+    """Write precomputed callback outputs into the layout they target.
+
+    The page is served with these values already in place, so the callbacks
+    that would produce them can skip the initial call.
+
+    Args:
+        roots: Layout components that together contain every target.
+        outputs: Property values keyed by ``(component id, property)``.
+
+    Raises:
+        KeyError: A target is missing from the layout.
+    """
+
+    components = index_components(roots)
+    for (component_id, prop), value in outputs.items():
+        setattr(components[component_id], prop, value)
@@ -0,0 +1,112 @@
+"""Check the compiled skill evaluators against the reference calculators.
+
+Run from the repository root::
+
+    python -m games.expedition33.calculator.verify
+
+Every skill row is evaluated over the full product of its character's state
+fields with ``calculate_skill_result``. The compiled evaluator from
+``compile_skill_evaluator`` is checked against it, and so is the row's shipped
+outcome table, since the app reads the table first and only runs the compiled
+evaluator outside it. The command exits non-zero on the first few mismatches,
+or when the shipped tables are missing or stale.
+"""
+
+from __future__ import annotations
+from games.expedition33.calculator.core import CALCULATOR_DATA, CalculatorRow, CalculatorState
+from games.expedition33.calculator.evaluators import compile_skill_evaluator
+from games.expedition33.calculator.logic import calculate_skill_result
+from games.expedition33.calculator.sweep import BOOLEAN_VALUES, SWEEP_FIELDS
+from games.expedition33.calculator.tables import OutcomeTable, load_outcome_tables
+from collections.abc import Iterator
+from typing import Any
+import argparse
+import itertools
+import sys
+
+# State fields the calculators read that the sweep panel does not expose.
+EXTRA_STATE_VALUES: dict[str, dict[str, list[Any]]] = {
+    "maelle": {"turns": list(range(1, 4))},
+    "sciel": {"foretell": list(range(0, 100))},
+}
+# Verso's rank bonus can also be suppressed by weapon passives.
+RANK_BONUS_FLAGS: dict[str, list[bool]] = {"verso": BOOLEAN_VALUES}
+
+
+def state_domains(character: str) -> dict[str, list[Any]]:
+    """Return the enumerated values of every state field one character reads."""
+
+    values = {key: list(field["values"]) for key, field in SWEEP_FIELDS[character].items()}
+    values.update(EXTRA_STATE_VALUES.get(character, {}))
+    return values
+
+
+def state_space(character: str) -> Iterator[CalculatorState]:
+    """Yield every combination of a character's state field values."""
+
+    values = state_domains(character)
+    keys = list(values)
+    for combination in itertools.product(*(values[key] for key in keys)):
+        yield dict(zip(keys, combination))
+
+
+def verify_character(
+    character: str,
+    limit: int,
+    tables: dict[CalculatorRow, OutcomeTable],
+) -> tuple[int, list[str]]:
+    """Compare the compiled evaluators and outcome tables with the reference.
+
+    Args:
+        character: The calculator character id.
+        limit: The most mismatches to describe.
+        tables: The loaded outcome tables by row.
+
+    Returns:
+        The number of compared evaluations and up to ``limit`` mismatch
+        descriptions.
+    """
+
+    rows = CALCULATOR_DATA[character]["records"]
+    evaluators = [compile_skill_evaluator(character, row) for row in rows]
+    flags = RANK_BONUS_FLAGS.get(character, [False])
+    compared = 0
+    mismatches: list[str] = []
+    for state in state_space(character):
+        for row, evaluator in zip(rows, evaluators):
+            table = tables.get(row)
+            for flag in flags:
+                expected = calculate_skill_result(character, row, state, flag)
+                checks = [("compiled", evaluator(state, flag))]
+                if table is not None:
+                    checks.append(("table", table.lookup(state, flag)))
+                for path, actual in checks:
+                    compared += 1
+                    if actual != expected and len(mismatches) < limit:
+                        mismatches.append(f"{character} / {row.skill} / {state} / {flag} ({path}): {actual} != {expected}")
+    return compared, mismatches
+
+
+def main() -> None:
+    """Verify every character, or the ones named on the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("characters", nargs="*", default=list(CALCULATOR_DATA), help="character ids to verify")
+    parser.add_argument("--limit", type=int, default=10, help="mismatches reported per character")
+    args = parser.parse_args()
+
+    tables = load_outcome_tables()
+    failed = not tables
+    if failed:
+        print("outcome tables are missing or stale; only the compiled evaluators were checked")
+    for character in args.characters:
+        compared, mismatches = verify_character(character, args.limit, tables)
+        print(f"{character}: {compared} evaluations, {len(mismatches)} mismatches reported")
+        for mismatch in mismatches:
+            print(f"  {mismatch}")
+        failed = failed or bool(mismatches)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
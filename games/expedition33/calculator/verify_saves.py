@@ -0,0 +1,86 @@
+"""Check the native save reader against uesave on real save files.
+
+Run from the repository root::
+
+    python -m games.expedition33.calculator.verify_saves path/to/EXPEDITION_0.sav [...]
+
+Each save is imported twice, once through ``gvas.read_save_properties`` and
+once through ``uesave to-json``, and the two ``SaveImportPayload`` results
+must be identical. The command prints both timings per save and exits
+non-zero when any save differs or cannot be read natively.
+"""
+
+from __future__ import annotations
+from games.expedition33.calculator.gvas import GvasError, read_save_properties
+from games.expedition33.calculator.save_import import (
+    IMPORT_PROPERTIES,
+    SaveImportPayload,
+    build_import_payload,
+    convert_save_bytes_to_json,
+)
+from pathlib import Path
+from typing import Any
+import argparse
+import sys
+import time
+
+
+def payload_differences(native: Any, reference: Any, path: str = "payload") -> list[str]:
+    """List the paths where two imported payloads disagree."""
+
+    if isinstance(native, dict) and isinstance(reference, dict):
+        return [
+            difference
+            for key in sorted(native.keys() | reference.keys())
+            for difference in payload_differences(native.get(key), reference.get(key), f"{path}.{key}")
+        ]
+    if native != reference:
+        return [f"{path}: native {native!r}, uesave {reference!r}"]
+    return []
+
+
+def verify_save(path: Path) -> tuple[float, float, list[str]]:
+    """Import one save both ways.
+
+    Returns:
+        The native and uesave import times in seconds, and the differences.
+    """
+
+    save_bytes = path.read_bytes()
+    started = time.perf_counter()
+    native: SaveImportPayload = build_import_payload(read_save_properties(save_bytes, IMPORT_PROPERTIES), path.name)
+    native_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    reference = build_import_payload(convert_save_bytes_to_json(save_bytes), path.name)
+    reference_seconds = time.perf_counter() - started
+    return native_seconds, reference_seconds, payload_differences(native, reference)
+
+
+def main() -> None:
+    """Verify every save named on the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("saves", nargs="+", type=Path, help=".sav files to compare")
+    parser.add_argument("--limit", type=int, default=10, help="differences reported per save")
+    args = parser.parse_args()
+
+    failed = False
+    for path in args.saves:
+        try:
+            native_seconds, reference_seconds, differences = verify_save(path)
+        except GvasError as exc:
+            print(f"{path}: native reader failed: {exc}")
+            failed = True
+            continue
+        print(
+            f"{path}: native {native_seconds * 1000:.1f} ms, uesave {reference_seconds * 1000:.1f} ms, "
+            f"{len(differences)} differences"
+        )
+        for difference in differences[: args.limit]:
+            print(f"  {difference}")
+        failed = failed or bool(differences)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
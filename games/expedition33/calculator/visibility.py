@@ -0,0 +1,217 @@
+from __future__ import annotations
+from games.expedition33.calculator.core import (
+    CALCULATOR_DATA,
+    DEFAULT_CHARACTER,
+    DEFAULT_SKILLS,
+    HIDDEN_STYLE,
+    VISIBLE_STYLE,
+    get_row,
+)
+from games.expedition33.calculator.logic import build_skill_control_styles
+from games.expedition33.calculator.pictos import PICTO_DEFINITIONS, PictoControl, required_picto_controls
+from games.expedition33.calculator.weapons import (
+    WEAPON_DEFINITIONS,
+    WEAPON_LEVEL_OPTIONS,
+    normalize_weapon_level,
+    required_weapon_character_controls,
+    required_weapon_controls,
+)
+from typing import Any, TypedDict, get_args
+
+# Character setup controls, grouped by the accordion section that holds them.
+CHARACTER_CONTROLS: dict[str, tuple[str, ...]] = {
+    "gustave": ("gustave_charges",),
+    "lune": (
+        "lune_stains",
+        "lune_earth_stains",
+        "lune_fire_stains",
+        "lune_ice_stains",
+        "lune_lightning_stains",
+        "lune_light_stains",
+        "lune_turns",
+        "lune_all_crits",
+    ),
+    "maelle": (
+        "maelle_stance",
+        "maelle_burn_stacks",
+        "maelle_hits_taken",
+        "maelle_marked",
+        "maelle_all_crits",
+    ),
+    "monoco": (
+        "monoco_turns",
+        "monoco_mask",
+        "monoco_stunned",
+        "monoco_marked",
+        "monoco_powerless",
+        "monoco_burning",
+        "monoco_low_life",
+        "monoco_full_life",
+        "monoco_all_crits",
+    ),
+    "sciel": ("sciel_foretell", "sciel_twilight", "sciel_full_life"),
+    "verso": (
+        "verso_rank",
+        "verso_shots",
+        "verso_uses",
+        "verso_stunned",
+        "verso_speed_bonus",
+        "verso_missing_health",
+    ),
+}
+PICTO_CONTROLS: tuple[PictoControl, ...] = get_args(PictoControl)
+# Weapon bonus controls with their own wrapper; the rest share a Picto control.
+WEAPON_CONTROLS = (
+    "unhit_turns",
+    "stain_consume_stacks",
+    "light_stains",
+    "dark_stains",
+    "self_burn_stacks",
+    "moon_charges",
+    "cursed",
+    "ap_consumed",
+    "critical_hit",
+    "monoco_mask_type",
+)
+
+
+class WeaponVisibility(TypedDict):
+    """Controls one weapon needs at one unlock tier."""
+
+    character: list[str]
+    bonus: list[str]
+
+
+class VisibilityMap(TypedDict):
+    """Precomputed control visibility read by the clientside visibility callbacks.
+
+    Every lookup is a union of independent parts, so the map is keyed per
+    skill, per weapon tier, and per Picto instead of per full selection.
+    """
+
+    default_character: str
+    default_skills: dict[str, str]
+    first_skills: dict[str, str]
+    characters: list[str]
+    character_controls: list[str]
+    picto_controls: list[str]
+    weapon_controls: list[str]
+    skills: dict[str, dict[str, list[str]]]
+    weapons: dict[str, dict[str, dict[str, WeaponVisibility]]]
+    pictos: dict[str, list[str]]
+
+
+def character_control_wrapper_id(control: str) -> str:
+    """Return the id of the wrapper around a character setup control."""
+
+    return f"exp33-calculator-control-{control.replace('_', '-')}"
+
+
+def picto_control_wrapper_id(control: str) -> str:
+    """Return the id of the wrapper around a Picto setup control."""
+
+    return f"exp33-calculator-picto-control-{control.replace('_', '-')}"
+
+
+def weapon_control_wrapper_id(control: str) -> str:
+    """Return the id of the wrapper around a weapon setup control."""
+
+    return f"exp33-calculator-weapon-control-{control.replace('_', '-')}"
+
+
+def build_visibility_map() -> VisibilityMap:
+    """Tabulate which setup controls every skill, weapon tier, and Picto needs.
+
+    Returns:
+        A JSON-serializable map. The visible controls for a selection are the
+        union of the entries for its primary skill, compare skill, weapon tier,
+        and each selected Picto, which is how the server-side helpers combine
+        them.
+    """
+
+    tiers = sorted({str(option["value"]) for option in WEAPON_LEVEL_OPTIONS}, key=int)
+    return {
+        "default_character": DEFAULT_CHARACTER,
+        "default_skills": dict(DEFAULT_SKILLS),
+        "first_skills": {character: payload["records"][0].skill for character, payload in CALCULATOR_DATA.items()},
+        "characters": list(CALCULATOR_DATA),
+        "character_controls": [control for controls in CHARACTER_CONTROLS.values() for control in controls],
+        "picto_controls": list(PICTO_CONTROLS),
+        "weapon_controls": list(WEAPON_CONTROLS),
+        "skills": {
+            character: {
+                skill: sorted(
+                    control
+                    for control, style in build_skill_control_styles(character, row).items()
+                    if style == VISIBLE_STYLE
+                )
+                for skill, row in payload["skills"].items()
+            }
+            for character, payload in CALCULATOR_DATA.items()
+        },
+        "weapons": {
+            character: {
+                weapon: {
+                    tier: {
+                        "character": sorted(required_weapon_character_controls(character, weapon, tier)),
+                        "bonus": sorted(required_weapon_controls(character, weapon, tier)),
+                    }
+                    for tier in tiers
+                }
+                for weapon in weapons
+            }
+            for character, weapons in WEAPON_DEFINITIONS.items()
+        },
+        "pictos": {name: sorted(required_picto_controls([name])) for name in PICTO_DEFINITIONS},
+    }
+
+
+def resolve_visibility(
+    visibility_map: VisibilityMap,
+    character: str | None,
+    skill: str | None,
+    compare_skill: str | None,
+    weapon: str | None,
+    weapon_level: str | int | None,
+    pictos: list[str] | None,
+) -> dict[tuple[str, str], Any]:
+    """Return what the clientside visibility callbacks show for one selection.
+
+    This mirrors ``syncVisibleControls`` and ``syncVisibleBonusControls`` in
+    ``calculatorClientside.js``. The page uses it to paint the default
+    selection into the layout so the first render needs no callback.
+
+    Returns:
+        Property values keyed by ``(component id, property)``.
+    """
+
+    active = character or visibility_map["default_character"]
+    skills = visibility_map["skills"][active]
+    tiers = visibility_map["weapons"].get(active, {}).get(weapon or "")
+    weapon_controls = tiers[str(normalize_weapon_level(weapon_level))] if tiers else {"character": [], "bonus": []}
+
+    visible = set(skills[get_row(active, skill).skill])
+    if compare_skill in skills:
+        visible.update(skills[compare_skill])
+    visible.update(weapon_controls["character"])
+    required = {control for name in pictos or [] for control in visibility_map["pictos"].get(name, [])}
+    required.update(weapon_controls["bonus"])
+    has_selection = bool(pictos) or bool(weapon)
+
+    outputs: dict[tuple[str, str], Any] = {
+        ("exp33-calculator-character-accordion", "active_item"): [f"setup-{active}"],
+        ("exp33-calculator-control-weapon-level", "style"): VISIBLE_STYLE if weapon else HIDDEN_STYLE,
+        ("exp33-calculator-pictos-collapse", "is_open"): has_selection,
+        ("exp33-calculator-bonus-empty", "style"): VISIBLE_STYLE if has_selection and not required else HIDDEN_STYLE,
+    }
+    for name in visibility_map["characters"]:
+        outputs[(f"exp33-calculator-item-{name}", "style")] = VISIBLE_STYLE if name == active else HIDDEN_STYLE
+        has_visible = any(control.startswith(name) for control in visible)
+        outputs[(f"exp33-calculator-empty-{name}", "style")] = HIDDEN_STYLE if has_visible else VISIBLE_STYLE
+    for control in visibility_map["character_controls"]:
+        outputs[(character_control_wrapper_id(control), "style")] = VISIBLE_STYLE if control in visible else HIDDEN_STYLE
+    for control in visibility_map["picto_controls"]:
+        outputs[(picto_control_wrapper_id(control), "style")] = VISIBLE_STYLE if control in required else HIDDEN_STYLE
+    for control in visibility_map["weapon_controls"]:
+        outputs[(weapon_control_wrapper_id(control), "style")] = VISIBLE_STYLE if control in required else HIDDEN_STYLE
+    return outputs
@@ -737,6 +737,13 @@ def required_weapon_character_controls(character: str, weapon: str | None, weapo
     return controls
 
 
+def weapon_row_keys(character: str, weapon: str | None) -> tuple[str, ...]:
+    """Return the skill-row columns a selected weapon's passives read."""
+
+    definitions = WEAPON_DEFINITIONS.get(character, {}).get(weapon or "", [])
+    return tuple(sorted({effect["row_key"] for effect in definitions if effect.get("row_key")}))
+
+
 def evaluate_weapon(
     character: str,
     selected_weapon: str | None,
@@ -0,0 +1,62 @@
+"""Check the compiled skill evaluators against ``calculate_skill_result``.
+
+The full state product takes minutes, which is what ``verify`` is for. Here
+every row is compared on each field swept alone from two base states, with
+values below, above, and outside each field's range, plus a seeded sample of
+the full product.
+"""
+
+from __future__ import annotations
+import itertools
+import random
+from typing import Any
+
+import pytest
+
+from games.expedition33.calculator.core import CALCULATOR_DATA, CalculatorState
+from games.expedition33.calculator.evaluators import compile_skill_evaluator
+from games.expedition33.calculator.logic import calculate_skill_result
+from games.expedition33.calculator.verify import RANK_BONUS_FLAGS, state_domains
+
+SAMPLED_STATES = 400
+
+
+def out_of_range(values: list[Any]) -> list[Any]:
+    """Return values a field can hold but its UI never offers."""
+
+    if all(isinstance(value, bool) for value in values):
+        return [None, 0, 1, "yes"]
+    if all(isinstance(value, int) for value in values):
+        return [None, "", "3", "x", values[0] - 1, values[-1] + 1, values[-1] + 50, 2.5, float("inf")]
+    return [None, "", "unknown", values[0].lower()]
+
+
+def row_states(character: str) -> list[CalculatorState]:
+    """Build the reduced state space for one character."""
+
+    domains = state_domains(character)
+    keys = list(domains)
+    states = []
+    for base in ({key: values[0] for key, values in domains.items()}, {key: values[-1] for key, values in domains.items()}):
+        states.append(base)
+        for key, values in domains.items():
+            states.extend({**base, key: value} for value in [*values, *out_of_range(values)])
+        states.extend({key: value for key, value in base.items() if key != missing} for missing in keys)
+    rng = random.Random(character)
+    states.extend({key: rng.choice(domains[key]) for key in keys} for _ in range(SAMPLED_STATES))
+    return states
+
+
+@pytest.mark.parametrize("character", list(CALCULATOR_DATA))
+def test_compiled_evaluators_match_reference(character: str) -> None:
+    states = row_states(character)
+    flags = RANK_BONUS_FLAGS.get(character, [False])
+    mismatches = []
+    for row in CALCULATOR_DATA[character]["records"]:
+        evaluate = compile_skill_evaluator(character, row)
+        for state, flag in itertools.product(states, flags):
+            expected = calculate_skill_result(character, row, state, flag)
+            if evaluate(state, flag) != expected:
+                mismatches.append(f"{row.skill} / {state} / {flag}")
+
+    assert mismatches == []
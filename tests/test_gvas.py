@@ -0,0 +1,266 @@
+"""Check the native GVAS reader on synthetic saves in both property tag layouts.
+
+These saves are written by the small encoder below, so they only show that
+the reader agrees with this test's reading of the format. The fixture save is
+the encoder's complete-type-name save; when a uesave binary is available it is
+also imported through uesave and both payloads must match. Real saves still
+need ``verify_saves`` before ``LUDEX_NATIVE_SAVE_READER=1`` is set.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+import struct
+import subprocess
+from typing import Any
+
+import pytest
+
+from games.expedition33.calculator.gvas import (
+    PROPERTY_TAG_COMPLETE_TYPE_NAME,
+    PROPERTY_TAG_EXTENSION,
+    GvasError,
+    read_save_properties,
+)
+from games.expedition33.calculator.save_import import (
+    IMPORT_PROPERTIES,
+    SaveImportError,
+    build_import_payload,
+    resolve_uesave_binary,
+)
+from games.expedition33.calculator.verify_saves import verify_save
+
+FIXTURE_SAVE = Path(__file__).with_name("fixtures") / "synthetic_ue54.sav"
+
+# (type name, type parameters), as in the complete-type-name tag layout.
+PropertyType = tuple[str, tuple[Any, ...]]
+
+INT: PropertyType = ("IntProperty", ())
+NAME: PropertyType = ("NameProperty", ())
+BOOL: PropertyType = ("BoolProperty", ())
+SCALAR_FORMATS = {"IntProperty": "<i", "FloatProperty": "<f", "DoubleProperty": "<d", "Int64Property": "<q"}
+
+
+def struct_type(name: str) -> PropertyType:
+    """A struct property type."""
+
+    return ("StructProperty", ((name, ()),))
+
+
+def enum_type(name: str) -> PropertyType:
+    """An enum property type stored as names."""
+
+    return ("EnumProperty", ((name, ()), ("ByteProperty", ())))
+
+
+def fstring(text: str) -> bytes:
+    """Encode an Unreal FString: Latin-1 with a positive length, else UTF-16 with a negative one."""
+
+    if not text:
+        return struct.pack("<i", 0)
+    try:
+        encoded = text.encode("latin-1") + b"\0"
+        return struct.pack("<i", len(encoded)) + encoded
+    except UnicodeEncodeError:
+        encoded = text.encode("utf-16-le") + b"\0\0"
+        return struct.pack("<i", -(len(encoded) // 2)) + encoded
+
+
+def type_name(property_type: PropertyType) -> bytes:
+    """Encode a complete type name with its parameters."""
+
+    name, parameters = property_type
+    return fstring(name) + struct.pack("<i", len(parameters)) + b"".join(type_name(parameter) for parameter in parameters)
+
+
+class SaveWriter:
+    """Write a GVAS save for one ``FileVersionUE5``."""
+
+    def __init__(self, ue5_version: int) -> None:
+        self.ue5_version = ue5_version
+        self.complete = ue5_version >= PROPERTY_TAG_COMPLETE_TYPE_NAME
+
+    def header(self) -> bytes:
+        """Encode the save header, with one custom version."""
+
+        header = b"GVAS" + struct.pack("<iii", 3, 522, self.ue5_version)
+        header += struct.pack("<HHHI", 5, 4, 4, 123) + fstring("++UE5+Release-5.4")
+        header += struct.pack("<ii", 3, 1) + bytes(16) + struct.pack("<i", 7)
+        return header + fstring("/Game/Gameplay/Save/BP_SaveData.BP_SaveData_C")
+
+    def element(self, property_type: PropertyType, value: Any) -> bytes:
+        """Encode one untagged value, as stored in containers."""
+
+        kind, parameters = property_type
+        if kind in SCALAR_FORMATS:
+            return struct.pack(SCALAR_FORMATS[kind], value)
+        if kind in ("NameProperty", "StrProperty", "EnumProperty"):
+            return fstring(value)
+        if kind == "BoolProperty":
+            return bytes([value])
+        if kind == "StructProperty":
+            if parameters[0][0] == "Vector":
+                return struct.pack("<3d", *value)
+            return self.properties(value)
+        raise ValueError(kind)
+
+    def value(self, name: str, property_type: PropertyType, value: Any) -> bytes:
+        """Encode the value that follows a property tag."""
+
+        kind, parameters = property_type
+        if kind == "ArrayProperty":
+            inner = parameters[0]
+            body = b"".join(self.element(inner, entry) for entry in value)
+            if inner[0] == "StructProperty" and not self.complete:
+                body = self.tag(name, inner, len(body), False) + body
+            return struct.pack("<i", len(value)) + body
+        if kind == "MapProperty":
+            entries = b"".join(self.element(parameters[0], key) + self.element(parameters[1], item) for key, item in value)
+            return struct.pack("<ii", 0, len(value)) + entries
+        if kind == "BoolProperty":
+            return b""
+        return self.element(property_type, value)
+
+    def tag(self, name: str, property_type: PropertyType, size: int, flag: bool) -> bytes:
+        """Encode a property tag in this version's layout."""
+
+        kind, parameters = property_type
+        tag = fstring(name)
+        if self.complete:
+            return tag + type_name(property_type) + struct.pack("<iB", size, 0x10 if flag else 0)
+        tag += fstring(kind) + struct.pack("<ii", size, 0)
+        if kind == "StructProperty":
+            tag += fstring(parameters[0][0]) + bytes(16)
+        elif kind == "BoolProperty":
+            tag += bytes([flag])
+        elif kind == "EnumProperty":
+            tag += fstring(parameters[0][0])
+        elif kind == "ArrayProperty":
+            tag += fstring(parameters[0][0])
+        elif kind == "MapProperty":
+            tag += fstring(parameters[0][0]) + fstring(parameters[1][0])
+        tag += bytes([0])
+        if self.ue5_version >= PROPERTY_TAG_EXTENSION:
+            tag += bytes([0])
+        return tag
+
+    def properties(self, items: list[tuple[str, PropertyType, Any]]) -> bytes:
+        """Encode a tagged property list ending in ``None``."""
+
+        encoded = b""
+        for name, property_type, value in items:
+            body = self.value(name, property_type, value)
+            encoded += self.tag(name, property_type, len(body), property_type == BOOL and bool(value)) + body
+        return encoded + fstring("None")
+
+    def save(self, items: list[tuple[str, PropertyType, Any]]) -> bytes:
+        """Encode a whole save."""
+
+        return self.header() + self.properties(items) + bytes(4)
+
+
+def character(name: str, skills: list[str], pictos: list[str], weapon: str) -> list[tuple[str, PropertyType, Any]]:
+    """Build one character's save data, with fields the import ignores."""
+
+    slot_key = struct_type("S_SlotKey")
+    slot = [("ItemType_3_AB12", enum_type("E_jRPG_ItemType"), "E_jRPG_ItemType::NewEnumerator0"), ("SlotIndex_6_CD", INT, 0)]
+    return [
+        ("CharacterHardcodedName_36_F1", NAME, name),
+        ("CurrentLevel_49_97", INT, 42),
+        ("Position_9_CC", struct_type("Vector"), (1.0, 2.0, 3.0)),
+        ("Flag_2_DD", BOOL, True),
+        ("AssignedAttributePoints_190_BB", ("MapProperty", (("ByteProperty", ()), INT)), []),
+        ("EquippedItemsPerSlot_187_CC", ("MapProperty", (slot_key, NAME)), [(slot, weapon)]),
+        ("EquippedSkills_134_DD", ("ArrayProperty", (NAME,)), skills),
+        ("EquippedPassiveEffects_140_EE", ("ArrayProperty", (NAME,)), pictos),
+        ("Junk_7_FF", ("ArrayProperty", (("FloatProperty", ()),)), [0.5] * 50),
+    ]
+
+
+def synthetic_save(ue5_version: int) -> bytes:
+    """Build a save with the imported properties among unrelated ones."""
+
+    characters = struct_type("S_jRPG_CharacterSaveData")
+    progression = struct_type("S_jRPG_WeaponProgression")
+    return SaveWriter(ue5_version).save(
+        [
+            ("SaveVersion", INT, 7),
+            ("Inventory", ("MapProperty", (NAME, INT)), [(f"Item{index}", index) for index in range(200)]),
+            (
+                "CharactersCollection",
+                ("MapProperty", (NAME, characters)),
+                [
+                    ("Lune", character("Lune", ["IceGust", "Thunderfall", "Nope"], ["AugmentedAim"], "Choralim")),
+                    ("Frey", character("Frey", ["UnleashCharge"], [], "None")),
+                ],
+            ),
+            (
+                "WeaponProgressions",
+                ("ArrayProperty", (progression,)),
+                [[("DefinitionID_2_AA", NAME, "Choralim"), ("CurrentLevel_5_BB", INT, 14)]],
+            ),
+            ("Trailer", ("StrProperty", ()), "end"),
+        ]
+    )
+
+
+@pytest.mark.parametrize("ue5_version", [1009, PROPERTY_TAG_EXTENSION, PROPERTY_TAG_COMPLETE_TYPE_NAME])
+def test_reads_wanted_properties(ue5_version: int) -> None:
+    properties = read_save_properties(synthetic_save(ue5_version), IMPORT_PROPERTIES)["root"]["properties"]
+
+    assert set(properties) == set(IMPORT_PROPERTIES)
+    assert properties["WeaponProgressions_0"] == [{"DefinitionID_2_AA_0": "Choralim", "CurrentLevel_5_BB_0": 14}]
+    lune = properties["CharactersCollection_0"][0]
+    assert lune["key"] == "Lune"
+    assert lune["value"]["EquippedSkills_134_DD_0"] == ["IceGust", "Thunderfall", "Nope"]
+    assert lune["value"]["Flag_2_DD_0"] is True
+    assert lune["value"]["Junk_7_FF_0"] == [0.5] * 50
+
+
+@pytest.mark.parametrize("ue5_version", [1009, PROPERTY_TAG_COMPLETE_TYPE_NAME])
+def test_payload_from_native_read(ue5_version: int) -> None:
+    payload = build_import_payload(read_save_properties(synthetic_save(ue5_version), IMPORT_PROPERTIES), "x.sav")
+
+    lune = payload["characters"]["lune"]
+    assert lune["level"] == 42
+    assert lune["equipped_weapon"] == "Choralim"
+    assert lune["weapon_level"] == "10"
+    assert lune["equipped_skills"] == ["Ice Lance", "Thunderfall"]
+    assert lune["unmatched_skills"] == ["Nope"]
+    assert lune["equipped_pictos"] == ["Augmented Aim"]
+    assert "gustave" in payload["characters"]
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda save: b"XXXX" + save[4:],
+        lambda save: save[:200],
+        lambda save: save[: len(save) // 2],
+        lambda save: b"",
+    ],
+)
+def test_malformed_saves_raise_gvas_error(corrupt: Any) -> None:
+    with pytest.raises(GvasError):
+        read_save_properties(corrupt(synthetic_save(PROPERTY_TAG_COMPLETE_TYPE_NAME)), IMPORT_PROPERTIES)
+
+
+def uesave_available() -> bool:
+    """Whether a uesave binary is found and runs on this machine."""
+
+    try:
+        binary = resolve_uesave_binary()
+        subprocess.run([str(binary), "--help"], capture_output=True, timeout=10, check=True)
+    except (SaveImportError, OSError, subprocess.SubprocessError):
+        return False
+    return True
+
+
+def test_fixture_save_matches_encoder() -> None:
+    assert FIXTURE_SAVE.read_bytes() == synthetic_save(PROPERTY_TAG_COMPLETE_TYPE_NAME)
+
+
+@pytest.mark.skipif(not uesave_available(), reason="uesave binary not available")
+def test_native_reader_matches_uesave_on_fixture() -> None:
+    _, _, differences = verify_save(FIXTURE_SAVE)
+
+    assert differences == []
@@ -0,0 +1,91 @@
+"""Check ``extract_members`` against ``json.loads``, including values split across chunks."""
+
+from __future__ import annotations
+import io
+import json
+import random
+from typing import Any
+
+import pytest
+
+from games.expedition33.calculator import json_stream
+from games.expedition33.calculator.json_stream import extract_members
+
+PATH = ("root", "properties")
+WANTED = frozenset({"CharactersCollection_0", "WeaponProgressions_0"})
+
+
+def random_value(rng: random.Random, depth: int = 0) -> Any:
+    """Build a random JSON value with numbers, escapes, and non-ASCII text."""
+
+    kinds = ["int", "float", "string", "bool", "null"]
+    if depth < 4:
+        kinds += ["list", "object"]
+    kind = rng.choice(kinds)
+    if kind == "int":
+        return rng.randint(-(10**12), 10**12)
+    if kind == "float":
+        return rng.uniform(-1e6, 1e6)
+    if kind == "string":
+        return "".join(rng.choice('ab"\\\n é€😀') for _ in range(rng.randint(0, 12)))
+    if kind == "bool":
+        return rng.random() < 0.5
+    if kind == "null":
+        return None
+    if kind == "list":
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{index}": random_value(rng, depth + 1) for index in range(rng.randint(0, 4))}
+
+
+def random_document(rng: random.Random) -> dict[str, Any]:
+    """Build a save-like document with the wanted members among unrelated ones."""
+
+    properties = {f"Other_{index}": random_value(rng) for index in range(rng.randint(0, 5))}
+    for name in WANTED:
+        if rng.random() < 0.8:
+            properties[name] = random_value(rng)
+    properties.update({f"Later_{index}": random_value(rng) for index in range(rng.randint(0, 3))})
+    return {"header": random_value(rng), "root": {"meta": random_value(rng), "properties": properties}, "extra": [1, 2]}
+
+
+@pytest.mark.parametrize("seed", range(60))
+@pytest.mark.parametrize("chunk_bytes", [1, 7, 64, json_stream.STREAM_CHUNK_BYTES])
+def test_extract_members_matches_json_loads(monkeypatch: pytest.MonkeyPatch, seed: int, chunk_bytes: int) -> None:
+    monkeypatch.setattr(json_stream, "STREAM_CHUNK_BYTES", chunk_bytes)
+    document = random_document(random.Random(seed))
+    text = json.dumps(document, indent=seed % 3 or None, ensure_ascii=seed % 2 == 0)
+    properties = document["root"]["properties"]
+
+    found = extract_members(io.BytesIO(text.encode()), PATH, WANTED)
+
+    assert found == {name: properties[name] for name in WANTED if name in properties}
+
+
+def test_numbers_split_at_chunk_boundary(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_stream, "STREAM_CHUNK_BYTES", 1)
+    text = '{"root": {"properties": {"WeaponProgressions_0": 1.5e3, "CharactersCollection_0": -12}}}'
+
+    assert extract_members(io.BytesIO(text.encode()), PATH, WANTED) == {
+        "WeaponProgressions_0": 1500.0,
+        "CharactersCollection_0": -12,
+    }
+
+
+def test_reading_stops_after_the_wanted_members() -> None:
+    source = io.BytesIO(b'{"root": {"properties": {"CharactersCollection_0": 1, "WeaponProgressions_0": 2}}, "tail": [')
+
+    assert extract_members(source, PATH, WANTED) == {"CharactersCollection_0": 1, "WeaponProgressions_0": 2}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"root": {"properties": {"CharactersCollection_0": [1, 2}}}',
+        '{"root": {"properties": {"CharactersCollection_0": 1',
+        '{"root": [1, 2]}',
+        "",
+    ],
+)
+def test_invalid_json_raises_value_error(text: str) -> None:
+    with pytest.raises(ValueError):
+        extract_members(io.BytesIO(text.encode()), PATH, WANTED)
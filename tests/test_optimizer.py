@@ -0,0 +1,54 @@
+"""Check the Picto branch-and-bound search against brute force."""
+
+from __future__ import annotations
+import itertools
+import math
+import random
+
+import pytest
+
+from games.expedition33.calculator.optimizer import search_picto_subsets
+
+FACTOR_CHOICES = (1.0, 1.1, 1.2, 1.25, 1.5, 2.0, 3.0)
+
+
+def brute_force(factors: list[tuple[str, float]], slot_budget: int, top_n: int) -> list[float]:
+    """Return the ``top_n`` best products over every subset within the budget."""
+
+    products = [
+        math.prod(factor for _, factor in subset)
+        for size in range(min(slot_budget, len(factors)) + 1)
+        for subset in itertools.combinations(factors, size)
+    ]
+    return sorted(products, reverse=True)[:top_n]
+
+
+def random_factors(rng: random.Random, count: int) -> list[tuple[str, float]]:
+    """Build ``(name, factor)`` pairs sorted strongest first, as ``picto_factors`` does."""
+
+    factors = [(f"picto{index}", rng.choice(FACTOR_CHOICES)) for index in range(count)]
+    return sorted(factors, key=lambda entry: (-entry[1], entry[0]))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_search_matches_brute_force(seed: int) -> None:
+    rng = random.Random(seed)
+    factors = random_factors(rng, rng.randint(0, 11))
+    slot_budget = rng.randint(0, 7)
+    top_n = rng.randint(1, 6)
+
+    found = search_picto_subsets(factors, slot_budget, top_n)
+
+    assert [product for product, _ in found] == pytest.approx(brute_force(factors, slot_budget, top_n))
+    for product, names in found:
+        assert len(names) <= slot_budget
+        assert len(set(names)) == len(names)
+        assert product == pytest.approx(math.prod(dict(factors)[name] for name in names))
+
+
+def test_budget_above_picto_count_is_capped() -> None:
+    factors = [("a", 2.0), ("b", 1.5)]
+
+    found = search_picto_subsets(factors, 12, 1)
+
+    assert found == [(3.0, ("a", "b"))]
@@ -0,0 +1,83 @@
+"""Check that result-card patches turn the old component JSON into the new one."""
+
+from __future__ import annotations
+import copy
+from typing import Any
+
+from dash import Patch, html, no_update
+
+from games.expedition33.calculator.ui import patches
+from games.expedition33.calculator.ui.patches import build_patch, component_json, patch_bodies
+
+
+def apply_patch(old: Any, patch: Patch) -> Any:
+    """Apply a patch's assignments to a copy of ``old``, as the Dash renderer does."""
+
+    patched = copy.deepcopy(old)
+    for operation in patch.to_plotly_json()["operations"]:
+        assert operation["operation"] == "Assign"
+        *parents, last = operation["location"]
+        target = patched
+        for key in parents:
+            target = target[key]
+        target[last] = operation["params"]["value"]
+    return patched
+
+
+def card(title: str, rows: list[tuple[str, str]], note: str | None = None) -> Any:
+    """Build the serialized body of a small result card."""
+
+    children: list[Any] = [html.H5(title), html.Table([html.Tr([html.Td(label), html.Td(value)]) for label, value in rows])]
+    if note is not None:
+        children.append(html.P(note, className="text-muted"))
+    return component_json(html.Div(children, className="card-body"))
+
+
+def test_changed_text_becomes_a_small_patch() -> None:
+    old = card("Ice Lance", [("Damage", "7,200"), ("Hits", "3")])
+    new = card("Ice Lance", [("Damage", "7,560"), ("Hits", "3")])
+
+    patch = build_patch(old, new)
+
+    assert patch is not None
+    assert len(patch.to_plotly_json()["operations"]) == 1
+    assert apply_patch(old, patch) == new
+
+
+def test_structural_changes_still_apply() -> None:
+    old = card("Ice Lance", [("Damage", "7,200")])
+    new = card("Wildfire", [("Damage", "5,100"), ("Burn", "12")], note="Burn ticks are estimated.")
+
+    patch = build_patch(old, new)
+
+    assert patch is not None
+    assert apply_patch(old, patch) == new
+
+
+def test_a_different_root_is_not_patched() -> None:
+    old = component_json(html.Div("a"))
+
+    assert build_patch(old, component_json(html.Span("a"))) is None
+    assert build_patch(old, "plain text") is None
+
+
+def test_patch_bodies_picks_the_smallest_output() -> None:
+    unchanged = card("Ice Lance", [("Damage", "7,200")])
+    old = card("Ice Lance", [("Damage", "7,200"), ("Hits", "3")] * 20)
+    new = card("Ice Lance", [("Damage", "7,200"), ("Hits", "4")] + [("Damage", "7,200"), ("Hits", "3")] * 19)
+
+    outputs = patch_bodies([unchanged, old, None], [unchanged, new, component_json(html.Div("x"))])
+
+    assert outputs[0] is no_update
+    assert isinstance(outputs[1], Patch)
+    assert apply_patch(old, outputs[1]) == new
+    assert outputs[2] == component_json(html.Div("x"))
+
+
+def test_unknown_base_sends_full_bodies() -> None:
+    bodies = [card("Ice Lance", [("Damage", "7,200")])]
+
+    assert patches.recall_bodies({"digest": "0" * 16}) is None
+    assert patch_bodies(None, bodies) == bodies
+    digest = patches.remember_bodies(bodies)
+    assert patches.recall_bodies({"digest": digest}) is bodies
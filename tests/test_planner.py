@@ -0,0 +1,75 @@
+"""Check the rotation planner's dynamic program against exhaustive replays."""
+
+from __future__ import annotations
+import itertools
+from typing import Any
+
+import pytest
+
+from games.expedition33.calculator.core import CalculatorState
+from games.expedition33.calculator.planner import MAX_PLAN_TURNS, castable_rows, plan_rotation
+from games.expedition33.calculator.rotation import build_turn_evaluator, simulate_rotation
+
+WEAPON_STATE = {"foretell": 0, "twilight": False, "rank": "D", "monoco_mask_type": "Balanced"}
+ATTACK = 1000.0
+STATES: dict[str, CalculatorState] = {
+    "gustave": {"charges": 0},
+    "lune": {
+        "stains": 0,
+        "earth_stains": 0,
+        "fire_stains": 0,
+        "ice_stains": 0,
+        "lightning_stains": 0,
+        "light_stains": 0,
+        "turns": 1,
+        "all_crits": False,
+    },
+}
+
+
+def plan(character: str, turns: int, **kwargs: Any) -> Any:
+    """Plan a rotation without Pictos or a weapon."""
+
+    return plan_rotation(character, turns, STATES[character], [], {}, None, "20", WEAPON_STATE, ATTACK, **kwargs)
+
+
+def best_replay(character: str, turns: int, start_ap: int) -> float:
+    """Return the best total over every affordable skill sequence, played by the simulator."""
+
+    evaluate_turn = build_turn_evaluator(character, [], {}, None, "20", ATTACK)
+    names = [row.skill for row in castable_rows(character)]
+    best = 0.0
+    for skills in itertools.product(names, repeat=turns):
+        result = simulate_rotation(
+            character, list(skills), STATES[character], WEAPON_STATE, evaluate_turn, start_ap=start_ap
+        )
+        if result["substitutions"] == 0:
+            best = max(best, result["total_damage"])
+    return best
+
+
+@pytest.mark.parametrize(
+    ("character", "start_ap"),
+    [("gustave", 0), ("gustave", 3), ("gustave", 9), ("lune", 3)],
+)
+def test_plan_matches_exhaustive_search(character: str, start_ap: int) -> None:
+    result = plan(character, 3, start_ap=start_ap)
+
+    assert result["expected_damage"] == pytest.approx(round(best_replay(character, 3, start_ap), 2))
+
+
+@pytest.mark.parametrize("character", ["gustave", "lune"])
+def test_planned_sequence_replays_to_its_damage(character: str) -> None:
+    result = plan(character, 6, start_ap=3)
+    evaluate_turn = build_turn_evaluator(character, [], {}, None, "20", ATTACK)
+
+    replay = simulate_rotation(character, result["skills"], STATES[character], WEAPON_STATE, evaluate_turn, start_ap=3)
+
+    assert len(result["turns"]) == 6
+    assert replay["substitutions"] == 0
+    assert replay["total_damage"] == pytest.approx(result["expected_damage"], abs=0.01)
+
+
+def test_turns_are_clamped() -> None:
+    assert plan("gustave", 0)["turns"] == []
+    assert len(plan("gustave", MAX_PLAN_TURNS + 5)["turns"]) == MAX_PLAN_TURNS
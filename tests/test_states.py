@@ -0,0 +1,42 @@
+"""Check that normalizing character state never changes a result."""
+
+from __future__ import annotations
+import random
+from typing import Any
+
+import pytest
+
+from games.expedition33.calculator.core import CALCULATOR_DATA, calculate_current_cost
+from games.expedition33.calculator.logic import calculate_skill_result
+from games.expedition33.calculator.states import CHARACTER_STATES, LUNE_STAIN_CONTROLS, build_character_state
+
+RAW_VALUES: list[Any] = [None, "", "x", " S ", "Virtuoso", -3, 0, 1, 2, 3.0, 4, 5, 7, 9, 11, 50, 99.5, 101, 1000, True, False]
+
+
+@pytest.mark.parametrize("character", list(CALCULATOR_DATA))
+def test_normalized_state_gives_the_same_results(character: str) -> None:
+    rng = random.Random(character)
+    controls = {**CHARACTER_STATES[character].CONTROLS, **(LUNE_STAIN_CONTROLS if character == "lune" else {})}
+    for _ in range(60):
+        values = {control: rng.choice(RAW_VALUES) for control in controls.values()}
+        normalized = build_character_state(character, values).as_state()
+        raw = {**normalized, **{name: values[control] for name, control in CHARACTER_STATES[character].CONTROLS.items()}}
+        for row in CALCULATOR_DATA[character]["records"]:
+            assert calculate_skill_result(character, row, normalized) == calculate_skill_result(character, row, raw)
+            assert calculate_current_cost(character, row, normalized) == calculate_current_cost(character, row, raw)
+
+
+@pytest.mark.parametrize(
+    ("character", "first", "second"),
+    [
+        ("lune", {"lune_turns": 7}, {"lune_turns": 5}),
+        ("lune", {"lune_stains": 9}, {"lune_stains": 4}),
+        ("monoco", {"monoco_turns": 3.0, "monoco_mask": 1}, {"monoco_turns": 8, "monoco_mask": True}),
+        ("maelle", {"maelle_stance": None, "maelle_burn_stacks": 250}, {"maelle_stance": "Stanceless", "maelle_burn_stacks": 100}),
+        ("verso", {"verso_rank": " B ", "verso_uses": 0}, {"verso_rank": "B", "verso_uses": 1}),
+        ("gustave", {"gustave_charges": "x"}, {"gustave_charges": 0}),
+    ],
+)
+def test_equivalent_controls_share_one_key(character: str, first: dict[str, Any], second: dict[str, Any]) -> None:
+    assert build_character_state(character, first) == build_character_state(character, second)
+    assert hash(build_character_state(character, first)) == hash(build_character_state(character, second))
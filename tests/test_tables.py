@@ -0,0 +1,44 @@
+"""Check the shipped outcome tables against ``calculate_skill_result``."""
+
+from __future__ import annotations
+import itertools
+import random
+
+import pytest
+
+from games.expedition33.calculator.core import CALCULATOR_DATA
+from games.expedition33.calculator.evaluators import SKILL_EVALUATORS
+from games.expedition33.calculator.logic import calculate_skill_result
+from games.expedition33.calculator.tables import TABLE_SOURCES, load_outcome_tables
+from games.expedition33.calculator.verify import RANK_BONUS_FLAGS, state_domains
+
+SAMPLED_STATES = 300
+TABLES = load_outcome_tables()
+
+
+def test_tables_are_current_and_cover_every_row() -> None:
+    assert any(path.name == "evaluators.py" for path in TABLE_SOURCES)
+    assert set(TABLES) == {row for payload in CALCULATOR_DATA.values() for row in payload["records"]}
+
+
+@pytest.mark.parametrize("character", list(CALCULATOR_DATA))
+def test_table_lookups_match_reference(character: str) -> None:
+    domains = state_domains(character)
+    rng = random.Random(character)
+    states = [{key: values[0] for key, values in domains.items()}, {key: values[-1] for key, values in domains.items()}]
+    states.extend({key: rng.choice(values) for key, values in domains.items()} for _ in range(SAMPLED_STATES))
+    mismatches = []
+    for row in CALCULATOR_DATA[character]["records"]:
+        for state, flag in itertools.product(states, RANK_BONUS_FLAGS.get(character, [False])):
+            if TABLES[row].lookup(state, flag) != calculate_skill_result(character, row, state, flag):
+                mismatches.append(f"{row.skill} / {state} / {flag}")
+
+    assert mismatches == []
+
+
+def test_states_outside_the_table_fall_back_to_the_compiled_evaluator() -> None:
+    row = next(row for row in CALCULATOR_DATA["sciel"]["records"] if "foretell" in (axis[0] for axis in TABLES[row].axes))
+    state = {"foretell": 150, "twilight": False, "full_life": False}
+
+    assert TABLES[row].lookup(state) is None
+    assert SKILL_EVALUATORS[row](state, False) == calculate_skill_result("sciel", row, state)